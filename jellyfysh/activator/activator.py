@@ -41,6 +41,11 @@ class Activator(Initializer, metaclass=ABCMeta):
 
     The activator may maintain internal states (for example cell-occupancy systems) in order to generate the in-state
     identifiers. These internal states should be connected to the event handlers whose in-states are based on them.
+
+    An activator may create further event handlers during the run. These are appended to the sequence that is returned
+    by the get_event_handlers method. An activator may also release event handlers that are not needed anymore. These
+    are generated by the get_released_event_handlers method once, after the trashable events were returned. Mediators
+    that can only deal with a fixed set of event handlers should call the fix_event_handlers method.
     """
 
     def __init__(self, internal_states: Sequence[InternalState]) -> None:
@@ -117,16 +122,21 @@ class Activator(Initializer, metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    def get_trashable_events(self, preceding_event_handler: EventHandler) -> Sequence[EventHandler]:
+    def get_trashable_events(self, preceding_event_handler: EventHandler,
+                             extracted_active_global_state: Any = None) -> Sequence[EventHandler]:
         """
         Return the event handlers whose events should be trashed in the scheduler.
 
         The preceding_event_handler should also be returned in this method.
+        The mediator additionally passes the extracted active global state after the preceding event was committed.
+        The precise format of the extracted active global state is specified by the used state handler.
 
         Parameters
         ----------
         preceding_event_handler : event_handler.EventHandler
             The event handler which committed the preceding event to the global state.
+        extracted_active_global_state : Any or None, optional
+            The extracted active global state information after the preceding event was committed.
 
         Returns
         -------
@@ -135,6 +145,30 @@ class Activator(Initializer, metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_released_event_handlers(self) -> Sequence[EventHandler]:
+        """
+        Return the event handlers that were released since the last call of this method.
+
+        Released event handlers were removed from the sequence returned by the get_event_handlers method and will not be
+        returned by the get_event_handlers_to_run method anymore. Their events have already been returned by the
+        get_trashable_events method. Per default, this method returns an empty sequence.
+
+        Returns
+        -------
+        Sequence[event_handler.EventHandler]
+            The sequence of released event handlers.
+        """
+        return ()
+
+    def fix_event_handlers(self) -> None:
+        """
+        Prevent the activator from creating or releasing event handlers during the run.
+
+        After a call of this method, the sequence returned by the get_event_handlers method does not change anymore.
+        Per default, this method does nothing.
+        """
+        pass
+
     @abstractmethod
     def get_info_internal_state(self, event_handler_asking: EventHandler, identifier_in_internal_state: Any) -> Any:
         """
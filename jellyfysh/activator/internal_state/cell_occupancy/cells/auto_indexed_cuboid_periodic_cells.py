@@ -0,0 +1,96 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the AutoIndexedCuboidPeriodicCells class."""
+import logging
+from jellyfysh.base.logging import log_init_arguments
+from .cell_system_sizing import size_cell_system
+from .indexed_cuboid_periodic_cells import IndexedCuboidPeriodicCells
+
+
+class AutoIndexedCuboidPeriodicCells(IndexedCuboidPeriodicCells):
+    """
+    This class constructs and stores the same cell system as the IndexedCuboidPeriodicCells class, where the number of
+    cells per side and the number of neighbor layers are chosen automatically.
+
+    The choice is based on a cost model (see cell_system_sizing.expected_cost function) that balances the cost of
+    recreating the in-states of nearby and surplus units after every event, whose number grows with the cell size,
+    against the number of cell-boundary events, which grows with the inverse cell size. The number of neighbor layers is
+    chosen so that the nearby cells cover all separations up to the given cutoff. This cutoff should be the separation
+    below which the cell-veto estimator cannot bound the event rate reasonably (for example, the characteristic length
+    of a Lennard-Jones potential or the diameter of a hard sphere). The costs of nearby and cell-veto events are
+    measured in a short benchmark on initialization unless both are given. The chosen number of cells per side and
+    number of neighbor layers are logged on the info level. Since the benchmark depends on the machine, the logged
+    values should be used in the IndexedCuboidPeriodicCells class if a run has to be exactly reproducible.
+
+    The number of units in the cell-occupancy system is estimated from the number of root nodes in the setting package.
+    Therefore, this class can only be used if the input handler that sets the number of root nodes is constructed before
+    the cell system.
+    """
+
+    def __init__(self, cutoff: float, occupants_per_root_node: float = 1.0, maximum_number_occupants: int = 1,
+                 maximum_number_of_cells: int = 32768, event_rate: float = 1.0, nearby_event_cost: float = None,
+                 cell_veto_event_cost: float = None,
+                 maximum_pair_table_size: int = 4194304) -> None:
+        """
+        The constructor of the AutoIndexedCuboidPeriodicCells class.
+
+        Parameters
+        ----------
+        cutoff : float
+            The separation up to which pairs of units must be treated by nearby event handlers.
+        occupants_per_root_node : float, optional
+            The number of units per root node that are stored in the cell-occupancy system.
+        maximum_number_occupants : int, optional
+            The maximum number of occupants per cell of the cell-occupancy system that uses this cell system.
+        maximum_number_of_cells : int, optional
+            The maximum number of cells in the cell system.
+        event_rate : float, optional
+            The expected number of events per unit displacement of the active unit that are not cell-boundary events.
+            This number can be estimated from a previous run.
+        nearby_event_cost : float or None, optional
+            The relative cost of computing a single nearby or surplus event.
+        cell_veto_event_cost : float or None, optional
+            The relative cost of computing a single cell-veto event.
+        maximum_pair_table_size : int, optional
+            The maximum number of entries in the precomputed tables of relative and translated cells.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the hypercuboid setting is not initialized.
+        base.exceptions.ConfigurationError
+            If the cutoff is not greater than zero.
+        base.exceptions.ConfigurationError
+            If the maximum number of cells is smaller than one.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, cutoff=cutoff,
+                           occupants_per_root_node=occupants_per_root_node,
+                           maximum_number_occupants=maximum_number_occupants,
+                           maximum_number_of_cells=maximum_number_of_cells, event_rate=event_rate,
+                           nearby_event_cost=nearby_event_cost,
+                           cell_veto_event_cost=cell_veto_event_cost,
+                           maximum_pair_table_size=maximum_pair_table_size)
+        cells_per_side, neighbor_layers = size_cell_system(
+            self.__class__.__name__, cutoff, occupants_per_root_node, maximum_number_occupants,
+            maximum_number_of_cells, event_rate, nearby_event_cost, cell_veto_event_cost)
+        super().__init__(cells_per_side=cells_per_side, neighbor_layers=neighbor_layers,
+                         maximum_pair_table_size=maximum_pair_table_size)
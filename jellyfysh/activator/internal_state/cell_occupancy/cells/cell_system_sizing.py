@@ -0,0 +1,269 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the cost model that chooses the number of cells per side and the number of neighbor layers."""
+from functools import reduce
+import logging
+from math import ceil, exp
+from operator import mul
+import random
+import time
+from typing import Iterable, List, Sequence, Tuple
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.event_handler.walker import FlatWalker, WalkerItem
+from jellyfysh.potential.inverse_power_potential import InversePowerPotential
+from jellyfysh.setting import hypercuboid_setting as setting
+
+
+def calibrate_event_costs(number_of_samples: int = 8192) -> Tuple[float, float]:
+    """
+    Measure the time of the dominant computation of a nearby event and of a cell-veto event.
+
+    A nearby event handler computes the separation between the active unit and its target unit and inverts the
+    cumulative event rate of the potential. This is measured with the inverse-power potential of a Coulomb interaction.
+    A cell-veto event handler samples a target cell from a Walker table. This is measured with the FlatWalker class on a
+    table of the size of a typical cell system.
+
+    The state of Python's random module is restored after the benchmark, so that the calibration does not change the
+    random numbers of the run.
+
+    Parameters
+    ----------
+    number_of_samples : int, optional
+        The number of times each computation is repeated.
+
+    Returns
+    -------
+    (float, float)
+        The time in seconds of a single nearby event computation, the time of a single cell-veto event computation.
+    """
+    random_state = random.getstate()
+    try:
+        potential = InversePowerPotential(power=1.0, prefactor=1.0)
+        velocity = [1.0] + [0.0] * (setting.dimension - 1)
+        positions = [[random.uniform(0.0, length) for length in setting.system_lengths]
+                     for _ in range(2 * number_of_samples)]
+        potential_changes = [random.expovariate(setting.beta) for _ in range(number_of_samples)]
+        start = time.perf_counter()
+        for index in range(number_of_samples):
+            separation = setting.periodic_boundaries.separation_vector(positions[2 * index], positions[2 * index + 1])
+            potential.displacement(velocity, separation, 1.0, -1.0, potential_changes[index])
+        nearby_event_cost = (time.perf_counter() - start) / number_of_samples
+
+        walker = FlatWalker([WalkerItem(cell, random.random()) for cell in range(4096)])
+        start = time.perf_counter()
+        for _ in range(number_of_samples):
+            walker.sample_cell()
+            random.expovariate(setting.beta)
+        cell_veto_event_cost = (time.perf_counter() - start) / number_of_samples
+    finally:
+        random.setstate(random_state)
+    return nearby_event_cost, cell_veto_event_cost
+
+
+def _product(factors: Iterable[float]) -> float:
+    """Return the product of all factors."""
+    return reduce(mul, factors, 1)
+
+
+def _expected_surplus_per_cell(mean_occupancy: float, maximum_number_occupants: int) -> float:
+    """Return the expected number of occupants exceeding the maximum number of occupants in a cell with a Poisson
+    distributed number of occupants."""
+    if maximum_number_occupants <= 0:
+        return 0.0
+    probability = exp(-mean_occupancy)
+    # E[max(0, X - M)] = E[X] - M + sum_{x < M} (M - x) P(X = x) for a Poisson distributed X.
+    expected_surplus = mean_occupancy - maximum_number_occupants
+    for number_occupants in range(maximum_number_occupants):
+        expected_surplus += (maximum_number_occupants - number_occupants) * probability
+        probability *= mean_occupancy / (number_occupants + 1)
+    return max(expected_surplus, 0.0)
+
+
+def expected_cost(cells_per_side: Sequence[int], neighbor_layers: int, number_of_occupants: float,
+                  maximum_number_occupants: int, event_rate: float, nearby_event_cost: float,
+                  cell_veto_event_cost: float) -> float:
+    """
+    Return the expected computational cost per unit displacement of the active unit for the given cell system.
+
+    After every event, the cell-veto event and the in-states of all nearby and surplus units are recreated. The number
+    of events per unit displacement is the given event rate of all events except cell-boundary events plus the number of
+    cell-boundary crossings. The latter is the inverse cell side length in the direction of motion, which is averaged
+    over all directions. The numbers of nearby and surplus units are their expected values for occupants that are
+    uniformly distributed in the simulation box. For the surplus units, the number of occupants per cell is
+    approximated by a Poisson distribution.
+
+    Parameters
+    ----------
+    cells_per_side : Sequence[int]
+        The number of cells per side of the simulation box in every direction.
+    neighbor_layers : int
+        The number of cells in each direction that are considered as nearby.
+    number_of_occupants : float
+        The number of units in the simulation box that are stored in the cell-occupancy system.
+    maximum_number_occupants : int
+        The maximum number of occupants per cell of the cell-occupancy system. If this number is smaller than or equal
+        to zero, there are no surplus units.
+    event_rate : float
+        The number of events per unit displacement of the active unit that are not cell-boundary events.
+    nearby_event_cost : float
+        The cost of computing a single nearby or surplus event.
+    cell_veto_event_cost : float
+        The cost of computing a single cell-veto event.
+
+    Returns
+    -------
+    float
+        The expected cost per unit displacement.
+    """
+    number_of_cells = _product(cells_per_side)
+    cell_side_lengths = [length / cells for length, cells in zip(setting.system_lengths, cells_per_side)]
+    nearby_volume_fraction = _product(min(2 * neighbor_layers + 1, cells) / cells for cells in cells_per_side)
+    number_of_nearby_units = max(number_of_occupants * nearby_volume_fraction - 1.0, 0.0)
+    number_of_surplus_units = number_of_cells * _expected_surplus_per_cell(number_of_occupants / number_of_cells,
+                                                                           maximum_number_occupants)
+    crossings = sum(1.0 / length for length in cell_side_lengths) / setting.dimension
+    return (crossings + event_rate) * (cell_veto_event_cost
+                                       + nearby_event_cost * (number_of_nearby_units + number_of_surplus_units))
+
+
+def choose_cell_system(cutoff: float, number_of_occupants: float, maximum_number_occupants: int,
+                       maximum_number_of_cells: int, event_rate: float, nearby_event_cost: float,
+                       cell_veto_event_cost: float) -> Tuple[List[int], int, float]:
+    """
+    Choose the number of cells per side and the number of neighbor layers with the smallest expected cost.
+
+    The candidate cell systems consist of cells whose side lengths are as similar as possible in all directions. For a
+    given cell side length, the number of neighbor layers is the smallest number so that the nearby cells cover all
+    separations up to the cutoff in every direction. Cell systems where the nearby cells of a cell would wrap around the
+    periodic simulation box are discarded, except for the cell system consisting of a single cell without neighbor
+    layers. The expected cost of all candidates is computed with the expected_cost function. If several candidates have
+    the same expected cost, the one with fewer cells is chosen.
+
+    Parameters
+    ----------
+    cutoff : float
+        The separation up to which pairs of units must be treated by nearby event handlers.
+    number_of_occupants : float
+        The number of units in the simulation box that are stored in the cell-occupancy system.
+    maximum_number_occupants : int
+        The maximum number of occupants per cell of the cell-occupancy system.
+    maximum_number_of_cells : int
+        The maximum number of cells in the cell system.
+    event_rate : float
+        The number of events per unit displacement of the active unit that are not cell-boundary events.
+    nearby_event_cost : float
+        The cost of computing a single nearby or surplus event.
+    cell_veto_event_cost : float
+        The cost of computing a single cell-veto event.
+
+    Returns
+    -------
+    ([int], int, float)
+        The number of cells per side in every direction, the number of neighbor layers, the expected cost.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If the cutoff is not greater than zero.
+    base.exceptions.ConfigurationError
+        If the maximum number of cells is smaller than one.
+    """
+    if not cutoff > 0.0:
+        raise ConfigurationError("The cutoff used to choose the cell system has to be greater than zero.")
+    if maximum_number_of_cells < 1:
+        raise ConfigurationError("The maximum number of cells used to choose the cell system has to be greater than "
+                                 "or equal to one.")
+    single_cell = [1] * setting.dimension
+    best_choice = (single_cell, 0, expected_cost(single_cell, 0, number_of_occupants, maximum_number_occupants,
+                                                 event_rate, nearby_event_cost, cell_veto_event_cost))
+    longest_side = max(setting.system_lengths)
+    cells_along_longest_side = 1
+    while True:
+        cells_along_longest_side += 1
+        cell_side_length = longest_side / cells_along_longest_side
+        cells_per_side = [max(1, round(length / cell_side_length)) for length in setting.system_lengths]
+        if _product(cells_per_side) > maximum_number_of_cells:
+            break
+        neighbor_layers = max(ceil(cutoff * cells / length - 1.0e-12)
+                              for length, cells in zip(setting.system_lengths, cells_per_side))
+        if any(2 * neighbor_layers + 1 > cells for cells in cells_per_side):
+            continue
+        cost = expected_cost(cells_per_side, neighbor_layers, number_of_occupants, maximum_number_occupants,
+                             event_rate, nearby_event_cost, cell_veto_event_cost)
+        if cost < best_choice[2]:
+            best_choice = (cells_per_side, neighbor_layers, cost)
+    return best_choice
+
+
+def size_cell_system(class_name: str, cutoff: float, occupants_per_root_node: float, maximum_number_occupants: int,
+                     maximum_number_of_cells: int, event_rate: float, nearby_event_cost: float = None,
+                     cell_veto_event_cost: float = None) -> Tuple[List[int], int]:
+    """
+    Choose the number of cells per side and the number of neighbor layers of a cell system for the current run.
+
+    The number of units that are stored in the cell-occupancy system is the number of root nodes in the setting package
+    multiplied by the number of occupants per root node. If any of the event costs is None, both costs are measured
+    with the calibrate_event_costs function. The choice is done with the choose_cell_system function and logged
+    together with the used event costs, so that it can be reproduced by specifying the cell system explicitly.
+
+    Parameters
+    ----------
+    class_name : str
+        The name of the class of the cell system that is used in the log message.
+    cutoff : float
+        The separation up to which pairs of units must be treated by nearby event handlers.
+    occupants_per_root_node : float
+        The number of units per root node that are stored in the cell-occupancy system.
+    maximum_number_occupants : int
+        The maximum number of occupants per cell of the cell-occupancy system.
+    maximum_number_of_cells : int
+        The maximum number of cells in the cell system.
+    event_rate : float
+        The number of events per unit displacement of the active unit that are not cell-boundary events.
+    nearby_event_cost : float or None, optional
+        The cost of computing a single nearby or surplus event.
+    cell_veto_event_cost : float or None, optional
+        The cost of computing a single cell-veto event.
+
+    Returns
+    -------
+    ([int], int)
+        The number of cells per side in every direction, the number of neighbor layers.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If the hypercuboid setting is not initialized.
+    """
+    if not setting.initialized():
+        raise ConfigurationError("The class {0} can only be used in a hypercuboid setting.".format(class_name))
+    if nearby_event_cost is None or cell_veto_event_cost is None:
+        nearby_event_cost, cell_veto_event_cost = calibrate_event_costs()
+    cells_per_side, neighbor_layers, cost = choose_cell_system(
+        cutoff, setting.number_of_root_nodes * occupants_per_root_node, maximum_number_occupants,
+        maximum_number_of_cells, event_rate, nearby_event_cost, cell_veto_event_cost)
+    logging.getLogger(__name__).info(
+        "The class {0} chose cells_per_side = {1} and neighbor_layers = {2} with an expected cost of {3} per unit "
+        "displacement (nearby event cost {4}, cell-veto event cost {5}).".format(
+            class_name, ", ".join(str(cells) for cells in cells_per_side), neighbor_layers, cost, nearby_event_cost,
+            cell_veto_event_cost))
+    return cells_per_side, neighbor_layers
@@ -154,6 +154,44 @@ class Cells(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def cell_min(self, cell: Cell) -> Sequence[float]:
+        """
+        Return the minimum position that belongs to the given cell.
+
+        Cell systems which do not represent their cells by instances of the Cell class (for example, by integers) should
+        overwrite this method.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell.
+
+        Returns
+        -------
+        Sequence[float]
+            The minimum position.
+        """
+        return cell.cell_min
+
+    def cell_max(self, cell: Cell) -> Sequence[float]:
+        """
+        Return the maximum position that belongs to the given cell.
+
+        Cell systems which do not represent their cells by instances of the Cell class (for example, by integers) should
+        overwrite this method.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell.
+
+        Returns
+        -------
+        Sequence[float]
+            The maximum position.
+        """
+        return cell.cell_max
+
     @abstractmethod
     def neighbor_cell(self, cell: Cell, direction: int, positive: bool) -> Optional[Cell]:
         """
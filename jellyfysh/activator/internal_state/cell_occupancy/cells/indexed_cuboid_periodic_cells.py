@@ -0,0 +1,585 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the IndexedCuboidPeriodicCells class."""
+from array import array
+import logging
+from typing import FrozenSet, Iterable, Sequence, Tuple
+from weakref import WeakValueDictionary
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.setting import hypercuboid_setting as setting
+from .cuboid_periodic_cells import CuboidPeriodicCells
+from .periodic_cells import PeriodicCells
+
+
+class _CellTables(object):
+    """
+    Class to store the precomputed tables of an integer-indexed cuboid periodic cell system.
+
+    Each cell of the cuboid periodic cell system is identified by the index of the cell in the list of cells stored in
+    the CuboidPeriodicCells class. All relations between cells are precomputed and stored in flat arrays that are
+    indexed by these integers.
+
+    Attributes
+    ----------
+    number_of_cells : int
+        The number of cells.
+    cells_per_side : Tuple[int]
+        The number of cells per side of the simulation box in each direction.
+    cell_side_lengths : Tuple[float]
+        The side lengths of the cells in each direction.
+    cumulative_product : Tuple[int]
+        The multiplicative factors which map the cell identifier in each direction onto the cell index.
+    cell_mins : List[Tuple[float]]
+        The minimum position of each cell.
+    cell_maxs : List[Tuple[float]]
+        The maximum position of each cell.
+    nearby_cells : List[FrozenSet[int]]
+        The set of nearby cells of each cell.
+    neighbor_cells : array.array
+        The neighbor cells of each cell. The neighbor cell of the cell with index i in the given direction is stored at
+        index (i * setting.dimension + direction) * 2 + positive, where positive is 1 for the neighbor along the
+        positive direction and 0 otherwise.
+    coordinates : array.array
+        The cell identifier in each direction of each cell. The identifier of the cell with index i in the given
+        direction is stored at index i * setting.dimension + direction.
+    relative_cells : array.array or None
+        The relative cells for all pairs of cells. The relative cell of the cell with index i with respect to the
+        reference cell with index j is stored at index i * number_of_cells + j. If the number of cells is too large,
+        this table is not stored.
+    translated_cells : array.array or None
+        The translated cells for all pairs of cells. The cell with index i translated by the relative cell with index j
+        is stored at index i * number_of_cells + j. If the number of cells is too large, this table is not stored.
+    number_of_block_levels : int
+        The number of levels of the hierarchy of blocks of cells. On the level l, the blocks contain 2 ** l cells per
+        side (or less at the upper boundaries of the simulation box). The blocks on the level 0 are the cells, and the
+        only block on the highest level is the entire cell system.
+    blocks_of_cells : List[array.array]
+        The block on each level that contains each cell. The block on the level l of the cell with index i is stored at
+        blocks_of_cells[l][i].
+    block_children : List[List[Tuple[int]]]
+        The blocks on the level l - 1 that make up each block on the level l > 0. The children of the block with index
+        i on the level l are stored at block_children[l][i]. The list for the level 0 is empty.
+    block_coordinate_ranges : List[List[Tuple[Tuple[int], Tuple[int]]]]
+        The smallest cell identifier in each direction of each block, and the largest cell identifier in each direction
+        of each block plus one. The range of the block with index i on the level l is stored at
+        block_coordinate_ranges[l][i].
+    """
+
+    def __init__(self, cells_per_side: Sequence[int], neighbor_layers: int, maximum_pair_table_size: int) -> None:
+        """
+        The constructor of the _CellTables class.
+
+        Parameters
+        ----------
+        cells_per_side : Sequence[int]
+            The number of cells per side of the simulation box.
+        neighbor_layers : int
+            The number of cells in each direction that are considered as nearby in this cell system.
+        maximum_pair_table_size : int
+            The maximum size of the pair tables that store the relative and translated cells.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the hypercuboid_setting is not initialized.
+        base.exceptions.ConfigurationError
+            If zero or too many cells per side are given for the chosen dimension.
+        base.exceptions.ConfigurationError
+            If the number of neighbor layers is smaller than zero.
+        """
+        # The CuboidPeriodicCells class is used to construct the cells and to validate the arguments.
+        cuboid_cells = CuboidPeriodicCells(cells_per_side, neighbor_layers)
+        cells = list(cuboid_cells.yield_cells())
+        index_of_cell = {cell: index for index, cell in enumerate(cells)}
+        self.number_of_cells = len(cells)
+        self.cells_per_side = tuple(cells_per_side[i] if i < len(cells_per_side) else cells_per_side[0]
+                                    for i in range(setting.dimension))
+        self.cell_side_lengths = tuple(setting.system_lengths[index] / self.cells_per_side[index]
+                                       for index in range(setting.dimension))
+        self.cumulative_product = [1]
+        for d in range(setting.dimension - 1):
+            self.cumulative_product.append(self.cumulative_product[d] * self.cells_per_side[d])
+        self.cumulative_product = tuple(self.cumulative_product)
+
+        self.cell_mins = [cell.cell_min for cell in cells]
+        self.cell_maxs = [cell.cell_max for cell in cells]
+        self.coordinates = array("l", (cell.identifier[direction] for cell in cells
+                                       for direction in range(setting.dimension)))
+
+        self.nearby_cells = [frozenset(index_of_cell[nearby_cell] for nearby_cell in cuboid_cells.nearby_cells(cell))
+                             for cell in cells]
+
+        self.neighbor_cells = array("l", (index_of_cell[cuboid_cells.neighbor_cell(cell, direction, positive)]
+                                          for cell in cells
+                                          for direction in range(setting.dimension)
+                                          for positive in (False, True)))
+
+        if self.number_of_cells * self.number_of_cells <= maximum_pair_table_size:
+            self.relative_cells = array("l", (self.compute_relative_cell(cell, reference_cell)
+                                              for cell in range(self.number_of_cells)
+                                              for reference_cell in range(self.number_of_cells)))
+            self.translated_cells = array("l", (self.compute_translated_cell(cell, relative_cell)
+                                                for cell in range(self.number_of_cells)
+                                                for relative_cell in range(self.number_of_cells)))
+        else:
+            self.relative_cells = None
+            self.translated_cells = None
+
+        self.number_of_block_levels = 1 + max((cells - 1).bit_length() for cells in self.cells_per_side)
+        self.blocks_of_cells = []
+        self.block_children = []
+        self.block_coordinate_ranges = []
+        for level in range(self.number_of_block_levels):
+            blocks_per_side = [(cells + (1 << level) - 1) >> level for cells in self.cells_per_side]
+            block_cumulative_product = [1]
+            for d in range(setting.dimension - 1):
+                block_cumulative_product.append(block_cumulative_product[d] * blocks_per_side[d])
+            self.blocks_of_cells.append(array("l", (
+                sum((self.coordinates[cell * setting.dimension + direction] >> level)
+                    * block_cumulative_product[direction] for direction in range(setting.dimension))
+                for cell in range(self.number_of_cells))))
+            number_of_blocks = block_cumulative_product[-1] * blocks_per_side[-1]
+            children = [set() for _ in range(number_of_blocks)]
+            if level > 0:
+                for cell in range(self.number_of_cells):
+                    children[self.blocks_of_cells[level][cell]].add(self.blocks_of_cells[level - 1][cell])
+                self.block_children.append([tuple(sorted(block_children)) for block_children in children])
+            else:
+                self.block_children.append([])
+            minimums = [list(self.cells_per_side) for _ in range(number_of_blocks)]
+            maximums = [[0] * setting.dimension for _ in range(number_of_blocks)]
+            for cell in range(self.number_of_cells):
+                block = self.blocks_of_cells[level][cell]
+                for direction in range(setting.dimension):
+                    coordinate = self.coordinates[cell * setting.dimension + direction]
+                    minimums[block][direction] = min(minimums[block][direction], coordinate)
+                    maximums[block][direction] = max(maximums[block][direction], coordinate + 1)
+            self.block_coordinate_ranges.append([(tuple(minimum), tuple(maximum))
+                                                 for minimum, maximum in zip(minimums, maximums)])
+
+    def compute_relative_cell(self, cell: int, reference_cell: int) -> int:
+        """Compute the index of the relative cell of the cell with respect to the reference cell."""
+        dimension = setting.dimension
+        return sum(((self.coordinates[cell * dimension + direction]
+                     - self.coordinates[reference_cell * dimension + direction]) % self.cells_per_side[direction])
+                   * self.cumulative_product[direction] for direction in range(dimension))
+
+    def compute_translated_cell(self, cell: int, relative_cell: int) -> int:
+        """Compute the index of the cell that is translated by the relative cell."""
+        dimension = setting.dimension
+        return sum(((self.coordinates[cell * dimension + direction]
+                     + self.coordinates[relative_cell * dimension + direction]) % self.cells_per_side[direction])
+                   * self.cumulative_product[direction] for direction in range(dimension))
+
+
+_cell_tables = WeakValueDictionary()
+"""
+Dictionary which maps the geometry of a cell system onto the precomputed tables so that they can be shared.
+
+The tables are only weakly referenced so that they are freed together with the last cell system that uses them.
+"""
+
+
+class IndexedCuboidPeriodicCells(PeriodicCells):
+    """
+    This class constructs and stores a cuboid cell system that takes periodic boundary conditions and translational
+    invariance into account, where every cell is identified by a dense integer.
+
+    This class constructs exactly the same cuboid cell system as the CuboidPeriodicCells class, and also uses the same
+    definition for nearby cells. However, the cells are not represented by instances of the Cell class but by their
+    index in the cell system (that is, by integers between 0 and the number of cells minus one). The cell index is
+    obtained from the cell identifier list in each direction by multiplying it with the cumulative product of the cells
+    per side in the smaller directions, and summing over all directions. The zero cell has the index 0.
+
+    All relations between cells (nearby cells, neighbor cells, relative cells, and translated cells) are precomputed on
+    initialization and stored in flat arrays, so that every lookup is reduced to indexing an array. These tables are
+    shared between all instances of this class that are constructed for the same setting, number of cells per side,
+    and number of neighbor layers (for example, the cell systems on the molecule and on the atom level of water) as long
+    as any of these instances exists. The
+    tables of relative and translated cells contain an entry for each pair of cells. If the number of pairs exceeds the
+    maximum pair table size, these two tables are not stored and the relative and translated cells are computed from the
+    stored cell identifiers in each direction instead.
+
+    Since the cells are integers, the minimum and maximum positions of a cell are accessed via the cell_min and cell_max
+    methods of this class.
+
+    Besides the cells, this class defines a hierarchy of blocks of cells (similar to an octree in three dimensions). On
+    the block level l, the cell system is decomposed into blocks of 2 ** l cells per side (the blocks at the upper
+    boundaries of the simulation box may contain less cells). The blocks on the level 0 are the cells themselves, and
+    the highest block level consists of a single block containing all cells. Each block on the level l > 0 is made up
+    of the blocks on the level l - 1 that are returned by the block_children method. Blocks are also identified by
+    dense integers on each level. This hierarchy is, for example, used by the cell-veto event handlers to sample target
+    cells coarse-to-fine.
+
+    This class can only be used if the hypercuboid setting is initialized.
+    """
+
+    def __init__(self, cells_per_side: Sequence[int], neighbor_layers: int = 1,
+                 maximum_pair_table_size: int = 4194304) -> None:
+        """
+        The constructor of the IndexedCuboidPeriodicCells class.
+
+        Parameters
+        ----------
+        cells_per_side : Sequence[int]
+            The number of cells per side of the simulation box that this class uses to construct the cuboid cell system.
+            If fewer numbers than the dimension of the simulation are given, the first number is reused.
+        neighbor_layers : int, optional
+            The number of cells in each direction that are considered as nearby in this cell system.
+        maximum_pair_table_size : int, optional
+            The maximum number of entries in the precomputed tables of relative and translated cells.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the hypercuboid_setting is not initialized.
+        base.exceptions.ConfigurationError
+            If zero or too many cells per side are given for the chosen dimension.
+        base.exceptions.ConfigurationError
+            If the number of neighbor layers is smaller than zero.
+        """
+        logger = logging.getLogger(__name__)
+        log_init_arguments(logger.debug, self.__class__.__name__, cells_per_side=cells_per_side,
+                           neighbor_layers=neighbor_layers, maximum_pair_table_size=maximum_pair_table_size)
+        super().__init__()
+        key = (tuple(cells_per_side), neighbor_layers, maximum_pair_table_size,
+               tuple(setting.system_lengths) if setting.initialized() else None)
+        tables = _cell_tables.get(key)
+        if tables is None:
+            tables = _CellTables(cells_per_side, neighbor_layers, maximum_pair_table_size)
+            _cell_tables[key] = tables
+        else:
+            logger.debug("Reusing the precomputed cell tables for cells per side {0} and {1} neighbor layers."
+                         .format(cells_per_side, neighbor_layers))
+        self._tables = tables
+        self._number_of_cells = tables.number_of_cells
+        self._cell_side_lengths = tables.cell_side_lengths
+        self._cumulative_product = tables.cumulative_product
+        self._nearby_cells = tables.nearby_cells
+        self._neighbor_cells = tables.neighbor_cells
+        self._relative_cells = tables.relative_cells
+        self._translated_cells = tables.translated_cells
+        if self._relative_cells is None:
+            # noinspection PyAttributeOutsideInit
+            self.relative_cell = tables.compute_relative_cell
+            # noinspection PyAttributeOutsideInit
+            self.translate = tables.compute_translated_cell
+
+    @property
+    def number_of_cells(self) -> int:
+        """
+        Return the number of cells in this cell system.
+
+        Returns
+        -------
+        int
+            The number of cells.
+        """
+        return self._number_of_cells
+
+    def yield_cells(self) -> Iterable[int]:
+        """
+        Generate all cells of the cell system.
+
+        Yields
+        ------
+        int
+            The cells.
+        """
+        yield from range(self._number_of_cells)
+
+    def position_to_cell(self, position: Sequence[float]) -> int:
+        """
+        Map a given position onto the corresponding cell.
+
+        Parameters
+        ----------
+        position : Sequence[float]
+            The position.
+
+        Returns
+        -------
+        int
+            The cell that contains the position.
+
+        Raises
+        ------
+        AssertionError
+            If the given position lies outside of the simulation box.
+        """
+        assert all(0.0 <= position[index] <= setting.system_lengths[index] for index in range(setting.dimension))
+        return sum(int(position[index] / self._cell_side_lengths[index]) * self._cumulative_product[index]
+                   for index in range(setting.dimension))
+
+    def nearby_cells(self, cell: int) -> FrozenSet[int]:
+        """
+        Return the set of nearby cells in the cell system of the given cell.
+
+        Each cell has the cells in its neighbored layers (in all directions) as its nearby cells. Therefore, each cell
+        has at most (neighbor_layers * 2 + 1) ** setting.dimension nearby cells.
+
+        Parameters
+        ----------
+        cell : int
+            The cell whose nearby cells are returned.
+
+        Returns
+        -------
+        FrozenSet[int]
+            The set of nearby cells.
+        """
+        return self._nearby_cells[cell]
+
+    def neighbor_cell(self, cell: int, direction: int, positive: bool) -> int:
+        """
+        Return the neighbor cell of the given cell in the given positive or negative direction.
+
+        The direction indicates the axis along which the neighbor is returned and should satisfy
+        0 <= direction < setting.dimension. If the positive bool is True, this method returns the neighbor in the
+        positive direction. Otherwise, it returns the neighbor in the negative direction. In the periodic cell system of
+        this class, the desired neighbor cell always exists.
+
+        Parameters
+        ----------
+        cell : int
+            The cell whose neighbor is returned
+        direction : int
+            The direction in which the neighbor is returned.
+        positive : bool
+            Whether this method returns the neighbor along the positive or negative direction.
+
+        Returns
+        -------
+        int
+            The neighbor cell in the given positive or negative direction.
+        """
+        return self._neighbor_cells[(cell * setting.dimension + direction) * 2 + positive]
+
+    def cell_min(self, cell: int) -> Sequence[float]:
+        """
+        Return the minimum position that belongs to the given cell.
+
+        Parameters
+        ----------
+        cell : int
+            The cell.
+
+        Returns
+        -------
+        Sequence[float]
+            The minimum position.
+        """
+        return self._tables.cell_mins[cell]
+
+    def cell_max(self, cell: int) -> Sequence[float]:
+        """
+        Return the maximum position that belongs to the given cell.
+
+        Parameters
+        ----------
+        cell : int
+            The cell.
+
+        Returns
+        -------
+        Sequence[float]
+            The maximum position.
+        """
+        return self._tables.cell_maxs[cell]
+
+    @property
+    def zero_cell(self) -> int:
+        """
+        Return the zero cell of the periodic cell system.
+
+        This class defines the cell that has the origin [0.0 * setting.dimension] of the simulation box as the minimum
+        position (i.e., the cell with the index 0) as the zero cell.
+
+        Returns
+        -------
+        int
+            The zero cell.
+        """
+        return 0
+
+    def relative_cell(self, cell: int, reference_cell: int) -> int:
+        """
+        Return the cell that has the same distance to the zero cell as the first cell in the argument list to the
+        second reference cell.
+
+        This method takes periodic boundaries into account. The 'translate' method is the inverse method.
+
+        Parameters
+        ----------
+        cell : int
+            The cell that gets mapped onto the returned cell, which has the same distance to the zero cell as this cell
+            to the reference cell.
+        reference_cell : int
+            The reference cell that gets mapped onto the zero cell.
+
+        Returns
+        -------
+        int
+            The cell that has the same distance to the zero cell as the first cell in the argument list to the second
+            reference cell.
+        """
+        return self._relative_cells[cell * self._number_of_cells + reference_cell]
+
+    def translate(self, cell: int, relative_cell: int) -> int:
+        """
+        Return the cell that has the same distance to the first cell in the argument list as the second relative cell
+        the zero cell.
+
+        This method takes periodic boundaries into account. The 'relative_cell' method is the inverse method.
+
+        Parameters
+        ----------
+        cell : int
+            The cell that gets mapped onto the zero cell and to which the returned cell has the same distance as the
+            second cell in the argument list to the zero cell.
+        relative_cell : int
+            The cell that gets mapped onto the returned cell, which has the same distance to the first cell in the
+            argument list as this cell to the zero cell.
+
+        Returns
+        -------
+        int
+            The cell that has the same distance to the first cell in the argument list as the second relative cell
+            the zero cell.
+        """
+        return self._translated_cells[cell * self._number_of_cells + relative_cell]
+
+    @property
+    def cells_per_side(self) -> Sequence[int]:
+        """
+        Return the number of cells per side of the simulation box in each direction.
+
+        Returns
+        -------
+        Sequence[int]
+            The number of cells per side.
+        """
+        return self._tables.cells_per_side
+
+    def cell_coordinates(self, cell: int) -> Sequence[int]:
+        """
+        Return the cell identifier in each direction of the given cell.
+
+        The cell identifier in a given direction is an integer between 0 and the number of cells per side in this
+        direction minus one.
+
+        Parameters
+        ----------
+        cell : int
+            The cell.
+
+        Returns
+        -------
+        Sequence[int]
+            The cell identifier in each direction.
+        """
+        return self._tables.coordinates[cell * setting.dimension:(cell + 1) * setting.dimension]
+
+    @property
+    def number_of_block_levels(self) -> int:
+        """
+        Return the number of levels of the hierarchy of blocks of cells.
+
+        Returns
+        -------
+        int
+            The number of block levels.
+        """
+        return self._tables.number_of_block_levels
+
+    def number_of_blocks(self, level: int) -> int:
+        """
+        Return the number of blocks on the given block level.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+
+        Returns
+        -------
+        int
+            The number of blocks.
+        """
+        return len(self._tables.block_coordinate_ranges[level])
+
+    def block(self, cell: int, level: int) -> int:
+        """
+        Return the block on the given block level that contains the given cell.
+
+        Parameters
+        ----------
+        cell : int
+            The cell.
+        level : int
+            The block level.
+
+        Returns
+        -------
+        int
+            The block.
+        """
+        return self._tables.blocks_of_cells[level][cell]
+
+    def block_children(self, block: int, level: int) -> Sequence[int]:
+        """
+        Return the blocks on the block level one below the given block level that make up the given block.
+
+        Parameters
+        ----------
+        block : int
+            The block.
+        level : int
+            The block level of the block which should be greater than zero.
+
+        Returns
+        -------
+        Sequence[int]
+            The blocks on the level below.
+        """
+        return self._tables.block_children[level][block]
+
+    def block_coordinate_range(self, block: int, level: int) -> Tuple[Sequence[int], Sequence[int]]:
+        """
+        Return the range of cell identifiers in each direction of the cells in the given block.
+
+        The first returned sequence contains the smallest cell identifier in each direction of all cells in the block.
+        The second returned sequence contains the largest cell identifier in each direction plus one.
+
+        Parameters
+        ----------
+        block : int
+            The block.
+        level : int
+            The block level.
+
+        Returns
+        -------
+        (Sequence[int], Sequence[int])
+            The smallest cell identifiers, the largest cell identifiers plus one.
+        """
+        return self._tables.block_coordinate_ranges[level][block]
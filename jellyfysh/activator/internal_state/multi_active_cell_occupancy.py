@@ -0,0 +1,348 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the MultiActiveCellOccupancy class."""
+from array import array
+from collections import deque
+from itertools import islice
+import logging
+from typing import List, Iterable, Optional, Sequence, Tuple
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node, yield_nodes_on_level_below
+import jellyfysh.setting as setting
+from jellyfysh.state_handler.tree_state_handler import StateId
+from .cell_occupancy import CellOccupancy
+from .cell_occupancy.cells import Cells, Cell
+from .cell_occupancy.cells.indexed_cuboid_periodic_cells import IndexedCuboidPeriodicCells
+
+
+class MultiActiveCellOccupancy(CellOccupancy):
+    """
+    Cell-occupancy system that maps identifiers of the global state onto cells in the underlying cell system.
+    This cell-occupancy system can consider any number of simultaneously relevant active units (see below for a
+    definition of a relevant unit).
+
+    This class is designed to work together with the TreeStateHandler. A global state identifier is then a tuple of
+    integers, where the tuple can have different lengths (see StateId in state_handler.tree_state_handler.py). This
+    cell-occupancy system has a cell_level attribute that determines the length of the relevant global state identifiers
+    that are stored in this internal state. All other global state identifiers are ignored.
+    For the TreeStateHandler, both the extracted global state, and the extracted active global state (that are used to
+    initialize and update this internal state, respectively) are sequences of branches of cnodes containing units.
+
+    Besides the cell_level attribute, this cell-occupancy system can include a charge to further restrict the relevant
+    global state identifiers that are stored in this cell-occupancy system. Here, only global state identifiers of units
+    with this charge unequal zero are stored.
+
+    On initialization, this cell-occupancy system receives a maximum number of global state identifiers that can be
+    possibly stored for each cell, and which are returned by the __getitem__ method. All additional global state
+    identifiers, which would be mapped onto a cell that has reached its maximum number of occupants, are treated as
+    surplus identifiers that are generated by the yield_surplus method. Note that it is also possible to choose an
+    infinite upper bound on the number of occupants. In this case, there are never any surplus identifiers.
+
+    Contrary to the SingleActiveCellOccupancy class, this cell-occupancy system tracks all relevant active units
+    together with their cells. The identifiers of the active units are not stored in the cell-occupancy system itself
+    (i.e., they are not returned by the __getitem__ and yield_surplus methods). They are stored separately, so that they
+    can be efficiently generated in the yield_active_cells method. Taggers generate the in-states for each active unit
+    independently based on this method. Note that in-states which would pair two active units are never generated
+    because the active units are not stored in the cells. This is correct if all active units move with the same
+    velocity, because then their separations and therefore their interactions do not change.
+
+    If the underlying cell system is an IndexedCuboidPeriodicCells instance, the cells are integers and the occupants of
+    all cells are stored in a list that is indexed by the cells instead of a dictionary. Moreover, this cell-occupancy
+    system then keeps track of the number of stored global state identifiers (not including surplus identifiers) in each
+    block of cells on each block level of the cell system. These numbers are updated incrementally whenever an
+    identifier is stored in or removed from a cell, and they are returned by the block_occupancy method. For each block
+    level, the most recent blocks that became empty or occupied are also stored (see block_transitions method).
+    """
+
+    def __init__(self, cells: Cells, cell_level: int, maximum_number_occupants: int = 1, charge: str = None) -> None:
+        """
+        The constructor of the MultiActiveCellOccupancy class.
+
+        Parameters
+        ----------
+        cells : activator.internal_state.cell_occupancy.cells.Cells
+            The underlying cell system.
+        cell_level : int
+            The length of the global state identifiers which should be stored in this internal state.
+        maximum_number_occupants : int, optional
+            The maximum number of allowed occupants per cell. If this number is smaller than or equal to zero, this
+            class allows for an infinite number of occupants per cell.
+        charge : str or None, optional
+            The charge of the unit that must be unequal zero in order for the corresponding identifier to be stored.
+            If the charge is None, all global state identifiers with the correct length are stored.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the cell_level corresponds to composite point objects which cannot have a charge but the charge is set.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, cells=cells.__class__.__name__,
+                           cell_level=cell_level, maximum_number_occupants=maximum_number_occupants, charge=charge)
+        super().__init__(cells, cell_level, maximum_number_occupants)
+        if cell_level < setting.number_of_node_levels and charge is not None:
+            raise ConfigurationError("Chosen cell level stores composite point objects which cannot have a charge!")
+        self._surplus = {}
+        if isinstance(self._cells, IndexedCuboidPeriodicCells):
+            # Cells are dense integers so that the occupants can be stored in a list that is indexed by the cells.
+            self._occupants = [[] for _ in self._cells.yield_cells()]
+            self._block_occupancy = [array("l", [0] * self._cells.number_of_blocks(level))
+                                     for level in range(self._cells.number_of_block_levels)]
+            # Only the most recent transitions are kept since all blocks can be checked in the same number of steps.
+            self._block_transitions = [deque(maxlen=self._cells.number_of_blocks(level))
+                                       for level in range(self._cells.number_of_block_levels)]
+            self._number_of_block_transitions = [0] * self._cells.number_of_block_levels
+        else:
+            self._occupants = {cell: [] for cell in self._cells.yield_cells()}
+            self._block_occupancy = None
+            self._block_transitions = None
+            self._number_of_block_transitions = None
+        # Dictionaries keep the insertion order so that the active cells are always generated in the same order.
+        self._active_cells = {}
+        self._is_relevant_unit = (lambda unit: unit.charge[charge] != 0) if charge is not None else lambda unit: True
+
+    def initialize(self, extracted_global_state: Sequence[Node]) -> None:
+        """
+        Initialize the internal state based on the full extracted global state from the tree state handler.
+
+        Extends the initialize method of the InternalState class. Use this method once in the beginning of the run to
+        initialize the internal state. Only after a call of this method, other public methods of this class can be
+        called without raising an error.
+
+        For the tree state handler, the full extracted global state is a sequence of cnodes of all root nodes that are
+        stored in the global state.
+
+        Parameters
+        ----------
+        extracted_global_state : Sequence[base.node.Node]
+            The full extracted global state from the tree state handler.
+        """
+        super().initialize(extracted_global_state)
+        for root_cnode in extracted_global_state:
+            for relevant_cnode in yield_nodes_on_level_below(root_cnode, self._cell_level - 1):
+                unit = relevant_cnode.value
+                if self._is_relevant_unit(unit):
+                    self._store(self._cells.position_to_cell(unit.position), unit.identifier)
+
+    def __getitem__(self, internal_state_identifier: Cell) -> List[StateId]:
+        """
+        Return a list of the stored global state identifiers that are stored for the given cell.
+
+        The number of entries in the list of the global state identifiers that are associated to the given cell is at
+        most the maximum number of allowed occupants per cell of this cell-occupancy system. If no global state
+        identifier is associated with the given cell, this method returns an empty list.
+
+        If this cell-occupancy system associates more global state identifiers to the given cell than the maximum number
+        of allowed occupants, surplus global state identifiers are generated by the yield_surplus method.
+
+        Relevant active global state identifiers that are also associated with the given cell are not returned by this
+        method.
+
+        Parameters
+        ----------
+        internal_state_identifier : activator.internal_state.cell_occupancy.cells.Cell
+            The cell.
+
+        Returns
+        -------
+        List[state_handler.tree_state_handler.StateId]
+           The global state identifiers associated with the cell.
+        """
+        return self._occupants[internal_state_identifier]
+
+    def update(self, extracted_active_global_state: Sequence[Node]) -> None:
+        """
+        Update the internal state based on the extracted active global state.
+
+        Use this method to keep the internal state consistent with the global state. For the tree state handler, the
+        extracted active global state is a sequence of cnodes of root cnodes where each cnode branch only contains
+        active units.
+
+        This method extracts all relevant active units on the cell level of this class. The identifiers of units that
+        are no longer active are stored again in the cells they were last located in. The identifiers of units that
+        became active are removed from their cells. For all active units, the active cell is determined again.
+
+        Parameters
+        ----------
+        extracted_active_global_state : Sequence[base.node.Node]
+            The extracted active global state from the tree state handler.
+        """
+        active_units = {cnode.value.identifier: cnode.value for root_cnode in extracted_active_global_state
+                        for cnode in yield_nodes_on_level_below(root_cnode, self._cell_level - 1)
+                        if self._is_relevant_unit(cnode.value)}
+        for identifier in [identifier for identifier in self._active_cells if identifier not in active_units]:
+            self._store(self._active_cells.pop(identifier), identifier)
+        for identifier, unit in active_units.items():
+            cell = self._cells.position_to_cell(unit.position)
+            if identifier not in self._active_cells:
+                self._remove(cell, identifier)
+            self._active_cells[identifier] = cell
+
+    def _store(self, cell: Cell, identifier: StateId) -> None:
+        """Store the identifier in the given cell, or in the surplus dictionary if the cell is full."""
+        if len(self._occupants[cell]) < self._maximum_number_occupants or self._number_occupants_not_bounded:
+            self._occupants[cell].append(identifier)
+            self._update_block_occupancy(cell, 1)
+        else:
+            self._surplus.setdefault(cell, []).append(identifier)
+
+    def _remove(self, cell: Cell, identifier: StateId) -> None:
+        """Remove the identifier from the given cell, or from the surplus dictionary of the cell."""
+        try:
+            self._occupants[cell].remove(identifier)
+            # Possibly move an identifier from the surplus list into the occupants list.
+            if self._surplus.get(cell):
+                self._occupants[cell].append(self._surplus[cell].pop())
+            else:
+                self._update_block_occupancy(cell, -1)
+        except ValueError:
+            # Identifier is in the surplus list.
+            self._surplus[cell].remove(identifier)
+        # Delete surplus list if it is now empty.
+        if not self._surplus.get(cell, True):
+            del self._surplus[cell]
+
+    def _update_block_occupancy(self, cell: int, change: int) -> None:
+        """Change the number of stored global state identifiers in all blocks that contain the given cell."""
+        if self._block_occupancy is not None:
+            for level, block_occupancy in enumerate(self._block_occupancy):
+                block = self._cells.block(cell, level)
+                block_occupancy[block] += change
+                # The block became occupied or empty.
+                if block_occupancy[block] == (1 if change > 0 else 0):
+                    self._block_transitions[level].append(block)
+                    self._number_of_block_transitions[level] += 1
+
+    def block_occupancy(self, level: int) -> Sequence[int]:
+        """
+        Return the number of stored global state identifiers in each block of cells on the given block level.
+
+        The returned sequence is indexed by the blocks of the given level (see the IndexedCuboidPeriodicCells class).
+        Surplus global state identifiers and the relevant active global state identifiers are not counted. The returned
+        sequence is updated by this cell-occupancy system and should not be modified.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+
+        Returns
+        -------
+        Sequence[int]
+            The number of stored global state identifiers in each block.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._block_occupancy is not None
+        return self._block_occupancy[level]
+
+    def number_of_block_transitions(self, level: int) -> int:
+        """
+        Return the number of times that a block of cells on the given block level became empty or occupied.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+
+        Returns
+        -------
+        int
+            The number of transitions.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._number_of_block_transitions is not None
+        return self._number_of_block_transitions[level]
+
+    def block_transitions(self, level: int, number_of_known_transitions: int) -> Optional[List[int]]:
+        """
+        Return the blocks of cells on the given block level that became empty or occupied after the given number of
+        transitions.
+
+        The blocks are returned in no particular order and can appear several times. Their current number of occupants
+        is returned by the block_occupancy method. If the transitions are not stored anymore, None is returned and all
+        blocks have to be checked.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+        number_of_known_transitions : int
+            The number of transitions that was returned by the number_of_block_transitions method before.
+
+        Returns
+        -------
+        List[int] or None
+            The blocks that became empty or occupied, or None.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._block_transitions is not None
+        number_of_new_transitions = self._number_of_block_transitions[level] - number_of_known_transitions
+        block_transitions = self._block_transitions[level]
+        if number_of_new_transitions > len(block_transitions):
+            return None
+        return list(islice(reversed(block_transitions), number_of_new_transitions))
+
+    def yield_surplus(self) -> Iterable[StateId]:
+        """
+        Generate all surplus identifiers of this cell-occupancy system.
+
+        Surplus global state identifiers are present if the number of global state identifiers associated to any cell
+        exceeds the maximum number of allowed occupants per cell. This method generates the surplus global state
+        identifiers of all cells.
+
+        Relevant active global state identifiers are never generated by this method.
+
+        Yields
+        ------
+        state_handler.tree_state_handler.StateId
+            The surplus global state identifier.
+        """
+        for value in self._surplus.values():
+            yield from value
+
+    def yield_active_cells(self) -> Iterable[Tuple[Cell, StateId]]:
+        """
+        Generate the cells and the global state identifiers of all relevant active units on the cell level of this
+        cell-occupancy system.
+
+        If this cell-occupancy system only stores global state identifiers of units with a given charge, some active
+        units might not be relevant and are not generated by this method.
+
+        Yields
+        ------
+        (Cell, StateId)
+            The cell, the global state identifier of the active unit.
+        """
+        for identifier, cell in self._active_cells.items():
+            yield cell, identifier
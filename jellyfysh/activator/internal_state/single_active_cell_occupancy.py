@@ -20,8 +20,11 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 """Module for the SingleActiveCellOccupancy class."""
+from array import array
+from collections import deque
+from itertools import islice
 import logging
-from typing import List, Iterable, Sequence, Tuple
+from typing import List, Iterable, Optional, Sequence, Tuple
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node, yield_nodes_on_level_below
@@ -29,6 +32,7 @@ import jellyfysh.setting as setting
 from jellyfysh.state_handler.tree_state_handler import StateId
 from .cell_occupancy import CellOccupancy
 from .cell_occupancy.cells import Cells, Cell
+from .cell_occupancy.cells.indexed_cuboid_periodic_cells import IndexedCuboidPeriodicCells
 
 
 class SingleActiveCellOccupancy(CellOccupancy):
@@ -57,6 +61,13 @@ class SingleActiveCellOccupancy(CellOccupancy):
     This cell-occupancy system can track at most one relevant active unit. The identifier of the active unit is not
     stored in the cell-occupancy system itself (i.e., it is not returned by the __getitem__ and yield_surplus methods),
     but it is stored separately so that it can be efficiently generated in the yield_active_cells_method.
+
+    If the underlying cell system is an IndexedCuboidPeriodicCells instance, the cells are integers and the occupants of
+    all cells are stored in a list that is indexed by the cells instead of a dictionary. Moreover, this cell-occupancy
+    system then keeps track of the number of stored global state identifiers (not including surplus identifiers) in each
+    block of cells on each block level of the cell system. These numbers are updated incrementally whenever an
+    identifier is stored in or removed from a cell, and they are returned by the block_occupancy method. For each block
+    level, the most recent blocks that became empty or occupied are also stored (see block_transitions method).
     """
 
     def __init__(self, cells: Cells, cell_level: int, maximum_number_occupants: int = 1, charge: str = None) -> None:
@@ -87,7 +98,20 @@ class SingleActiveCellOccupancy(CellOccupancy):
         if cell_level < setting.number_of_node_levels and charge is not None:
             raise ConfigurationError("Chosen cell level stores composite point objects which cannot have a charge!")
         self._surplus = {}
-        self._occupants = {cell: [] for cell in self._cells.yield_cells()}
+        if isinstance(self._cells, IndexedCuboidPeriodicCells):
+            # Cells are dense integers so that the occupants can be stored in a list that is indexed by the cells.
+            self._occupants = [[] for _ in self._cells.yield_cells()]
+            self._block_occupancy = [array("l", [0] * self._cells.number_of_blocks(level))
+                                     for level in range(self._cells.number_of_block_levels)]
+            # Only the most recent transitions are kept since all blocks can be checked in the same number of steps.
+            self._block_transitions = [deque(maxlen=self._cells.number_of_blocks(level))
+                                       for level in range(self._cells.number_of_block_levels)]
+            self._number_of_block_transitions = [0] * self._cells.number_of_block_levels
+        else:
+            self._occupants = {cell: [] for cell in self._cells.yield_cells()}
+            self._block_occupancy = None
+            self._block_transitions = None
+            self._number_of_block_transitions = None
         self._active_unit_identifier = None
         self._is_relevant_unit = (lambda unit: unit.charge[charge] != 0) if charge is not None else lambda unit: True
         self._active_cell = None
@@ -117,6 +141,7 @@ class SingleActiveCellOccupancy(CellOccupancy):
                     if (len(self._occupants[cell]) < self._maximum_number_occupants
                             or self._number_occupants_not_bounded):
                         self._occupants[cell].append(unit.identifier)
+                        self._update_block_occupancy(cell, 1)
                     else:
                         self._surplus.setdefault(cell, []).append(unit.identifier)
 
@@ -178,6 +203,7 @@ class SingleActiveCellOccupancy(CellOccupancy):
                 if (len(self._occupants[self._active_cell]) < self._maximum_number_occupants
                         or self._number_occupants_not_bounded):
                     self._occupants[self._active_cell].append(self._active_unit_identifier)
+                    self._update_block_occupancy(self._active_cell, 1)
                 else:
                     self._surplus.setdefault(self._active_cell, []).append(self._active_unit_identifier)
 
@@ -190,6 +216,8 @@ class SingleActiveCellOccupancy(CellOccupancy):
                     # Use get because the surplus dictionary might not have active cell key.
                     if not self._surplus.get(self._active_cell, True):
                         self._occupants[self._active_cell].append(self._surplus[self._active_cell].pop())
+                    else:
+                        self._update_block_occupancy(self._active_cell, -1)
                 except ValueError:
                     # New active unit is in surplus list.
                     self._surplus[self._active_cell].remove(new_active_unit.identifier)
@@ -202,6 +230,98 @@ class SingleActiveCellOccupancy(CellOccupancy):
         else:
             self._active_cell = self._cells.position_to_cell(new_active_unit.position)
 
+    def _update_block_occupancy(self, cell: int, change: int) -> None:
+        """Change the number of stored global state identifiers in all blocks that contain the given cell."""
+        if self._block_occupancy is not None:
+            for level, block_occupancy in enumerate(self._block_occupancy):
+                block = self._cells.block(cell, level)
+                block_occupancy[block] += change
+                # The block became occupied or empty.
+                if block_occupancy[block] == (1 if change > 0 else 0):
+                    self._block_transitions[level].append(block)
+                    self._number_of_block_transitions[level] += 1
+
+    def block_occupancy(self, level: int) -> Sequence[int]:
+        """
+        Return the number of stored global state identifiers in each block of cells on the given block level.
+
+        The returned sequence is indexed by the blocks of the given level (see the IndexedCuboidPeriodicCells class).
+        Surplus global state identifiers and the relevant active global state identifier are not counted. The returned
+        sequence is updated by this cell-occupancy system and should not be modified.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+
+        Returns
+        -------
+        Sequence[int]
+            The number of stored global state identifiers in each block.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._block_occupancy is not None
+        return self._block_occupancy[level]
+
+    def number_of_block_transitions(self, level: int) -> int:
+        """
+        Return the number of times that a block of cells on the given block level became empty or occupied.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+
+        Returns
+        -------
+        int
+            The number of transitions.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._number_of_block_transitions is not None
+        return self._number_of_block_transitions[level]
+
+    def block_transitions(self, level: int, number_of_known_transitions: int) -> Optional[List[int]]:
+        """
+        Return the blocks of cells on the given block level that became empty or occupied after the given number of
+        transitions.
+
+        The blocks are returned in no particular order and can appear several times. Their current number of occupants
+        is returned by the block_occupancy method. If the transitions are not stored anymore, None is returned and all
+        blocks have to be checked.
+
+        Parameters
+        ----------
+        level : int
+            The block level.
+        number_of_known_transitions : int
+            The number of transitions that was returned by the number_of_block_transitions method before.
+
+        Returns
+        -------
+        List[int] or None
+            The blocks that became empty or occupied, or None.
+
+        Raises
+        ------
+        AssertionError
+            If the underlying cell system is not an instance of the IndexedCuboidPeriodicCells class.
+        """
+        assert self._block_transitions is not None
+        number_of_new_transitions = self._number_of_block_transitions[level] - number_of_known_transitions
+        block_transitions = self._block_transitions[level]
+        if number_of_new_transitions > len(block_transitions):
+            return None
+        return list(islice(reversed(block_transitions), number_of_new_transitions))
+
     def yield_surplus(self) -> Iterable[StateId]:
         """
         Generate all surplus identifiers of this cell-occupancy system.
@@ -22,7 +22,7 @@
 """Module for the TagActivator class."""
 import copy
 import logging
-from typing import Any, Dict, List, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 from jellyfysh.base.exceptions import ConfigurationError, TagActivatorError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.event_handler import EventHandler
@@ -30,6 +30,7 @@ from jellyfysh.event_handler.abstracts import StartOfRunEventHandler
 from .activator import Activator
 from .internal_state import InternalState
 from .tagger import Tagger
+from .tagger.abstracts import TaggerWithInternalState
 
 
 class TagActivator(Activator):
@@ -50,11 +51,48 @@ class TagActivator(Activator):
     candidate event of them is stored in the scheduler) and 'not running'. This allows to efficiently trash events with
     a certain tag, and to get event handlers which can compute events with a given tag.
 
+    The graph of taggers given by the four lists of tags is compiled once. Each tagger receives an integer index, and
+    the creates, trashes, activates and deactivates lists are stored as tuples in lists that are indexed by the index of
+    a tagger. The running and not-running event handlers of each tagger are stored in stacks that are only modified in
+    place. On initialization, the tuples of the creates and trashes lists are resolved into tuples that directly contain
+    these stacks. By this, no dictionary lookups of taggers and no list concatenations are necessary in each leg of the
+    time evolution.
+
+    If all event handlers of a tagger are running but another event handler of this tagger should be run, the tagger
+    creates a new event handler by cloning its template event handler. The pools of event handlers thus grow on demand,
+    and the number of event handlers of a tagger only sets the initial size of its pool. Whenever the pool of a tagger
+    reaches a new maximum size, this is logged on the info level. The logged high-water marks can be used to set the
+    initial number of event handlers of the taggers in later runs. Optionally, the pools shrink back to the initial
+    number of event handlers when the events of a tagger are trashed. The surplus not-running event handlers are then
+    released (see get_released_event_handlers method) so that the mediator can release their resources in the
+    scheduler. The growth of the pools can be disabled with the fix_event_handlers method, for example, if the mediator
+    starts a process for each event handler.
+
+    Per default, all running event handlers of the taggers in the trashes list of the tagger of the preceding event
+    handler are trashed. The taggers whose tags appear in the selective_trash_tags argument instead keep the candidate
+    events whose in-states were not modified by the committed out-state. For this, this class stores the in-state
+    identifiers of each running event handler of these taggers. After an event was committed, the velocities in the
+    active global state are compared with the velocities in the active global state before the event. Each global state
+    identifier whose velocity changed (including units that became active or inactive) marks its root unit as touched.
+    Since all units that are not active keep their positions, and active units continue on the same trajectory as long
+    as their velocity does not change, a candidate event whose in-state contains no unit of a touched root unit is still
+    valid. Such an event is only kept if the tagger is also in the creates list of the preceding tagger and it is not
+    activated or deactivated by the preceding tagger. When the tagger later generates the in-state identifiers of a kept
+    event again, no new event handler is run for them. The event handler which committed the preceding event and event
+    handlers without in-state identifiers are always trashed. Only taggers without an internal state can trash
+    selectively, and their in-state identifiers should only depend on the active units. The comparison of the
+    velocities relies on the format of the extracted active global state of the TreeStateHandler, that is, a sequence
+    of root cnodes of branches whose values are units. In the validation mode, all events are trashed as usual, and it
+    is checked that each event which would have been kept is created again with the same in-state identifiers in the
+    next call of the get_event_handlers_to_run method.
+
     When first asked for new event handlers to run, this activator will specifically return the StartOfRunEventHandler
     together with its in-state identifiers.
     """
 
-    def __init__(self, taggers: Sequence[Tagger], internal_states: Sequence[InternalState] = ()) -> None:
+    def __init__(self, taggers: Sequence[Tagger], internal_states: Sequence[InternalState] = (),
+                 shrink_event_handler_pools: bool = False, selective_trash_tags: Sequence[str] = (),
+                 validate_selective_trash: bool = False) -> None:
         """
         The constructor of the TagActivator class.
 
@@ -69,40 +107,80 @@ class TagActivator(Activator):
             Sequence of taggers involved.
         internal_states : Sequence[activator.internal_state.InternalState]
             Sequence of internal states involved.
+        shrink_event_handler_pools : bool, optional
+            Whether surplus not-running event handlers of a tagger beyond its initial number of event handlers are
+            released when the events of the tagger are trashed.
+        selective_trash_tags : Sequence[str], optional
+            The tags of the taggers whose events are only trashed if their in-states were modified.
+        validate_selective_trash : bool, optional
+            Whether all events are trashed while it is checked that the events that would have been kept are created
+            again.
 
         Raises
         ------
         base.exceptions.ConfigurationError
             If not exactly one StartOfRunEventHandler has been provided in all the taggers.
+        base.exceptions.ConfigurationError
+            If a tag in the selective_trash_tags argument does not exist or belongs to a tagger with an internal state.
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            taggers=[tagger.__class__.__name__ for tagger in taggers],
-                           internal_states=[internal_state.__class__.__name__ for internal_state in internal_states])
+                           internal_states=[internal_state.__class__.__name__ for internal_state in internal_states],
+                           shrink_event_handler_pools=shrink_event_handler_pools,
+                           selective_trash_tags=selective_trash_tags,
+                           validate_selective_trash=validate_selective_trash)
         super().__init__(internal_states)
-        self._taggers = taggers
-        self._create_taggers = self._build_tagger_dictionary("creates")
-        self._trash_taggers = self._build_tagger_dictionary("trashes")
-        self._activate_taggers = self._build_tagger_dictionary("activates")
-        self._deactivate_taggers = self._build_tagger_dictionary("deactivates")
+        self._taggers = list(taggers)
+        self._create_tagger_indices = self._build_tagger_indices("creates")
+        self._trash_tagger_indices = self._build_tagger_indices("trashes")
+        self._activate_taggers = [tuple(self._taggers[index] for index in indices)
+                                  for indices in self._build_tagger_indices("activates")]
+        self._deactivate_taggers = [tuple(self._taggers[index] for index in indices)
+                                    for indices in self._build_tagger_indices("deactivates")]
+        self._shrink_event_handler_pools = shrink_event_handler_pools
+        self._event_handlers_fixed = False
+        self._released_event_handlers = []
+        self._maximum_numbers_event_handlers = None
+        tag_to_index_dictionary = {tagger.tag: index for index, tagger in enumerate(self._taggers)}
+        for tag in selective_trash_tags:
+            if tag not in tag_to_index_dictionary.keys():
+                raise ConfigurationError("Given tag '{0}' in the argument selective_trash_tags of the class {1} does "
+                                         "not exist as a tagger!".format(tag, self.__class__.__name__))
+            if isinstance(self._taggers[tag_to_index_dictionary[tag]], TaggerWithInternalState):
+                raise ConfigurationError("The tagger '{0}' has an internal state and cannot be used in the argument "
+                                         "selective_trash_tags of the class {1}."
+                                         .format(tag, self.__class__.__name__))
+        self._selective_trash_tagger_indices = {tag_to_index_dictionary[tag] for tag in selective_trash_tags}
+        self._validate_selective_trash = validate_selective_trash
+        self._velocities = None
 
         # These attributes are set in the initialize method.
         self._event_handlers = None
-        self._event_handler_tagger_dictionary = None
+        self._event_handler_tagger_indices = None
         self._running_event_handlers = None
         self._not_running_event_handlers = None
+        self._create_stacks = None
+        self._trash_stacks = None
+        self._running_identifiers = None
+        self._event_handler_identifiers = None
+        self._validation_identifiers = None
         self._start_of_run_event_handler = None
 
-    def _build_tagger_dictionary(self, list_attribute: str) -> Dict[Tagger, List[Tagger]]:
-        tag_to_tagger_dictionary = {tagger.tag: tagger for tagger in self._taggers}
-        tagger_dictionary = {tagger: [] for tagger in self._taggers}
+    def _build_tagger_indices(self, list_attribute: str) -> List[Tuple[int, ...]]:
+        """
+        Return the list which maps the index of each tagger onto the tuple of indices of the taggers whose tags appear
+        in the given list attribute of the tagger.
+        """
+        tag_to_index_dictionary = {tagger.tag: index for index, tagger in enumerate(self._taggers)}
+        tagger_indices = []
         for tagger in self._taggers:
             for tag in getattr(tagger, list_attribute):
-                if tag not in tag_to_tagger_dictionary.keys():
+                if tag not in tag_to_index_dictionary.keys():
                     raise ConfigurationError("Given tag '{0}' in the list attribute '{1}'"
                                              " of the tagger '{2}' does not exist as a tagger!"
                                              .format(tag, list_attribute, tagger.tag))
-                tagger_dictionary[tagger].append(tag_to_tagger_dictionary[tag])
-        return tagger_dictionary
+            tagger_indices.append(tuple(tag_to_index_dictionary[tag] for tag in getattr(tagger, list_attribute)))
+        return tagger_indices
 
     def initialize(self, extracted_global_state: Any) -> None:
         """
@@ -135,11 +213,36 @@ class TagActivator(Activator):
             tagger.initialize()
 
         self._event_handlers = sum((tagger.get_event_handlers() for tagger in self._taggers), [])
-        self._event_handler_tagger_dictionary = {event_handler: tagger
-                                                 for tagger in self._taggers
-                                                 for event_handler in tagger.get_event_handlers()}
-        self._running_event_handlers = {tagger: [] for tagger in self._taggers}
-        self._not_running_event_handlers = {tagger: copy.copy(tagger.get_event_handlers()) for tagger in self._taggers}
+        self._event_handler_tagger_indices = {event_handler: index
+                                              for index, tagger in enumerate(self._taggers)
+                                              for event_handler in tagger.get_event_handlers()}
+        # The stacks of running and not-running event handlers are never replaced, so that they can be stored directly
+        # in the compiled tuples of the creates and trashes lists.
+        self._running_event_handlers = [[] for _ in self._taggers]
+        self._not_running_event_handlers = [copy.copy(tagger.get_event_handlers()) for tagger in self._taggers]
+        # For each tagger that trashes selectively, the running event handlers are mapped onto their in-state
+        # identifiers and vice versa. In the validation mode, the in-state identifiers of the events that would have
+        # been kept are collected instead.
+        self._event_handler_identifiers = {}
+        self._running_identifiers = [{} if index in self._selective_trash_tagger_indices else None
+                                     for index in range(len(self._taggers))]
+        self._validation_identifiers = [set() if index in self._selective_trash_tagger_indices else None
+                                        for index in range(len(self._taggers))]
+        self._create_stacks = [tuple((self._taggers[index], index, self._not_running_event_handlers[index],
+                                      self._running_event_handlers[index], self._running_identifiers[index])
+                                     for index in indices)
+                               for indices in self._create_tagger_indices]
+        # A tagger only keeps events after an event of the preceding tagger if it is also created by the preceding
+        # tagger and if its activation is not changed by the preceding tagger.
+        self._trash_stacks = [tuple((index, self._not_running_event_handlers[index],
+                                     self._running_event_handlers[index], self._running_identifiers[index],
+                                     self._running_identifiers[index] is not None
+                                     and index in self._create_tagger_indices[preceding_index]
+                                     and self._taggers[index] not in self._activate_taggers[preceding_index]
+                                     and self._taggers[index] not in self._deactivate_taggers[preceding_index])
+                                    for index in indices)
+                              for preceding_index, indices in enumerate(self._trash_tagger_indices)]
+        self._maximum_numbers_event_handlers = [len(tagger.get_event_handlers()) for tagger in self._taggers]
 
         # Search the one and only instance of StartOfRunEventHandler
         self._start_of_run_event_handler = None
@@ -156,6 +259,8 @@ class TagActivator(Activator):
         """
         Return the sequence of all event handlers.
 
+        New event handlers that are created during the run are appended to the returned sequence.
+
         Returns
         -------
         Sequence[event_handler.EventHandler]
@@ -163,6 +268,51 @@ class TagActivator(Activator):
         """
         return self._event_handlers
 
+    def _create_event_handler(self, tagger_index: int) -> EventHandler:
+        """
+        Let the tagger with the given index create a new event handler, register it in this class, and log the new size
+        of the pool of the tagger if it reached a new maximum.
+        """
+        tagger = self._taggers[tagger_index]
+        if self._event_handlers_fixed:
+            raise TagActivatorError("Not-running event handler list of the tagger {0} is empty. "
+                                    "Increase the number of event handlers of this tagger."
+                                    .format(tagger.__class__.__name__))
+        event_handler = tagger.create_event_handler()
+        self._event_handler_tagger_indices[event_handler] = tagger_index
+        self._event_handlers.append(event_handler)
+        number_event_handlers = len(tagger.get_event_handlers())
+        if number_event_handlers > self._maximum_numbers_event_handlers[tagger_index]:
+            self._maximum_numbers_event_handlers[tagger_index] = number_event_handlers
+            logging.getLogger(__name__).info("The tagger {0} created a new event handler. The maximum number of event "
+                                             "handlers of this tagger is now {1}."
+                                             .format(tagger.tag, number_event_handlers))
+        return event_handler
+
+    def _shrink_event_handler_pool(self, tagger_index: int, preceding_event_handler: EventHandler) -> None:
+        """
+        Release not-running event handlers of the tagger with the given index until the initial number of event handlers
+        of the tagger is reached.
+
+        The preceding event handler is never released because it is still required in the next call of the
+        get_event_handlers_to_run method.
+        """
+        tagger = self._taggers[tagger_index]
+        not_running_event_handlers = self._not_running_event_handlers[tagger_index]
+        number_surplus_event_handlers = len(tagger.get_event_handlers()) - tagger.number_event_handlers
+        index = 0
+        while number_surplus_event_handlers > 0 and index < len(not_running_event_handlers):
+            event_handler = not_running_event_handlers[index]
+            if event_handler is preceding_event_handler:
+                index += 1
+                continue
+            del not_running_event_handlers[index]
+            tagger.remove_event_handler(event_handler)
+            del self._event_handler_tagger_indices[event_handler]
+            self._event_handlers.remove(event_handler)
+            self._released_event_handlers.append(event_handler)
+            number_surplus_event_handlers -= 1
+
     def get_event_handlers_to_run(self, extracted_active_global_state: Any, preceding_event_handler: EventHandler) \
             -> Dict[EventHandler, Union[Sequence[Any], None]]:
         """
@@ -175,8 +325,8 @@ class TagActivator(Activator):
         redirected to _get_event_handlers_to_run_update.
         For this call, the tagger containing the StartOfRunEventHandler will be asked to activate and deactivate other
         taggers. Then, the StartOfRunEventHandler is returned together with its in-state identifiers.
-        Only 'not running' event handlers can be returned here. Returned event handlers are then stored internally as
-        'running'.
+        Only 'not running' event handlers can be returned here. If a tagger has no 'not running' event handlers left,
+        it creates a new one. Returned event handlers are then stored internally as 'running'.
         Overwrites the get_event_handlers_to_run method of the abstract Activator class.
         The precise format of the extracted_active_global_state is specified by the used state handler. Since it is
         just passed through to the taggers and the internal states, only these need to be implemented for different
@@ -200,27 +350,28 @@ class TagActivator(Activator):
             If the preceding_event_handler is not None or the length of the active_units sequence is unequal zero.
         base.exceptions.TagActivatorError
             If the list of not running event handlers of a tagger is empty but an event handler of this tagger should
-            be run.
+            be run, and the fix_event_handlers method was called before.
         """
         assert preceding_event_handler is None
         event_handlers_identifiers_dictionary = {}
-        start_of_run_tagger = self._event_handler_tagger_dictionary[self._start_of_run_event_handler]
-        for tagger in self._activate_taggers[start_of_run_tagger]:
+        start_of_run_tagger_index = self._event_handler_tagger_indices[self._start_of_run_event_handler]
+        start_of_run_tagger = self._taggers[start_of_run_tagger_index]
+        for tagger in self._activate_taggers[start_of_run_tagger_index]:
             tagger.activate()
-        for tagger in self._deactivate_taggers[start_of_run_tagger]:
+        for tagger in self._deactivate_taggers[start_of_run_tagger_index]:
             tagger.deactivate()
 
         for identifiers_send_event_time in start_of_run_tagger.yield_identifiers_send_event_time(
                 extracted_active_global_state):
             try:
-                event_handler = self._not_running_event_handlers[start_of_run_tagger].pop()
+                event_handler = self._not_running_event_handlers[start_of_run_tagger_index].pop()
             except IndexError:
-                raise TagActivatorError("Not-running event handler list of the tagger {0} is empty. "
-                                        "Increase the number of event handlers of this tagger."
-                                        .format(start_of_run_tagger.__class__.__name__))
+                event_handler = self._create_event_handler(start_of_run_tagger_index)
 
-            self._running_event_handlers[start_of_run_tagger].append(event_handler)
+            self._running_event_handlers[start_of_run_tagger_index].append(event_handler)
             event_handlers_identifiers_dictionary[event_handler] = identifiers_send_event_time
+        if self._selective_trash_tagger_indices:
+            self._touched_root_identifiers(extracted_active_global_state)
         # noinspection PyAttributeOutsideInit
         self.get_event_handlers_to_run = self._get_event_handlers_to_run_update
         return event_handlers_identifiers_dictionary
@@ -242,8 +393,8 @@ class TagActivator(Activator):
         3. Update the internal state based on the active global state information.
         4. Ask each tagger in the creates list of the preceding_event_tagger for the event handlers and their in-states
         identifiers.
-        Only 'not running' event handlers can be returned here. Returned event handlers are then stored internally as
-        'running'.
+        Only 'not running' event handlers can be returned here. If a tagger has no 'not running' event handlers left,
+        it creates a new one. Returned event handlers are then stored internally as 'running'.
         The precise format of the extracted_active_global_state is specified by the used state handler. Since it is
         just passed through to the taggers and the internal states, only these need to be implemented for different
         versions of state handlers.
@@ -264,57 +415,200 @@ class TagActivator(Activator):
         ------
         base.exceptions.TagActivatorError
             If the list of not running event handlers of a tagger is empty but an event handler of this tagger should
-            be run.
+            be run, and the fix_event_handlers method was called before.
         """
-        preceding_event_tagger = self._event_handler_tagger_dictionary[preceding_event_handler]
-        for tagger in self._activate_taggers[preceding_event_tagger]:
+        preceding_event_tagger_index = self._event_handler_tagger_indices[preceding_event_handler]
+        for tagger in self._activate_taggers[preceding_event_tagger_index]:
             tagger.activate()
-        for tagger in self._deactivate_taggers[preceding_event_tagger]:
+        for tagger in self._deactivate_taggers[preceding_event_tagger_index]:
             tagger.deactivate()
         event_handlers_identifiers_dictionary = {}
 
         for internal_state in self._internal_states:
             internal_state.update(extracted_active_global_state)
 
-        for tagger in self._create_taggers[preceding_event_tagger]:
-            for identifiers_send_event_time in tagger.yield_identifiers_send_event_time(extracted_active_global_state):
-                try:
-                    event_handler = self._not_running_event_handlers[tagger].pop()
-                except IndexError:
-                    raise TagActivatorError("Not-running event handler list of the tagger {0} is empty. "
-                                            "Increase the number of event handlers of this tagger."
-                                            .format(tagger.__class__.__name__))
-                self._running_event_handlers[tagger].append(event_handler)
-                event_handlers_identifiers_dictionary[event_handler] = identifiers_send_event_time
+        for tagger, tagger_index, not_running_event_handlers, running_event_handlers, running_identifiers in \
+                self._create_stacks[preceding_event_tagger_index]:
+            if running_identifiers is None:
+                for identifiers_send_event_time in tagger.yield_identifiers_send_event_time(
+                        extracted_active_global_state):
+                    try:
+                        event_handler = not_running_event_handlers.pop()
+                    except IndexError:
+                        event_handler = self._create_event_handler(tagger_index)
+                    running_event_handlers.append(event_handler)
+                    event_handlers_identifiers_dictionary[event_handler] = identifiers_send_event_time
+            else:
+                self._create_selectively(tagger, tagger_index, extracted_active_global_state,
+                                         event_handlers_identifiers_dictionary)
         return event_handlers_identifiers_dictionary
 
-    def get_trashable_events(self, preceding_event_handler: EventHandler) -> List[EventHandler]:
+    def _create_selectively(self, tagger: Tagger, tagger_index: int, extracted_active_global_state: Any,
+                            event_handlers_identifiers_dictionary: Dict[EventHandler, Union[Sequence[Any], None]]) \
+            -> None:
+        """
+        Add the event handlers to run of a tagger that trashes selectively to the given dictionary.
+
+        No event handler is run for in-state identifiers whose event was kept in the scheduler. In the validation mode,
+        this method checks that the in-state identifiers of all events that would have been kept are generated again.
+        """
+        not_running_event_handlers = self._not_running_event_handlers[tagger_index]
+        running_event_handlers = self._running_event_handlers[tagger_index]
+        running_identifiers = self._running_identifiers[tagger_index]
+        generated_identifiers = set()
+        for identifiers_send_event_time in tagger.yield_identifiers_send_event_time(extracted_active_global_state):
+            if identifiers_send_event_time is not None:
+                generated_identifiers.add(identifiers_send_event_time)
+                if identifiers_send_event_time in running_identifiers:
+                    continue
+            try:
+                event_handler = not_running_event_handlers.pop()
+            except IndexError:
+                event_handler = self._create_event_handler(tagger_index)
+            running_event_handlers.append(event_handler)
+            event_handlers_identifiers_dictionary[event_handler] = identifiers_send_event_time
+            if identifiers_send_event_time is not None:
+                running_identifiers[identifiers_send_event_time] = event_handler
+                self._event_handler_identifiers[event_handler] = identifiers_send_event_time
+        validation_identifiers = self._validation_identifiers[tagger_index]
+        if validation_identifiers:
+            if not validation_identifiers <= generated_identifiers:
+                raise TagActivatorError("The tagger {0} did not create events for the in-state identifiers {1} that "
+                                        "would have been kept by the selective trashing."
+                                        .format(tagger.tag, validation_identifiers - generated_identifiers))
+            validation_identifiers.clear()
+
+    def get_trashable_events(self, preceding_event_handler: EventHandler,
+                             extracted_active_global_state: Any = None) -> List[EventHandler]:
         """
         Return the event handlers whose events should be trashed in the scheduler.
 
         The method asks each tagger in the trashes list of the preceding_event_tagger for the event handlers to trash.
         The preceding_event_handler should also be returned in this method. Returned event handlers are stored
-        internally as 'not running' so that they can be returned by get_new_event_handlers_to_run again.
+        internally as 'not running' so that they can be returned by get_new_event_handlers_to_run again. If the pools of
+        event handlers should shrink, surplus 'not running' event handlers of the taggers in the trashes list are
+        released afterwards.
+        The taggers in the selective_trash_tags argument of this class only trash the events whose in-states contain a
+        unit of a root unit whose velocities were changed by the preceding event. The changed velocities are determined
+        from the extracted active global state after the preceding event was committed. If it is not given, all events
+        are trashed.
         Overwrites the get_trashable_events method of the abstract Activator class.
 
         Parameters
         ----------
         preceding_event_handler : event_handler.EventHandler
             The event handler which committed the preceding event to the global state.
+        extracted_active_global_state : Any or None, optional
+            The extracted active global state information after the preceding event was committed.
 
         Returns
         -------
         List[event_handler.EventHandler]
             The sequence of event handlers whose events should be trashed in the scheduler.
         """
+        touched_root_identifiers = (self._touched_root_identifiers(extracted_active_global_state)
+                                    if self._selective_trash_tagger_indices else None)
         trashable_events = []
-        for tagger in self._trash_taggers[self._event_handler_tagger_dictionary[preceding_event_handler]]:
-            trashable_events += self._running_event_handlers[tagger]
-            self._not_running_event_handlers[tagger] += self._running_event_handlers[tagger]
-            self._running_event_handlers[tagger] = []
+        for tagger_index, not_running_event_handlers, running_event_handlers, running_identifiers, selective in \
+                self._trash_stacks[self._event_handler_tagger_indices[preceding_event_handler]]:
+            if selective and touched_root_identifiers is not None:
+                self._trash_selectively(tagger_index, preceding_event_handler, touched_root_identifiers,
+                                        trashable_events)
+            else:
+                trashable_events.extend(running_event_handlers)
+                not_running_event_handlers.extend(running_event_handlers)
+                if running_identifiers is not None:
+                    for event_handler in running_event_handlers:
+                        self._event_handler_identifiers.pop(event_handler, None)
+                    running_identifiers.clear()
+                running_event_handlers.clear()
+            if self._shrink_event_handler_pools:
+                self._shrink_event_handler_pool(tagger_index, preceding_event_handler)
         assert preceding_event_handler in trashable_events
         return trashable_events
 
+    def _trash_selectively(self, tagger_index: int, preceding_event_handler: EventHandler,
+                           touched_root_identifiers: Set[Any], trashable_events: List[EventHandler]) -> None:
+        """
+        Append the event handlers of a tagger that trashes selectively whose in-states were modified to the list of
+        trashable events.
+
+        In the validation mode, all event handlers are trashed and the in-state identifiers of the events that would
+        have been kept are stored.
+        """
+        not_running_event_handlers = self._not_running_event_handlers[tagger_index]
+        running_event_handlers = self._running_event_handlers[tagger_index]
+        running_identifiers = self._running_identifiers[tagger_index]
+        kept_event_handlers = []
+        for event_handler in running_event_handlers:
+            identifiers = self._event_handler_identifiers.get(event_handler)
+            if (event_handler is not preceding_event_handler and identifiers is not None
+                    and not any(identifier[0] in touched_root_identifiers for identifier in identifiers)):
+                if not self._validate_selective_trash:
+                    kept_event_handlers.append(event_handler)
+                    continue
+                self._validation_identifiers[tagger_index].add(identifiers)
+            trashable_events.append(event_handler)
+            not_running_event_handlers.append(event_handler)
+            if identifiers is not None:
+                del self._event_handler_identifiers[event_handler]
+                running_identifiers.pop(identifiers, None)
+        running_event_handlers[:] = kept_event_handlers
+
+    def _touched_root_identifiers(self, extracted_active_global_state: Any) -> Optional[Set[Any]]:
+        """
+        Return the identifiers of the root units whose velocities changed since the last call of this method, and store
+        the velocities of the given extracted active global state.
+
+        The extracted active global state is a sequence of root cnodes of branches whose values are units. If the
+        velocities of the last call are not known, None is returned.
+        """
+        if extracted_active_global_state is None:
+            self._velocities = None
+            return None
+        velocities = {}
+        nodes = list(extracted_active_global_state)
+        while nodes:
+            node = nodes.pop()
+            velocity = node.value.velocity
+            velocities[node.value.identifier] = tuple(velocity) if velocity is not None else None
+            nodes.extend(node.children)
+        previous_velocities = self._velocities
+        self._velocities = velocities
+        if previous_velocities is None:
+            return None
+        return {identifier[0] for identifier in previous_velocities.keys() | velocities.keys()
+                if previous_velocities.get(identifier) != velocities.get(identifier)}
+
+    def get_released_event_handlers(self) -> List[EventHandler]:
+        """
+        Return the event handlers that were released since the last call of this method.
+
+        Event handlers are only released if the pools of event handlers should shrink. Released event handlers were
+        removed from their tagger and from the list returned by the get_event_handlers method.
+        Overwrites the get_released_event_handlers method of the abstract Activator class.
+
+        Returns
+        -------
+        List[event_handler.EventHandler]
+            The list of released event handlers.
+        """
+        released_event_handlers = self._released_event_handlers
+        if released_event_handlers:
+            self._released_event_handlers = []
+        return released_event_handlers
+
+    def fix_event_handlers(self) -> None:
+        """
+        Prevent the taggers from creating or releasing event handlers during the run.
+
+        After a call of this method, a TagActivatorError is raised if all event handlers of a tagger are running but
+        another event handler of this tagger should be run.
+        Overwrites the fix_event_handlers method of the abstract Activator class.
+        """
+        self._event_handlers_fixed = True
+        self._shrink_event_handler_pools = False
+
     def get_info_internal_state(self, event_handler_asking: EventHandler, identifier_in_internal_state: Any) -> Any:
         """
         Return the global state identifier associated to the identifier of the internal state.
@@ -340,4 +634,5 @@ class TagActivator(Activator):
         Any
             The global state identifier associated with the internal state identifier.
         """
-        return self._event_handler_tagger_dictionary[event_handler_asking].internal_state[identifier_in_internal_state]
+        return self._taggers[self._event_handler_tagger_indices[event_handler_asking]].internal_state[
+            identifier_in_internal_state]
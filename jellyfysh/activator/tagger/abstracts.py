@@ -62,8 +62,8 @@ class TaggerWithInternalState(Tagger, metaclass=ABCMeta):
         event_handler : event_handler.EventHandler
             A single event handler instance.
         number_event_handlers : int
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         internal_state_label : str
             The label of the internal state this tagger wants to use.
         tag : str or None, optional
@@ -89,7 +89,7 @@ class TaggerWithInternalState(Tagger, metaclass=ABCMeta):
         internal states. If a tagger needs to further initialize its event handler in the self._event_handler_to_copy
         attribute (for example, with a cell system), it should extend this method.
 
-        The subsequent call of the initialize method will then deepcopy the initialized event handler to create all
+        The subsequent call of the initialize method will then clone the initialized event handler to create all
         event handlers for this tagger.
 
         Parameters
@@ -57,8 +57,8 @@ class ActiveRootUnitInStateTagger(Tagger):
         event_handler : event_handler.EventHandler
             A single event handler instance.
         number_event_handlers : int, optional
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         tag : str or None, optional
             Tag used in all four lists (also of other taggers). If None, the class name (or the alias set in the
             factory) will be used as the tag.
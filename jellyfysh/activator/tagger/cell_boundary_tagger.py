@@ -69,8 +69,8 @@ class CellBoundaryTagger(TaggerWithInternalState):
         internal_state_label : str
             The label of the internal state this tagger wants to use.
         number_event_handlers : int, optional
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         tag : str or None, optional
             Tag used in all four lists (also of other taggers). If None, the class name (or the alias set in the
             factory) will be used as the tag.
@@ -102,7 +102,7 @@ class CellBoundaryTagger(TaggerWithInternalState):
 
         This method checks if the internal state of this tagger is a cell-occupancy system. Also, the cell boundary
         event handler in the self._event_handler_to_copy attribute gets knowledge about the cell system and the cell
-        level of the cell-occupancy system. This event handler is deepcopied in the subsequent call of the initialize
+        level of the cell-occupancy system. This event handler is cloned in the subsequent call of the initialize
         method to create the desired number of (initialized) event handlers for this tagger (see Tagger base class).
 
         Parameters
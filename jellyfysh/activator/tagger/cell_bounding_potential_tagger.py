@@ -67,8 +67,8 @@ class CellBoundingPotentialTagger(TaggerWithInternalState):
         event_handler : event_handler.cell_boundary_event_handler.CellBoundaryEventHandler
             A single event handler instance.
         number_event_handlers : int
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         internal_state_label : str
             The label of the internal state this tagger wants to use.
         tag : str or None, optional
@@ -104,7 +104,7 @@ class CellBoundingPotentialTagger(TaggerWithInternalState):
 
         This method checks if the internal state of this tagger is a cell-occupancy system. Also, the cell bounding
         potential event handler in the self._event_handler_to_copy attribute gets knowledge about the cell system, and
-        is initialized itself. This event handler is deepcopied in the subsequent call of the initialize method to
+        is initialized itself. This event handler is cloned in the subsequent call of the initialize method to
         create the desired number of (initialized) event handlers for this tagger (see Tagger base class).
 
         Parameters
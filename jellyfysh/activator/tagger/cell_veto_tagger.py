@@ -43,7 +43,9 @@ class CellVetoTagger(TaggerWithInternalState):
 
     This class does not deal with exceptional target particles, i.e. particles in excluded cells and surplus particles.
     These should be taken care of with the ExcludedCellsTagger and the SurplusCellsTagger.
-    This tagger only works for a single active unit on the cell level of the cell-occupancy system.
+    If the cell-occupancy system tracks several active units on its cell level (see MultiActiveCellOccupancy class),
+    the in-states of the different active units are generated independently. The number of event handlers should then
+    be at least the number of active units that are relevant to the cell-occupancy system.
 
     This class is designed to work together with the TreeStateHandler. The in-state identifiers are then a sequence of
     tuples of integers, where the tuples can have different lengths. Each tuple in the sequence specifies a particle in
@@ -74,8 +76,8 @@ class CellVetoTagger(TaggerWithInternalState):
         internal_state_label : str
             The label of the internal state this tagger wants to use.
         number_event_handlers : int, optional
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         tag : str or None, optional
             Tag used in all four lists (also of other taggers). If None, the class name (or the alias set in the
             factory) will be used as the tag.
@@ -107,9 +109,11 @@ class CellVetoTagger(TaggerWithInternalState):
 
         This method checks if the internal state of this tagger is a cell-occupancy system. Also, the cell veto
         event handler in the self._event_handler_to_copy attribute gets knowledge about the cell system, and the cell
-        level of the cell-occupancy system. By this, the event handler is initialized. This event handler is deepcopied
-        in the subsequent call of the initialize method to create the desired number of (initialized) event handlers for
-        this tagger (see Tagger base class).
+        level of the cell-occupancy system. By this, the event handler is initialized. Finally, the event handler gets
+        knowledge about the cell-occupancy system. This event handler is cloned in the subsequent call of the initialize
+        method to create the desired number of (initialized) event handlers for this tagger (see Tagger base class).
+        Since the clones share the samplers of target cells with this event handler, all event handlers use the
+        cell-occupancy system of this tagger.
 
         Parameters
         ----------
@@ -127,6 +131,8 @@ class CellVetoTagger(TaggerWithInternalState):
                                      "the internal state.".format(self.__class__.__name__))
         # noinspection PyUnresolvedReferences
         self._event_handler_to_copy.initialize(self._internal_state.cells, self._internal_state.cell_level)
+        # noinspection PyUnresolvedReferences
+        self._event_handler_to_copy.set_cell_occupancy(self._internal_state)
 
     def yield_identifiers_send_event_time(
             self, extracted_active_global_state: Sequence[Node]) -> Iterable[Tuple[StateId]]:
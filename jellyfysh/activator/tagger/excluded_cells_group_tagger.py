@@ -0,0 +1,157 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the ExcludedCellsGroupTagger class."""
+import logging
+from typing import Iterable, Sequence, Tuple
+from jellyfysh.activator.internal_state import InternalState
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node
+from jellyfysh.event_handler import EventHandler
+import jellyfysh.setting as setting
+from jellyfysh.state_handler.tree_state_handler import StateId
+from .excluded_cells_tagger import ExcludedCellsTagger
+
+
+class ExcludedCellsGroupTagger(ExcludedCellsTagger):
+    """
+    Tagger which generates a single in-state for each active unit in the cell-occupancy system consisting of the active
+    unit identifier and all identifiers in excluded nearby cells.
+
+    Whereas the ExcludedCellsTagger generates one pairwise in-state for each identifier in the excluded cells, this
+    tagger groups all of them into one in-state. The event handler of this tagger should therefore treat all factors
+    between the active unit and the units in the excluded cells at once (see, e.g., the TwoLeafUnitGroupEventHandler
+    class). Then, a single event handler per active unit is sufficient.
+
+    This tagger only works with a cell-occupancy system as the internal state. If the cell-occupancy system tracks
+    several active units (see MultiActiveCellOccupancy class), one in-state is generated for each active unit. If the
+    excluded cells of an active unit are empty, no in-state is generated for it.
+
+    Optionally, this tagger appends the identifiers of all other leaf units within the composite object of the active
+    leaf unit to each in-state (if they are not already located in the excluded cells). The event handler can then also
+    treat the factors within the composite object (for example, the tether of a hard-disk dipole) in the same call
+    (see the composite_object_potential argument of the TwoLeafUnitGroupEventHandler class). This requires that the
+    cell-occupancy system stores leaf units of composite objects with two node levels.
+
+    This class is designed to work together with the TreeStateHandler. The in-state identifiers are then a sequence of
+    tuples of integers, where the tuples can have different lengths. Each tuple in the sequence specifies a particle in
+    the global state (see StateId in state_handler.tree_state_handler.py).
+    """
+
+    def __init__(self, create: Sequence[str], trash: Sequence[str], event_handler: EventHandler,
+                 number_event_handlers: int, internal_state_label: str, tag: str = None,
+                 include_composite_object: bool = False) -> None:
+        """
+        The constructor of the ExcludedCellsGroupTagger class.
+
+        Parameters
+        ----------
+        create : Sequence[str]
+            Sequence of tags to create after an event handler of this tagger has committed an event to the global state.
+        trash : Sequence[str]
+            Sequence of tags to trash after an event handler of this tagger has committed an event to the global state.
+        event_handler : event_handler.EventHandler
+            A single event handler instance.
+        number_event_handlers : int
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
+        internal_state_label : str
+            The label of the internal state this tagger wants to use.
+        tag : str or None, optional
+            Tag used in all four lists (also of other taggers). If None, the class name (or the alias set in the
+            factory) will be used as the tag.
+        include_composite_object : bool, optional
+            Whether the identifiers of the other leaf units within the composite object of the active leaf unit are
+            appended to each in-state.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
+                           event_handler=event_handler.__class__.__name__, number_event_handlers=number_event_handlers,
+                           internal_state_label=internal_state_label, create=create, trash=trash, tag=tag,
+                           include_composite_object=include_composite_object)
+        super().__init__(create, trash, event_handler, number_event_handlers=number_event_handlers,
+                         internal_state_label=internal_state_label, tag=tag)
+        self._include_composite_object = include_composite_object
+
+    def initialize_with_internal_states(self, internal_states: Sequence[InternalState]) -> None:
+        """
+        Initialize the tagger based on the initialized internal states.
+
+        Extends the initialize_with_internal_states method of the ExcludedCellsTagger class. If the identifiers of the
+        composite object of the active leaf unit should be included, this method checks that the cell-occupancy system
+        stores leaf units of composite objects with two node levels.
+
+        Parameters
+        ----------
+        internal_states : Sequence[activator.internal_state.InternalState]
+            Sequence of all initialized internal states in the activator.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the internal state is not an instance of CellOccupancy.
+        base.exceptions.ConfigurationError
+            If the composite object should be included but the cell-occupancy system does not store leaf units of
+            composite objects with two node levels.
+        """
+        super().initialize_with_internal_states(internal_states)
+        if self._include_composite_object and not (self._internal_state.cell_level == setting.number_of_node_levels
+                                                   == 2):
+            raise ConfigurationError("The tagger {0} can only include the composite object of the active leaf unit "
+                                     "if the cell-occupancy system stores leaf units of composite objects with two "
+                                     "node levels.".format(self.__class__.__name__))
+
+    def yield_identifiers_send_event_time(
+            self, extracted_active_global_state: Sequence[Node]) -> Iterable[Tuple[StateId, ...]]:
+        """
+        Generate grouped in-state identifiers for the send_event_time method of this tagger's event handlers.
+
+        The in-state identifiers will be transformed into real in-states using the state handler via the mediator.
+        The active global state is given by a sequence of root cnodes where each cnode branch only contains active
+        units. The in-state identifiers are generated as a tuple of global state identifiers.
+
+        The generated in-states contain the active identifier in the cell-occupancy system followed by every stored
+        identifier in the excluded cells. If the composite object should be included, the identifiers of the other leaf
+        units within the composite object of the active leaf unit follow (unless they are stored in the excluded
+        cells).
+
+        Parameters
+        ----------
+        extracted_active_global_state : Sequence[base.node.Node]
+            The active global state information.
+
+        Yields
+        ------
+        Tuple[activator.tag_activator.StateId, ...]
+            The global state in-state identifiers.
+        """
+        for active_cell, active_identifier in self._internal_state.yield_active_cells():
+            occupant_identifiers = tuple(occupant_identifier
+                                         for nearby_cell in self._internal_state.cells.nearby_cells(active_cell)
+                                         for occupant_identifier in self._internal_state[nearby_cell])
+            if self._include_composite_object:
+                occupant_identifiers += tuple(
+                    composite_object_identifier for composite_object_identifier in
+                    ((active_identifier[0], index) for index in range(setting.number_of_nodes_per_root_node)
+                     if index != active_identifier[1])
+                    if composite_object_identifier not in occupant_identifiers)
+            if occupant_identifiers:
+                yield (active_identifier,) + occupant_identifiers
@@ -59,8 +59,8 @@ class FactorTypeMapInStateTagger(Tagger):
         event_handler : event_handler.cell_boundary_event_handler.CellBoundaryEventHandler
             A single event handler instance.
         number_event_handlers : int
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         factor_type_maps: activator.tagger.factor_type_maps.FactorTypeMaps
             The factor type maps instance which parses the factor type maps out of a file.
         tag : str or None, optional
@@ -21,6 +21,7 @@
 #
 """Module for the FactorTypeMaps class."""
 from abc import ABCMeta, abstractmethod
+from array import array
 from copy import copy
 import logging
 import re
@@ -88,11 +89,21 @@ class FactorTypeMaps(object):
     The factor type maps can be used by the FactorTypeMapInStateTagger, which will assume the same factors given for
     two composite point objects between all composite point objects. In this class, also the mapping from the factor
     name given here onto the event handlers which handle the in-states will take place.
+
+    Per default, the factor type maps generate the in-state identifiers of the factors by looping over all composite
+    point objects whenever they are asked for the factors of an active unit. For large systems, the factors can instead
+    be precomputed into a table that is indexed by the global index of the active leaf unit
+    (root_node_number * setting.number_of_nodes_per_root_node + leaf_node_number). A row of this table stores the
+    global indices of the leaf units of all factors of the leaf unit in flat integer arrays, from which the in-state
+    identifiers are constructed on request. The rows are either computed all at once when a factor type map is first
+    requested, or lazily when a leaf unit becomes active for the first time. The number of stored identifiers together
+    with an estimate of the required memory is logged after all rows were computed at once, or whenever another quarter
+    of the rows was computed lazily.
     """
 
     _instance = None
 
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, precompute_factors: bool = False, lazy_precomputation: bool = True) -> None:
         """
         The constructor of the FactorTypeMaps class.
 
@@ -106,15 +117,22 @@ class FactorTypeMaps(object):
         ----------
         filename : str
             The filename out of which the factor type maps should be parsed.
+        precompute_factors : bool, optional
+            Whether the factors of each leaf unit are stored in a table instead of being generated in each call.
+        lazy_precomputation : bool, optional
+            Whether the rows of the table are only computed when the corresponding leaf unit becomes active for the
+            first time.
 
         Raises
         ------
         AttributeError
             If it is tried to construct this class a second time with a different filename.
         """
-        log_init_arguments(_logger.debug, self.__class__.__name__, filename=filename)
+        log_init_arguments(_logger.debug, self.__class__.__name__, filename=filename,
+                           precompute_factors=precompute_factors, lazy_precomputation=lazy_precomputation)
         if not FactorTypeMaps._instance:
-            FactorTypeMaps._instance = FactorTypeMaps.__FactorTypeMaps(filename)
+            FactorTypeMaps._instance = FactorTypeMaps.__FactorTypeMaps(filename, precompute_factors,
+                                                                       lazy_precomputation)
         else:
             if FactorTypeMaps._instance.filename != filename:
                 raise AttributeError("Class {0} is created as a singleton and should only be created for one filename."
@@ -157,7 +175,7 @@ class FactorTypeMaps(object):
         The real FactorTypeMaps class used in _instance in the singleton class FactorTypeMaps.
         """
 
-        def __init__(self, filename: str) -> None:
+        def __init__(self, filename: str, precompute_factors: bool, lazy_precomputation: bool) -> None:
             """
             The constructor of the __FactorTypeMaps class.
 
@@ -168,6 +186,11 @@ class FactorTypeMaps(object):
             ----------
             filename : str
                 The filename out of which the factor type maps should be parsed.
+            precompute_factors : bool
+                Whether the factors of each leaf unit are stored in a table instead of being generated in each call.
+            lazy_precomputation : bool
+                Whether the rows of the table are only computed when the corresponding leaf unit becomes active for the
+                first time.
 
             Raises
             ------
@@ -178,6 +201,9 @@ class FactorTypeMaps(object):
             self._factors = {}
             self._instantiate_factor_type_maps(filename)
             self._filename = filename
+            self._precompute_factors = precompute_factors
+            self._lazy_precomputation = lazy_precomputation
+            self._precomputed_factors = {}
 
         def _instantiate_factor_type_maps(self, filename: str) -> None:
             line_pattern = re.compile(r"""
@@ -225,18 +251,30 @@ class FactorTypeMaps(object):
             factor : str
                 The name of the factor appearing in the parsed file.
 
+            If the factors should be precomputed, the factor type map is wrapped in a _PrecomputedFactorTypeMap, which
+            is only constructed once for each factor.
+
             Returns
             -------
-            activator.tagger.factor_type_maps._FactorTypeMap
+            activator.tagger.factor_type_maps._FactorTypeMapAbstractClass
                 The FactorTypeMap for the given factor.
             """
+            if factor in self._precomputed_factors.keys():
+                return self._precomputed_factors[factor]
             try:
-                return self._factors[factor]
+                factor_type_map = self._factors[factor]
             except KeyError:
                 _logger.warning("No factor type map given for factor {0}. "
                                 "Falling back on default map which maps from the active leaf unit onto all other leaf "
                                 "units which are not in the same composite point object.".format(factor))
-                return _AllLeafUnitFactorTypeMap()
+                factor_type_map = _AllLeafUnitFactorTypeMap()
+            if not self._precompute_factors:
+                return factor_type_map
+            precomputed_factor_type_map = _PrecomputedFactorTypeMap(factor_type_map, factor)
+            if not self._lazy_precomputation:
+                precomputed_factor_type_map.precompute()
+            self._precomputed_factors[factor] = precomputed_factor_type_map
+            return precomputed_factor_type_map
 
         @property
         def filename(self) -> str:
@@ -324,7 +362,12 @@ class _FactorTypeMap(_FactorTypeMapAbstractClass):
     def _yield_factor_identifier_local(self, active_identifier):
         assert len(active_identifier) == 2
         assert active_identifier[0] < setting.number_of_root_nodes
-        for target_leaf_node_number_list in self._map[active_identifier[1]]:
+        try:
+            target_leaf_node_number_lists = self._map[active_identifier[1]]
+        except KeyError:
+            raise FactorSetError("The leaf node number {0} does not appear in the local factor type map."
+                                 .format(active_identifier[1]))
+        for target_leaf_node_number_list in target_leaf_node_number_lists:
             yield tuple((active_identifier[0], target_leaf_node) for target_leaf_node in target_leaf_node_number_list)
 
     def _yield_factor_identifier_non_local(self, active_identifier):
@@ -392,3 +435,92 @@ class _AllLeafUnitFactorTypeMap(_FactorTypeMapAbstractClass):
             for leaf_node_number in range(setting.number_of_nodes_per_root_node):
                 # noinspection PyRedundantParentheses
                 yield (active_unit_identifier, (other_root_number, leaf_node_number))
+
+
+# noinspection PyMissingOrEmptyDocstring
+class _PrecomputedFactorTypeMap(_FactorTypeMapAbstractClass):
+    """
+    This class implements a factor type map which stores the factors of another factor type map in flat integer arrays.
+
+    Every in-state identifier of a factor is stored as the global index of its leaf unit in the _identifiers array. The
+    _factor_ends array stores the end of each factor in the _identifiers array. The factors of a leaf unit are stored
+    consecutively, and the start and the end of its row in the _factor_ends array are stored in the _row_starts and
+    _row_ends arrays, which are indexed by the global index of the leaf unit (the start is -1 if the row was not yet
+    computed). A row is computed on the first request unless all rows were computed in the precompute method. The
+    tuples of identifiers are only constructed on request. The size of the arrays is logged after the precompute method,
+    or whenever another quarter of the rows was computed on request.
+
+    Should only be constructed by the FactorTypeMaps class.
+    """
+    def __init__(self, factor_type_map, factor):
+        super().__init__()
+        self._factor_type_map = factor_type_map
+        self._factor = factor
+        self._number_of_leaf_units = setting.number_of_root_nodes * setting.number_of_nodes_per_root_node
+        self._identifiers = array("q")
+        self._factor_ends = array("q")
+        self._row_starts = array("q", [-1]) * self._number_of_leaf_units
+        self._row_ends = array("q", [0]) * self._number_of_leaf_units
+        self._number_computed_rows = 0
+        self._next_logged_quarter = 1
+
+    @staticmethod
+    def _index(active_unit_identifier):
+        if len(active_unit_identifier) == 1:
+            assert setting.number_of_nodes_per_root_node == 1
+            return active_unit_identifier[0]
+        assert len(active_unit_identifier) == 2
+        return active_unit_identifier[0] * setting.number_of_nodes_per_root_node + active_unit_identifier[1]
+
+    @staticmethod
+    def _identifier(index):
+        if setting.number_of_nodes_per_root_node == 1:
+            return (index,)
+        return divmod(index, setting.number_of_nodes_per_root_node)
+
+    def yield_factor_identifier(self, active_unit_identifier):
+        index = self._index(active_unit_identifier)
+        if self._row_starts[index] == -1:
+            self._compute_row(index, active_unit_identifier)
+            if 4 * self._number_computed_rows >= self._next_logged_quarter * self._number_of_leaf_units:
+                self._next_logged_quarter = 4 * self._number_computed_rows // self._number_of_leaf_units + 1
+                self._log_size()
+        factor_start = self._factor_ends[self._row_starts[index] - 1] if self._row_starts[index] > 0 else 0
+        for factor_end in self._factor_ends[self._row_starts[index]:self._row_ends[index]]:
+            yield tuple(self._identifier(identifier_index)
+                        for identifier_index in self._identifiers[factor_start:factor_end])
+            factor_start = factor_end
+
+    def _compute_row(self, index, active_unit_identifier):
+        self._row_starts[index] = len(self._factor_ends)
+        for factor in self._factor_type_map.yield_factor_identifier(active_unit_identifier):
+            self._identifiers.extend(self._index(identifier) for identifier in factor)
+            self._factor_ends.append(len(self._identifiers))
+        self._row_ends[index] = len(self._factor_ends)
+        self._number_computed_rows += 1
+
+    def precompute(self):
+        for index in range(self._number_of_leaf_units):
+            if self._row_starts[index] == -1:
+                self._compute_row(index, self._identifier(index))
+        self._next_logged_quarter = 5
+        self._log_size()
+
+    def _log_size(self):
+        _logger.info("Precomputed {0} factors with {1} in-state identifiers of {2} out of {3} leaf units for factor "
+                     "{4} (approximately {5} bytes).".format(self.number_factors, self.number_identifiers,
+                                                         self._number_computed_rows, self._number_of_leaf_units,
+                                                         self._factor, self.memory_size))
+
+    @property
+    def number_factors(self):
+        return len(self._factor_ends)
+
+    @property
+    def number_identifiers(self):
+        return len(self._identifiers)
+
+    @property
+    def memory_size(self):
+        return sum(len(integer_array) * integer_array.itemsize for integer_array in
+                   (self._identifiers, self._factor_ends, self._row_starts, self._row_ends))
@@ -36,7 +36,8 @@ class SurplusCellsTagger(TaggerWithInternalState):
     Tagger which generates pairwise in-states consisting of the active unit identifiers in the cell-occupancy system and
     all surplus identifiers.
 
-    This tagger only works with a cell-occupancy system as the internal state.
+    This tagger only works with a cell-occupancy system as the internal state. If the cell-occupancy system tracks
+    several active units (see MultiActiveCellOccupancy class), each of them is paired with all surplus identifiers.
 
     This class is designed to work together with the TreeStateHandler. The in-state identifiers are then a sequence of
     tuples of integers, where the tuples can have different lengths. Each tuple in the sequence specifies a particle in
@@ -62,8 +63,8 @@ class SurplusCellsTagger(TaggerWithInternalState):
         event_handler : event_handler.cell_boundary_event_handler.CellBoundaryEventHandler
             A single event handler instance.
         number_event_handlers : int
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         internal_state_label : str
             The label of the internal state this tagger wants to use.
         tag : str or None, optional
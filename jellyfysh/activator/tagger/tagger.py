@@ -21,7 +21,6 @@
 #
 """Module for the abstract Tagger class."""
 from abc import ABCMeta, abstractmethod
-from copy import deepcopy
 from typing import Iterable, List, Sequence, Tuple
 from jellyfysh.activator.internal_state import InternalState
 from jellyfysh.base.factory import get_alias
@@ -45,16 +44,20 @@ class Tagger(Initializer, metaclass=ABCMeta):
 
     On initialization, a tagger receives a single event handler instance that should be able to compute the events for
     the in-states that this tagger produces. Since there can be more than one event with the same tag simultaneously
-    in the scheduler, the event handler that was received on initialization is deepcopied in the initialize method of
-    this class. The number of created event handlers is set on initialization. The number of event handlers inside a
-    tagger should meet the maximum number of events with the given tag simultaneously in the scheduler.
-
-    Note that the initialize method, which deepcopies the event handler that is stored in the
-    self._event_handler_to_copy attribute, is called by the tag activator after the initialize_with_internal_states
-    method. Taggers might initialize their event handler in the self._event_handler_to_copy attribute with information
-    about the internal state (e.g., with a cell system). By this, the (possibly numerically complex) initialization
-    of an event handler has to be only run once, and the already initialized event handler is deepcopied to create
-    all event handlers that are available to this tagger.
+    in the scheduler, the event handler that was received on initialization is cloned in the initialize method of this
+    class (see the clone method of the EventHandler class). The number of initially created event handlers is set on
+    initialization. If more event handlers are needed during the run, further clones are created with the
+    create_event_handler method. The number of event handlers inside a tagger therefore only needs to meet the typical
+    number of events with the given tag simultaneously in the scheduler, and can also be reduced again with the
+    remove_event_handler method.
+
+    Note that the initialize method, which clones the event handler that is stored in the self._event_handler_to_copy
+    attribute, is called by the tag activator after the initialize_with_internal_states method. Taggers might
+    initialize their event handler in the self._event_handler_to_copy attribute with information about the internal
+    state (e.g., with a cell system). By this, the (possibly numerically complex) initialization of an event handler has
+    to be only run once, and the already initialized event handler is cloned to create all event handlers that are
+    available to this tagger. In the initialize method, an additional clone of this event handler is stored as the
+    template for all event handlers that are created later during the run. This template never computes any events.
 
     This class is designed to work together with the TreeStateHandler. The in-state identifiers are then a sequence of
     tuples of integers, where the tuples can have different lengths. Each tuple in the sequence specifies a particle in
@@ -76,8 +79,8 @@ class Tagger(Initializer, metaclass=ABCMeta):
         event_handler : event_handler.EventHandler
             A single event handler instance.
         number_event_handlers : int
-            Number of event handlers to prepare. The tagger will deepcopy the given event handler instance to create
-            this number of event handlers.
+            Number of event handlers to prepare. The tagger will clone the given event handler instance to create this
+            number of event handlers on initialization.
         tag : str or None, optional
             Tag used in all four lists (also of other taggers). If None, the class name (or the alias set in the
             factory) will be used as the tag.
@@ -101,6 +104,7 @@ class Tagger(Initializer, metaclass=ABCMeta):
         self._trashes = trash
         self._number_event_handlers = number_event_handlers
         self._event_handler_to_copy = event_handler
+        self._event_handler_template = None
         self._event_handlers = None
 
     @property
@@ -128,7 +132,7 @@ class Tagger(Initializer, metaclass=ABCMeta):
         Per default, this method does nothing. Some taggers might need to gain access to their internal state (if
         they need one), or their event handler in the self._event_handler_to_copy attribute should be initialized (for
         example, with a cell system). Such taggers must extend this method. The subsequent call of the initialize method
-        by the tag activator will then deepcopy the initialized event handler to create all event handlers for this
+        by the tag activator will then clone the initialized event handler to create all event handlers for this
         tagger.
 
         Parameters
@@ -140,25 +144,39 @@ class Tagger(Initializer, metaclass=ABCMeta):
 
     def initialize(self) -> None:
         """
-        Initialize the tagger by deepcopying the single instance of the event handler which was received on
-        initialization of this class.
+        Initialize the tagger by cloning the single instance of the event handler which was received on initialization
+        of this class.
 
         Extends the initialize method of the Initializer class. Use this method once in the beginning of the run to
         initialize the tagger. Only after a call of this method, other public methods of this class can be called
         without raising an error.
 
-        This method creates all event handlers of this tagger (accessible via the get_event_handlers method) by
-        deepcopying the self._event_handler_to_copy attribute. The number of event handlers that are created was set
-        on initialization of this class.
+        This method creates the initial event handlers of this tagger (accessible via the get_event_handlers method)
+        by cloning the self._event_handler_to_copy attribute. The number of event handlers that are created was set
+        on initialization of this class. Moreover, the template for event handlers that are created later by the
+        create_event_handler method is cloned.
 
         Note that this method is called after the initialize_with_internal_states method. There, the event handler
         that will be copied might have been initialized with information of the internal state. By this, the
         initialization of the event handler is only done once.
         """
         super().initialize()
-        self._event_handlers = [self._event_handler_to_copy] + [deepcopy(self._event_handler_to_copy)
+        self._event_handler_template = self._event_handler_to_copy.clone()
+        self._event_handlers = [self._event_handler_to_copy] + [self._event_handler_template.clone()
                                                                 for _ in range(1, self._number_event_handlers)]
 
+    @property
+    def number_event_handlers(self) -> int:
+        """
+        Return the number of event handlers that were created on initialization of this tagger.
+
+        Returns
+        -------
+        int
+            The initial number of event handlers.
+        """
+        return self._number_event_handlers
+
     @property
     def creates(self) -> Sequence[str]:
         """
@@ -222,6 +240,32 @@ class Tagger(Initializer, metaclass=ABCMeta):
         """
         return self._event_handlers
 
+    def create_event_handler(self) -> EventHandler:
+        """
+        Create a new event handler of this tagger by cloning the template event handler.
+
+        The new event handler is appended to the list of all event handlers of this tagger.
+
+        Returns
+        -------
+        event_handler.EventHandler
+            The new event handler.
+        """
+        event_handler = self._event_handler_template.clone()
+        self._event_handlers.append(event_handler)
+        return event_handler
+
+    def remove_event_handler(self, event_handler: EventHandler) -> None:
+        """
+        Remove the given event handler from the list of all event handlers of this tagger.
+
+        Parameters
+        ----------
+        event_handler : event_handler.EventHandler
+            The event handler to remove.
+        """
+        self._event_handlers.remove(event_handler)
+
     @abstractmethod
     def yield_identifiers_send_event_time(
             self, extracted_active_global_state: Sequence[Node]) -> Iterable[Tuple[StateId, ...]]:
@@ -85,7 +85,8 @@ class SchedulerError(Exception):
 class TagActivatorError(Exception):
     """
     Raised in the TagActivator class, when it tries to get an event handler to run for a certain tagger but all but
-    event handler for this tagger are already running.
+    event handler for this tagger are already running, and the tag activator is not allowed to create new event
+    handlers.
 
     For more details on the TagActivator class, see the activator.tag_activator module.
     """
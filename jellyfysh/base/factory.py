@@ -23,8 +23,8 @@
 from collections import abc
 from configparser import ConfigParser
 from importlib import import_module
+from importlib.util import find_spec
 from inspect import signature, Parameter
-from pkg_resources import resource_isdir
 import re
 import typing
 from jellyfysh.base import strings
@@ -38,6 +38,122 @@ used_sections = []
 """Sequence of section arguments of the build_from_config function calls."""
 
 
+class ConstructionPlan(object):
+    """
+    The resolved construction of the object in a section of the configuration.
+
+    A construction plan is created by the create_plan function which performs the reflection on the __init__ method of
+    the class, the conversion of all values to their types, and the checks for missing or unknown arguments. The
+    build_from_plan function then only imports the module and calls the constructor with the stored arguments. The
+    arguments are either instances of the simple types bool, float, int, and str, lists, or construction plans of user
+    defined classes. Since construction plans only store names of modules and classes, they can be pickled without the
+    classes.
+
+    Two construction plans are equal if they construct the same class with equal arguments within equal sections.
+    """
+
+    def __init__(self, section: str, package: str, module_name: str, class_name: str,
+                 arguments: typing.Mapping[str, typing.Any]) -> None:
+        """
+        The constructor of the ConstructionPlan class.
+
+        Parameters
+        ----------
+        section : str
+            The section in CamelCase.
+        package : str
+            The package which was handed to the create_plan function.
+        module_name : str
+            The full name of the module where the class is defined.
+        class_name : str
+            The real class name in CamelCase.
+        arguments : Mapping[str, Any]
+            The converted arguments of the __init__ method of the class in the order of its signature.
+        """
+        self.section = section
+        self.package = package
+        self.module_name = module_name
+        self.class_name = class_name
+        self.arguments = dict(arguments)
+
+    def yield_plans(self) -> typing.Iterator["ConstructionPlan"]:
+        """
+        Generate this construction plan and all construction plans in its arguments.
+
+        Yields
+        ------
+        ConstructionPlan
+            The construction plan.
+        """
+        yield self
+        for plan in _yield_plans(self.arguments.values()):
+            yield from plan.yield_plans()
+
+    def yield_sections(self) -> typing.Iterator[str]:
+        """
+        Generate the sections of this construction plan and of all construction plans in its arguments.
+
+        Yields
+        ------
+        str
+            The section.
+        """
+        for plan in self.yield_plans():
+            yield plan.section
+
+    def replace_sections(self, config: ConfigParser, sections: typing.Container[str]) -> "ConstructionPlan":
+        """
+        Return a copy of this construction plan where the plans of the given sections are created anew.
+
+        The plans of the given sections (together with all construction plans in their arguments) are created with the
+        create_plan function based on the given configuration. This is used to change single options of a construction
+        plan without creating the remaining plans again.
+
+        Parameters
+        ----------
+        config : configparser.ConfigParser
+            The configuration.
+        sections : Container[str]
+            The sections whose plans are created anew.
+
+        Returns
+        -------
+        ConstructionPlan
+            The copied construction plan.
+        """
+        if self.section in sections:
+            return create_plan(config, self.section, self.package,
+                               self.class_name if self.class_name != self.section else None)
+        return ConstructionPlan(self.section, self.package, self.module_name, self.class_name,
+                                {option: _replace_sections(value, config, sections)
+                                 for option, value in self.arguments.items()})
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, ConstructionPlan) and self.__dict__ == other.__dict__
+
+    def __repr__(self) -> str:
+        return "ConstructionPlan({0!r}, {1!r}, {2!r}, {3!r}, {4!r})".format(
+            self.section, self.package, self.module_name, self.class_name, self.arguments)
+
+
+def _yield_plans(values: typing.Iterable[typing.Any]) -> typing.Iterator[ConstructionPlan]:
+    """Generate the construction plans in the given arguments, also within lists."""
+    for value in values:
+        if isinstance(value, ConstructionPlan):
+            yield value
+        elif isinstance(value, list):
+            yield from _yield_plans(value)
+
+
+def _replace_sections(value: typing.Any, config: ConfigParser, sections: typing.Container[str]) -> typing.Any:
+    """Replace the construction plans of the given sections within an argument of a construction plan."""
+    if isinstance(value, ConstructionPlan):
+        return value.replace_sections(config, sections)
+    if isinstance(value, list):
+        return [_replace_sections(entry, config, sections) for entry in value]
+    return value
+
+
 def build_from_config(config: ConfigParser, section: str, package: str, class_name: str = None) -> typing.Any:
     """
     Construct the object in a section of the configuration.
@@ -67,7 +183,9 @@ def build_from_config(config: ConfigParser, section: str, package: str, class_na
     If there exists a package with the same snake_case name as the class name (given via the section or class_name),
     the package is changed to this package before trying to import the module given by the class name.
 
-    This function will append the section argument to the used_sections sequence of this module.
+    This function first creates the construction plan of the section with the create_plan function, and then constructs
+    the object with the build_from_plan function. It will append the section argument to the used_sections sequence of
+    this module.
 
     Parameters
     ----------
@@ -86,6 +204,49 @@ def build_from_config(config: ConfigParser, section: str, package: str, class_na
     Any
         The constructed object.
 
+    Raises
+    ------
+    ImportError
+        If the module given by the class name does not exist in the given package.
+    base.exceptions.ConfigurationError
+        If the section does not specify all needed arguments of the __init__ method to construct the class.
+        If the section specifies an argument which does not appear in the __init__ method of the class.
+    TypeError
+        If a type hint in the __init__ method is unsupported.
+        If a type hint specifies a boolean but the corresponding value is not recognized as one.
+    AssertionError
+        If the package does not start with 'jellyfysh.'.
+    """
+    return build_from_plan(create_plan(config, section, package, class_name))
+
+
+def create_plan(config: ConfigParser, section: str, package: str, class_name: str = None) -> ConstructionPlan:
+    """
+    Create the construction plan of the object in a section of the configuration.
+
+    This function resolves the module and the class of the section, and converts the values of the section (see the
+    build_from_config function for the conventions of the configuration). The construction plans of user defined
+    classes in the values are created recursively. No object is constructed.
+
+    This function will append the section argument to the used_sections sequence of this module.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The parsed configuration file.
+    section : str
+        The section in CamelCase.
+    package : str
+        The package where the object specified in the section is defined. The package must be part of the jellyfysh
+        package.
+    class_name : str or None, optional
+        If the section is an alias, this is the real class name in CamelCase.
+
+    Returns
+    -------
+    ConstructionPlan
+        The construction plan.
+
     Raises
     ------
     ImportError
@@ -110,14 +271,17 @@ def build_from_config(config: ConfigParser, section: str, package: str, class_na
 
     module_name = strings.to_snake_case(class_name)
     assert package.startswith("jellyfysh.")
-    if resource_isdir("jellyfysh", strings.to_directory_path(package[len("jellyfysh."):]) + "/" + module_name):
-        package = package + "." + module_name
+    class_package = package
+    # Only packages have submodule search locations
+    module_specification = find_spec(class_package + "." + module_name)
+    if module_specification is not None and module_specification.submodule_search_locations is not None:
+        class_package = class_package + "." + module_name
 
     try:
-        module = import_module(package + "." + module_name)
+        module = import_module(class_package + "." + module_name)
     except ImportError:
         raise ImportError("Module '{0}' (set by section name) not existing in package '{1}'."
-                          .format(module_name, package))
+                          .format(module_name, class_package))
 
     class_object = getattr(module, class_name)
     init_signature = signature(class_object.__init__)
@@ -140,17 +304,61 @@ def build_from_config(config: ConfigParser, section: str, package: str, class_na
                 "Tried to initialize object '{0}' with argument '{1}' in section '{2}', "
                 "which is not a possible argument of this class.".format(class_name, option, section))
 
-    if class_name != section:
+    return ConstructionPlan(section, package, class_package + "." + module_name, class_name, call_dictionary)
+
+
+def build_from_plan(plan: ConstructionPlan,
+                    object_built: typing.Callable[[ConstructionPlan, typing.Any], None] = None) -> typing.Any:
+    """
+    Construct the object of a construction plan.
+
+    The objects of the construction plans in the arguments are constructed first in the order of the arguments.
+    Aliased classes are constructed as in the build_from_config function.
+
+    Parameters
+    ----------
+    plan : ConstructionPlan
+        The construction plan.
+    object_built : Callable[[ConstructionPlan, Any], None] or None, optional
+        A function which is called with the construction plan and the constructed object directly after every
+        construction of an object (including the objects of the construction plans in the arguments).
+
+    Returns
+    -------
+    Any
+        The constructed object.
+
+    Raises
+    ------
+    ImportError
+        If the module of the construction plan does not exist.
+    """
+    class_object = getattr(import_module(plan.module_name), plan.class_name)
+    call_dictionary = {option: _build_argument(value, object_built) for option, value in plan.arguments.items()}
+    if plan.class_name != plan.section:
         # If 'section' is an alias, we want instance.__class__.__name__ to be 'section (class_name)'
         # We use type to dynamically create a class inheriting from class_object with the proper name
         # Dict (last argument) is empty since we do not want to add attributes/methods
         # For dumping with dill to work, we have to set the __module__ to __main__
         # (see https://stackoverflow.com/questions/51016272)
-        class_object = type("{0} ({1})".format(section, class_name), (class_object,), {"__module__": "__main__"})
+        class_object = type("{0} ({1})".format(plan.section, plan.class_name), (class_object,),
+                            {"__module__": "__main__"})
     instance = class_object(**call_dictionary)
+    if object_built is not None:
+        object_built(plan, instance)
     return instance
 
 
+def _build_argument(value: typing.Any,
+                    object_built: typing.Callable[[ConstructionPlan, typing.Any], None]) -> typing.Any:
+    """Construct the objects of the construction plans within an argument of a construction plan."""
+    if isinstance(value, ConstructionPlan):
+        return build_from_plan(value, object_built)
+    if isinstance(value, list):
+        return [_build_argument(entry, object_built) for entry in value]
+    return value
+
+
 _class_name_pattern = re.compile(r"(\w+)(?: \(\w+\))*")
 
 
@@ -225,5 +433,5 @@ def _create_object(value: str, parameter_type: typing.Any, config: ConfigParser)
         match = _class_pattern.match(str(parameter_type))
         if match is None or len(match.groups()) != 1:
             raise ConfigurationError("Given parameter type '{0}' could not be processed.".format(parameter_type))
-        return build_from_config(config, strings.to_camel_case(class_name), match.group(1),
-                                 strings.to_camel_case(class_to_build))
+        return create_plan(config, strings.to_camel_case(class_name), match.group(1),
+                           strings.to_camel_case(class_to_build))
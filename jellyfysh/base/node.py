@@ -20,6 +20,7 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 """Module for the Node class."""
+from copy import copy
 from typing import Any, Iterable, Sequence, Tuple
 from jellyfysh.base.unit import Unit
 import jellyfysh.setting as setting
@@ -184,3 +185,28 @@ def yield_closest_leaf_unit_positions(root_cnode: Node) -> Iterable[Tuple[Unit,
         for leaf_node in yield_leaf_nodes(root_cnode):
             shortest_separation = setting.periodic_boundaries.separation_vector(root_position, leaf_node.value.position)
             yield leaf_node.value, [entry + shortest_separation[index] for index, entry in enumerate(root_position)]
+
+
+def copy_cnode_tree(cnode: Node) -> Node:
+    """
+    Copy the given cnode together with all its children cnodes.
+
+    The units of the copied cnodes are new instances. Their positions, velocities, and time stamps are copied, so that
+    the copied tree is not affected by later modifications of the global state. The charges are not copied.
+
+    Parameters
+    ----------
+    cnode : Node
+        The cnode.
+
+    Returns
+    -------
+    Node
+        The copied cnode.
+    """
+    unit = cnode.value
+    copied_cnode = Node(Unit(unit.identifier, copy(unit.position), unit.charge, copy(unit.velocity),
+                             copy(unit.time_stamp)), cnode.weight)
+    for child in cnode.children:
+        copied_cnode.add_child(copy_cnode_tree(child))
+    return copied_cnode
@@ -0,0 +1,323 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""
+Module for reading and writing construction plan files, and for the static data that is cached alongside them.
+
+A construction plan file stores the parsed configuration file of a run together with the construction plans of the
+setting and of the mediator (see base.factory.ConstructionPlan class). Starting a run from a construction plan file
+does not require the reflection and the type conversions of the factory. Single options of the configuration can be
+overridden on the command line with strings of the form 'Section.option=value'. Only the construction plans of the
+overridden sections are then created anew.
+
+Construction plans do not contain the objects of a run. Therefore, the static data of the run that is only determined
+during the construction of the mediator (for example, the bounds of the estimators for all cell separations) is cached
+in a separate file next to the construction plan file (see the StaticData class).
+
+Both files start with two text lines. The first line is given by the plan_file_magic_line. The second line starts with
+'# ' and contains a JSON object with the metadata of the file. The remaining bytes are the pickled objects compressed
+with zlib. Both files are written to a temporary file which is renamed into the filename afterwards.
+"""
+from configparser import ConfigParser
+import hashlib
+import json
+import os
+import pickle
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+import zlib
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.factory import ConstructionPlan
+from jellyfysh.estimator import Estimator
+from jellyfysh.version import __version__
+
+
+plan_file_magic_line = b"# JeLLyFysh construction plan\n"
+"""The first line of every file written in this module."""
+
+plan_file_format_version = 1
+"""The version of the format of the construction plan file."""
+
+_override_pattern = re.compile(r"(\w+)\.(\w+)=(.*)", re.DOTALL)
+
+
+def _write_file(filename: str, kind: str, objects: Any) -> None:
+    """Write the header and the compressed pickled objects into a temporary file and rename it into the filename."""
+    metadata = {"kind": kind, "format_version": plan_file_format_version, "jellyfysh_version": __version__}
+    # Include the process identifier so that several runs can write the static data file at the same time
+    temporary_filename = "{0}.{1}.tmp".format(filename, os.getpid())
+    with open(temporary_filename, "wb") as file:
+        file.write(plan_file_magic_line)
+        file.write("# {0}\n".format(json.dumps(metadata)).encode("ascii"))
+        file.write(zlib.compress(pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL), 1))
+    os.replace(temporary_filename, filename)
+
+
+def _read_file(filename: str, kind: str) -> Any:
+    """Read the compressed pickled objects of a file and check that the file is of the given kind."""
+    with open(filename, "rb") as file:
+        if file.readline() != plan_file_magic_line:
+            raise ValueError("The file {0} is not a construction plan file.".format(filename))
+        metadata = json.loads(file.readline()[2:].decode("ascii"))
+        payload = file.read()
+    if metadata.get("kind") != kind:
+        raise ValueError("The file {0} is not a {1} file.".format(filename, kind))
+    if metadata.get("format_version") != plan_file_format_version:
+        raise ValueError("The file {0} has the unsupported format version {1}."
+                         .format(filename, metadata.get("format_version")))
+    if metadata.get("jellyfysh_version") != __version__:
+        raise ValueError("The file {0} was written by the JeLLyFysh application version {1}. Compile the configuration "
+                         "file again.".format(filename, metadata.get("jellyfysh_version")))
+    return pickle.loads(zlib.decompress(payload))
+
+
+def is_plan_file(filename: str) -> bool:
+    """
+    Return whether the file starts with the plan_file_magic_line.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    bool
+        Whether the file is a construction plan file or a static data file.
+    """
+    with open(filename, "rb") as file:
+        return file.readline() == plan_file_magic_line
+
+
+def static_data_filename(plan_filename: str) -> str:
+    """
+    Return the filename of the static data file that belongs to a construction plan file.
+
+    Parameters
+    ----------
+    plan_filename : str
+        The filename of the construction plan file.
+
+    Returns
+    -------
+    str
+        The filename of the static data file.
+    """
+    return plan_filename + ".static"
+
+
+def write_plan_file(filename: str, config: ConfigParser, setting_plan: ConstructionPlan,
+                    mediator_plan: ConstructionPlan) -> None:
+    """
+    Write the configuration and the construction plans of the setting and the mediator into a construction plan file.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the construction plan file.
+    config : configparser.ConfigParser
+        The parsed configuration file. The values are stored without interpolation.
+    setting_plan : base.factory.ConstructionPlan
+        The construction plan of the setting.
+    mediator_plan : base.factory.ConstructionPlan
+        The construction plan of the mediator.
+    """
+    config_dictionary = {section: dict(config.items(section, raw=True)) for section in config.sections()}
+    _write_file(filename, "construction plan", [config_dictionary, setting_plan, mediator_plan])
+
+
+def read_plan_file(filename: str) -> Tuple[ConfigParser, ConstructionPlan, ConstructionPlan]:
+    """
+    Read the configuration and the construction plans of the setting and the mediator of a construction plan file.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the construction plan file.
+
+    Returns
+    -------
+    (configparser.ConfigParser, base.factory.ConstructionPlan, base.factory.ConstructionPlan)
+        The configuration, the construction plan of the setting, the construction plan of the mediator.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a construction plan file, has an unsupported format version, or was written by a different
+        version of the JeLLyFysh application.
+    """
+    config_dictionary, setting_plan, mediator_plan = _read_file(filename, "construction plan")
+    config = ConfigParser()
+    config.read_dict(config_dictionary)
+    return config, setting_plan, mediator_plan
+
+
+def override_config(config: ConfigParser, overrides: Sequence[str]) -> List[str]:
+    """
+    Override options of the configuration and return the sections of the overridden options.
+
+    Each override is a string of the form 'Section.option=value'. Sections that do not exist in the configuration are
+    added.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The configuration.
+    overrides : Sequence[str]
+        The overrides.
+
+    Returns
+    -------
+    List[str]
+        The sections of the overridden options.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If an override is not of the form 'Section.option=value'.
+    """
+    sections = []
+    for override in overrides:
+        override_match = _override_pattern.fullmatch(override)
+        if override_match is None:
+            raise ConfigurationError("The override '{0}' is not of the form 'Section.option=value'.".format(override))
+        section, option, value = override_match.groups()
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, option, value)
+        if section not in sections:
+            sections.append(section)
+    return sections
+
+
+def override_plans(config: ConfigParser, plans: Sequence[ConstructionPlan],
+                   overrides: Sequence[str]) -> List[ConstructionPlan]:
+    """
+    Override options of the configuration and create the construction plans of the overridden sections anew.
+
+    Each override is a string of the form 'Section.option=value'. The configuration is changed in place.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The configuration of the construction plans.
+    plans : Sequence[base.factory.ConstructionPlan]
+        The construction plans.
+    overrides : Sequence[str]
+        The overrides.
+
+    Returns
+    -------
+    List[base.factory.ConstructionPlan]
+        The construction plans with the overridden options.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If an override is not of the form 'Section.option=value'.
+    base.exceptions.ConfigurationError
+        If the section of an override is not used in the construction plans.
+    base.exceptions.ConfigurationError
+        If an overridden option is not a possible argument of the class of its section.
+    """
+    sections = override_config(config, overrides)
+    used_sections = {section for plan in plans for section in plan.yield_sections()}
+    for section in sections:
+        if section not in used_sections:
+            raise ConfigurationError("The section {0} of an override is not used in the construction plan."
+                                     .format(section))
+    return [plan.replace_sections(config, sections) for plan in plans]
+
+
+class StaticData(object):
+    """
+    The static data of runs which is cached in a static data file next to a construction plan file.
+
+    The static data consists of the caches of the bounds of the estimators (see estimator.Estimator class) which are
+    determined during the initialization of, for example, cell-veto event handlers and cell bounding potentials. The
+    cache of an estimator is identified by the construction plan of the estimator together with the construction plan
+    of the setting. Therefore, runs with overridden options share the bounds unless the options change the estimator or
+    the setting. The bounds of a single cell separation are identified by the corners of the region of separations, so
+    that a change of the cell system results in new bounds as well.
+
+    The object_built method should be given to the base.factory.build_from_plan function when the mediator is
+    constructed. It sets the caches of all constructed estimators. Afterwards, the write method stores new bounds in the
+    static data file.
+    """
+
+    def __init__(self, filename: str, setting_plan: ConstructionPlan) -> None:
+        """
+        The constructor of the StaticData class.
+
+        This method reads the static data file if it exists.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the static data file.
+        setting_plan : base.factory.ConstructionPlan
+            The construction plan of the setting of the run.
+        """
+        self._filename = filename
+        self._setting_plan = setting_plan
+        self._estimator_caches = self._read()
+        self._number_of_stored_bounds = self._number_of_bounds(self._estimator_caches)
+
+    def _read(self) -> Dict[str, Dict[Tuple[Any, ...], Sequence[float]]]:
+        """Return the caches of the estimators in the static data file, or an empty dictionary if it does not exist."""
+        if not os.path.exists(self._filename):
+            return {}
+        return _read_file(self._filename, "static data")
+
+    @staticmethod
+    def _number_of_bounds(estimator_caches: Dict[str, Dict[Tuple[Any, ...], Sequence[float]]]) -> int:
+        """Return the total number of bounds in the caches of the estimators."""
+        return sum(len(cache) for cache in estimator_caches.values())
+
+    def object_built(self, plan: ConstructionPlan, instance: Any) -> None:
+        """
+        Set the cache of the instance if it is an estimator.
+
+        Parameters
+        ----------
+        plan : base.factory.ConstructionPlan
+            The construction plan of the instance.
+        instance : Any
+            The constructed instance.
+        """
+        if isinstance(instance, Estimator):
+            key = hashlib.sha256(repr((self._setting_plan, plan)).encode("utf-8")).hexdigest()
+            instance.set_derivative_bound_cache(self._estimator_caches.setdefault(key, {}))
+
+    def write(self) -> None:
+        """
+        Write the static data file if new bounds were determined since it was read.
+
+        The static data file is read again before so that bounds which were written by other runs in the meantime are
+        kept.
+        """
+        if self._number_of_bounds(self._estimator_caches) == self._number_of_stored_bounds:
+            return
+        estimator_caches = self._read()
+        for key, cache in self._estimator_caches.items():
+            estimator_caches.setdefault(key, {}).update(cache)
+        _write_file(self._filename, "static data", estimator_caches)
+        self._number_of_stored_bounds = self._number_of_bounds(self._estimator_caches)
@@ -0,0 +1,201 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the StartupReport class."""
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+import sys
+import time
+from typing import Any, Iterator, List, Optional, TextIO, Tuple
+
+
+class StartupReport(object):
+    """
+    Report of the imported modules and the durations of the phases during the startup of the JeLLyFysh application.
+
+    After the start method was called, every module that is imported for the first time is timed by a finder which is
+    inserted at the beginning of sys.meta_path. The finder wraps the loaders of the found modules so that their
+    creation and execution is timed. The report of the imports follows the format of the -X importtime option of the
+    Python interpreter: For every imported module, the time spent in the module itself, and the cumulative time
+    including its nested imports are given in microseconds. Nested imports are indented and listed before the
+    importing module.
+    Independently of the start method, the durations of setup phases can be measured with the phase method.
+    """
+
+    def __init__(self) -> None:
+        """The constructor of the StartupReport class."""
+        self._finder = _TimingFinder(self)
+        # Stack of [start time, time spent in nested imports] of the currently timed imports
+        self._import_stack = []
+        self._creation_times = {}
+        self._imports = []
+        self._phases = []
+        self._process_time_at_start = None
+
+    def start(self) -> None:
+        """Start timing the imports."""
+        if self._finder not in sys.meta_path:
+            self._process_time_at_start = time.process_time()
+            sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        """Stop timing the imports."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measure the duration of the phase with the given name.
+
+        This method should be used in a with statement which encloses the phase.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start_time))
+
+    @property
+    def imports(self) -> List[Tuple[str, int, float, float]]:
+        """
+        Return the timed imports in the order in which they were finished.
+
+        Returns
+        -------
+        List[(str, int, float, float)]
+            The name, the depth of nesting, the time spent in the module itself, and the cumulative time (in seconds)
+            of every timed import.
+        """
+        return self._imports
+
+    @property
+    def phases(self) -> List[Tuple[str, float]]:
+        """
+        Return the measured phases in the order in which they were finished.
+
+        Returns
+        -------
+        List[(str, float)]
+            The name and the duration (in seconds) of every phase.
+        """
+        return self._phases
+
+    def write(self, file: Optional[TextIO] = None) -> None:
+        """
+        Write the report into the given file.
+
+        Parameters
+        ----------
+        file : TextIO or None, optional
+            The file. If None, the report is written to sys.stderr (as the -X importtime option does).
+        """
+        file = file if file is not None else sys.stderr
+        print("import time: self [us] | cumulative | imported package", file=file)
+        for name, depth, self_time, cumulative_time in self._imports:
+            print("import time: {0:>9} | {1:>10} | {2}{3}".format(round(self_time * 1.0e6),
+                                                                  round(cumulative_time * 1.0e6), "  " * depth, name),
+                  file=file)
+        if self._process_time_at_start is not None:
+            print("startup phase: {0:>9.3f} s | process time before the imports were timed"
+                  .format(self._process_time_at_start), file=file)
+        print("startup phase: {0:>9.3f} s | timed imports"
+              .format(sum(entry[3] for entry in self._imports if entry[1] == 0)), file=file)
+        for name, duration in self._phases:
+            print("startup phase: {0:>9.3f} s | {1}".format(duration, name), file=file)
+
+    def _enter_import(self) -> None:
+        """Start timing an import."""
+        self._import_stack.append([time.perf_counter(), 0.0])
+
+    def _exit_import(self) -> Tuple[float, float]:
+        """Stop timing an import and return the time spent in the module itself and the cumulative time."""
+        start_time, nested_time = self._import_stack.pop()
+        cumulative_time = time.perf_counter() - start_time
+        if self._import_stack:
+            self._import_stack[-1][1] += cumulative_time
+        return cumulative_time - nested_time, cumulative_time
+
+    def _module_created(self, name: str) -> None:
+        """Stop timing the creation of the module with the given name."""
+        self._creation_times[name] = self._exit_import()
+
+    def _module_executed(self, name: str) -> None:
+        """Stop timing the execution of the module with the given name, and store the timed import."""
+        self_time, cumulative_time = self._exit_import()
+        creation_self_time, creation_cumulative_time = self._creation_times.pop(name, (0.0, 0.0))
+        self._imports.append((name, len(self._import_stack), self_time + creation_self_time,
+                              cumulative_time + creation_cumulative_time))
+
+
+class _TimingFinder(MetaPathFinder):
+    """Finder which uses the remaining finders in sys.meta_path and wraps the loaders of the found modules."""
+
+    def __init__(self, report: StartupReport) -> None:
+        self._report = report
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimingLoader(spec.loader, self._report)
+                return spec
+        return None
+
+
+class _TimingLoader(Loader):
+    """Loader which times the creation and the execution of modules of another loader."""
+
+    def __init__(self, loader: Loader, report: StartupReport) -> None:
+        self._loader = loader
+        self._report = report
+
+    def create_module(self, spec: Any) -> Any:
+        # noinspection PyProtectedMember
+        self._report._enter_import()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            # noinspection PyProtectedMember
+            self._report._module_created(spec.name)
+
+    def exec_module(self, module: Any) -> None:
+        # noinspection PyProtectedMember
+        self._report._enter_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            # noinspection PyProtectedMember
+            self._report._module_executed(module.__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate all other methods (for example, get_code or get_resource_reader) to the wrapped loader
+        if name == "_loader":
+            raise AttributeError(name)
+        return getattr(self._loader, name)
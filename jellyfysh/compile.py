@@ -0,0 +1,105 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""
+Executable script which compiles a configuration file of the JeLLyFysh application into a construction plan file.
+"""
+from argparse import ArgumentParser, Namespace
+import os
+import sys
+from typing import Sequence
+from jellyfysh.base import factory
+from jellyfysh.base.plan_file import override_config, write_plan_file
+from jellyfysh.base.startup_report import StartupReport
+from jellyfysh.base.strings import to_camel_case
+from jellyfysh.run import (add_general_parser_arguments, add_override_parser_argument, print_start_message, read_config,
+                           set_up_logging, warn_about_unused_sections)
+
+
+def parse_options(args: Sequence[str]) -> Namespace:
+    """
+    Convert argument strings to objects and assign them as attributes of the argparse namespace. Return the populated
+    namespace.
+
+    The argument strings can for example be sys.argv[1:] in order to parse the command line arguments. The argument
+    parser parses the arguments specified in the add_general_parser_arguments and the add_override_parser_argument
+    functions in run.py. This function also adds the configuration file as a required positional argument, and the
+    --output option which specifies the construction plan file.
+
+    Parameters
+    ----------
+    args : Sequence[str]
+        The argument strings.
+
+    Returns
+    -------
+    argparse.Namespace
+        The populated argparse namespace.
+    """
+    parser = ArgumentParser(description="Compile a configuration file of the JeLLyFysh application into a construction "
+                                        "plan file which can replace the configuration file in the jellyfysh command.")
+    parser.add_argument("config_file", help="specify the path to the configuration file")
+    parser.add_argument("-o", "--output", action="store",
+                        help="specify the construction plan file (per default, the configuration file with the "
+                             "extension .plan)")
+    add_override_parser_argument(parser)
+    add_general_parser_arguments(parser)
+    return parser.parse_args(args)
+
+
+def main() -> None:
+    """
+    Use the command line arguments to compile a configuration file of the JeLLyFysh application.
+
+    First the command line arguments are parsed, and then the logging is set up. Afterwards, the configuration file
+    specified in the command line is parsed and the overrides of its options are applied. Based on the configuration
+    file, the construction plans of the setting and the mediator are created by the JeLLyFysh factory. This validates
+    the configuration file without constructing any object. The construction plans are written into the construction
+    plan file (see base.plan_file module). If requested, a report of the imports and the durations of these phases is
+    written afterwards.
+    """
+    print_start_message()
+
+    args = parse_options(sys.argv[1:])
+    startup_report = StartupReport()
+    if args.startup_report:
+        startup_report.start()
+    logger = set_up_logging(args)
+    output = args.output if args.output is not None else os.path.splitext(args.config_file)[0] + ".plan"
+
+    logger.info("Compiling the configuration file {0}.".format(args.config_file))
+    with startup_report.phase("reading of the configuration file"):
+        config = read_config(args.config_file)
+        override_config(config, args.overrides)
+    with startup_report.phase("creation of the construction plans"):
+        setting_plan = factory.create_plan(config, to_camel_case(config.get("Run", "setting")), "jellyfysh.setting")
+        mediator_plan = factory.create_plan(config, to_camel_case(config.get("Run", "mediator")), "jellyfysh.mediator")
+    warn_about_unused_sections(config, logger)
+    with startup_report.phase("writing of the construction plan file"):
+        write_plan_file(output, config, setting_plan, mediator_plan)
+    if args.startup_report:
+        startup_report.stop()
+        startup_report.write()
+    print("Wrote the construction plan file {0}.".format(output))
+
+
+if __name__ == '__main__':
+    main()
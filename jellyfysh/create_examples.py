@@ -22,7 +22,6 @@
 """Executable script which copies the exemplary configuration files of the JeLLyFysh application into the current
 working directory."""
 from argparse import ArgumentParser, Namespace
-from pkg_resources import resource_filename
 from os import mkdir
 import platform
 from shutil import copytree
@@ -72,6 +71,9 @@ def main() -> None:
     logger.info("Underlying platform (determined via platform.platform(aliased=True): {0}"
                 .format(platform.platform(aliased=True)))
 
+    # pkg_resources is slow to import, so it is only imported here
+    from pkg_resources import resource_filename
+
     print("Creating directory jellyfysh-examples.")
     mkdir("jellyfysh-examples")
 
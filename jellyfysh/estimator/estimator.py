@@ -21,7 +21,7 @@
 #
 """Module for the abstract Estimator class."""
 from abc import ABCMeta, abstractmethod
-from typing import Any, Sequence, Tuple, Union
+from typing import Any, MutableMapping, Sequence, Tuple, Union
 from jellyfysh.potential import Potential
 import jellyfysh.setting as setting
 
@@ -48,6 +48,11 @@ class Estimator(metaclass=ABCMeta):
     separations in the given region are corrected for periodic boundaries.
 
     Examples for the usage of this class can be found in the CellBoundingPotential and the CellVetoEventHandler.
+
+    Optionally, the estimated bounds are stored in a cache that is set with the set_derivative_bound_cache method. The
+    cached_derivative_bound method then only estimates bounds for regions that are not yet stored in the cache. Since
+    the cache can be filled by a different estimator of a previous run, it should only be set if this estimator was
+    constructed with the same arguments and setting as the previous one (see base.plan_file.StaticData class).
     """
 
     def __init__(self, potential: Potential, prefactor: float = 1.0, empirical_bound: float = float('inf'),
@@ -79,6 +84,7 @@ class Estimator(metaclass=ABCMeta):
         self._empirical_bound = empirical_bound
         self._derivative = None
         self._number_charges = self._potential.number_charge_arguments
+        self._derivative_bound_cache = None
         if periodic_boundaries:
             self._correct_separation = setting.periodic_boundaries.correct_separation
         else:
@@ -130,6 +136,52 @@ class Estimator(metaclass=ABCMeta):
         for i in range(setting.dimension):
             assert lower_corner[i] <= upper_corner[i]
 
+    def set_derivative_bound_cache(self, cache: MutableMapping[Tuple[Any, ...], Sequence[float]]) -> None:
+        """
+        Set the cache of the bounds which is used in the cached_derivative_bound method.
+
+        Parameters
+        ----------
+        cache : MutableMapping[Tuple[Any, ...], Sequence[float]]
+            The cache, which may already contain bounds.
+        """
+        self._derivative_bound_cache = cache
+
+    def cached_derivative_bound(self, lower_corner: Sequence[float], upper_corner: Sequence[float], direction: int,
+                                calculate_lower_bound: bool = False) -> Sequence[float]:
+        """
+        Return the bounds of the derivative_bound method which are stored in the cache if it was set.
+
+        If no cache was set with the set_derivative_bound_cache method, this method just returns the result of the
+        derivative_bound method. Otherwise, the result of the derivative_bound method is only determined if the cache
+        does not yet contain the bounds for the given arguments. The determined bounds are then stored in the cache.
+
+        Parameters
+        ----------
+        lower_corner : Sequence[float]
+            Lower corner of the region to be estimated. The length of the tuple agrees with system dimensions.
+        upper_corner : Sequence[float]
+            Upper corner of the region to be estimated. The length of the tuple agrees with system dimensions.
+        direction : int
+            Direction with respect to which the space derivative is taken and the bound is determined.
+        calculate_lower_bound : bool
+            Whether the lower bound should be calculated or not.
+
+        Returns
+        -------
+        Sequence[float]
+            The sequence of the determined upper bound and the optionally determined lower bound.
+        """
+        if self._derivative_bound_cache is None:
+            return self.derivative_bound(lower_corner, upper_corner, direction, calculate_lower_bound)
+        key = (tuple(lower_corner), tuple(upper_corner), direction, calculate_lower_bound)
+        try:
+            return self._derivative_bound_cache[key]
+        except KeyError:
+            bounds = self.derivative_bound(lower_corner, upper_corner, direction, calculate_lower_bound)
+            self._derivative_bound_cache[key] = bounds
+            return bounds
+
     @property
     def potential(self) -> Potential:
         """
@@ -41,6 +41,8 @@ class CellBoundingPotentialEventHandler(Initializer, metaclass=ABCMeta):
     the 'PeriodicCells' class. The same restriction thus holds for this event handler (see 'initialize' method).
     """
 
+    _shared_attributes = ("_cells",)
+
     def __init__(self, bounding_potential: CellBoundingPotential, **kwargs: Any) -> None:
         """
         The constructor of the CellBoundingPotentialEventHandler class.
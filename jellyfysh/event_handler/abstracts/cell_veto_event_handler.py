@@ -23,13 +23,19 @@
 from abc import ABCMeta
 import random
 from typing import Any, List, Sequence, Tuple, Union
+from jellyfysh.activator.internal_state import CellOccupancy
+from jellyfysh.activator.internal_state.multi_active_cell_occupancy import MultiActiveCellOccupancy
+from jellyfysh.activator.internal_state.single_active_cell_occupancy import SingleActiveCellOccupancy
 from jellyfysh.activator.internal_state.cell_occupancy.cells import PeriodicCells
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.initializer import Initializer
 import jellyfysh.base.node as node
 from jellyfysh.base.time import Time
 from jellyfysh.estimator import Estimator
-from jellyfysh.event_handler.walker import Walker, WalkerItem
+from jellyfysh.event_handler.hierarchical_cell_veto_sampler import HierarchicalCellVetoSampler, TopBlockRateCache
+from jellyfysh.event_handler.walker import FlatWalker, WalkerItem
 import jellyfysh.setting as setting
 from .event_handler_with_bounding_potential import EventHandlerWithBoundingPotential
 
@@ -55,8 +61,19 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
     This branch then accompanies the out-state request.
 
     This class uses an estimator to determine upper and lower bounds for the derivatives for all non-nearby cell
-    separations. The event rates are put into a Walker scheme (see event_handler.Walker) which stores the total cell
-    event rate and allows to sample a target cell.
+    separations. The event rates are put into a Walker scheme (see event_handler.walker.FlatWalker) which stores the
+    total cell event rate and allows to sample a target cell.
+
+    Optionally, a target cell is instead sampled coarse-to-fine in the hierarchy of blocks of cells of an
+    IndexedCuboidPeriodicCells instance (see event_handler.hierarchical_cell_veto_sampler.HierarchicalCellVetoSampler).
+    This is enabled by setting the top block level of this hierarchy. Here, the total event rate only includes the
+    blocks on the top level that are occupied in the cell-occupancy system, and sampled empty target cells are
+    discarded without creating a vetoed event. This reduces the number of vetoed events in sparsely occupied cell
+    systems with many cells. The cell-occupancy system is set with the set_cell_occupancy method, and it must be an
+    instance of the SingleActiveCellOccupancy or the MultiActiveCellOccupancy class. The hierarchical samplers do not
+    change during the run and are shared between clones. The event rates of the occupied blocks for the recent active
+    cells change during the run and are therefore stored separately for each event handler (see
+    event_handler.hierarchical_cell_veto_sampler.TopBlockRateCache).
 
     This event handler can consider the charge of the active leaf unit by using the charge correction factor of the
     estimator that is used to estimate upper and lower bounds on the derivative for any non-nearby cell separation. The
@@ -67,7 +84,10 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
     with 1 (see base.time.Time class for more information).
     """
 
-    def __init__(self, estimator: Estimator, **kwargs: Any) -> None:
+    _shared_attributes = ("_estimator", "_cells", "_derivative_bounds", "_upper_bound_samplers",
+                          "_lower_bound_samplers")
+
+    def __init__(self, estimator: Estimator, block_level: int = None, **kwargs: Any) -> None:
         """
         The constructor of the CellVetoEventHandler class.
 
@@ -78,11 +98,27 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
         ----------
         estimator : estimator.Estimator
             The estimator used to determine bounds for the derivatives.
+        block_level : int or None, optional
+            The top block level of the hierarchy of blocks of cells that is used to sample target cells. If None, target
+            cells are sampled with the Walker scheme.
         kwargs : Any
             Additional kwargs which are passed to the __init__ method of the next class in the MRO.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the block level is not None and smaller than zero.
         """
         super().__init__(**kwargs)
+        if block_level is not None and block_level < 0:
+            raise ConfigurationError("The block level of the event handler {0} should be greater than or equal to zero."
+                                     .format(self.__class__.__name__))
         self._estimator = estimator
+        self._block_level = block_level
+        self._upper_bound_samplers = None
+        self._lower_bound_samplers = None
+        self._upper_bound_caches = None
+        self._lower_bound_caches = None
         self._cells = None
         self._upper_bound_walker = None
         self._lower_bound_walker = None
@@ -114,14 +150,30 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
         charge : str or None
             The relevant charge for this event handler.
 
+        If the top block level is set, two hierarchical cell-veto samplers are set up in addition, one for the upper and
+        one for the lower bounds.
+
         Raises
         ------
         base.exceptions.ConfigurationError
             If the cells are not an instance of PeriodicCells.
+        base.exceptions.ConfigurationError
+            If the top block level is set and the cells are not an instance of IndexedCuboidPeriodicCells.
+        base.exceptions.ConfigurationError
+            If the top block level is set and it does not exist in the cell system.
         """
         if not isinstance(cells, PeriodicCells):
             raise ConfigurationError("The event handler {0} needs an instance of PeriodicCells!"
                                      .format(self.__class__.__name__))
+        if self._block_level is not None:
+            if not isinstance(cells, IndexedCuboidPeriodicCells):
+                raise ConfigurationError("The event handler {0} needs an instance of IndexedCuboidPeriodicCells if the "
+                                         "block level is set!".format(self.__class__.__name__))
+            if self._block_level >= cells.number_of_block_levels:
+                raise ConfigurationError("The block level {0} of the event handler {1} does not exist in the cell "
+                                         "system with {2} block levels.".format(self._block_level,
+                                                                                self.__class__.__name__,
+                                                                                cells.number_of_block_levels))
         Initializer.initialize(self)
         self._cells = cells
         self._cell_level = cell_level
@@ -135,13 +187,13 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
             if cell not in cells.nearby_cells(cells.zero_cell):
                 cell_separation = cells.relative_cell(cell, cells.zero_cell)
                 self._derivative_bounds[cell_separation] = []
-                lower_corner = [cell.cell_min[direction] - cells.zero_cell.cell_max[direction]
+                lower_corner = [cells.cell_min(cell)[direction] - cells.cell_max(cells.zero_cell)[direction]
                                 for direction in range(setting.dimension)]
-                upper_corner = [cell.cell_max[direction] - cells.zero_cell.cell_min[direction]
+                upper_corner = [cells.cell_max(cell)[direction] - cells.cell_min(cells.zero_cell)[direction]
                                 for direction in range(setting.dimension)]
 
                 for direction in range(setting.dimension):
-                    upper_bound, lower_bound = self._estimator.derivative_bound(
+                    upper_bound, lower_bound = self._estimator.cached_derivative_bound(
                         lower_corner, upper_corner, direction, calculate_lower_bound=True)
                     self._derivative_bounds[cell_separation].append((upper_bound, -lower_bound))
 
@@ -155,10 +207,51 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
                         WalkerItem(cell, max(self._derivative_bounds[cell_separation][direction][0], 0.0)))
                     lower_bound_walker_items[direction].append(
                         WalkerItem(cell, max(self._derivative_bounds[cell_separation][direction][1], 0.0)))
-        self._upper_bound_walker = [Walker(item_list) for item_list in upper_bound_walker_items]
-        self._lower_bound_walker = [Walker(item_list) for item_list in lower_bound_walker_items]
+        self._upper_bound_walker = [FlatWalker(item_list) for item_list in upper_bound_walker_items]
+        self._lower_bound_walker = [FlatWalker(item_list) for item_list in lower_bound_walker_items]
+        if self._block_level is not None:
+            self._upper_bound_samplers = [self._hierarchical_sampler(item_list)
+                                          for item_list in upper_bound_walker_items]
+            self._lower_bound_samplers = [self._hierarchical_sampler(item_list)
+                                          for item_list in lower_bound_walker_items]
         print("Finished initialization of the cell-veto event handler {0}.".format(self.__class__.__name__))
 
+    def _hierarchical_sampler(self, walker_items: Sequence[WalkerItem]) -> HierarchicalCellVetoSampler:
+        """Set up a hierarchical cell-veto sampler with the event rates of the relative cells in the walker items."""
+        relative_cell_rates = [0.0] * self._cells.number_of_cells
+        for walker_item in walker_items:
+            relative_cell_rates[self._cells.relative_cell(walker_item.item, self._cells.zero_cell)] = walker_item.rate
+        return HierarchicalCellVetoSampler(self._cells, relative_cell_rates, self._block_level)
+
+    def set_cell_occupancy(self, cell_occupancy: CellOccupancy) -> None:
+        """
+        Set the cell-occupancy system that stores the global state identifiers in the target cells.
+
+        The cell-occupancy system is only used if the top block level is set. This method should be called after the
+        initialize method. Clones of this event handler use the same cell-occupancy system, which is however not a
+        shared member because it changes during the run.
+
+        Parameters
+        ----------
+        cell_occupancy : activator.internal_state.CellOccupancy
+            The cell-occupancy system.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the top block level is set and the cell-occupancy system is neither an instance of
+            SingleActiveCellOccupancy nor of MultiActiveCellOccupancy.
+        """
+        if self._block_level is not None:
+            if not isinstance(cell_occupancy, (SingleActiveCellOccupancy, MultiActiveCellOccupancy)):
+                raise ConfigurationError("The event handler {0} needs an instance of SingleActiveCellOccupancy or "
+                                         "MultiActiveCellOccupancy if the block level is set!"
+                                         .format(self.__class__.__name__))
+            self._upper_bound_caches = [TopBlockRateCache(sampler, cell_occupancy)
+                                        for sampler in self._upper_bound_samplers]
+            self._lower_bound_caches = [TopBlockRateCache(sampler, cell_occupancy)
+                                        for sampler in self._lower_bound_samplers]
+
     def send_event_time(self, in_state: Sequence[node.Node]) -> Tuple[Time, List[int]]:
         """
         Return the candidate event time together with the sampled target cell.
@@ -175,6 +268,11 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
         This method returns the sampled target cell besides the candidate event time, so that the corresponding branch
         can be received in the send_out_state method.
 
+        If the top block level is set, the target cell and the total event rate are instead determined by the relevant
+        hierarchical cell-veto sampler. If it needed several trials to sample an occupied target cell, the candidate
+        event time is the sum of the exponentially distributed times of all trials. If no block on the top level is
+        occupied, the Walker class is used.
+
         Also, the event rate bound between the cell of the active unit on cell level and the target cell is recorded in
         the _bounding_event_rate attribute.
 
@@ -223,15 +321,34 @@ class CellVetoEventHandler(EventHandlerWithBoundingPotential, Initializer, metac
             walker = self._lower_bound_walker[direction_of_motion]
             bounding_event_rate_index = 1
 
-        total_rate = walker.total_rate * charge_factor
-        relative_cell = walker.sample_cell()
+        sample = None
+        if self._block_level is not None:
+            sample = (self._upper_bound_caches if bounding_event_rate_index == 0
+                      else self._lower_bound_caches)[direction_of_motion].sample_cell(active_cell)
+        time_displacement = 0.0
+        if sample is not None and sample[2] is None:
+            # All trials failed because of rounding errors. The time of the rejected trials has elapsed before the
+            # Walker scheme takes over.
+            time_displacement = (sum(random.expovariate(setting.beta) for _ in range(sample[1]))
+                                 / (sample[0] * charge_factor * speed))
+            sample = None
+        if sample is not None:
+            total_rate, number_of_trials, target_cell = sample
+            total_rate *= charge_factor
+            relative_cell = self._cells.relative_cell(target_cell, active_cell)
+        else:
+            # Without any occupied block on the top level, the Walker scheme is used.
+            total_rate = walker.total_rate * charge_factor
+            number_of_trials = 1
+            relative_cell = walker.sample_cell()
+            target_cell = self._cells.translate(active_cell, relative_cell)
         self._bounding_event_rate = (
                 self._derivative_bounds[relative_cell][direction_of_motion][bounding_event_rate_index]
                 * charge_factor)
         assert self._bounding_event_rate > 0.0
-        target_cell = self._cells.translate(active_cell, relative_cell)
         # TODO add a seeding option at each place a random number is used so that we can insert random numbers
-        time_displacement = random.expovariate(setting.beta) / (total_rate * speed)
+        time_displacement += (sum(random.expovariate(setting.beta) for _ in range(number_of_trials))
+                              / (total_rate * speed))
         self._event_time = self._active_leaf_unit.time_stamp + time_displacement
         self._time_slice_all_units_in_state()
 
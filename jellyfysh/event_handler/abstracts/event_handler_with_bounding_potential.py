@@ -21,6 +21,9 @@
 #
 """Modules for useful abstract event handler base classes with bounding potentials."""
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from copy import copy
+import logging
 import random
 from typing import Any, Sequence
 from jellyfysh.base.exceptions import ConfigurationError, bounding_potential_warning
@@ -32,6 +35,48 @@ from .abstracts import SingleActiveLeafUnitEventHandler
 from .composite_objects import CompositeObjectsEventHandler
 
 
+class _BoundingSegmentStore(object):
+    """
+    Store of the bounding segments of an EventHandlerWithPiecewiseConstantBoundingPotential.
+
+    The store is modified during the run. It is therefore not a shared attribute of the event handler (which are only
+    read after initialization, see event_handler.EventHandler class). Instead, a deepcopy of this class (for example,
+    when an event handler is cloned) returns the same instance so that all copies of an event handler use the same
+    store.
+
+    The number of stored segments is bounded. If a new segment would exceed the maximum number of segments, the least
+    recently stored or resumed segment is removed.
+    """
+
+    def __init__(self, maximum_number_of_segments: int) -> None:
+        """
+        The constructor of the _BoundingSegmentStore class.
+
+        Parameters
+        ----------
+        maximum_number_of_segments : int
+            The maximum number of stored segments.
+        """
+        # Map from the identifiers of the leaf units and the index of the active leaf unit to the stored segment, which
+        # is ordered from the least to the most recently used segment
+        self.segments = OrderedDict()
+        self.maximum_number_of_segments = maximum_number_of_segments
+        self.number_of_searches = 0
+        self.number_of_resumed_segments = 0
+
+    def store(self, segment_key: Any, segment: Any) -> None:
+        """Store the segment, and remove the least recently used segment if the store is full."""
+        self.segments[segment_key] = segment
+        self.segments.move_to_end(segment_key)
+        if len(self.segments) > self.maximum_number_of_segments:
+            self.segments.popitem(last=False)
+
+    def __deepcopy__(self, memo: dict) -> "_BoundingSegmentStore":
+        """Return this instance so that the store is shared among all copies."""
+        memo[id(self)] = self
+        return self
+
+
 class EventHandlerWithBoundingPotential(SingleActiveLeafUnitEventHandler, metaclass=ABCMeta):
     """
     This event handler base class assumes a bounding event rate and deals with an interaction between a single active
@@ -46,6 +91,8 @@ class EventHandlerWithBoundingPotential(SingleActiveLeafUnitEventHandler, metacl
     velocities.
     """
 
+    _shared_attributes = ("_potential",)
+
     def __init__(self, potential: Potential, **kwargs: Any):
         """
         The constructor of the EventHandlerWithBoundingPotential class.
@@ -196,11 +243,7 @@ class TwoCompositeObjectBoundingPotentialEventHandler(EventHandlerWithBoundingPo
             if local_unit is self._active_leaf_unit:
                 local_composite_object_factor_derivatives[index_1] = active_leaf_unit_derivative
                 continue
-            for index_2, target_unit in enumerate(target_units):
-                pairwise_derivative = self._potential.derivative(
-                    self._active_leaf_unit.velocity,
-                    setting.periodic_boundaries.separation_vector(local_unit.position, target_unit.position),
-                    *self._potential_charges(local_unit, target_unit))
+            for index_2, pairwise_derivative in enumerate(self._pairwise_derivatives(local_unit, target_units)):
                 local_composite_object_factor_derivatives[index_1] += pairwise_derivative
                 target_composite_object_factor_derivatives[index_2] -= pairwise_derivative
 
@@ -219,6 +262,30 @@ class TwoCompositeObjectBoundingPotentialEventHandler(EventHandlerWithBoundingPo
                 self._lifting.insert(local_composite_object_factor_derivatives[index_1],
                                      local_unit.identifier, local_unit is self._active_leaf_unit)
 
+    def _pairwise_derivatives(self, local_unit: Unit, target_units: Sequence[Unit]) -> Sequence[float]:
+        """
+        Return the derivatives between the given local unit and each of the target units.
+
+        The derivatives are computed along the velocity of the active leaf unit. Inheriting classes can overwrite this
+        method to compute all derivatives at once.
+
+        Parameters
+        ----------
+        local_unit : base.unit.Unit
+            The unit within the same composite object as the active leaf unit.
+        target_units : Sequence[base.unit.Unit]
+            Units within the target composite object.
+
+        Returns
+        -------
+        Sequence[float]
+            The derivatives between the local unit and each of the target units.
+        """
+        return [self._potential.derivative(
+            self._active_leaf_unit.velocity,
+            setting.periodic_boundaries.separation_vector(local_unit.position, target_unit.position),
+            *self._potential_charges(local_unit, target_unit)) for target_unit in target_units]
+
 
 class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEventHandler, metaclass=ABCMeta):
     """
@@ -245,9 +312,29 @@ class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEve
     with 1 (see base.time.Time class for more information). The maximum time displacement, however, can stay a simple
     float because it is always of the same order of magnitude during a run of JF. The same is true for the time
     displacement returned by the dynamically constructed bounding potential.
+
+    Optionally, the constant bounding event rates are stored together with the segment of the trajectory of the active
+    leaf unit they are valid for. If the same active leaf unit later continues along this segment with the same velocity
+    and with unchanged positions of the other leaf units (for instance after a rejected event or after an event of an
+    unrelated factor), the stored bounding event rate is reused on the remaining part of the segment instead of
+    evaluating the potential derivatives again. The stored segments are shared among all copies of the event handler
+    and are identified by the identifiers of the leaf units and the index of the active leaf unit. A stored segment is
+    removed as soon as it cannot be resumed anymore, and the number of stored segments is bounded by removing the least
+    recently used segment. The fraction of reused segments is regularly logged on the info level.
     """
 
-    def __init__(self, potential: Potential, offset: float, max_displacement: float, **kwargs: Any):
+    _shared_attributes = ("_potential",)
+
+    # Number of searches for stored bounding segments after which the fraction of reused segments is logged
+    _bounding_segment_report_interval = 100000
+    # Tolerance of the distance between the active leaf unit and its expected position on a stored bounding segment,
+    # and minimum remaining time displacement on a stored bounding segment
+    _bounding_segment_tolerance = 1.0e-9
+    # Maximum number of stored bounding segments
+    _maximum_number_of_bounding_segments = 10000
+
+    def __init__(self, potential: Potential, offset: float, max_displacement: float,
+                 reuse_bounding_segments: bool = False, **kwargs: Any):
         """
         The constructor of the EventHandlerWithPiecewiseConstantBoundingPotential class.
 
@@ -262,6 +349,8 @@ class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEve
             The offset.
         max_displacement : float
             The maximum time displacement by which the active unit is displaced to determine the bounding event rate.
+        reuse_bounding_segments : bool, optional
+            Whether constant bounding event rates are stored and reused on the remaining part of their segment.
         kwargs : Any
             Additional kwargs which are passed to the __init__ method of the next class in the MRO.
 
@@ -278,13 +367,16 @@ class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEve
                                      .format(self.__class__.__name__))
         self._max_displacement = max_displacement
         self._bounding_event_rate = None
+        self._reuse_bounding_segments = reuse_bounding_segments
+        self._bounding_segment_store = _BoundingSegmentStore(self._maximum_number_of_bounding_segments)
 
     def _displacement_from_piecewise_constant_bounding_potential(self, potential_change: float) -> float:
         """
         Calculate the time displacement based on the constant bounding event rate.
 
-        The constant bounding event rate is determined dynamically. The ratio of the sampled potential change and this
-        bounding event rate then yields the time displacement.
+        The constant bounding event rate is determined dynamically, or it is taken from a stored segment the active
+        leaf unit is still located on if bounding segments are reused. The ratio of the sampled potential change and
+        this bounding event rate then yields the time displacement.
 
         Parameters
         ----------
@@ -297,6 +389,12 @@ class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEve
             The time displacement of the active leaf unit where the cumulative event rate equals the sampled potential
             change.
         """
+        if self._reuse_bounding_segments:
+            segment_key = (tuple(unit.identifier for unit in self._leaf_units), self._active_leaf_unit_index)
+            resumed_segment = self._resume_bounding_segment(segment_key)
+            if resumed_segment is not None:
+                return self._displacement_in_bounding_segment(potential_change, resumed_segment[1],
+                                                              resumed_segment[0])
         leaf_unit_positions = [unit.position for unit in self._leaf_units]
         separations = self._get_separations(leaf_unit_positions)
         charges = self._get_charges(self._leaf_units)
@@ -321,15 +419,113 @@ class EventHandlerWithPiecewiseConstantBoundingPotential(SingleActiveLeafUnitEve
             derivative_two = derivatives
 
         constant_derivative = max(derivative_one, derivative_two) + self._offset
+        if self._reuse_bounding_segments:
+            self._store_bounding_segment(segment_key, constant_derivative)
+        return self._displacement_in_bounding_segment(potential_change, constant_derivative, self._max_displacement)
+
+    def _displacement_in_bounding_segment(self, potential_change: float, constant_derivative: float,
+                                          segment_displacement: float) -> float:
+        """
+        Calculate the time displacement within a segment of a constant bounding event rate and set the bounding event
+        rate.
+
+        If the sampled potential change is not reached within the segment, the bounding event rate is set to None and
+        the time displacement to the end of the segment is returned.
+
+        Parameters
+        ----------
+        potential_change : float
+            The sampled potential change.
+        constant_derivative : float
+            The constant bounding event rate within the segment.
+        segment_displacement : float
+            The time displacement of the active leaf unit to the end of the segment.
+
+        Returns
+        -------
+        float
+            The time displacement of the active leaf unit.
+        """
         if constant_derivative <= 0.0:
             self._bounding_event_rate = None
-            return self._max_displacement
-        elif potential_change / constant_derivative < self._max_displacement:
+            return segment_displacement
+        elif potential_change / constant_derivative < segment_displacement:
             self._bounding_event_rate = constant_derivative
             return potential_change / constant_derivative
         else:
             self._bounding_event_rate = None
-            return self._max_displacement
+            return segment_displacement
+
+    def _store_bounding_segment(self, segment_key: Any, constant_derivative: float) -> None:
+        """
+        Store the segment of the trajectory of the active leaf unit starting at its present position together with
+        its constant bounding event rate.
+
+        Parameters
+        ----------
+        segment_key : Any
+            The identifiers of the leaf units and the index of the active leaf unit.
+        constant_derivative : float
+            The constant bounding event rate within the segment.
+        """
+        self._bounding_segment_store.store(segment_key, (
+            copy(self._active_leaf_unit.velocity),
+            [copy(unit.position) for index, unit in enumerate(self._leaf_units)
+             if index != self._active_leaf_unit_index],
+            copy(self._active_leaf_unit.position), copy(self._active_leaf_unit.time_stamp), constant_derivative))
+
+    def _resume_bounding_segment(self, segment_key: Any) -> Any:
+        """
+        Return the remaining time displacement and the constant bounding event rate of a stored segment if the active
+        leaf unit is still located on it.
+
+        The stored segment can only be resumed if the active leaf unit has the same velocity, if the positions of all
+        other leaf units are unchanged, and if the active leaf unit is located at the expected position on the segment
+        which is corrected for periodic boundaries. A stored segment that cannot be resumed is removed from the store.
+
+        Parameters
+        ----------
+        segment_key : Any
+            The identifiers of the leaf units and the index of the active leaf unit.
+
+        Returns
+        -------
+        (float, float) or None
+            The remaining time displacement and the constant bounding event rate of the segment, or None if no segment
+            can be resumed.
+        """
+        store = self._bounding_segment_store
+        segment = store.segments.get(segment_key)
+        resumed_segment = None
+        if segment is not None:
+            velocity, other_positions, start_position, start_time, constant_derivative = segment
+            elapsed_time = self._active_leaf_unit.time_stamp - start_time
+            remaining_displacement = self._max_displacement - elapsed_time
+            if (self._active_leaf_unit.velocity == velocity and elapsed_time >= 0.0
+                    and remaining_displacement > self._bounding_segment_tolerance
+                    and [unit.position for index, unit in enumerate(self._leaf_units)
+                         if index != self._active_leaf_unit_index] == other_positions):
+                expected_position = [setting.periodic_boundaries.correct_position_entry(
+                    start_position[d] + velocity[d] * elapsed_time, d) for d in range(setting.dimension)]
+                if all(abs(entry) < self._bounding_segment_tolerance for entry in
+                       setting.periodic_boundaries.separation_vector(expected_position,
+                                                                     self._active_leaf_unit.position)):
+                    resumed_segment = remaining_displacement, constant_derivative
+            if resumed_segment is not None:
+                store.segments.move_to_end(segment_key)
+            else:
+                # The segment is stale because it was consumed or because any leaf unit moved differently
+                del store.segments[segment_key]
+        store.number_of_searches += 1
+        if resumed_segment is not None:
+            store.number_of_resumed_segments += 1
+        if store.number_of_searches % self._bounding_segment_report_interval == 0:
+            logging.getLogger(__name__).info("The event handlers of the class {0} resumed {1} of {2} bounding "
+                                             "potentials from stored segments ({3:.1%}).".format(
+                                                 self.__class__.__name__, store.number_of_resumed_segments,
+                                                 store.number_of_searches,
+                                                 store.number_of_resumed_segments / store.number_of_searches))
+        return resumed_segment
 
     def _event_rate_from_piecewise_constant_bounding_potential(self) -> float:
         """
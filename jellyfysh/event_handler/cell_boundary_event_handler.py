@@ -51,6 +51,8 @@ class CellBoundaryEventHandler(BasicEventHandler, Initializer):
     with 1 (see base.time.Time class for more information).
     """
 
+    _shared_attributes = ("_cells",)
+
     def __init__(self) -> None:
         """The constructor of the CellBoundaryEventHandler class."""
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__)
@@ -136,13 +138,15 @@ class CellBoundaryEventHandler(BasicEventHandler, Initializer):
         for direction, velocity_component in enumerate(self._relevant_unit.velocity):
             if velocity_component != 0.0:
                 if velocity_component > 0.0:
-                    neighbor_boundary = self._cells.neighbor_cell(cell, direction, True).cell_min[direction]
+                    neighbor_boundary = self._cells.cell_min(
+                        self._cells.neighbor_cell(cell, direction, True))[direction]
                     separation = neighbor_boundary - self._relevant_unit.position[direction]
                     if separation < 0.0:
                         separation = setting.periodic_boundaries.next_image(separation, direction)
                     time_to_boundary = separation / velocity_component
                 else:
-                    neighbor_boundary = self._cells.neighbor_cell(cell, direction, False).cell_max[direction]
+                    neighbor_boundary = self._cells.cell_max(
+                        self._cells.neighbor_cell(cell, direction, False))[direction]
                     separation = self._relevant_unit.position[direction] - neighbor_boundary
                     if separation < 0.0:
                         separation = setting.periodic_boundaries.next_image(separation, direction)
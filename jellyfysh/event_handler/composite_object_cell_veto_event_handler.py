@@ -61,7 +61,8 @@ class CompositeObjectCellVetoEventHandler(CellVetoEventHandler, TwoCompositeObje
     with 1 (see base.time.Time class for more information).
     """
 
-    def __init__(self, estimator: Estimator, lifting: Lifting, potential: Potential = None, charge: str = None) -> None:
+    def __init__(self, estimator: Estimator, lifting: Lifting, potential: Potential = None, charge: str = None,
+                 block_level: int = None) -> None:
         """
         The constructor of the CompositeObjectCellVetoEventHandler class.
 
@@ -77,12 +78,17 @@ class CompositeObjectCellVetoEventHandler(CellVetoEventHandler, TwoCompositeObje
             The potential between two leaf units.
         charge : str or None, optional
             The relevant charge for this event handler.
+        block_level : int or None, optional
+            The top block level of the hierarchy of blocks of cells that is used to sample target cells. If None, target
+            cells are sampled with the Walker scheme.
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            estimator=estimator.__class__.__name__, lifting=lifting.__class__.__name__,
-                           potential=None if potential is None else potential.__class__.__name__, charge=charge)
+                           potential=None if potential is None else potential.__class__.__name__, charge=charge,
+                           block_level=block_level)
         super().__init__(estimator=estimator, lifting=lifting,
-                         potential=estimator.potential if potential is None else potential, charge=charge)
+                         potential=estimator.potential if potential is None else potential, charge=charge,
+                         block_level=block_level)
         self._charge = charge
 
     # noinspection PyMethodOverriding
@@ -21,8 +21,9 @@
 #
 """Module for the abstract EventHandler class."""
 from abc import ABCMeta, abstractmethod
+from copy import deepcopy
 import inspect
-from typing import Any, Sequence, Tuple, Union
+from typing import Any, List, Sequence, Tuple, Union
 from jellyfysh.base.time import Time
 
 
@@ -49,6 +50,13 @@ class EventHandler(metaclass=ABCMeta):
 
     The precise format of the in-state and the out-state is specified by the used state handler.
 
+    Several copies of the same event handler can compute candidate events simultaneously. These copies are created with
+    the clone method. A clone is a deepcopy of this event handler which however shares the members that are only read
+    after the initialization of the event handler (for example, potentials, estimators, or tables of derivative bounds).
+    The names of these attributes are stored in the _shared_attributes class attribute. Inheriting classes extend this
+    tuple by defining their own _shared_attributes class attribute which is collected along the MRO. Members that store
+    information about the last computed candidate event must never be shared.
+
     Note that in order to avoid loss of precision during long runs of JF, candidate event times and time stamps of
     active units are not stored as simple floats but as the quotient and remainder of an integer division of the time
     with 1 (see base.time.Time class for more information).
@@ -61,6 +69,8 @@ class EventHandler(metaclass=ABCMeta):
         The number of arguments of the send_out_state method.
     """
 
+    _shared_attributes = ()
+
     def __init__(self, **kwargs: Any):
         """
         The constructor of the EventHandler class.
@@ -123,3 +133,39 @@ class EventHandler(metaclass=ABCMeta):
             The out-state.
         """
         raise NotImplementedError
+
+    def clone(self) -> "EventHandler":
+        """
+        Return a copy of this event handler that can compute candidate events independently of this event handler.
+
+        All attributes are deepcopied except for the attributes whose names appear in the _shared_attributes class
+        attributes of the classes in the MRO. These members are shared between this event handler and the clone.
+
+        Returns
+        -------
+        EventHandler
+            The clone.
+        """
+        memo = {id(shared_member): shared_member for shared_member in self.get_shared_members()}
+        return deepcopy(self, memo)
+
+    def get_shared_members(self) -> List[Any]:
+        """
+        Return the members of this event handler whose names appear in the _shared_attributes class attributes of the
+        classes in the MRO.
+
+        These members are only read after the initialization of this event handler. They are shared with all clones of
+        this event handler. Shared members which were not set (or are None) are not returned.
+
+        Returns
+        -------
+        List[Any]
+            The shared members.
+        """
+        shared_members = []
+        for cls in self.__class__.__mro__:
+            for attribute in cls.__dict__.get("_shared_attributes", ()):
+                shared_member = getattr(self, attribute, None)
+                if shared_member is not None:
+                    shared_members.append(shared_member)
+        return shared_members
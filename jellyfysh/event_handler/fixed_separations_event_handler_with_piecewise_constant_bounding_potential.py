@@ -65,7 +65,7 @@ class FixedSeparationsEventHandlerWithPiecewiseConstantBoundingPotential(
     """
 
     def __init__(self, potential: Potential, lifting: Lifting, offset: float, max_displacement: float,
-                 separations: Sequence[int]) -> None:
+                 separations: Sequence[int], reuse_bounding_segments: bool = False) -> None:
         """
         The constructor of the FixedSeparationsEventHandlerWithPiecewiseConstantBoundingPotential class.
 
@@ -82,6 +82,8 @@ class FixedSeparationsEventHandlerWithPiecewiseConstantBoundingPotential(
         separations : Sequence[int]
             A sequence of integers in the format [i1, j1, i2, j2...in, jn]. The separations passed to the potential
             will be [r_j1 - r_i1, r_j2 - r_i2, ..., r_jn - r_in].
+        reuse_bounding_segments : bool, optional
+            Whether constant bounding event rates are stored and reused on the remaining part of their segment.
 
         Raises
         ------
@@ -94,8 +96,9 @@ class FixedSeparationsEventHandlerWithPiecewiseConstantBoundingPotential(
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            potential=potential.__class__.__name__,
                            lifting=lifting.__class__.__name__, offset=offset, max_displacement=max_displacement,
-                           separations=separations)
-        super().__init__(potential=potential, offset=offset, max_displacement=max_displacement)
+                           separations=separations, reuse_bounding_segments=reuse_bounding_segments)
+        super().__init__(potential=potential, offset=offset, max_displacement=max_displacement,
+                         reuse_bounding_segments=reuse_bounding_segments)
         self._lifting = lifting
         self._separations = separations
         if len(self._separations) % 2 != 0:
@@ -0,0 +1,517 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the HierarchicalCellVetoSampler and the TopBlockRateCache classes used in the cell veto event handlers."""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import accumulate
+import random
+from typing import List, Optional, Sequence, Tuple, Union
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
+from jellyfysh.activator.internal_state.multi_active_cell_occupancy import MultiActiveCellOccupancy
+from jellyfysh.activator.internal_state.single_active_cell_occupancy import SingleActiveCellOccupancy
+import jellyfysh.setting as setting
+
+
+class HierarchicalCellVetoSampler(object):
+    """
+    Class to sample target cells of the cell-veto algorithm coarse-to-fine in the hierarchy of blocks of cells of an
+    IndexedCuboidPeriodicCells instance under consideration of the occupancy of the blocks.
+
+    This class receives the event rate for each relative cell (with respect to the zero cell). For a given active cell,
+    the event rate of any target cell is then given by the event rate of the relative cell of the target cell with
+    respect to the active cell. The event rate of a block of cells is the sum of the event rates of all cells in the
+    block. In order to compute the event rate of any block for any active cell in constant time, the event rates of the
+    relative cells are periodically continued onto a cuboid grid with twice the number of cells per side, and the
+    summed-area table of this grid is stored.
+
+    Contrary to the Walker classes, the total event rate of this class depends on the active cell and on the
+    cell-occupancy system. Only the blocks on the top block level that contain at least one occupant contribute their
+    event rate to the total event rate. The number of occupants of all blocks on all levels is updated incrementally by
+    the cell-occupancy system (see SingleActiveCellOccupancy and MultiActiveCellOccupancy classes). Blocks on the top
+    block level that contain no occupant are therefore skipped entirely. Their event rate does not lead to any (vetoed)
+    events. The event rates of the occupied blocks on the top level for a given active cell are stored in a
+    TopBlockRates instance which is updated incrementally by a TopBlockRateCache instance. This class only stores data
+    that does not change during the run, so that it can be shared between event handlers.
+
+    A target cell is sampled in trials. Each trial first samples a block on the top level with a probability that is
+    proportional to its event rate. Then, one of the blocks on the level below is sampled with a probability
+    proportional to its event rate, and so on until a cell is reached. If a block without occupants is reached on this
+    way, the trial yields an empty target cell. Since the corresponding event would be vetoed without changing the
+    global state, the trial is discarded and a new trial is started. The candidate event time of the cell-veto event
+    handler is then the sum of the exponentially distributed times of all trials. Since the global state does not change
+    until the candidate event time (otherwise the event is trashed), this is equivalent to vetoing the events of the
+    discarded trials. In order to bound the computational cost per event, the number of trials is limited. In the last
+    trial, blocks without occupants are not discarded so that the last trial can yield an empty target cell whose
+    event is then vetoed by the event handler.
+
+    The cost of a trial is logarithmic in the number of cells. The top block level determines the trade-off between the
+    memory of the TopBlockRates instances (which is proportional to the number of blocks on the top level) and the
+    number of discarded trials.
+    """
+
+    _maximum_number_of_trials = 64
+    """The maximum number of trials per sampled target cell."""
+
+    def __init__(self, cells: IndexedCuboidPeriodicCells, relative_cell_rates: Sequence[float],
+                 top_block_level: int) -> None:
+        """
+        The constructor of the HierarchicalCellVetoSampler class.
+
+        Parameters
+        ----------
+        cells : activator.internal_state.cell_occupancy.cells.IndexedCuboidPeriodicCells
+            The integer-indexed cuboid periodic cell system.
+        relative_cell_rates : Sequence[float]
+            The non-negative event rate of each relative cell, indexed by the relative cell.
+        top_block_level : int
+            The top block level of the hierarchy of blocks of cells.
+
+        Raises
+        ------
+        AssertionError
+            If the top block level does not exist in the cell system.
+        AssertionError
+            If an event rate of a relative cell is smaller than zero.
+        """
+        assert 0 <= top_block_level < cells.number_of_block_levels
+        assert all(rate >= 0.0 for rate in relative_cell_rates)
+        self._cells = cells
+        self._top_block_level = top_block_level
+        self._relative_cell_rates = array("d", relative_cell_rates)
+        self._cells_per_side = tuple(cells.cells_per_side)
+        self._sizes = tuple(2 * cells_per_side + 1 for cells_per_side in self._cells_per_side)
+        self._strides = tuple(accumulate((1,) + self._sizes[:-1], lambda first, second: first * second))
+        # Each corner of a box contributes to the box sum with a sign and either with the minimum or maximum.
+        self._corners = [(-1 if (setting.dimension - bin(corner).count("1")) % 2 else 1,
+                          tuple((corner >> direction) & 1 for direction in range(setting.dimension)))
+                         for corner in range(1 << setting.dimension)]
+        self._summed_rates = self._summed_area_table()
+        # Differences of the summed-area table have rounding errors that are relative to the sum of all event rates.
+        self._rate_tolerance = 1.0e-12 * sum(self._relative_cell_rates)
+
+    def _summed_area_table(self) -> array:
+        """
+        Construct the summed-area table of the event rates of the relative cells that are periodically continued onto a
+        grid with twice the number of cells per side.
+
+        The entry of the grid with the identifier x + 1 in a given direction corresponds to the relative cell with the
+        identifier x - cells_per_side (modulo cells_per_side) in this direction. The first entry in each direction is
+        zero.
+        """
+        cumulative_products = tuple(accumulate((1,) + self._cells_per_side[:-1],
+                                               lambda first, second: first * second))
+        summed_rates = array("d", bytes(8 * self._strides[-1] * self._sizes[-1]))
+        for index in range(len(summed_rates)):
+            grid_coordinates = [(index // stride) % size for stride, size in zip(self._strides, self._sizes)]
+            if all(grid_coordinates):
+                summed_rates[index] = self._relative_cell_rates[sum(
+                    (grid_coordinate - 1) % cells_per_side * cumulative_product
+                    for grid_coordinate, cells_per_side, cumulative_product
+                    in zip(grid_coordinates, self._cells_per_side, cumulative_products))]
+        for stride, size in zip(self._strides, self._sizes):
+            for outer_start in range(0, len(summed_rates), stride * size):
+                for grid_coordinate in range(1, size):
+                    start = outer_start + grid_coordinate * stride
+                    summed_rates[start:start + stride] = array("d", map(
+                        float.__add__, summed_rates[start:start + stride], summed_rates[start - stride:start]))
+        return summed_rates
+
+    @property
+    def top_block_level(self) -> int:
+        """
+        Return the top block level of the hierarchy of blocks of cells.
+
+        Returns
+        -------
+        int
+            The top block level.
+        """
+        return self._top_block_level
+
+    def block_rate(self, block: int, level: int, active_cell_coordinates: Sequence[int]) -> float:
+        """
+        Return the event rate of the given block for the given active cell.
+
+        The event rate of the block is the sum of the event rates of the relative cells of all cells in the block with
+        respect to the active cell. Event rates that vanish up to the rounding errors of the summed-area table are set
+        to zero.
+
+        Parameters
+        ----------
+        block : int
+            The block.
+        level : int
+            The block level.
+        active_cell_coordinates : Sequence[int]
+            The cell identifiers in each direction of the active cell.
+
+        Returns
+        -------
+        float
+            The event rate of the block.
+        """
+        minimums, maximums = self._cells.block_coordinate_range(block, level)
+        # Shift the cell identifiers relative to the active cell into the range [0, 2 * cells_per_side].
+        terms = [((minimum - active_coordinate + cells_per_side) * stride,
+                  (maximum - active_coordinate + cells_per_side) * stride)
+                 for minimum, maximum, active_coordinate, cells_per_side, stride
+                 in zip(minimums, maximums, active_cell_coordinates, self._cells_per_side, self._strides)]
+        summed_rates = self._summed_rates
+        rate = 0.0
+        for sign, selection in self._corners:
+            rate += sign * summed_rates[sum(term[selected] for term, selected in zip(terms, selection))]
+        return rate if rate > self._rate_tolerance else 0.0
+
+    def top_block_rate(self, block: int, active_cell: int) -> float:
+        """
+        Return the event rate of the given block on the top level for the given active cell.
+
+        Parameters
+        ----------
+        block : int
+            The block on the top level.
+        active_cell : int
+            The active cell.
+
+        Returns
+        -------
+        float
+            The event rate of the block.
+        """
+        if self._top_block_level == 0:
+            return self._relative_cell_rates[self._cells.relative_cell(block, active_cell)]
+        return self.block_rate(block, self._top_block_level, self._cells.cell_coordinates(active_cell))
+
+    def sample_cell(self, active_cell: int, cell_occupancy: Union[SingleActiveCellOccupancy, MultiActiveCellOccupancy],
+                    top_block_rates: "TopBlockRates") -> Optional[Tuple[float, int, Optional[int]]]:
+        """
+        Sample a target cell for the given active cell.
+
+        This method returns the total event rate for the active cell, the number of trials that were needed to sample
+        the target cell, and the target cell. The target cell is only empty if the maximum number of trials was reached.
+        If no block on the top level contains an occupant, or if the total event rate is zero, this method returns None.
+        In the unlikely case that the last trial fails because of rounding errors, the returned target cell is None.
+        The time of all rejected trials has nevertheless elapsed, so the number of trials is still returned.
+
+        Parameters
+        ----------
+        active_cell : int
+            The active cell.
+        cell_occupancy : activator.internal_state.SingleActiveCellOccupancy or
+                         activator.internal_state.MultiActiveCellOccupancy
+            The cell-occupancy system.
+        top_block_rates : TopBlockRates
+            The event rates of the occupied blocks on the top level for the active cell.
+
+        Returns
+        -------
+        (float, int, int or None) or None
+            The total event rate, the number of trials, the target cell.
+        """
+        total_rate = top_block_rates.total_rate()
+        if total_rate <= 0.0:
+            return None
+        active_cell_coordinates = self._cells.cell_coordinates(active_cell)
+        for trial in range(1, self._maximum_number_of_trials + 1):
+            discard_empty = trial < self._maximum_number_of_trials
+            block = top_block_rates.sample_block(random.uniform(0.0, total_rate))
+            # The block is only None because of rounding errors.
+            if block is not None:
+                target_cell = self._descend(block, active_cell, active_cell_coordinates, cell_occupancy,
+                                            discard_empty)
+                if target_cell is not None:
+                    return total_rate, trial, target_cell
+        return total_rate, self._maximum_number_of_trials, None
+
+    def _descend(self, block: int, active_cell: int, active_cell_coordinates: Sequence[int],
+                 cell_occupancy: Union[SingleActiveCellOccupancy, MultiActiveCellOccupancy],
+                 discard_empty: bool) -> Optional[int]:
+        """
+        Sample a cell in the given block on the top level coarse-to-fine.
+
+        If discard_empty is True, None is returned as soon as a block without occupants is sampled. If the event rates
+        of all child blocks vanish up to rounding errors, the cell is sampled directly among all cells of the block.
+        """
+        for level in range(self._top_block_level, 0, -1):
+            children = self._cells.block_children(block, level)
+            if level > 1:
+                rates = [self.block_rate(child, level - 1, active_cell_coordinates) for child in children]
+            else:
+                rates = [self._relative_cell_rates[self._cells.relative_cell(child, active_cell)]
+                         for child in children]
+            cumulative_rates = list(accumulate(rates))
+            if cumulative_rates[-1] <= 0.0:
+                return self._sample_cell_in_block(block, level, active_cell, cell_occupancy, discard_empty)
+            block = children[_sample_index(cumulative_rates)]
+            if discard_empty and not cell_occupancy.block_occupancy(level - 1)[block]:
+                return None
+        return block
+
+    def _sample_cell_in_block(self, block: int, level: int, active_cell: int,
+                              cell_occupancy: Union[SingleActiveCellOccupancy, MultiActiveCellOccupancy],
+                              discard_empty: bool) -> Optional[int]:
+        """
+        Sample a cell among all cells of the given block with the event rates of the relative cells.
+
+        If discard_empty is True and the sampled cell contains no occupant, or if all event rates vanish, None is
+        returned.
+        """
+        cells = [block]
+        for child_level in range(level, 0, -1):
+            cells = [child for cell in cells for child in self._cells.block_children(cell, child_level)]
+        cumulative_rates = list(accumulate(self._relative_cell_rates[self._cells.relative_cell(cell, active_cell)]
+                                           for cell in cells))
+        if cumulative_rates[-1] <= 0.0:
+            return None
+        cell = cells[_sample_index(cumulative_rates)]
+        if discard_empty and not cell_occupancy.block_occupancy(0)[cell]:
+            return None
+        return cell
+
+
+def _sample_index(cumulative_rates: Sequence[float]) -> int:
+    """Sample an index with a probability proportional to the differences of the positive cumulative rates."""
+    index = bisect_right(cumulative_rates, random.uniform(0.0, cumulative_rates[-1]))
+    # The uniform random number can be equal to the upper bound.
+    if index == len(cumulative_rates):
+        index = bisect_left(cumulative_rates, cumulative_rates[-1])
+    return index
+
+
+class TopBlockRates(object):
+    """
+    Class to store the event rates of all blocks on the top block level of a HierarchicalCellVetoSampler for a single
+    active cell in a binary indexed tree (Fenwick tree).
+
+    The event rate of blocks without occupants is zero. Single event rates can be changed, and the total event rate can
+    be computed in logarithmic time in the number of blocks. Also, a block can be sampled with a probability
+    proportional to its event rate in logarithmic time. Since the changes of the event rates accumulate rounding errors
+    in the binary indexed tree, it is set up again after as many changes as there are blocks.
+    """
+
+    def __init__(self, rates: Sequence[float]) -> None:
+        """
+        The constructor of the TopBlockRates class.
+
+        Parameters
+        ----------
+        rates : Sequence[float]
+            The non-negative event rate of every block on the top level.
+        """
+        self._rates = array("d", rates)
+        self._highest_power_of_two = 1 << (len(self._rates).bit_length() - 1) if self._rates else 0
+        self._tree = None
+        self._number_of_changes = 0
+        self._set_up_tree()
+
+    def _set_up_tree(self) -> None:
+        """Set up the binary indexed tree of the event rates where the first entry is not used."""
+        tree = array("d", [0.0]) + self._rates
+        size = len(self._rates)
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+        self._number_of_changes = 0
+
+    def set_rate(self, block: int, rate: float) -> None:
+        """
+        Set the event rate of the given block.
+
+        Parameters
+        ----------
+        block : int
+            The block on the top level.
+        rate : float
+            The non-negative event rate.
+        """
+        change = rate - self._rates[block]
+        if change == 0.0:
+            return
+        self._rates[block] = rate
+        self._number_of_changes += 1
+        if self._number_of_changes > len(self._rates):
+            self._set_up_tree()
+            return
+        tree = self._tree
+        size = len(self._rates)
+        index = block + 1
+        while index <= size:
+            tree[index] += change
+            index += index & -index
+
+    def total_rate(self) -> float:
+        """
+        Return the sum of the event rates of all blocks.
+
+        Returns
+        -------
+        float
+            The total event rate.
+        """
+        tree = self._tree
+        total_rate = 0.0
+        index = len(self._rates)
+        while index > 0:
+            total_rate += tree[index]
+            index -= index & -index
+        return total_rate
+
+    def sample_block(self, value: float) -> Optional[int]:
+        """
+        Return the first block where the cumulative event rate exceeds the given value.
+
+        If the value is uniformly distributed between zero and the total event rate, the block is sampled with a
+        probability proportional to its event rate. Because of rounding errors, the block could have a vanishing event
+        rate or the value could exceed the total event rate. Then, None is returned.
+
+        Parameters
+        ----------
+        value : float
+            The value.
+
+        Returns
+        -------
+        int or None
+            The block.
+        """
+        tree = self._tree
+        size = len(self._rates)
+        position = 0
+        step = self._highest_power_of_two
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] <= value:
+                position = next_position
+                value -= tree[next_position]
+            step >>= 1
+        if position == size or self._rates[position] <= 0.0:
+            return None
+        return position
+
+
+class TopBlockRateCache(object):
+    """
+    Class to sample target cells with a HierarchicalCellVetoSampler based on a cell-occupancy system, where the event
+    rates of the occupied blocks on the top level are cached for the most recent active cells.
+
+    For each cached active cell, the event rates are stored in a TopBlockRates instance. When it is used again, only the
+    event rates of the blocks on the top level that became empty or occupied in the meantime are updated (see the
+    block_transitions method of the cell-occupancy system). The cost per sampled target cell is therefore logarithmic
+    in the number of cells whenever the active cell was used recently. Otherwise, the event rates of all blocks on the
+    top level are computed.
+
+    Contrary to the HierarchicalCellVetoSampler, this class changes during the run. It must therefore not be shared
+    between event handlers. A deepcopy of this class (for example, when an event handler is cloned) shares the sampler
+    and the cell-occupancy system with the original instance. Only the cached event rates are copied.
+    """
+
+    _maximum_number_of_active_cells = 16
+    """The maximum number of active cells whose event rates are cached."""
+
+    def __init__(self, sampler: HierarchicalCellVetoSampler,
+                 cell_occupancy: Union[SingleActiveCellOccupancy, MultiActiveCellOccupancy]) -> None:
+        """
+        The constructor of the TopBlockRateCache class.
+
+        Parameters
+        ----------
+        sampler : HierarchicalCellVetoSampler
+            The sampler.
+        cell_occupancy : activator.internal_state.SingleActiveCellOccupancy or
+                         activator.internal_state.MultiActiveCellOccupancy
+            The cell-occupancy system.
+        """
+        self._sampler = sampler
+        self._cell_occupancy = cell_occupancy
+        # Maps the active cells onto the number of known block transitions and the event rates of the top blocks.
+        self._top_block_rates = OrderedDict()
+
+    def __deepcopy__(self, memo: dict) -> "TopBlockRateCache":
+        """Deepcopy this class while sharing the sampler and the cell-occupancy system."""
+        copied_cache = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied_cache
+        copied_cache.__dict__.update(self.__dict__)
+        copied_cache._top_block_rates = deepcopy(self._top_block_rates, memo)
+        return copied_cache
+
+    def sample_cell(self, active_cell: int) -> Optional[Tuple[float, int, Optional[int]]]:
+        """
+        Sample a target cell for the given active cell.
+
+        See the sample_cell method of the HierarchicalCellVetoSampler class for the returned values.
+
+        Parameters
+        ----------
+        active_cell : int
+            The active cell.
+
+        Returns
+        -------
+        (float, int, int or None) or None
+            The total event rate, the number of trials, the target cell.
+        """
+        return self._sampler.sample_cell(active_cell, self._cell_occupancy, self.top_block_rates(active_cell))
+
+    def top_block_rates(self, active_cell: int) -> TopBlockRates:
+        """
+        Return the updated event rates of the occupied blocks on the top level for the given active cell.
+
+        Parameters
+        ----------
+        active_cell : int
+            The active cell.
+
+        Returns
+        -------
+        TopBlockRates
+            The event rates.
+        """
+        top_block_level = self._sampler.top_block_level
+        number_of_transitions = self._cell_occupancy.number_of_block_transitions(top_block_level)
+        block_occupancy = self._cell_occupancy.block_occupancy(top_block_level)
+        entry = self._top_block_rates.get(active_cell)
+        if entry is not None:
+            changed_blocks = self._cell_occupancy.block_transitions(top_block_level, entry[0])
+            if changed_blocks is not None:
+                top_block_rates = entry[1]
+                for block in set(changed_blocks):
+                    top_block_rates.set_rate(
+                        block, self._sampler.top_block_rate(block, active_cell) if block_occupancy[block] else 0.0)
+                self._top_block_rates[active_cell] = (number_of_transitions, top_block_rates)
+                self._top_block_rates.move_to_end(active_cell)
+                return top_block_rates
+        top_block_rates = TopBlockRates(self._rates(active_cell, block_occupancy))
+        self._top_block_rates[active_cell] = (number_of_transitions, top_block_rates)
+        self._top_block_rates.move_to_end(active_cell)
+        if len(self._top_block_rates) > self._maximum_number_of_active_cells:
+            self._top_block_rates.popitem(last=False)
+        return top_block_rates
+
+    def _rates(self, active_cell: int, block_occupancy: Sequence[int]) -> List[float]:
+        """Return the event rates of all blocks on the top level where blocks without occupants have no event rate."""
+        return [self._sampler.top_block_rate(block, active_cell) if number_of_occupants else 0.0
+                for block, number_of_occupants in enumerate(block_occupancy)]
@@ -56,7 +56,8 @@ class LeafUnitCellVetoEventHandler(CellVetoEventHandler):
     with 1 (see base.time.Time class for more information).
     """
 
-    def __init__(self, estimator: Estimator, potential: Potential = None, charge: str = None) -> None:
+    def __init__(self, estimator: Estimator, potential: Potential = None, charge: str = None,
+                 block_level: int = None) -> None:
         """
         The constructor of the LeafUnitCellVetoEventHandler class.
 
@@ -70,6 +71,9 @@ class LeafUnitCellVetoEventHandler(CellVetoEventHandler):
             The potential between two leaf units.
         charge : str or None, optional
             The relevant charge for this event handler.
+        block_level : int or None, optional
+            The top block level of the hierarchy of blocks of cells that is used to sample target cells. If None, target
+            cells are sampled with the Walker scheme.
 
         Raises
         ------
@@ -78,8 +82,10 @@ class LeafUnitCellVetoEventHandler(CellVetoEventHandler):
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            estimator=estimator.__class__.__name__,
-                           potential=None if potential is None else potential.__class__.__name__, charge=charge)
-        super().__init__(estimator=estimator, potential=estimator.potential if potential is None else potential)
+                           potential=None if potential is None else potential.__class__.__name__, charge=charge,
+                           block_level=block_level)
+        super().__init__(estimator=estimator, potential=estimator.potential if potential is None else potential,
+                         block_level=block_level)
         self._charge = charge
         if charge is None:
             self._charges = lambda unit_one, unit_two: tuple(1.0 for _ in
@@ -28,6 +28,7 @@ from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node
 from jellyfysh.base.time import Time
 from jellyfysh.potential import Potential, InvertiblePotential
+from jellyfysh.potential.abstracts import PairwiseDerivativesPotential, SummedInvertiblePotential
 import jellyfysh.setting as setting
 from jellyfysh.state_handler.tree_state_handler import StateId
 from .abstracts import CompositeObjectsLifting
@@ -52,6 +53,12 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
     If the (bounding) potential can consider charges, this event handler can pass the charges of the two respective leaf
     units to the potential. The name of the used charge is set on initialization.
 
+    If the fused_kernel option is set, the potential and the bounding potential treat all pairs of leaf units in a
+    single call. For this, the potential has to be a PairwiseDerivativesPotential and the bounding potential has to be
+    a SummedInvertiblePotential (see potential.abstracts module), as for example the MergedImageCoulombPotential and
+    the InversePowerCoulombBoundingPotential classes.
+    This yields the same results as the loop over all pairs of leaf units in Python which is used otherwise.
+
     Note that in order to avoid loss of precision during long runs of JF, candidate event times and time stamps of
     active units are not stored as simple floats but as the quotient and remainder of an integer division of the time
     with 1 (see base.time.Time class for more information). The time displacements returned by the bounding potential's
@@ -59,7 +66,10 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
     a run of JF.
     """
 
-    def __init__(self, potential: Potential, bounding_potential: InvertiblePotential, charge: str = None) -> None:
+    _shared_attributes = ("_potential", "_bounding_potential")
+
+    def __init__(self, potential: Potential, bounding_potential: InvertiblePotential, charge: str = None,
+                 fused_kernel: bool = False) -> None:
         """
         The constructor of the RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler class.
 
@@ -71,6 +81,8 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
             The invertible bounding potential between the leaf units.
         charge : str or None, optional
             The relevant charge for this event handler.
+        fused_kernel : bool, optional
+            Whether the potential and the bounding potential treat all pairs of leaf units in a single call.
 
         Raises
         ------
@@ -84,10 +96,17 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
             If the number of nodes per root node is one and therefore no composite objects are present in the run.
         base.exceptions.ConfigurationError:
             If the displacement method of the bounding potential does not require a potential change.
+        base.exceptions.ConfigurationError:
+            If the fused kernel should be used but the potential is not a PairwiseDerivativesPotential or the bounding
+            potential is not a SummedInvertiblePotential.
+        base.exceptions.ConfigurationError:
+            If the fused kernel should be used but the potential or the bounding potential expects not exactly 2
+            charges.
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            potential=potential.__class__.__name__,
-                           bounding_potential=bounding_potential.__class__.__name__, charge=charge)
+                           bounding_potential=bounding_potential.__class__.__name__, charge=charge,
+                           fused_kernel=fused_kernel)
         super().__init__()
         self._potential = potential
         self._bounding_potential = bounding_potential
@@ -120,6 +139,23 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
         if not self._bounding_potential.potential_change_required:
             raise ConfigurationError("The event handler {0} expects a bounding potential that requires a potential "
                                      "change in its displacement method.".format(self.__class__.__name__))
+        self._fused_kernel = fused_kernel
+        if fused_kernel:
+            if not (isinstance(self._potential, PairwiseDerivativesPotential)
+                    and isinstance(self._bounding_potential, SummedInvertiblePotential)):
+                raise ConfigurationError("The event handler {0} was initialized with fused_kernel=True, but its "
+                                         "potential {1} is not a PairwiseDerivativesPotential and/or its bounding "
+                                         "potential {2} is not a SummedInvertiblePotential."
+                                         .format(self.__class__.__name__, self._potential.__class__.__name__,
+                                                 self._bounding_potential.__class__.__name__))
+            if (self._potential.number_charge_arguments != 2
+                    or self._bounding_potential.number_charge_arguments != 2):
+                raise ConfigurationError("The event handler {0} was initialized with fused_kernel=True, but its "
+                                         "potential {1} and/or its bounding potential {2} expects not exactly 2 "
+                                         "charges.".format(self.__class__.__name__, self._potential.__class__.__name__,
+                                                           self._bounding_potential.__class__.__name__))
+            self._charges = ((lambda units: [1.0] * len(units)) if charge is None
+                             else (lambda units: [unit.charge[charge] for unit in units]))
 
     def send_event_time(self, in_state: Sequence[Node]) -> Tuple[Time, List[StateId]]:
         """
@@ -156,13 +192,21 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
         self._construct_leaf_cnodes()
         self._construct_leaf_units_of_composite_objects()
         assert all(unit.velocity == self._local_leaf_units[0].velocity for unit in self._local_leaf_units)
-        time_displacement = min(self._bounding_potential.displacement(
-            local_leaf_unit.velocity,
-            setting.periodic_boundaries.separation_vector(local_leaf_unit.position, target_leaf_unit.position),
-            *self._bounding_potential_charges(local_leaf_unit, target_leaf_unit),
-            random.expovariate(setting.beta))
-                           for local_leaf_unit in self._local_leaf_units
-                           for target_leaf_unit in self._target_leaf_units)
+        if self._fused_kernel:
+            time_displacement = self._bounding_potential.minimum_displacement(
+                self._local_leaf_units[0].velocity, [unit.position for unit in self._local_leaf_units],
+                self._charges(self._local_leaf_units), [unit.position for unit in self._target_leaf_units],
+                self._charges(self._target_leaf_units),
+                [random.expovariate(setting.beta)
+                 for _ in range(len(self._local_leaf_units) * len(self._target_leaf_units))])
+        else:
+            time_displacement = min(self._bounding_potential.displacement(
+                local_leaf_unit.velocity,
+                setting.periodic_boundaries.separation_vector(local_leaf_unit.position, target_leaf_unit.position),
+                *self._bounding_potential_charges(local_leaf_unit, target_leaf_unit),
+                random.expovariate(setting.beta))
+                                    for local_leaf_unit in self._local_leaf_units
+                                    for target_leaf_unit in self._target_leaf_units)
         self._event_time = self._local_leaf_units[0].time_stamp + time_displacement
         self._time_slice_all_units_in_state()
         return self._event_time, [(self._local_leaf_units[0].identifier[0],),
@@ -192,15 +236,24 @@ class RootUnitActiveTwoCompositeObjectSummedBoundingPotentialEventHandler(Compos
         """
         bounding_event_rate = 0.0
         factor_derivative = 0.0
-        for active_leaf_unit in self._local_leaf_units:
-            for target_leaf_unit in self._target_leaf_units:
-                separation = setting.periodic_boundaries.separation_vector(active_leaf_unit.position,
-                                                                           target_leaf_unit.position)
-                bounding_event_rate += max(0.0, self._bounding_potential.derivative(
-                    active_leaf_unit.velocity, separation, *self._bounding_potential_charges(active_leaf_unit,
-                                                                                             target_leaf_unit)))
-                factor_derivative += self._potential.derivative(
-                    active_leaf_unit.velocity, separation, *self._potential_charges(active_leaf_unit, target_leaf_unit))
+        if self._fused_kernel:
+            arguments = (self._local_leaf_units[0].velocity, [unit.position for unit in self._local_leaf_units],
+                         self._charges(self._local_leaf_units), [unit.position for unit in self._target_leaf_units],
+                         self._charges(self._target_leaf_units))
+            bounding_event_rate = self._bounding_potential.summed_positive_derivative(*arguments)
+            for pairwise_derivative in self._potential.pairwise_derivatives(*arguments):
+                factor_derivative += pairwise_derivative
+        else:
+            for active_leaf_unit in self._local_leaf_units:
+                for target_leaf_unit in self._target_leaf_units:
+                    separation = setting.periodic_boundaries.separation_vector(active_leaf_unit.position,
+                                                                               target_leaf_unit.position)
+                    bounding_event_rate += max(0.0, self._bounding_potential.derivative(
+                        active_leaf_unit.velocity, separation, *self._bounding_potential_charges(active_leaf_unit,
+                                                                                                 target_leaf_unit)))
+                    factor_derivative += self._potential.derivative(
+                        active_leaf_unit.velocity, separation, *self._potential_charges(active_leaf_unit,
+                                                                                        target_leaf_unit))
         bounding_potential_warning(self.__class__.__name__, bounding_event_rate, factor_derivative)
         self._store_in_state(composite_object_root_cnodes)
         self._time_slice_all_units_in_state()
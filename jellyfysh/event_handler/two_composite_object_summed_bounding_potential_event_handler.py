@@ -22,13 +22,15 @@
 """Module for the TwoCompositeObjectSummedBoundingPotentialEventHandler class."""
 import logging
 import random
-from typing import Sequence
+from typing import List, Sequence
 from jellyfysh.base.exceptions import ConfigurationError, bounding_potential_warning
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node
+from jellyfysh.base.unit import Unit
 from jellyfysh.base.time import Time
 from jellyfysh.lifting import Lifting
 from jellyfysh.potential import Potential, InvertiblePotential
+from jellyfysh.potential.abstracts import PairwiseDerivativesPotential, SummedInvertiblePotential
 import jellyfysh.setting as setting
 from .abstracts import TwoCompositeObjectBoundingPotentialEventHandler
 
@@ -56,6 +58,12 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
 
     Since the interaction involves more than two leaf units, a lifting scheme is required.
 
+    If the fused_kernel option is set, the potential and the bounding potential treat all pairs of leaf units in a
+    single call. For this, the potential has to be a PairwiseDerivativesPotential and the bounding potential has to be
+    a SummedInvertiblePotential (see potential.abstracts module), as for example the MergedImageCoulombPotential and
+    the InversePowerCoulombBoundingPotential classes.
+    This yields the same results as the loop over all pairs of leaf units in Python which is used otherwise.
+
     Note that in order to avoid loss of precision during long runs of JF, candidate event times and time stamps of
     active units are not stored as simple floats but as the quotient and remainder of an integer division of the time
     with 1 (see base.time.Time class for more information). The time displacements returned by the bounding potential's
@@ -63,8 +71,10 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
     a run of JF.
     """
 
+    _shared_attributes = ("_bounding_potential",)
+
     def __init__(self, potential: Potential, bounding_potential: InvertiblePotential,
-                 lifting: Lifting, charge: str = None) -> None:
+                 lifting: Lifting, charge: str = None, fused_kernel: bool = False) -> None:
         """
         The constructor of the TwoCompositeObjectSummedBoundingPotentialEventHandler class.
 
@@ -78,6 +88,8 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
             The lifting scheme.
         charge : str or None, optional
             The relevant charge for this event handler.
+        fused_kernel : bool, optional
+            Whether the potential and the bounding potential treat all pairs of leaf units in a single call.
 
         Raises
         ------
@@ -87,11 +99,17 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
             If the charge is not None but the potential or the bounding potential expects more than two charges.
         base.exceptions.ConfigurationError:
             If the displacement method of the bounding potential does not require a potential change.
+        base.exceptions.ConfigurationError:
+            If the fused kernel should be used but the potential is not a PairwiseDerivativesPotential or the bounding
+            potential is not a SummedInvertiblePotential.
+        base.exceptions.ConfigurationError:
+            If the fused kernel should be used but the potential or the bounding potential expects not exactly 2
+            charges.
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            potential=potential.__class__.__name__,
                            bounding_potential=bounding_potential.__class__.__name__,
-                           lifting=lifting.__class__.__name__, charge=charge)
+                           lifting=lifting.__class__.__name__, charge=charge, fused_kernel=fused_kernel)
         super().__init__(charge=charge, potential=potential, lifting=lifting)
         self._bounding_potential = bounding_potential
         if self._bounding_potential.number_separation_arguments != 1:
@@ -115,6 +133,23 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
         if not self._bounding_potential.potential_change_required:
             raise ConfigurationError("The event handler {0} expects a bounding potential that requires a potential "
                                      "change in its displacement method.".format(self.__class__.__name__))
+        self._fused_kernel = fused_kernel
+        if fused_kernel:
+            if not (isinstance(self._potential, PairwiseDerivativesPotential)
+                    and isinstance(self._bounding_potential, SummedInvertiblePotential)):
+                raise ConfigurationError("The event handler {0} was initialized with fused_kernel=True, but its "
+                                         "potential {1} is not a PairwiseDerivativesPotential and/or its bounding "
+                                         "potential {2} is not a SummedInvertiblePotential."
+                                         .format(self.__class__.__name__, self._potential.__class__.__name__,
+                                                 self._bounding_potential.__class__.__name__))
+            if (self._potential.number_charge_arguments != 2
+                    or self._bounding_potential.number_charge_arguments != 2):
+                raise ConfigurationError("The event handler {0} was initialized with fused_kernel=True, but its "
+                                         "potential {1} and/or its bounding potential {2} expects not exactly 2 "
+                                         "charges.".format(self.__class__.__name__, self._potential.__class__.__name__,
+                                                           self._bounding_potential.__class__.__name__))
+            self._charges = ((lambda units: [1.0] * len(units)) if charge is None
+                             else (lambda units: [unit.charge[charge] for unit in units]))
 
     def send_event_time(self, in_state: Sequence[Node]) -> Time:
         """
@@ -144,11 +179,18 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
         self._construct_leaf_cnodes()
         self._extract_active_leaf_unit()
         self._construct_leaf_units_of_composite_objects()
-        time_displacement = min(self._bounding_potential.displacement(
-            self._active_leaf_unit.velocity,
-            setting.periodic_boundaries.separation_vector(self._active_leaf_unit.position, target_unit.position),
-            *self._bounding_potential_charges(self._active_leaf_unit, target_unit),
-            random.expovariate(setting.beta)) for target_unit in self._target_leaf_units)
+        if self._fused_kernel:
+            time_displacement = self._bounding_potential.minimum_displacement(
+                self._active_leaf_unit.velocity, [self._active_leaf_unit.position],
+                self._charges([self._active_leaf_unit]), [unit.position for unit in self._target_leaf_units],
+                self._charges(self._target_leaf_units),
+                [random.expovariate(setting.beta) for _ in self._target_leaf_units])
+        else:
+            time_displacement = min(self._bounding_potential.displacement(
+                self._active_leaf_unit.velocity,
+                setting.periodic_boundaries.separation_vector(self._active_leaf_unit.position, target_unit.position),
+                *self._bounding_potential_charges(self._active_leaf_unit, target_unit),
+                random.expovariate(setting.beta)) for target_unit in self._target_leaf_units)
         self._event_time = self._active_leaf_unit.time_stamp + time_displacement
         self._time_slice_all_units_in_state()
         return self._event_time
@@ -175,18 +217,31 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
         bounding_event_rate = 0.0
         factor_derivative = 0.0
         target_composite_object_factor_derivatives = [0.0] * len(self._target_leaf_units)
-        for index, target_leaf_unit in enumerate(self._target_leaf_units):
-            separation = setting.periodic_boundaries.separation_vector(self._active_leaf_unit.position,
-                                                                       target_leaf_unit.position)
-            bounding_event_rate += max(
-                0.0, self._bounding_potential.derivative(
-                    self._active_leaf_unit.velocity, separation,
-                    *self._bounding_potential_charges(self._active_leaf_unit, target_leaf_unit)))
-            pairwise_derivative = self._potential.derivative(
-                self._active_leaf_unit.velocity, separation, *self._potential_charges(self._active_leaf_unit,
-                                                                                      target_leaf_unit))
-            factor_derivative += pairwise_derivative
-            target_composite_object_factor_derivatives[index] -= pairwise_derivative
+        if self._fused_kernel:
+            active_leaf_unit_charges = self._charges([self._active_leaf_unit])
+            target_positions = [unit.position for unit in self._target_leaf_units]
+            target_charges = self._charges(self._target_leaf_units)
+            bounding_event_rate = self._bounding_potential.summed_positive_derivative(
+                self._active_leaf_unit.velocity, [self._active_leaf_unit.position], active_leaf_unit_charges,
+                target_positions, target_charges)
+            for index, pairwise_derivative in enumerate(self._potential.pairwise_derivatives(
+                    self._active_leaf_unit.velocity, [self._active_leaf_unit.position], active_leaf_unit_charges,
+                    target_positions, target_charges)):
+                factor_derivative += pairwise_derivative
+                target_composite_object_factor_derivatives[index] -= pairwise_derivative
+        else:
+            for index, target_leaf_unit in enumerate(self._target_leaf_units):
+                separation = setting.periodic_boundaries.separation_vector(self._active_leaf_unit.position,
+                                                                           target_leaf_unit.position)
+                bounding_event_rate += max(
+                    0.0, self._bounding_potential.derivative(
+                        self._active_leaf_unit.velocity, separation,
+                        *self._bounding_potential_charges(self._active_leaf_unit, target_leaf_unit)))
+                pairwise_derivative = self._potential.derivative(
+                    self._active_leaf_unit.velocity, separation, *self._potential_charges(self._active_leaf_unit,
+                                                                                          target_leaf_unit))
+                factor_derivative += pairwise_derivative
+                target_composite_object_factor_derivatives[index] -= pairwise_derivative
         event_rate = max(0.0, factor_derivative)
         bounding_potential_warning(self.__class__.__name__, bounding_event_rate, event_rate)
         if event_rate <= random.uniform(0.0, bounding_event_rate):
@@ -200,3 +255,28 @@ class TwoCompositeObjectSummedBoundingPotentialEventHandler(TwoCompositeObjectBo
         assert len(next_active_cnode) == 1
         self._exchange_velocity(self._leaf_cnodes[self._active_leaf_unit_index], next_active_cnode[0])
         return self._state
+
+    def _pairwise_derivatives(self, local_unit: Unit, target_units: Sequence[Unit]) -> List[float]:
+        """
+        Return the derivatives between the given local unit and each of the target units.
+
+        The derivatives are computed along the velocity of the active leaf unit. If the fused kernel is used, the
+        potential computes all derivatives in a single call.
+
+        Parameters
+        ----------
+        local_unit : base.unit.Unit
+            The unit within the same composite object as the active leaf unit.
+        target_units : Sequence[base.unit.Unit]
+            Units within the target composite object.
+
+        Returns
+        -------
+        List[float]
+            The derivatives between the local unit and each of the target units.
+        """
+        if self._fused_kernel:
+            return self._potential.pairwise_derivatives(
+                self._active_leaf_unit.velocity, [local_unit.position], self._charges([local_unit]),
+                [unit.position for unit in target_units], self._charges(target_units))
+        return super()._pairwise_derivatives(local_unit, target_units)
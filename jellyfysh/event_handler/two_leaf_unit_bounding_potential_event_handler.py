@@ -57,6 +57,8 @@ class TwoLeafUnitBoundingPotentialEventHandler(EventHandlerWithBoundingPotential
     a run of JF.
     """
 
+    _shared_attributes = ("_bounding_potential",)
+
     def __init__(self, potential: Potential, bounding_potential: InvertiblePotential, charge: str = None) -> None:
         """
         The constructor of the TwoLeafUnitBoundingPotentialEventHandler class.
@@ -58,6 +58,8 @@ class TwoLeafUnitEventHandler(SingleActiveLeafUnitEventHandler):
     a run of JF.
     """
 
+    _shared_attributes = ("_potential",)
+
     def __init__(self, potential: InvertiblePotential, charge: str = None) -> None:
         """
         The constructor of the TwoLeafUnitEventHandler class.
@@ -59,7 +59,8 @@ class TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(EventHandler
     displacement returned by the dynamically constructed bounding potential.
     """
 
-    def __init__(self, potential: Potential, offset: float, max_displacement: float, charge: str = None) -> None:
+    def __init__(self, potential: Potential, offset: float, max_displacement: float, charge: str = None,
+                 reuse_bounding_segments: bool = False) -> None:
         """
         The constructor of the TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential class.
 
@@ -73,6 +74,8 @@ class TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(EventHandler
             The maximum time displacement used to create piecewise constant bounding potential.
         charge : str or None, optional
             The relevant charge for this event handler.
+        reuse_bounding_segments : bool, optional
+            Whether constant bounding event rates are stored and reused on the remaining part of their segment.
 
         Raises
         ------
@@ -83,8 +86,9 @@ class TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(EventHandler
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            potential=potential.__class__.__name__, offset=offset, max_displacement=max_displacement,
-                           charge=charge)
-        super().__init__(potential=potential, offset=offset, max_displacement=max_displacement)
+                           charge=charge, reuse_bounding_segments=reuse_bounding_segments)
+        super().__init__(potential=potential, offset=offset, max_displacement=max_displacement,
+                         reuse_bounding_segments=reuse_bounding_segments)
         if self._potential.number_separation_arguments != 1:
             raise ConfigurationError("The event handler {0} expects a potential "
                                      "which handles exactly one separation!".format(self.__class__.__name__))
@@ -0,0 +1,272 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the TwoLeafUnitGroupEventHandler class."""
+import logging
+import random
+from typing import Sequence
+from jellyfysh.base.exceptions import ConfigurationError, bounding_potential_warning
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node
+from jellyfysh.base.time import Time
+from jellyfysh.potential import Potential, InvertiblePotential
+import jellyfysh.setting as setting
+from .abstracts import SingleActiveLeafUnitEventHandler
+
+
+class TwoLeafUnitGroupEventHandler(SingleActiveLeafUnitEventHandler):
+    """
+    Event handler which treats a group of interactions between a single active leaf unit and several target leaf units
+    at once.
+
+    This class is designed to work together with the TreeStateHandler. Here, the in-states are branches of cnodes
+    containing units. Also, the event handlers are responsible for keeping the time-slicing of composite objects and
+    its point masses consistent.
+
+    The in-state consists of the branch of the active leaf unit followed by the branches of all target leaf units (see,
+    e.g., the ExcludedCellsGroupTagger class). Each pair of the active leaf unit and a target leaf unit is an
+    independent factor. For each factor, this event handler samples a candidate event time in the same way as the
+    TwoLeafUnitEventHandler (if no bounding potential is given) or as the TwoLeafUnitBoundingPotentialEventHandler (if a
+    bounding potential is given). Only the smallest of these candidate event times is returned. Since the candidate
+    event times of the factors are independent, this yields the same time evolution as one event handler per factor,
+    while the mediator and the scheduler only treat a single candidate event. This reduces the overhead per leg if the
+    active leaf unit interacts with many target leaf units, for example, in nearby cells of a cell system at high
+    density.
+
+    The out-state only contains the branches of the active leaf unit and of the target leaf unit of the factor with the
+    smallest candidate event time. If no bounding potential is given, the velocity of the active leaf unit is always
+    transferred to the target leaf unit. Otherwise, the event is first confirmed with the potential.
+
+    If the potentials can consider charges, this event handler can pass the charges of the two leaf units of each factor
+    to the potentials. The name of the used charge is set on initialization.
+
+    Optionally, an additional invertible composite-object potential can be given. It acts (in addition to the potential)
+    between the active leaf unit and the target leaf units within the same composite object (for example, the tether
+    of a hard-disk dipole, see the include_composite_object argument of the ExcludedCellsGroupTagger class). Its
+    candidate event times compete with the ones of the potential, and a winning factor of the composite-object
+    potential is never confirmed. Each target leaf unit should then appear only once in the in-state.
+    """
+
+    _shared_attributes = ("_potential", "_bounding_potential", "_composite_object_potential")
+
+    def __init__(self, potential: Potential, bounding_potential: InvertiblePotential = None,
+                 charge: str = None, composite_object_potential: InvertiblePotential = None) -> None:
+        """
+        The constructor of the TwoLeafUnitGroupEventHandler class.
+
+        Parameters
+        ----------
+        potential : potential.Potential
+            The potential between the leaf units. If no bounding potential is given, it has to be invertible.
+        bounding_potential : potential.InvertiblePotential or None, optional
+            The invertible bounding potential between the leaf units.
+        charge : str or None, optional
+            The relevant charge for this event handler.
+        composite_object_potential : potential.InvertiblePotential or None, optional
+            The additional invertible potential between leaf units within the same composite object.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError:
+            If the potential or the bounding potential does not expect exactly one separation.
+        base.exceptions.ConfigurationError:
+            If no bounding potential is given and the potential is not invertible.
+        base.exceptions.ConfigurationError:
+            If the bounding potential does not require a potential change in its displacement method.
+        base.exceptions.ConfigurationError:
+            If the charge is not None but the potential or the bounding potential expects not exactly two charges.
+        base.exceptions.ConfigurationError:
+            If the composite-object potential is not invertible or does not expect exactly one separation.
+        base.exceptions.ConfigurationError:
+            If the charge is not None but the composite-object potential expects not exactly two charges.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
+                           potential=potential.__class__.__name__,
+                           bounding_potential=(None if bounding_potential is None
+                                               else bounding_potential.__class__.__name__), charge=charge,
+                           composite_object_potential=(None if composite_object_potential is None
+                                                       else composite_object_potential.__class__.__name__))
+        super().__init__()
+        self._potential = potential
+        self._bounding_potential = bounding_potential
+        self._composite_object_potential = composite_object_potential
+        potentials = (self._potential,) if self._bounding_potential is None else (self._potential,
+                                                                                self._bounding_potential)
+        if any(potential.number_separation_arguments != 1 for potential in potentials):
+            raise ConfigurationError("The event handler {0} expects a potential and a bounding potential "
+                                     "which handle exactly one separation!".format(self.__class__.__name__))
+        if self._bounding_potential is None:
+            if not isinstance(self._potential, InvertiblePotential):
+                raise ConfigurationError("The event handler {0} expects an invertible potential if no bounding "
+                                         "potential is given.".format(self.__class__.__name__))
+            self._displacement_potential = self._potential
+        else:
+            if not self._bounding_potential.potential_change_required:
+                raise ConfigurationError("The event handler {0} expects a bounding potential that requires a "
+                                         "potential change in its displacement method."
+                                         .format(self.__class__.__name__))
+            self._displacement_potential = self._bounding_potential
+
+        if charge is None:
+            self._potential_charges = (lambda unit_one, unit_two:
+                                       tuple(1.0 for _ in range(self._potential.number_charge_arguments)))
+            self._displacement_potential_charges = (
+                lambda unit_one, unit_two: tuple(1.0 for _ in
+                                                 range(self._displacement_potential.number_charge_arguments)))
+        else:
+            if any(potential.number_charge_arguments != 2 for potential in potentials):
+                raise ConfigurationError("The event handler {0} was initialized with a charge which is not None,"
+                                         " but its potential {1} and/or its bounding potential {2} "
+                                         "expects not exactly 2 charges."
+                                         .format(self.__class__.__name__, self._potential.__class__.__name__,
+                                                 self._bounding_potential.__class__.__name__))
+            self._potential_charges = lambda unit_one, unit_two: (unit_one.charge[charge], unit_two.charge[charge])
+            self._displacement_potential_charges = self._potential_charges
+
+        if self._displacement_potential.potential_change_required:
+            self._potential_displacement = (
+                lambda *args: self._displacement_potential.displacement(
+                    *args, potential_change=random.expovariate(setting.beta)))
+        else:
+            self._potential_displacement = self._displacement_potential.displacement
+
+        if self._composite_object_potential is not None:
+            if (not isinstance(self._composite_object_potential, InvertiblePotential)
+                    or self._composite_object_potential.number_separation_arguments != 1):
+                raise ConfigurationError("The event handler {0} expects an invertible composite-object potential "
+                                         "which handles exactly one separation.".format(self.__class__.__name__))
+            if charge is None:
+                self._composite_object_potential_charges = (
+                    lambda unit_one, unit_two: tuple(1.0 for _ in
+                                                     range(self._composite_object_potential.number_charge_arguments)))
+            else:
+                if self._composite_object_potential.number_charge_arguments != 2:
+                    raise ConfigurationError("The event handler {0} was initialized with a charge which is not None,"
+                                             " but its composite-object potential {1} expects not exactly 2 charges."
+                                             .format(self.__class__.__name__,
+                                                     self._composite_object_potential.__class__.__name__))
+                self._composite_object_potential_charges = self._potential_charges
+            if self._composite_object_potential.potential_change_required:
+                self._composite_object_potential_displacement = (
+                    lambda *args: self._composite_object_potential.displacement(
+                        *args, potential_change=random.expovariate(setting.beta)))
+            else:
+                self._composite_object_potential_displacement = self._composite_object_potential.displacement
+        self._minimum_of_composite_object_potential = False
+
+    def send_event_time(self, in_state: Sequence[Node]) -> Time:
+        """
+        Return the candidate event time.
+
+        The in-state should consist of the branch of the active leaf unit followed by the branches of all target leaf
+        units. The smallest candidate event time of all factors between the active leaf unit and a target leaf unit is
+        returned. Afterwards, only the branches of the active leaf unit and the target leaf unit of this factor are kept
+        in the internal state of this event handler.
+
+        If a composite-object potential is given, its candidate event times for the target leaf units within the
+        composite object of the active leaf unit are also considered.
+
+        Parameters
+        ----------
+        in_state : Sequence[base.node.Node]
+            The in-state.
+
+        Returns
+        -------
+        base.time.Time
+            The candidate event time.
+
+        Raises
+        ------
+        AssertionError
+            If the in-state does not contain at least two leaf units.
+        AssertionError
+            If the first leaf unit in the in-state is not active.
+        """
+        self._store_in_state(in_state)
+        self._construct_leaf_cnodes()
+        assert len(self._leaf_cnodes) == len(in_state) >= 2
+        active_leaf_unit = self._leaf_units[0]
+        assert active_leaf_unit.velocity is not None
+        active_position = active_leaf_unit.position
+        velocity = active_leaf_unit.velocity
+        separation_vector = setting.periodic_boundaries.separation_vector
+        minimum_time_displacement = None
+        minimum_index = None
+        self._minimum_of_composite_object_potential = False
+        for index in range(1, len(self._leaf_units)):
+            target_leaf_unit = self._leaf_units[index]
+            time_displacement = self._potential_displacement(
+                velocity, separation_vector(active_position, target_leaf_unit.position),
+                *self._displacement_potential_charges(active_leaf_unit, target_leaf_unit))
+            if minimum_index is None or time_displacement < minimum_time_displacement:
+                minimum_time_displacement = time_displacement
+                minimum_index = index
+                self._minimum_of_composite_object_potential = False
+            if (self._composite_object_potential is not None
+                    and target_leaf_unit.identifier[0] == active_leaf_unit.identifier[0]):
+                time_displacement = self._composite_object_potential_displacement(
+                    velocity, separation_vector(active_position, target_leaf_unit.position),
+                    *self._composite_object_potential_charges(active_leaf_unit, target_leaf_unit))
+                if time_displacement < minimum_time_displacement:
+                    minimum_time_displacement = time_displacement
+                    minimum_index = index
+                    self._minimum_of_composite_object_potential = True
+        self._state = [in_state[0], in_state[minimum_index]]
+        self._leaf_cnodes = [self._leaf_cnodes[0], self._leaf_cnodes[minimum_index]]
+        self._leaf_units = [active_leaf_unit, self._leaf_units[minimum_index]]
+        self._active_leaf_unit_index = 0
+        self._active_leaf_unit = active_leaf_unit
+        self._event_time = active_leaf_unit.time_stamp + minimum_time_displacement
+        self._time_slice_all_units_in_state()
+        return self._event_time
+
+    def send_out_state(self) -> Sequence[Node]:
+        """
+        Return the out-state.
+
+        The out-state consists of the branches of the active leaf unit and the target leaf unit of the factor with the
+        smallest candidate event time. If a bounding potential is used, the event is first confirmed. If the event is
+        confirmed (or no bounding potential is used), the velocity of the active leaf unit is transferred to the target
+        leaf unit and the branches are kept consistent. The event of a factor of the composite-object potential is
+        never confirmed.
+
+        Returns
+        -------
+        Sequence[base.node.Node]
+            The out-state.
+        """
+        if self._bounding_potential is None or self._minimum_of_composite_object_potential:
+            self._exchange_velocity(self._leaf_cnodes[0], self._leaf_cnodes[1])
+            return self._state
+        separation = setting.periodic_boundaries.separation_vector(self._leaf_units[0].position,
+                                                                   self._leaf_units[1].position)
+        bounding_event_rate = self._bounding_potential.derivative(
+            self._active_leaf_unit.velocity, separation,
+            *self._displacement_potential_charges(self._leaf_units[0], self._leaf_units[1]))
+        real_derivative = self._potential.derivative(self._active_leaf_unit.velocity, separation,
+                                                     *self._potential_charges(self._leaf_units[0],
+                                                                              self._leaf_units[1]))
+        if real_derivative > 0:
+            bounding_potential_warning(self.__class__.__name__, bounding_event_rate, real_derivative)
+            if random.uniform(0, bounding_event_rate) < real_derivative:
+                self._exchange_velocity(self._leaf_cnodes[0], self._leaf_cnodes[1])
+        return self._state
@@ -19,9 +19,12 @@
 # JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
-"""Module for the Walker class used in the cell veto event handlers."""
+"""Module for the Walker and FlatWalker classes used in the cell veto event handlers."""
+from array import array
+from importlib.util import find_spec
 import random
 from typing import Any, Sequence
+from jellyfysh.base.exceptions import ConfigurationError
 
 
 class WalkerItem(object):
@@ -128,3 +131,160 @@ class Walker(object):
             The total rate.
         """
         return self._total_rate
+
+
+class FlatWalker(object):
+    """
+    Class to store Walker's table in flat arrays, the total event rate and to sample an object from the table.
+
+    This class implements the same alias method as the Walker class. However, Walker's table is not stored as a list of
+    tuples of walker items but in parallel flat arrays. For each column of the table, the threshold (relative to the
+    mean rate) is stored in an array of doubles, and the index of the alias item in an array of integers. The associated
+    objects are stored in an array of integers if they are all integers (for example, the cells of an
+    IndexedCuboidPeriodicCells instance), and in a tuple otherwise.
+
+    A single uniform random number in [0, 1) is used per sample. Its integer part after multiplication with the number
+    of columns determines the column, and its fractional part is compared to the threshold of the column. The uniform
+    random numbers are pre-generated in blocks, and the objects of a whole block are sampled at once. The sample_cell
+    method then only returns the next sampled object of the block, and the block is refilled once it is exhausted. By
+    default, the random numbers of a block are generated with Python's random module. Optionally, the blocks are
+    generated and evaluated with NumPy, where the random generator is seeded with random bits drawn from Python's random
+    module. In both cases, the sampled objects are determined by the state of Python's random module only. Since the
+    remaining samples of the current block are an attribute of this class, which is dumped together with the event
+    handler that owns it, a run that is resumed with the state of Python's random module stored in the dump samples the
+    same objects as the uninterrupted run.
+
+    A deepcopy of this class (for example, when an event handler is cloned) shares Walker's table with the original
+    instance. The copy starts without pre-generated samples so that it does not return the same samples as the
+    original instance.
+    """
+
+    def __init__(self, walker_items: Sequence[WalkerItem], block_size: int = 4096, use_numpy: bool = False) -> None:
+        """
+        The constructor of the FlatWalker class.
+
+        Parameters
+        ----------
+        walker_items : Sequence[WalkerItem]
+            The sequence of walker items which associate an object with an event rate.
+        block_size : int, optional
+            The number of uniform random numbers that are pre-generated at once.
+        use_numpy : bool, optional
+            Whether the blocks of uniform random numbers are generated with a NumPy random generator.
+
+        Raises
+        ------
+        AssertionError
+            If a rate of a walker item is smaller than zero.
+        base.exceptions.ConfigurationError
+            If the block size is not greater than zero.
+        base.exceptions.ConfigurationError
+            If use_numpy is True but NumPy cannot be imported.
+        """
+        if not block_size > 0:
+            raise ConfigurationError("The block size of the class {0} has to be greater than zero."
+                                     .format(self.__class__.__name__))
+        # NumPy is only imported when it is used (see _refill method)
+        if use_numpy and find_spec("numpy") is None:
+            raise ConfigurationError("The class {0} can only use NumPy to generate random numbers if NumPy is "
+                                     "installed.".format(self.__class__.__name__))
+        for walker_item in walker_items:
+            assert walker_item.rate >= 0.0
+        self._number_of_items = len(walker_items)
+        self._total_rate = sum(walker_item.rate for walker_item in walker_items)
+        if all(isinstance(walker_item.item, int) for walker_item in walker_items):
+            self._items = array("l", (walker_item.item for walker_item in walker_items))
+        else:
+            self._items = tuple(walker_item.item for walker_item in walker_items)
+        self._thresholds = array("d", [1.0] * self._number_of_items)
+        self._aliases = array("l", range(self._number_of_items))
+        self._build_table([walker_item.rate for walker_item in walker_items])
+        self._block_size = block_size
+        self._use_numpy = use_numpy
+        # The first block is only generated in the first call of the sample_cell method.
+        self._samples = []
+
+    def __deepcopy__(self, memo: dict) -> "FlatWalker":
+        """
+        Deepcopy this class while sharing the read-only arrays of Walker's table.
+
+        The copy starts without pre-generated samples. Otherwise, the copy would return the same samples as this
+        instance.
+        """
+        copied_walker = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied_walker
+        copied_walker.__dict__.update(self.__dict__)
+        copied_walker._samples = []
+        return copied_walker
+
+    def _build_table(self, rates: Sequence[float]) -> None:
+        """Build Walker's table in the threshold and alias arrays using the given rates."""
+        if self._total_rate == 0.0:
+            return
+        scaled_rates = [rate * self._number_of_items / self._total_rate for rate in rates]
+        small_list = [index for index, scaled_rate in enumerate(scaled_rates) if scaled_rate < 1.0]
+        large_list = [index for index, scaled_rate in enumerate(scaled_rates) if scaled_rate >= 1.0]
+        while small_list and large_list:
+            small_index = small_list.pop()
+            large_index = large_list[-1]
+            self._thresholds[small_index] = scaled_rates[small_index]
+            self._aliases[small_index] = large_index
+            scaled_rates[large_index] -= 1.0 - scaled_rates[small_index]
+            if scaled_rates[large_index] < 1.0:
+                small_list.append(large_list.pop())
+        # The remaining scaled rates are equal to one up to rounding errors.
+        for index in small_list + large_list:
+            assert 1 - 1e-6 < scaled_rates[index] < 1 + 1e-6
+            self._thresholds[index] = 1.0
+            self._aliases[index] = index
+
+    def _refill(self) -> None:
+        """Pre-generate the next block of uniform random numbers in [0, 1), and sample a block of objects with them."""
+        number_of_items = self._number_of_items
+        if self._use_numpy:
+            import numpy
+            generator = numpy.random.Generator(numpy.random.PCG64(random.getrandbits(64)))
+            scaled_uniforms = generator.random(self._block_size) * number_of_items
+            indices = scaled_uniforms.astype(numpy.int64)
+            thresholds = numpy.frombuffer(self._thresholds, dtype=numpy.float64)
+            aliases = numpy.frombuffer(self._aliases, dtype=numpy.dtype("l"))
+            indices = numpy.where(scaled_uniforms - indices < thresholds[indices], indices, aliases[indices])
+            self._samples = [self._items[index] for index in indices.tolist()]
+        else:
+            thresholds = self._thresholds
+            aliases = self._aliases
+            items = self._items
+            uniform = random.random
+            self._samples = samples = []
+            for _ in range(self._block_size):
+                scaled_uniform = uniform() * number_of_items
+                index = int(scaled_uniform)
+                samples.append(items[index] if scaled_uniform - index < thresholds[index] else items[aliases[index]])
+        # Samples are popped from the end of the list.
+        self._samples.reverse()
+
+    def sample_cell(self) -> Any:
+        """
+        Sample a random object out of a walker item with a probability proportional to the rate stored in the item.
+
+        Returns
+        -------
+        Any
+            The sampled object.
+        """
+        if not self._samples:
+            self._refill()
+        return self._samples.pop()
+
+    @property
+    def total_rate(self) -> float:
+        """
+        Return the sum of all rates of all walker items stored in the Walker table.
+
+        Returns
+        -------
+        float
+            The total rate.
+        """
+        return self._total_rate
+
@@ -0,0 +1,291 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""
+Module for reading and writing compact checkpoint files of a run.
+
+A checkpoint consists of two files. The static file stores the members of the event handlers that are only read after
+their initialization (see the get_shared_members method of the event_handler.EventHandler class), as for example
+potentials, estimators, cell systems, and tables of bounds. It only has to be rewritten if these objects change,
+which can be detected by hashing the objects pickled with the pickle_static_objects function. The checkpoint file
+stores all remaining objects of the run, where every reference to an object of the static file is replaced by its
+index in the memo of the pickler of the static file. By this, also objects within the static objects (as, for
+example, the cells of a cell system which are used as keys in cell occupancies) are not duplicated in the checkpoint
+file.
+
+Both files start with two text lines. The first line is given by the checkpoint_magic_line. The second line starts
+with '# ' and contains a JSON object with the metadata of the file. The remaining bytes are the objects pickled with
+the dill package and compressed with zlib. The metadata of the checkpoint file contains the name of its static file
+and the SHA-256 hash of the compressed objects of the static file, which is verified on reading.
+Both files are written to a temporary file (filename + '.tmp') which is renamed into the filename afterwards. By
+this, an existing file is only replaced by a complete file.
+"""
+import hashlib
+import io
+import json
+import os
+import platform
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import zlib
+import dill
+from jellyfysh.version import __version__
+
+
+checkpoint_magic_line = b"# JeLLyFysh checkpoint\n"
+"""The first line of every file written in this module."""
+
+checkpoint_format_version = 1
+"""The version of the checkpoint format."""
+
+
+class _StaticReferencePickler(dill.Pickler):
+    """Pickler which replaces the objects of the static file by their index in the memo of the static file."""
+
+    def __init__(self, file: io.BytesIO, static_memo: Mapping[int, Tuple[int, Any]]) -> None:
+        super().__init__(file)
+        self._static_memo = static_memo
+
+    def persistent_id(self, obj: Any) -> Any:
+        memo_entry = self._static_memo.get(id(obj))
+        return memo_entry[0] if memo_entry is not None else None
+
+
+class _StaticReferenceUnpickler(dill.Unpickler):
+    """Unpickler which replaces the indices in the memo of the static file by the objects of the static file."""
+
+    def __init__(self, file: io.BytesIO, static_memo: Mapping[int, Any]) -> None:
+        super().__init__(file)
+        self._static_memo = static_memo
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._static_memo[pid]
+
+
+def _metadata(kind: str) -> Dict[str, Any]:
+    """Return the metadata which is common to the checkpoint file and the static file."""
+    return {"kind": kind, "format_version": checkpoint_format_version, "jellyfysh_version": __version__,
+            "python_implementation": platform.python_implementation(), "python_version": platform.python_version()}
+
+
+def _write_file(filename: str, metadata: Mapping[str, Any], payload: bytes) -> None:
+    """Write the header and the payload into a temporary file and rename it into the filename."""
+    with open(filename + ".tmp", "wb") as file:
+        file.write(checkpoint_magic_line)
+        file.write("# {0}\n".format(json.dumps(metadata)).encode("ascii"))
+        file.write(payload)
+    os.replace(filename + ".tmp", filename)
+
+
+def _read_file(filename: str, kind: str) -> Tuple[Dict[str, Any], bytes]:
+    """Read the metadata and the payload of a file and check that the file is of the given kind."""
+    with open(filename, "rb") as file:
+        if file.readline() != checkpoint_magic_line:
+            raise ValueError("The file {0} is not a checkpoint file.".format(filename))
+        metadata = json.loads(file.readline()[2:].decode("ascii"))
+        payload = file.read()
+    if metadata.get("kind") != kind:
+        raise ValueError("The file {0} is not a {1} file.".format(filename, kind))
+    if metadata.get("format_version") != checkpoint_format_version:
+        raise ValueError("The file {0} has the unsupported checkpoint format version {1}."
+                         .format(filename, metadata.get("format_version")))
+    return metadata, payload
+
+
+def is_checkpoint_file(filename: str) -> bool:
+    """
+    Return whether the file starts with the checkpoint_magic_line.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    bool
+        Whether the file is a checkpoint file or a static file of a checkpoint.
+    """
+    with open(filename, "rb") as file:
+        return file.readline() == checkpoint_magic_line
+
+
+def pickle_static_objects(static_objects: Sequence[Any]) -> Tuple[bytes, Dict[int, Tuple[int, Any]]]:
+    """
+    Pickle the static objects.
+
+    The returned memo of the pickler maps the ids of all pickled objects to their index in the memo and the object
+    itself.
+
+    Parameters
+    ----------
+    static_objects : Sequence[Any]
+        The static objects.
+
+    Returns
+    -------
+    (bytes, Dict[int, (int, Any)])
+        The uncompressed pickled static objects, the memo of the pickler.
+    """
+    buffer = io.BytesIO()
+    pickler = dill.Pickler(buffer)
+    pickler.dump(list(static_objects))
+    return buffer.getvalue(), pickler.memo
+
+
+def hash_static_objects(static_objects: Sequence[Any]) -> str:
+    """
+    Return the SHA-256 hash of the pickled static objects.
+
+    The hash changes whenever any object reachable from the static objects changes. It can therefore be used to
+    decide whether the static file has to be rewritten.
+
+    Parameters
+    ----------
+    static_objects : Sequence[Any]
+        The static objects.
+
+    Returns
+    -------
+    str
+        The SHA-256 hash of the uncompressed pickled static objects.
+    """
+    return hashlib.sha256(pickle_static_objects(static_objects)[0]).hexdigest()
+
+
+def write_static_file(filename: str, static_objects: Sequence[Any], compression_level: int = 1,
+                      pickled_static_objects: Optional[Tuple[bytes, Dict[int, Tuple[int, Any]]]] = None
+                      ) -> Tuple[str, Dict[int, Tuple[int, Any]]]:
+    """
+    Write the static objects into the static file.
+
+    Besides the hash of the written payload, this function returns the memo of the pickler which maps the ids of all
+    pickled objects to their index in the memo and the object itself. The memo is required to write checkpoint files.
+    It keeps all pickled objects alive so that their ids cannot be reused by other objects.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the static file.
+    static_objects : Sequence[Any]
+        The static objects.
+    compression_level : int, optional
+        The zlib compression level.
+    pickled_static_objects : (bytes, Dict[int, (int, Any)]) or None, optional
+        The static objects pickled with the pickle_static_objects function. If None, the static objects are pickled
+        in this function.
+
+    Returns
+    -------
+    (str, Dict[int, (int, Any)])
+        The SHA-256 hash of the payload of the static file, the memo of the pickler.
+    """
+    if pickled_static_objects is None:
+        pickled_static_objects = pickle_static_objects(static_objects)
+    payload = zlib.compress(pickled_static_objects[0], compression_level)
+    _write_file(filename, _metadata("static"), payload)
+    return hashlib.sha256(payload).hexdigest(), pickled_static_objects[1]
+
+
+def write_checkpoint_file(filename: str, objects: Any, static_filename: str, static_hash: str,
+                          static_memo: Mapping[int, Tuple[int, Any]], compression_level: int = 1,
+                          **metadata: Any) -> None:
+    """
+    Write the objects into the checkpoint file, where the static objects are replaced by their indices.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the checkpoint file.
+    objects : Any
+        The objects to pickle.
+    static_filename : str
+        The filename of the static file. Only the base name is stored, so the static file is expected in the directory
+        of the checkpoint file on reading.
+    static_hash : str
+        The SHA-256 hash of the payload of the static file (as returned by the write_static_file function).
+    static_memo : Mapping[int, (int, Any)]
+        The memo of the pickler of the static file (as returned by the write_static_file function).
+    compression_level : int, optional
+        The zlib compression level.
+    metadata : Any
+        Additional metadata which is stored in the header, for example the run identification hash.
+    """
+    buffer = io.BytesIO()
+    _StaticReferencePickler(buffer, static_memo).dump(objects)
+    payload = zlib.compress(buffer.getvalue(), compression_level)
+    checkpoint_metadata = _metadata("checkpoint")
+    checkpoint_metadata.update(metadata)
+    checkpoint_metadata.update(static_file=os.path.basename(static_filename), static_hash=static_hash)
+    _write_file(filename, checkpoint_metadata, payload)
+
+
+def read_checkpoint_metadata(filename: str) -> Dict[str, Any]:
+    """
+    Return the metadata of a checkpoint file.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the checkpoint file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The metadata.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a checkpoint file or has an unsupported format version.
+    """
+    return _read_file(filename, "checkpoint")[0]
+
+
+def read_checkpoint_file(filename: str) -> Tuple[Any, List[Any]]:
+    """
+    Read the objects of a checkpoint file together with the objects of its static file.
+
+    Parameters
+    ----------
+    filename : str
+        The filename of the checkpoint file.
+
+    Returns
+    -------
+    (Any, List[Any])
+        The objects of the checkpoint file, the static objects.
+
+    Raises
+    ------
+    ValueError
+        If the file or its static file is not a valid file of this format, or if the static file was changed after the
+        checkpoint file was written.
+    """
+    metadata, payload = _read_file(filename, "checkpoint")
+    static_filename = os.path.join(os.path.dirname(filename), metadata["static_file"])
+    _, static_payload = _read_file(static_filename, "static")
+    if hashlib.sha256(static_payload).hexdigest() != metadata["static_hash"]:
+        raise ValueError("The static file {0} does not belong to the checkpoint file {1}."
+                         .format(static_filename, filename))
+    static_unpickler = dill.Unpickler(io.BytesIO(zlib.decompress(static_payload)))
+    static_objects = static_unpickler.load()
+    objects = _StaticReferenceUnpickler(io.BytesIO(zlib.decompress(payload)), static_unpickler.memo.copy()).load()
+    return objects, static_objects
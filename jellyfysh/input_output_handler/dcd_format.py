@@ -0,0 +1,183 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the DcdWriter class which writes .dcd trajectory files without MDAnalysis."""
+from array import array
+import logging
+import os
+import struct
+from typing import Sequence
+
+
+_logger = logging.getLogger(__name__)
+
+
+class DcdWriter(object):
+    """
+    Writer of trajectories in the binary .dcd file format (in the CHARMM flavor with unit cells, as written by
+    MDAnalysis).
+
+    A .dcd file consists of Fortran records, i.e., each record is enclosed by its length in bytes as a 4-byte integer.
+    The header consists of three records which store the number of frames, a title, and the number of atoms. Each
+    frame consists of a record for the unit cell and one record for each of the x, y, and z coordinates of all atoms
+    as 4-byte floats. The number of frames in the header is updated after each frame so that the file is always
+    consistent.
+
+    In contrast to the writer of MDAnalysis, this class can continue writing into an existing .dcd file (for example,
+    after resuming a dumped run). This is only done if the title of the existing file agrees with the given title. The
+    title should therefore identify the run (for example, by the run identification hash).
+    """
+
+    _header_format = "<i4s9if11i"
+    _header_size = (4 + 84 + 4) + (4 + 4 + 3 * 80 + 4) + (4 + 4 + 4)
+    _cell_record = struct.Struct("<i6di")
+
+    def __init__(self, filename: str, number_of_atoms: int, title: str = "", number_of_frames: int = None) -> None:
+        """
+        The constructor of the DcdWriter class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the .dcd file.
+        number_of_atoms : int
+            The number of atoms in each frame.
+        title : str, optional
+            The title which is stored in the header (at most 80 characters are used). If the number of frames is not
+            None, the title of the existing .dcd file has to agree with it.
+        number_of_frames : int or None, optional
+            If not None, the existing .dcd file is opened and the writing continues after the given number of frames.
+            Any later frames in the file are removed, which is logged as a warning. Otherwise, a new .dcd file is
+            created.
+
+        Raises
+        ------
+        ValueError
+            If the existing .dcd file does not contain the given number of frames of the given number of atoms.
+        ValueError
+            If the existing .dcd file has a different title.
+        """
+        self._filename = filename
+        self._number_of_atoms = number_of_atoms
+        self._coordinate_record_marker = struct.pack("<i", 4 * number_of_atoms)
+        self._frame_size = self._cell_record.size + 3 * (4 + 4 * number_of_atoms + 4)
+        if number_of_frames is None:
+            self._file = open(filename, "wb")
+            self._number_of_frames = 0
+            self._file.write(self._header(title))
+        else:
+            self._open_existing_file(title, number_of_frames)
+
+    def _header(self, title: str) -> bytes:
+        """Return the three header records."""
+        control = [self._number_of_frames, 0, 1] + [0] * 6
+        # The time step 1000.0 and the CHARMM version 24 with unit cells are the values written by MDAnalysis
+        header = struct.pack(self._header_format, 84, b"CORD", *control, 1000.0, 1, *([0] * 8), 24, 84)
+        # MDAnalysis stores three title lines of which only the first one is used here
+        header += struct.pack("<2i240si", 244, 3, self._title_bytes(title), 244)
+        header += struct.pack("<3i", 4, self._number_of_atoms, 4)
+        return header
+
+    @staticmethod
+    def _title_bytes(title: str) -> bytes:
+        """Return the three title lines of the header which store the first 80 characters of the title."""
+        return title.encode("ascii", "replace")[:80].ljust(240, b"\0")
+
+    def _open_existing_file(self, title: str, number_of_frames: int) -> None:
+        """
+        Open the existing .dcd file and prepare it for continued writing after the given number of frames.
+
+        The existing file has to have the given title, and its header has to store at least the given number of frames
+        of the given number of atoms. Later frames are removed.
+        """
+        expected_size = self._header_size + number_of_frames * self._frame_size
+        if not os.path.isfile(self._filename) or os.path.getsize(self._filename) < expected_size:
+            raise ValueError("The file {0} does not contain {1} frames.".format(self._filename, number_of_frames))
+        self._file = open(self._filename, "r+b")
+        header = self._file.read(self._header_size)
+        stored_number_of_frames = struct.unpack_from("<i", header, 8)[0]
+        try:
+            if struct.unpack_from("<i", header, self._header_size - 8)[0] != self._number_of_atoms:
+                raise ValueError("The file {0} does not contain {1} atoms.".format(self._filename,
+                                                                                  self._number_of_atoms))
+            if header[100:340] != self._title_bytes(title):
+                raise ValueError("The file {0} was written by a different run.".format(self._filename))
+            if stored_number_of_frames < number_of_frames:
+                raise ValueError("The file {0} does not contain {1} frames.".format(self._filename, number_of_frames))
+        except ValueError:
+            self._file.close()
+            raise
+        if os.path.getsize(self._filename) > expected_size:
+            _logger.warning("Removing {0} frames from the file {1} which were written after frame {2}."
+                            .format(stored_number_of_frames - number_of_frames, self._filename, number_of_frames))
+        self._file.truncate(expected_size)
+        self._number_of_frames = number_of_frames
+        self._update_number_of_frames()
+
+    def write_frame(self, x: array, y: array, z: array, unit_cell: Sequence[float]) -> None:
+        """
+        Append a frame to the .dcd file.
+
+        Parameters
+        ----------
+        x : array.array
+            The x coordinates of all atoms as an array of type 'f'.
+        y : array.array
+            The y coordinates of all atoms as an array of type 'f'.
+        z : array.array
+            The z coordinates of all atoms as an array of type 'f'.
+        unit_cell : Sequence[float]
+            The three lengths of the orthorhombic unit cell.
+        """
+        # The unit cell is stored as [A, cos(gamma), B, cos(beta), cos(alpha), C] in CHARMM
+        self._file.write(self._cell_record.pack(48, unit_cell[0], 0.0, unit_cell[1], 0.0, 0.0, unit_cell[2], 48))
+        for coordinates in (x, y, z):
+            self._file.write(self._coordinate_record_marker)
+            coordinates.tofile(self._file)
+            self._file.write(self._coordinate_record_marker)
+        self._number_of_frames += 1
+        self._update_number_of_frames()
+
+    def _update_number_of_frames(self) -> None:
+        """Update the number of frames in the header and move to the end of the file."""
+        self._file.seek(8)
+        self._file.write(struct.pack("<i", self._number_of_frames))
+        self._file.seek(0, os.SEEK_END)
+
+    def flush(self) -> None:
+        """Flush the .dcd file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the .dcd file."""
+        self._file.close()
+
+    @property
+    def number_of_frames(self) -> int:
+        """
+        Return the number of frames in the .dcd file.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        return self._number_of_frames
@@ -0,0 +1,111 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the NativePdbInputHandler class."""
+import logging
+from typing import List, Sequence, Tuple
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.input_output_handler.pdb_format import read_pdb_file
+from .abstracts import PdbFormatInputHandler
+from .charge_values import ChargeValues
+
+
+class NativePdbInputHandler(PdbFormatInputHandler):
+    """
+    Input handler which reads an initial global physical state for the tree state handler from a .pdb file without
+    using MDAnalysis.
+
+    This input handler reads the same .pdb files as the PdbInputHandler. It only parses the fixed columns of the
+    CRYST1, ATOM and HETATM records which makes it much faster for large initial configurations. Each residue in the
+    .pdb file, i.e., each sequence of atoms with the same chain identifier and residue id, becomes a composite object.
+
+    This class is designed to work together with the TreeStateHandler. Here, the global physical state is given
+    by a sequence of trees. Each tree is specified by a root node, which themselves are connected to children nodes.
+    Each node contains a Particle object, which stores the position and the charge.
+    This input handler allows for a variable number of root nodes with the same number of children. Each tree is of
+    height at most two. If the height is two, the root nodes correspond to composite objects and the child nodes to
+    point masses. If the height is one, the root nodes correspond to point masses.
+    Only point masses can have a charge. The wanted charges are given by a sequence of ChargeValues objects. These
+    contain every charge and a charge name.
+    Note that the positions of the point masses in the .pdb file are corrected for periodic boundaries (see
+    PdbFormatInputHandler class). Also, this input handler can only be used when the hypercuboid setting is initialized
+    and in at most three dimensions.
+    """
+
+    def __init__(self, filename: str, charge_values: Sequence[ChargeValues] = ()) -> None:
+        """
+        The constructor of the NativePdbInputHandler class.
+
+        The constructor sets the number of root nodes, the number of nodes per root node and the number of node levels
+        in the setting package.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the .pdb file which contains the initial global physical state.
+        charge_values : Sequence[input_output_handler.input_handler.charge_values.ChargeValues], optional
+            The sequence of charge values.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the filename does not end with .pdb.
+        base.exceptions.ConfigurationError
+            If the .pdb file does not contain a CRYST1 record with the system box.
+        base.exceptions.ConfigurationError
+            If the setting package specifies a dimension larger than 3 which cannot be initialized with a .pdb file.
+        base.exceptions.ConfigurationError
+            If the setting package specifies a dimension smaller than 3 and any of the superfluous system lengths in the
+            .pdb file is not 0.0.
+        base.exceptions.ConfigurationError
+            If the .pdb file specifies composite objects with different numbers of point masses.
+        base.exceptions.ConfigurationError
+            If the .pdb specifies other system lengths as the ones stored in the setting.hypercuboid_setting module.
+        base.exceptions.ConfigurationError
+            If the charge values does not contain a charge for each child node within a root node.
+        base.exceptions.ConfigurationError:
+            If in the sequence of charge values a charge name appears more than once.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
+                           filename=filename,
+                           charge_values=[charge_value.__class__.__name__ for charge_value in charge_values])
+        super().__init__(filename, charge_values)
+
+    def _read_file(self) -> Tuple[Sequence[float], List[List[Sequence[float]]]]:
+        """
+        Read the .pdb file.
+
+        Returns
+        -------
+        (Sequence[float], List[List[Sequence[float]]])
+            The system box given as [x, y, z, alpha, beta, gamma], and the three-dimensional positions of the atoms
+            grouped by residues.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the .pdb file does not contain a CRYST1 record with the system box.
+        """
+        try:
+            return read_pdb_file(self._filename)
+        except ValueError as error:
+            raise ConfigurationError(str(error))
@@ -21,21 +21,17 @@
 #
 """Module for the PdbInputHandler class."""
 import logging
-from typing import List, Sequence
-from jellyfysh.base.exceptions import ConfigurationError
+from typing import List, Sequence, Tuple
 from jellyfysh.base.logging import log_init_arguments
-from jellyfysh.base.node import Node
-from jellyfysh.base.particle import Particle
 from jellyfysh.input_output_handler.mdanalysis_import import Universe
-import jellyfysh.setting as setting
-from jellyfysh.setting import hypercuboid_setting
+from .abstracts import PdbFormatInputHandler
 from .charge_values import ChargeValues
-from .input_handler import InputHandler
 
 
-class PdbInputHandler(InputHandler):
+class PdbInputHandler(PdbFormatInputHandler):
     """
-    Input handler which reads an initial global physical state for the tree state handler from a .pdb file.
+    Input handler which reads an initial global physical state for the tree state handler from a .pdb file using the
+    MDAnalysis package.
 
     This class is designed to work together with the TreeStateHandler. Here, the global physical state is given
     by a sequence of trees. Each tree is specified by a root node, which themselves are connected to children nodes.
@@ -45,7 +41,8 @@ class PdbInputHandler(InputHandler):
     point masses. If the height is one, the root nodes correspond to point masses.
     Only point masses can have a charge. The wanted charges are given by a sequence of ChargeValues objects. These
     contain every charge and a charge name.
-    To read the .pdb file, this class uses the MDAnalysis package.
+    To read the .pdb file, this class uses the MDAnalysis package. The NativePdbInputHandler reads the same files
+    without MDAnalysis.
     Note that the positions of the point masses in the .pdb file are corrected for periodic boundaries in order to allow
     for different conventions of the origin of the system box (e.g., [0.0]*setting.dimension, which is used in this
     application, vs. [-L/2]*setting.dimension, which is used in .pdb files created by Lammps). The positions of the
@@ -88,104 +85,25 @@ class PdbInputHandler(InputHandler):
         base.exceptions.ConfigurationError:
             If in the sequence of charge values a charge name appears more than once.
         """
-        logger = logging.getLogger(__name__)
-        log_init_arguments(logger.debug, self.__class__.__name__,
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            filename=filename,
                            charge_values=[charge_value.__class__.__name__ for charge_value in charge_values])
-        super().__init__()
-        if not filename.endswith(".pdb"):
-            raise ConfigurationError("Input filename for input handler {0} should end with .pdb."
-                                     .format(self.__class__.__name__))
-        if setting.dimension < 3:
-            logger.warning("The PDB format only allows for 3 dimensions but the simulation is done in {0} dimensions. "
-                           "This class will check if the positions in not used dimensions are 0.0."
-                           .format(setting.dimension))
-        if setting.dimension > 3:
-            raise ConfigurationError("The PDB format does not allow for dimensions > 3.")
+        super().__init__(filename, charge_values)
 
-        self._filename = filename
-        self._universe = Universe(self._filename)
-        self._charge_values = charge_values
-        if not all(len(residue.atoms) == len(self._universe.residues[0].atoms) for residue in self._universe.residues):
-            raise ConfigurationError("Currently only point composite objects with the same number of children are "
-                                     "supported!")
-        setting.set_number_of_root_nodes(len(self._universe.residues))
-        setting.set_number_of_nodes_per_root_node(len(self._universe.residues[0].atoms))
-        setting.set_number_of_node_levels(1 if len(self._universe.residues[0].atoms) == 1 else 2)
-
-        system_lengths = self._universe.dimensions[:setting.dimension]
-        for index, system_length in enumerate(system_lengths):
-            if abs(system_length - hypercuboid_setting.system_lengths[index]) > 1.0e-5:
-                raise ConfigurationError("The system lengths {0} stored in the .pdb file {1} are not equal to the "
-                                         "system lengths {2} stored in the setting.hypercuboid_setting module."
-                                         .format(system_lengths, self._filename, hypercuboid_setting.system_lengths))
-        unused_system_lengths = self._universe.dimensions[setting.dimension:3]
-        if any(unused_system_length != 0.0 for unused_system_length in unused_system_lengths):
-            raise ConfigurationError("The setting.hypercuboid_setting module specifies the dimension {0}<3 but the"
-                                     " superfluous system lengths {1} stored in the .pdb file {2} are not 0.0."
-                                     .format(setting.dimension, unused_system_lengths, self._filename))
-
-        # Test that per charge value there is a charge given for every point mass
-        for charge_value in self._charge_values:
-            if len(charge_value) != setting.number_of_nodes_per_root_node:
-                raise ConfigurationError("Please give the charge {0} for every child of a composite point object!"
-                                         .format(charge_value.charge_name))
-        # Test that each charge value has a different name
-        if len(set(charge_value.charge_name for charge_value in self._charge_values)) != len(self._charge_values):
-            raise ConfigurationError("Each given charge should have a different name!")
-
-    def read(self) -> List[Node]:
+    def _read_file(self) -> Tuple[Sequence[float], List[List[Sequence[float]]]]:
         """
-        Return the initial global physical state.
-
-        This method creates the root nodes of the trees and fills them with the atom positions given in the .pdb file.
-        The charges of the atoms are initialized with the sequence of charge values. The barycenter positions of the
-        composite objects are calculated using the atom positions.
+        Read the .pdb file with MDAnalysis.
 
         Returns
         -------
-        List[base.node.Node]
-            The initial global physical state.
-
-        Raises
-        ------
-        AssertionError
-            If the setting package specifies a dimension smaller than 3 and any of the superfluous position entries in
-            the .pdb file is not 0.0.
+        (Sequence[float], List[List[Sequence[float]]])
+            The system box given as [x, y, z, alpha, beta, gamma], and the three-dimensional positions of the atoms
+            grouped by residues.
         """
-        # self._universe is set to None at the end of this method. If this method is used again, recreate it.
-        if self._universe is None:
-            self._universe = Universe(self._filename)
-
-        all_nodes = [Node() for _ in range(setting.number_of_root_nodes)]
-        for atom in self._universe.atoms:
-            # Indices in pdb files start at 1
-            atom_index = (atom.id - 1) % setting.number_of_nodes_per_root_node
-            # MDAnalysis uses numpy floats -> Cast to float
-            position = [float(atom.position[index]) for index in range(setting.dimension)]
-            assert all(float(unused_position) == 0.0 for unused_position in atom.position[setting.dimension:3])
-            setting.periodic_boundaries.correct_position(position)
-            particle = Particle(position=position, charge={charge_value.charge_name: charge_value[atom_index]
-                                                           for charge_value in self._charge_values})
-            if setting.number_of_node_levels > 1:
-                all_nodes[atom.resid - 1].add_child(Node(particle))
-            else:
-                all_nodes[atom.resid - 1].value = particle
-        if setting.number_of_node_levels > 1:
-            for node in all_nodes:
-                first_position = node.children[0].value.position
-                center_position = [entry * node.children[0].weight for entry in first_position]
-                for other_point_mass_index in range(1, len(node.children)):
-                    other_position = node.children[other_point_mass_index].value.position
-                    shortest_separation = setting.periodic_boundaries.separation_vector(first_position, other_position)
-                    closest_position = [entry + shortest_separation[index]
-                                        for index, entry in enumerate(first_position)]
-                    center_position = [entry + closest_position[index] * node.children[other_point_mass_index].weight
-                                       for index, entry in enumerate(center_position)]
-                setting.periodic_boundaries.correct_position(center_position)
-                node.value = Particle(position=center_position)
-
-        # Remove large universe object from storage, and allow pickling of this class (because the Universe class of
+        # The large universe object is not stored which allows pickling of this class (because the Universe class of
         # MDAnalysis cannot be pickled).
-        self._universe = None
-        return all_nodes
+        universe = Universe(self._filename)
+        # MDAnalysis uses numpy floats -> Cast to float
+        return ([float(entry) for entry in universe.dimensions],
+                [[[float(entry) for entry in atom.position] for atom in residue.atoms]
+                 for residue in universe.residues])
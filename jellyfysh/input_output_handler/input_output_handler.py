@@ -21,7 +21,9 @@
 #
 """Module for the InputOutputHandler class."""
 import logging
-from typing import Any, List, Sequence
+import queue
+import threading
+from typing import Any, List, MutableMapping, Sequence
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.factory import get_alias
 from jellyfysh.base.logging import log_init_arguments
@@ -38,9 +40,17 @@ class InputOutputHandler(object):
     It breaks up into a single input handler and a possible empty sequence of output handlers. The input handler enters
     the initial global physical state into the application. The output handlers serve many purposes, from the output
     of the global state to the sampling and the dumping of the entire run.
+
+    In the asynchronous output mode, the write methods of the output handlers are called in a background thread. For
+    this, the arguments are copied with the snapshot method of the output handler and put into a bounded queue from
+    which the background thread takes them. If the queue is full, the run waits until the background thread has
+    written an entry (back-pressure). Output handlers whose arguments cannot be copied (as, for example, the
+    DumpingOutputHandler which receives the mediator) are called immediately after the queue has been emptied. The
+    queue is also emptied before the post_run methods of the output handlers are called.
     """
 
-    def __init__(self, input_handler: InputHandler, output_handlers: Sequence[OutputHandler] = ()) -> None:
+    def __init__(self, input_handler: InputHandler, output_handlers: Sequence[OutputHandler] = (),
+                 asynchronous_output: bool = False, output_queue_size: int = 64) -> None:
         """
         The constructor of the InputOutputHandler class.
 
@@ -50,11 +60,29 @@ class InputOutputHandler(object):
             The input handler.
         output_handlers : Sequence[input_output_handler.output_handler.OutputHandler]
             The sequence of output handlers.
+        asynchronous_output : bool, optional
+            Whether the write methods of the output handlers are called in a background thread.
+        output_queue_size : int, optional
+            The maximum number of arguments in the queue of the background thread.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the output queue size is not positive.
         """
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            input_handler=input_handler.__class__.__name__,
-                           output_handlers=[output_handler.__class__.__name__ for output_handler in output_handlers])
+                           output_handlers=[output_handler.__class__.__name__ for output_handler in output_handlers],
+                           asynchronous_output=asynchronous_output, output_queue_size=output_queue_size)
+        if output_queue_size <= 0:
+            raise ConfigurationError("The output queue size of the class {0} should be positive."
+                                     .format(self.__class__.__name__))
         self._input_handler = input_handler
+        self._asynchronous_output = asynchronous_output
+        self._output_queue_size = output_queue_size
+        self._output_queue = None
+        self._writer_thread = None
+        self._writer_exception = None
         # Event Handlers may refer to the alias (if there is one) of the .ini file which is included in the
         # __class__.__name__ property in the factory. get_alias() extracts this alias
         self._output_handlers_dictionary = {to_snake_case(get_alias(output_handler.__class__.__name__)): output_handler
@@ -81,6 +109,8 @@ class InputOutputHandler(object):
         The arguments could be for example the full global state so that the output handler can start its sampling.
         This method is called in the mediating methods of event handlers in the mediator. There, each event handler
         defines itself, which methods should be passed to its output handler.
+        In the asynchronous output mode, the write method of the output handler is called later in the background thread
+        if the output handler can copy the arguments in its snapshot method.
         When the output handlers were built using the JF factory, their names can include an alias. Then the output
         handler name should be this alias.
 
@@ -95,18 +125,98 @@ class InputOutputHandler(object):
         ------
         base.exceptions.ConfigurationError
             If no output handler with the given name exists.
+        Exception
+            If the write method of an output handler raised an exception in the background thread.
         """
         try:
-            self._output_handlers_dictionary[output_handler].write(*args)
+            output_handler_instance = self._output_handlers_dictionary[output_handler]
         except KeyError:
             raise ConfigurationError("The given output handler {0} does not exist.".format(output_handler))
+        if self._asynchronous_output:
+            snapshot = output_handler_instance.snapshot(*args)
+            if snapshot is not None:
+                if self._writer_exception is not None:
+                    raise self._writer_exception
+                if self._writer_thread is None:
+                    self._start_writer_thread()
+                self._output_queue.put((output_handler_instance, snapshot))
+                return
+            self.flush()
+        output_handler_instance.write(*args)
+
+    def flush(self) -> None:
+        """
+        Wait until the background thread of the asynchronous output mode has written all arguments in its queue.
+
+        Raises
+        ------
+        Exception
+            If the write method of an output handler raised an exception in the background thread.
+        """
+        if self._writer_thread is not None:
+            self._output_queue.join()
+            if self._writer_exception is not None:
+                raise self._writer_exception
+
+    def flush_output_handlers(self) -> None:
+        """
+        Flush the buffered output of all output handlers into their files.
+
+        In the asynchronous output mode, the background thread first writes all arguments in its queue.
+
+        Raises
+        ------
+        Exception
+            If the write method of an output handler raised an exception in the background thread.
+        """
+        self.flush()
+        for output_handler in self._output_handlers_dictionary.values():
+            output_handler.flush()
+
+    def _start_writer_thread(self) -> None:
+        """Create the bounded queue and start the background thread of the asynchronous output mode."""
+        self._output_queue = queue.Queue(maxsize=self._output_queue_size)
+        self._writer_thread = threading.Thread(target=self._write_from_queue, name="OutputWriter", daemon=True)
+        self._writer_thread.start()
+
+    def _stop_writer_thread(self) -> None:
+        """Empty the queue and stop the background thread of the asynchronous output mode."""
+        if self._writer_thread is not None:
+            self._output_queue.put(None)
+            self._writer_thread.join()
+            self._output_queue = None
+            self._writer_thread = None
+            if self._writer_exception is not None:
+                raise self._writer_exception
+
+    def _write_from_queue(self) -> None:
+        """
+        Pass the arguments in the queue to the write methods of their output handlers until None is received.
+
+        This method runs in the background thread. If an output handler raises an exception, the exception is stored
+        and the remaining arguments in the queue are discarded. The exception is raised in the flush method.
+        """
+        while True:
+            entry = self._output_queue.get()
+            try:
+                if entry is None:
+                    return
+                if self._writer_exception is None:
+                    output_handler, args = entry
+                    output_handler.write(*args)
+            except Exception as exception:
+                self._writer_exception = exception
+            finally:
+                self._output_queue.task_done()
 
     def post_run(self) -> None:
         """
         Call the post_run method of all output handlers.
 
-        This method is called by the mediator at the end of a run.
+        This method is called by the mediator at the end of a run. In the asynchronous output mode, the background
+        thread first writes all remaining arguments in its queue.
         """
+        self._stop_writer_thread()
         for output_handler in self._output_handlers_dictionary.values():
             output_handler.post_run()
 
@@ -116,9 +226,28 @@ class InputOutputHandler(object):
 
         These have no output. This method is used in debugging mode in resume.py.
         """
+        self._stop_writer_thread()
         for name in self._output_handlers_dictionary.keys():
             self._output_handlers_dictionary[name] = DummyOutputHandler()
 
+    def __getstate__(self) -> MutableMapping[str, Any]:
+        """
+        Return a state of this class that can be pickled.
+
+        This method removes the queue and the background thread of the asynchronous output mode (which cannot be
+        pickled) from the self.__dict__ dictionary. Output handlers that dump the run receive their arguments only after
+        the queue was emptied. The background thread is restarted on the next asynchronous write.
+
+        Returns
+        -------
+        MutableMapping[str, Any]
+            The state that can be pickled.
+        """
+        state = self.__dict__.copy()
+        state["_output_queue"] = None
+        state["_writer_thread"] = None
+        return state
+
     @property
     def output_handlers(self) -> List[str]:
         """
@@ -22,15 +22,14 @@
 """Module for the abstract MDAnalysisOutputHandler class."""
 from abc import ABCMeta
 import logging
-from typing import Any, MutableMapping, Sequence
-from jellyfysh.base.exceptions import ConfigurationError
+from typing import Any, MutableMapping, Sequence, Tuple
 from jellyfysh.input_output_handler.mdanalysis_import import Universe
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.setting import hypercuboid_setting as setting
-from .output_handler import OutputHandler
+from .topology_output_handler import TopologyOutputHandler
 
 
-class MDAnalysisOutputHandler(OutputHandler, metaclass=ABCMeta):
+class MDAnalysisOutputHandler(TopologyOutputHandler, metaclass=ABCMeta):
     """
     Abstract output handler class that creates and stores a universe in MDAnalysis. This universe can be used to use
     MDAnalysis writer classes in an inheriting output handler.
@@ -62,51 +61,24 @@ class MDAnalysisOutputHandler(OutputHandler, metaclass=ABCMeta):
         base.exceptions.ConfigurationError
             If the hypercuboid setting is not initialized.
         base.exceptions.ConfigurationError
-            If the setting package specifies a dimension larger than 3 which cannot be used within MDAnalysis.
+            If the setting package specifies a dimension larger than 3.
         base.exceptions.ConfigurationError
             If the bonds_within_composite_object sequence is not divisible by two.
         base.exceptions.ConfigurationError
             If the names_within_composite_object sequence does not specify a name for each point mass (if it is not
             empty).
         """
-        logger = logging.getLogger(__name__)
-        log_init_arguments(logger.debug, self.__class__.__name__, filename=filename,
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
                            names_within_composite_object=names_within_composite_object,
                            bonds_within_composite_object=bonds_within_composite_object)
-        if not setting.initialized():
-            raise ConfigurationError("The class {0} can only be used in a hypercuboid setting."
-                                     .format(self.__class__.__name__))
-        if setting.dimension < 3:
-            logger.warning("MDAnalysis only allows for 3 dimensions but the simulation is done in {0} dimensions. "
-                           "This class will set positions in not used dimensions to 0.0.".format(setting.dimension))
-        if setting.dimension > 3:
-            raise ConfigurationError("MDAnalysis does not allow for dimensions > 3.")
-        super().__init__(filename)
-        self._names_within_composite_object = names_within_composite_object
-        self._number_of_atoms = setting.number_of_root_nodes * setting.number_of_nodes_per_root_node
-        # dimensions = [x, y, z, alpha, beta, gamma]
-        self._dimensions = ([setting.system_lengths[index] for index in range(setting.dimension)]
-                            + [0.0 for _ in range(3 - setting.dimension)] + [90.0 for _ in range(3)])
-
-        if setting.number_of_node_levels == 1:
-            self._get_atom = lambda universe, identifier: universe.atoms[identifier[0]]
-        else:
-            self._get_atom = lambda universe, identifier: universe.atoms[
-                identifier[0] * setting.number_of_nodes_per_root_node + identifier[1]]
-
-        if bonds_within_composite_object:
-            if len(bonds_within_composite_object) % 2 != 0:
-                raise ConfigurationError("The list of bonds should be divisible by two!")
-        self._bonds_within_composite_object = bonds_within_composite_object
-
-        if names_within_composite_object:
-            if len(names_within_composite_object) != setting.number_of_nodes_per_root_node:
-                raise ConfigurationError("Please give a name for each point mass within a composite point object!")
-        self._names_within_composite_object = names_within_composite_object
-
+        super().__init__(filename, names_within_composite_object, bonds_within_composite_object)
         self._universe = self._create_universe_with_topologies(setting.number_of_root_nodes,
                                                                setting.number_of_nodes_per_root_node)
 
+    def _get_atom(self, universe: Universe, identifier: Tuple[int, ...]) -> Any:
+        """Return the atom in the MDAnalysis universe that corresponds to the given global state identifier."""
+        return universe.atoms[self._atom_index(identifier)]
+
     def _create_universe_with_topologies(self, number_of_root_nodes, number_of_nodes_per_root_node) -> Universe:
         """Create a MDAnalysis universe with all topologies that can be set by the JF application."""
         # noinspection PyArgumentEqualDefault
@@ -120,12 +92,7 @@ class MDAnalysisOutputHandler(OutputHandler, metaclass=ABCMeta):
         universe.add_TopologyAttr("resids", values=[index + 1 for index in range(len(universe.residues))])
 
         if self._bonds_within_composite_object:
-            bonds = sum(([index + composite_index * number_of_nodes_per_root_node
-                          for index in self._bonds_within_composite_object]
-                         for composite_index in range(number_of_root_nodes)), [])
-            bonds_iterator = iter(bonds)
-            universe.add_TopologyAttr("bonds",
-                                      values=[index_tuple for index_tuple in zip(bonds_iterator, bonds_iterator)])
+            universe.add_TopologyAttr("bonds", values=self._bonds(number_of_root_nodes, number_of_nodes_per_root_node))
 
         # PDBWriter currently not supports changing the record type from ATOM to HETATM although the attribute exists
         # universe.add_TopologyAttr("record_types")
@@ -27,10 +27,10 @@ from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node
 from jellyfysh.base import vectors
 import jellyfysh.setting as setting
-from .output_handler import OutputHandler, HardBufferedTextWriter
+from .sample_output_handler import SampleOutputHandler
 
 
-class BondLengthAndAngleOutputHandler(OutputHandler):
+class BondLengthAndAngleOutputHandler(SampleOutputHandler):
     """
     Output handler which samples the bond length and the bond angle of water molecules.
 
@@ -45,31 +45,48 @@ class BondLengthAndAngleOutputHandler(OutputHandler):
     include '_Angle' in the filename.
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, binary: bool = False, histogram_bin_width: float = None,
+                 blocking_analysis: bool = False):
         """
         The constructor of the BondLengthAndAngleOutputHandler class.
 
-        This class uses a HardBufferedTextWriter to first write the bond lengths and angles to temporary files.
+        This class uses a HardBufferedTextWriter to first write the bond lengths and angles to temporary files. If
+        binary is True, BinaryColumnarWriter instances are used instead. If the histogram bin width is specified,
+        SampleAccumulator instances are used with the same bin width for the bond lengths and the bond angles.
 
         Parameters
         ----------
         filename : str
             The filename of the file this output handler is connected to.
+        binary : bool, optional
+            Whether the bond lengths and angles are written into binary columnar files instead of text files.
+        histogram_bin_width : float or None, optional
+            If not None, the histograms and moments of the bond lengths and angles are accumulated with this histogram
+            bin width instead of writing the bond lengths and angles.
+        blocking_analysis : bool, optional
+            Whether the accumulated moments include a blocking analysis of the standard error of the mean.
 
         Raises
         ------
         base.exceptions.ConfigurationError
             If the number of node levels is not two or the number of nodes per root node is not three.
+        base.exceptions.ConfigurationError
+            If both binary is True and the histogram bin width is specified.
+        base.exceptions.ConfigurationError
+            If the histogram bin width is not positive.
+        base.exceptions.ConfigurationError
+            If blocking_analysis is True but the histogram bin width is not specified.
         """
-        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename)
-        super().__init__(filename)
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           binary=binary, histogram_bin_width=histogram_bin_width, blocking_analysis=blocking_analysis)
+        super().__init__(filename, binary, histogram_bin_width, blocking_analysis)
         filename_dot_position = self._output_filename.rfind('.')
         bond_length_filename = (self._output_filename[:filename_dot_position]
                                 + '_Length' + self._output_filename[filename_dot_position:])
         bond_angle_filename = (self._output_filename[:filename_dot_position]
                                + '_Angle' + self._output_filename[filename_dot_position:])
-        self._file_bond_lengths = HardBufferedTextWriter(bond_length_filename)
-        self._file_bond_angles = HardBufferedTextWriter(bond_angle_filename)
+        self._file_bond_lengths = self._create_writer(bond_length_filename, ["bond_length"])
+        self._file_bond_angles = self._create_writer(bond_angle_filename, ["bond_angle"])
         if setting.number_of_node_levels != 2 or setting.number_of_nodes_per_root_node != 3:
             raise ConfigurationError("The output handler {0} can only be used if each root node has 3 child nodes."
                                      .format(self.__class__.__name__))
@@ -96,9 +113,9 @@ class BondLengthAndAngleOutputHandler(OutputHandler):
             hydrogen_two_position = root_cnode.children[2].value.position
             vector_oh_one = setting.periodic_boundaries.separation_vector(oxygen_position, hydrogen_one_position)
             vector_oh_two = setting.periodic_boundaries.separation_vector(oxygen_position, hydrogen_two_position)
-            print(vectors.norm(vector_oh_one), file=self._file_bond_lengths)
-            print(vectors.norm(vector_oh_two), file=self._file_bond_lengths)
-            print(vectors.angle_between_two_vectors(vector_oh_one, vector_oh_two), file=self._file_bond_angles)
+            self._file_bond_lengths.write_row([vectors.norm(vector_oh_one)])
+            self._file_bond_lengths.write_row([vectors.norm(vector_oh_two)])
+            self._file_bond_angles.write_row([vectors.angle_between_two_vectors(vector_oh_one, vector_oh_two)])
 
     def post_run(self):
         """Clean up the output handler."""
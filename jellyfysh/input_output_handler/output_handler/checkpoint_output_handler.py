@@ -0,0 +1,187 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the CheckpointOutputHandler class."""
+import hashlib
+import logging
+import os
+from typing import Any, MutableMapping
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+import jellyfysh.base.uuid as uuid
+from jellyfysh.input_output_handler.checkpoint_format import (pickle_static_objects, write_checkpoint_file,
+                                                              write_static_file)
+from jellyfysh.mediator import Mediator
+import jellyfysh.setting as setting
+from .mediator_dumping_output_handler import MediatorDumpingOutputHandler
+
+
+class CheckpointOutputHandler(MediatorDumpingOutputHandler):
+    """
+    Output handler which writes compact checkpoints of an entire run.
+
+    In contrast to the DumpingOutputHandler, the members of the event handlers that are only read after their
+    initialization (for example, potentials, estimators, cell systems, and tables of bounds) are not written into every
+    checkpoint. Instead, they are written into a static file whose name is given by the filename with '_static_' and
+    the beginning of the SHA-256 hash of the pickled shared members appended to its stem. A new static file is only
+    written if new shared members appear or if the shared members changed since the last static file was written,
+    which is detected by pickling and hashing them before every checkpoint. The latter should not happen for members
+    that are only read and is logged as a warning. Since the name of the static file depends on its content, a static
+    file that is referenced by the checkpoint file on disk is never overwritten. An old static file is deleted once the
+    checkpoint file was replaced by a checkpoint that references a newer static file. Note that the shared members are
+    pickled at every checkpoint for the detection of changes, although they are only written when they changed.
+    The checkpoint file then only stores the remaining state
+    of the run (the mediator with the positions, the lifting state, the scheduler, the activator, and the output
+    handlers), the state of the random module, and the setting package. See the input_output_handler.checkpoint_format
+    module for the file format. The checkpoint file can be used in resume.py to resume the run starting from the
+    checkpointed configuration. The static file has to be located in the same directory. Since the objects are pickled
+    with dill, the run should be resumed with the same python implementation and version, which are stored in the header
+    of the checkpoint file. Optionally, the checkpoints are written in forked processes (see the
+    MediatorDumpingOutputHandler class). The static file is always written in the process of the run.
+    """
+
+    def __init__(self, filename: str, compression_level: int = 1, fork_dumps: bool = False,
+                 maximum_number_of_forked_dumps: int = 1) -> None:
+        """
+        The constructor of the CheckpointOutputHandler class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the checkpoint file.
+        compression_level : int, optional
+            The zlib compression level of the checkpoint file and the static file (between 0 and 9).
+        fork_dumps : bool, optional
+            Whether the checkpoints are written in forked processes.
+        maximum_number_of_forked_dumps : int, optional
+            The maximum number of concurrently running forked processes.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the filename contains more than one '.'.
+        base.exceptions.ConfigurationError
+            If the compression level is not between 0 and 9.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           compression_level=compression_level, fork_dumps=fork_dumps,
+                           maximum_number_of_forked_dumps=maximum_number_of_forked_dumps)
+        split_filename = filename.split(".")
+        if len(split_filename) != 2:
+            raise ConfigurationError("The given filename {0} contains more than one '.'.".format(filename))
+        if not 0 <= compression_level <= 9:
+            raise ConfigurationError("The compression level of the class {0} should be between 0 and 9."
+                                     .format(self.__class__.__name__))
+        super().__init__(filename, fork_dumps, maximum_number_of_forked_dumps)
+        self._static_filename_format = split_filename[0] + "_static_{0}." + split_filename[1]
+        self._static_filename = None
+        self._obsolete_static_filenames = []
+        self._compression_level = compression_level
+        self._static_objects = []
+        self._static_hash = None
+        self._static_objects_hash = None
+        self._static_memo = {}
+
+    def _prepare_dump(self, mediator: Mediator) -> None:
+        """
+        Write the static file if the event handlers of the mediator have shared members that were not written yet or
+        if the written shared members changed.
+
+        Parameters
+        ----------
+        mediator : mediator.Mediator
+            The mediator.
+        """
+        static_objects_identifiers = {id(static_object) for static_object in self._static_objects}
+        number_of_static_objects = len(self._static_objects)
+        for event_handler in mediator.get_event_handlers():
+            for shared_member in event_handler.get_shared_members():
+                if id(shared_member) not in static_objects_identifiers:
+                    static_objects_identifiers.add(id(shared_member))
+                    self._static_objects.append(shared_member)
+        pickled_static_objects = pickle_static_objects(self._static_objects)
+        static_objects_hash = hashlib.sha256(pickled_static_objects[0]).hexdigest()
+        if static_objects_hash != self._static_objects_hash:
+            static_filename = self._static_filename_format.format(static_objects_hash[:16])
+            if self._static_objects_hash is not None and len(self._static_objects) == number_of_static_objects:
+                logging.getLogger(__name__).warning(
+                    "The shared members of the event handlers changed since the static file {0} was written. "
+                    "Writing the new static file {1}.".format(self._static_filename, static_filename))
+            self._static_hash, self._static_memo = write_static_file(static_filename, self._static_objects,
+                                                                     self._compression_level, pickled_static_objects)
+            if self._static_filename is not None and self._static_filename != static_filename:
+                self._obsolete_static_filenames.append(self._static_filename)
+            self._static_filename = static_filename
+            self._static_objects_hash = static_objects_hash
+        # Forget about the obsolete static files that were already deleted (possibly in forked processes)
+        self._obsolete_static_filenames = [obsolete_static_filename
+                                           for obsolete_static_filename in self._obsolete_static_filenames
+                                           if os.path.exists(obsolete_static_filename)]
+
+    def _clean_up_after_dump(self) -> None:
+        """
+        Delete the static files that were replaced by a newer static file before the last checkpoint was started.
+
+        The checkpoint file on disk references the newest static file, and checkpoints that are written in forked
+        processes which were started later can only reference the same or even newer static files. Therefore, no
+        checkpoint on disk references the deleted static files.
+        """
+        for obsolete_static_filename in self._obsolete_static_filenames:
+            if os.path.exists(obsolete_static_filename):
+                os.remove(obsolete_static_filename)
+
+    def _dump(self, mediator: Mediator, random_state: Any, filename: str) -> None:
+        """
+        Write a checkpoint of the mediator, the state of the random module and the setting package into the given file.
+
+        Parameters
+        ----------
+        mediator : mediator.Mediator
+            The mediator.
+        random_state : Any
+            The state of the random module.
+        filename : str
+            The filename.
+        """
+        write_checkpoint_file(filename, [mediator, setting, uuid, random_state], self._static_filename,
+                              self._static_hash, self._static_memo, self._compression_level,
+                              run_identification_hash=str(uuid.get_uuid()))
+
+    def __getstate__(self) -> MutableMapping[str, Any]:
+        """
+        Return a state of this class that can be pickled.
+
+        This method empties the static objects and the memo of the pickler of the static file, which identifies objects
+        by their ids in the running process. Therefore, the static file is rewritten at the first checkpoint of a
+        resumed run. The name of the static file is kept so that it can be deleted if the static file of the resumed
+        run differs.
+
+        Returns
+        -------
+        MutableMapping[str, Any]
+            The state that can be pickled.
+        """
+        state = super().__getstate__()
+        state["_static_objects"] = []
+        state["_static_hash"] = None
+        state["_static_objects_hash"] = None
+        state["_static_memo"] = {}
+        return state
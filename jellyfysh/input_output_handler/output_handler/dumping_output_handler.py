@@ -21,18 +21,18 @@
 #
 """Module for the DumpingOutputHandler class."""
 import logging
-import random
 import sys
+from typing import Any
 import dill
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 import jellyfysh.base.uuid as uuid
 from jellyfysh.mediator import Mediator
 import jellyfysh.setting as setting
-from .output_handler import OutputHandler
+from .mediator_dumping_output_handler import MediatorDumpingOutputHandler
 
 
-class DumpingOutputHandler(OutputHandler):
+class DumpingOutputHandler(MediatorDumpingOutputHandler):
     """
     Output handler which dumps an entire run into a file.
 
@@ -40,9 +40,10 @@ class DumpingOutputHandler(OutputHandler):
     the dill package. The file can be used in resume.py to resume the run starting from the dumped configuration.
     The run can only be resumed using the same python implementation and version. These are included in the filename
     of the dumping file.
+    Optionally, the dumps are written in forked processes (see the MediatorDumpingOutputHandler class).
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, fork_dumps: bool = False, maximum_number_of_forked_dumps: int = 1) -> None:
         """
         The constructor of the DumpingOutputHandler class.
 
@@ -50,45 +51,57 @@ class DumpingOutputHandler(OutputHandler):
         ----------
         filename : str
             The filename of the file this output handler is connected to.
+        fork_dumps : bool, optional
+            Whether the dumps are written in forked processes.
+        maximum_number_of_forked_dumps : int, optional
+            The maximum number of concurrently running forked processes.
 
         Raises
         ------
-        AssertionError
-            If the filename does not contain a file format.
+        base.exceptions.ConfigurationError
+            If the filename contains more than one '.'.
         """
-        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename)
-        split_filename = filename.split(".")
-        if len(split_filename) != 2:
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           fork_dumps=fork_dumps, maximum_number_of_forked_dumps=maximum_number_of_forked_dumps)
+        if len(filename.split(".")) != 2:
             raise ConfigurationError("The given filename {0} contains more than one '.'.".format(filename))
-        # Include python implementation and version (implementation_major_minor_macro in filename)
-        dumping_filename = (split_filename[0] + "_" + sys.implementation.name + "_" +
-                            "_".join([str(sys.version_info[i]) for i in range(3)])
-                            + "." + split_filename[1])
+        super().__init__(self.dumping_filename(filename), fork_dumps, maximum_number_of_forked_dumps)
 
-        super().__init__(dumping_filename)
+    @staticmethod
+    def dumping_filename(filename: str) -> str:
+        """
+        Return the name of the dumping file that is written for the given filename argument of the constructor.
 
-    def write(self, mediator: Mediator) -> None:
+        The python implementation and version are included in the filename.
+
+        Parameters
+        ----------
+        filename : str
+            The filename argument of the constructor.
+
+        Returns
+        -------
+        str
+            The filename of the dumping file.
         """
-        Dump the mediator, the state of the random module and the setting package into the dumping file.
+        split_filename = filename.split(".")
+        # Include python implementation and version (implementation_major_minor_macro in filename)
+        return (split_filename[0] + "_" + sys.implementation.name + "_" +
+                "_".join([str(sys.version_info[i]) for i in range(3)])
+                + "." + split_filename[1])
+
+    def _dump(self, mediator: Mediator, random_state: Any, filename: str) -> None:
+        """
+        Dump the mediator, the state of the random module and the setting package into the given file.
 
         Parameters
         ----------
         mediator : mediator.Mediator
             The mediator.
-
-        Raises
-        ------
-        RuntimeError
-            If the argument is not a mediator.
+        random_state : Any
+            The state of the random module.
+        filename : str
+            The filename.
         """
-        print("Writing dump into file {0}".format(self._output_filename))
-        if not isinstance(mediator, Mediator):
-            raise RuntimeError("The argument of the 'write' method of the class {0} is not the required mediator "
-                               "object. Make sure that this output handler is connected to the DumpingEventHandler."
-                               .format(self.__class__.__name__))
-        with open(self._output_filename, "wb") as file:
-            dill.dump([mediator, setting, uuid, random.getstate()], file)
-
-    def post_run(self) -> None:
-        """Clean up the output handler."""
-        pass
+        with open(filename, "wb") as file:
+            dill.dump([mediator, setting, uuid, random_state], file)
@@ -0,0 +1,251 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the abstract MediatorDumpingOutputHandler class."""
+from abc import ABCMeta, abstractmethod
+import logging
+import os
+import random
+import sys
+import traceback
+from typing import Any, MutableMapping
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.mediator import Mediator
+from .output_handler import OutputHandler
+
+
+class MediatorDumpingOutputHandler(OutputHandler, metaclass=ABCMeta):
+    """
+    Abstract output handler class that dumps the mediator of an entire run into a file.
+
+    The dump is first written into a temporary file which then replaces the dumping file. By this, the dumping file
+    always contains a complete dump. Besides the mediator, the state of the random module is dumped.
+    Optionally, the dumps are written in forked processes (using os.fork, which is only available on Unix systems).
+    The forked process sees a copy-on-write snapshot of the mediator, writes the dump, and exits, while the run
+    continues immediately in the parent process. The number of concurrently running forked processes is limited. If the
+    limit is reached, the run waits until the oldest forked process has finished. A forked process only replaces the
+    dumping file after the forked process of the preceding dump has exited, so that an older dump never replaces a
+    newer one. If a forked process fails, a RuntimeError is raised in the parent process on the next dump or in the
+    post_run method.
+    Since the random module is reseeded in forked processes, its state is determined before forking. Also, the buffered
+    output of all output handlers is flushed before forking. Otherwise, the forked process would write the buffered
+    data a second time when it pickles the open files, and the file positions in the dump would not include it.
+    """
+
+    def __init__(self, filename: str, fork_dumps: bool = False, maximum_number_of_forked_dumps: int = 1) -> None:
+        """
+        The constructor of the abstract MediatorDumpingOutputHandler class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the dumping file.
+        fork_dumps : bool, optional
+            Whether the dumps are written in forked processes.
+        maximum_number_of_forked_dumps : int, optional
+            The maximum number of concurrently running forked processes.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the dumps should be written in forked processes, but os.fork is not available.
+        base.exceptions.ConfigurationError
+            If the maximum number of forked dumps is not positive.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           fork_dumps=fork_dumps, maximum_number_of_forked_dumps=maximum_number_of_forked_dumps)
+        super().__init__(filename)
+        if fork_dumps and not hasattr(os, "fork"):
+            raise ConfigurationError("The class {0} can only fork dumps on systems which support os.fork."
+                                     .format(self.__class__.__name__))
+        if maximum_number_of_forked_dumps <= 0:
+            raise ConfigurationError("The maximum number of forked dumps of the class {0} should be positive."
+                                     .format(self.__class__.__name__))
+        self._fork_dumps = fork_dumps
+        self._maximum_number_of_forked_dumps = maximum_number_of_forked_dumps
+        self._forked_processes = []
+        # Read end of a pipe whose write end is only open in the forked process of the preceding dump
+        self._preceding_dump_file_descriptor = None
+
+    @staticmethod
+    def dumping_filename(filename: str) -> str:
+        """
+        Return the name of the dumping file that is written for the given filename argument of the constructor.
+
+        Inheriting classes which change the filename in their constructor should overwrite this method.
+
+        Parameters
+        ----------
+        filename : str
+            The filename argument of the constructor.
+
+        Returns
+        -------
+        str
+            The filename of the dumping file.
+        """
+        return filename
+
+    def write(self, mediator: Mediator) -> None:
+        """
+        Dump the mediator into the dumping file, possibly in a forked process.
+
+        Parameters
+        ----------
+        mediator : mediator.Mediator
+            The mediator.
+
+        Raises
+        ------
+        RuntimeError
+            If the argument is not a mediator.
+        RuntimeError
+            If a forked process of a preceding dump failed.
+        """
+        print("Writing dump into file {0}".format(self._output_filename))
+        if not isinstance(mediator, Mediator):
+            raise RuntimeError("The argument of the 'write' method of the class {0} is not the required mediator "
+                               "object. Make sure that this output handler is connected to the DumpingEventHandler."
+                               .format(self.__class__.__name__))
+        self._prepare_dump(mediator)
+        random_state = random.getstate()
+        if not self._fork_dumps:
+            temporary_filename = self._output_filename + ".tmp"
+            self._dump(mediator, random_state, temporary_filename)
+            os.replace(temporary_filename, self._output_filename)
+            self._clean_up_after_dump()
+            return
+        self._wait_for_forked_processes(self._maximum_number_of_forked_dumps - 1)
+        mediator.flush_output()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_file_descriptor, write_file_descriptor = os.pipe()
+        process_identifier = os.fork()
+        if process_identifier == 0:
+            self._run_forked_process(mediator, random_state, read_file_descriptor)
+        os.close(write_file_descriptor)
+        if self._preceding_dump_file_descriptor is not None:
+            os.close(self._preceding_dump_file_descriptor)
+        self._preceding_dump_file_descriptor = read_file_descriptor
+        self._forked_processes.append(process_identifier)
+
+    def _run_forked_process(self, mediator: Mediator, random_state: Any, own_read_file_descriptor: int) -> None:
+        """
+        Write the dump in the forked process and exit the forked process.
+
+        The write end of the pipe of this dump stays open until this process exits. Before the dumping file is
+        replaced, this process waits until the write end of the pipe of the preceding dump was closed.
+        """
+        exit_code = 0
+        temporary_filename = "{0}.{1}.tmp".format(self._output_filename, os.getpid())
+        try:
+            os.close(own_read_file_descriptor)
+            self._dump(mediator, random_state, temporary_filename)
+            if self._preceding_dump_file_descriptor is not None:
+                os.read(self._preceding_dump_file_descriptor, 1)
+            os.replace(temporary_filename, self._output_filename)
+            self._clean_up_after_dump()
+        except BaseException:
+            traceback.print_exc()
+            sys.stderr.flush()
+            if os.path.exists(temporary_filename):
+                os.remove(temporary_filename)
+            exit_code = 1
+        finally:
+            # Do not run any clean up of the parent process (as, for example, flushing buffered output files)
+            os._exit(exit_code)
+
+    def _wait_for_forked_processes(self, maximum_number_of_running_processes: int) -> None:
+        """
+        Collect all finished forked processes, and wait for the oldest forked processes until at most the given number
+        of forked processes are running.
+
+        Raises
+        ------
+        RuntimeError
+            If a forked process failed.
+        """
+        for process_identifier in list(self._forked_processes):
+            must_wait = (len(self._forked_processes) > maximum_number_of_running_processes
+                         and process_identifier == self._forked_processes[0])
+            finished_process_identifier, status = os.waitpid(process_identifier, 0 if must_wait else os.WNOHANG)
+            if finished_process_identifier == 0:
+                continue
+            self._forked_processes.remove(process_identifier)
+            if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+                raise RuntimeError("The forked process {0} of the class {1} failed to write the dump into the file {2}."
+                                   .format(process_identifier, self.__class__.__name__, self._output_filename))
+
+    def _prepare_dump(self, mediator: Mediator) -> None:
+        """
+        Prepare the dump of the mediator in the process of the run.
+
+        This method is called before every dump (and before forking). Changes of the state of this class are only kept
+        when they are made in this method. This method does nothing by default.
+        """
+        pass
+
+    def _clean_up_after_dump(self) -> None:
+        """
+        Clean up after the dumping file was replaced by a new dump.
+
+        This method is called in the process that wrote the dump, that is, possibly in a forked process. Since the
+        forked processes replace the dumping file in the order of the dumps, every dump that was started before has
+        already replaced the dumping file. This method does nothing by default.
+        """
+        pass
+
+    @abstractmethod
+    def _dump(self, mediator: Mediator, random_state: Any, filename: str) -> None:
+        """Dump the mediator and the state of the random module into the file with the given filename."""
+        raise NotImplementedError
+
+    def post_run(self) -> None:
+        """
+        Wait for all forked processes.
+
+        Raises
+        ------
+        RuntimeError
+            If a forked process failed.
+        """
+        self._wait_for_forked_processes(0)
+        if self._preceding_dump_file_descriptor is not None:
+            os.close(self._preceding_dump_file_descriptor)
+            self._preceding_dump_file_descriptor = None
+
+    def __getstate__(self) -> MutableMapping[str, Any]:
+        """
+        Return a state of this class that can be pickled.
+
+        The forked processes and the file descriptor of the preceding dump only refer to the process of the run.
+        Therefore, they are not part of the returned state.
+
+        Returns
+        -------
+        MutableMapping[str, Any]
+            The state that can be pickled.
+        """
+        state = self.__dict__.copy()
+        state["_forked_processes"] = []
+        state["_preceding_dump_file_descriptor"] = None
+        return state
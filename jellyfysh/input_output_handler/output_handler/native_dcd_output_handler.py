@@ -0,0 +1,176 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the NativeDcdOutputHandler class."""
+from array import array
+import logging
+from typing import Any, MutableMapping, Sequence
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node, yield_closest_leaf_unit_positions
+from jellyfysh.base.uuid import get_uuid
+from jellyfysh.input_output_handler.dcd_format import DcdWriter
+from jellyfysh.setting import hypercuboid_setting as setting
+from .topology_output_handler import TopologyOutputHandler
+
+
+class NativeDcdOutputHandler(TopologyOutputHandler):
+    """
+    Output handler which writes the trajectory of the leaf units in the extracted global state into a .dcd file
+    without using MDAnalysis.
+
+    This output handler writes the same .dcd and .pdb files as the DcdOutputHandler. However, the frames are assembled
+    in flat coordinate arrays and written directly into the .dcd file instead of going through a MDAnalysis universe.
+    Also, this output handler continues writing into the same .dcd file after resuming a dumped run.
+
+    This output handler should receive the extracted global state in its write method. It is designed to work together
+    with the TreeStateHandler. Here, the extracted global state is given by a sequence of trees. Each tree is specified
+    by a root node, which themselves are connected to children nodes. Each node contains a Unit object.
+    This output handler allows for a variable number of root nodes, each with the same number of children. For each
+    leaf node, the names of the corresponding point masses can be given on initialization of this class. The same is
+    true for the bonds of leaf nodes of a single root node.
+
+    The first call of the write method further stores the topology of the extracted global state (i.e., the names and
+    connections of the leaf units) in a .pdb file. For this, the same filename with exchanged file suffixes is used.
+    Note that the positions of point masses are corrected for periodic boundary conditions so that they are the closest
+    to the position of the composite point object they belong to.
+    The writing to .dcd files can only be used if the hypercuboid setting is initialized and in at most three
+    dimensions (see TopologyOutputHandler class).
+    """
+
+    def __init__(self, filename: str, names_within_composite_object: Sequence[str] = (),
+                 bonds_within_composite_object: Sequence[int] = ()) -> None:
+        """
+        The constructor of the NativeDcdOutputHandler class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the file this output handler is connected to.
+        names_within_composite_object : Sequence[str], optional
+            The sequence of names of the point masses within a composite object.
+        bonds_within_composite_object : Sequence[int], optional
+            The sequence of bonds of the point masses within the composite object. In the sequence, the bonds should be
+            given in pairs of two. The point masses are numbered as they appear in the children sequence of the root
+            node.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the hypercuboid setting is not initialized.
+        base.exceptions.ConfigurationError
+            If the filename does not end with .dcd.
+        base.exceptions.ConfigurationError
+            If the setting package specifies a dimension larger than 3.
+        base.exceptions.ConfigurationError
+            If the bonds_within_composite_object sequence is not divisible by two.
+        base.exceptions.ConfigurationError
+            If the names_within_composite_object sequence does not specify a name for each point mass (if it is not
+            empty).
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           names_within_composite_object=names_within_composite_object,
+                           bonds_within_composite_object=bonds_within_composite_object)
+        if not filename.endswith(".dcd"):
+            raise ConfigurationError("Output filename for output handler {0} should end with .dcd."
+                                     .format(self.__class__.__name__))
+        super().__init__(filename, names_within_composite_object, bonds_within_composite_object)
+        self._filename_without_ending = filename[:-4]
+        self._pdb_file_created = False
+        self._coordinates = [array("f", bytes(4 * self._number_of_atoms)) for _ in range(3)]
+        self._title = "RUN IDENTIFICATION HASH: {0}".format(get_uuid())
+        self._writer = DcdWriter(filename, self._number_of_atoms, title=self._title)
+
+    def write(self, extracted_global_state: Sequence[Node]) -> None:
+        """
+        Write the positions of the leaf units in the extracted global state as a frame into the .dcd file.
+
+        In the first call, the topology of the extracted global state is additionally written into a .pdb file.
+
+        Parameters
+        ----------
+        extracted_global_state : Sequence[base.node.Node]
+            The extracted global state.
+        """
+        super().write(extracted_global_state)
+        # Coordinates in not used dimensions remain 0.0
+        coordinates = self._coordinates[:setting.dimension]
+        for root_cnode in extracted_global_state:
+            for leaf_unit, position in yield_closest_leaf_unit_positions(root_cnode):
+                atom_index = self._atom_index(leaf_unit.identifier)
+                for coordinate_array, coordinate in zip(coordinates, position):
+                    coordinate_array[atom_index] = coordinate
+        if not self._pdb_file_created:
+            self._write_pdb_file(self._filename_without_ending + ".pdb", list(zip(*self._coordinates)))
+            self._pdb_file_created = True
+        self._writer.write_frame(*self._coordinates, unit_cell=self._dimensions[:3])
+
+    def flush(self) -> None:
+        """Flush the .dcd file."""
+        self._writer.flush()
+
+    def post_run(self) -> None:
+        """Clean up the output handler."""
+        self._writer.close()
+
+    def __getstate__(self) -> MutableMapping[str, Any]:
+        """
+        Return a state of this class that can be pickled.
+
+        This method replaces the self._writer attribute in the self.__dict__ dictionary by the number of frames that
+        were written into the .dcd file so far.
+
+        Returns
+        -------
+        MutableMapping[str, Any]
+            The state that can be pickled.
+        """
+        self._writer.flush()
+        instance_dictionary = self.__dict__.copy()
+        del instance_dictionary["_writer"]
+        instance_dictionary["_number_of_frames"] = self._writer.number_of_frames
+        return instance_dictionary
+
+    def __setstate__(self, state: MutableMapping[str, Any]) -> None:
+        """
+        Use the state dictionary to initialize this class.
+
+        This method creates the self._writer attribute that was deleted in the __getstate__ method. The writer
+        continues writing into the .dcd file after the frames that were written before the dump. Later frames (which
+        were written after the dump in a previous run) are removed, which is logged as a warning. If the .dcd file does
+        not contain the frames that were written before the dump, or if it was written by a different run, a new .dcd
+        file ending with '_after_dump.dcd' is started in order to avoid loss of data.
+
+        Parameters
+        ----------
+        state : MutableMapping[str, Any]
+            The state.
+        """
+        number_of_frames = state.pop("_number_of_frames")
+        self.__dict__.update(state)
+        try:
+            self._writer = DcdWriter(self._filename_without_ending + ".dcd", self._number_of_atoms,
+                                     title=self._title, number_of_frames=number_of_frames)
+        except ValueError as error:
+            logging.getLogger(__name__).warning("{0} Starting a new file {1}."
+                                                .format(error, self._filename_without_ending + "_after_dump.dcd"))
+            self._writer = DcdWriter(self._filename_without_ending + "_after_dump.dcd", self._number_of_atoms,
+                                     title=self._title)
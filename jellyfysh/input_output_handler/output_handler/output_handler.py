@@ -21,8 +21,12 @@
 #
 """Module for the abstract OutputHandler class."""
 from abc import ABCMeta, abstractmethod
+import array
+import json
+import math
 import os
-from typing import Any
+import sys
+from typing import Any, List, Optional, Sequence, Tuple
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.uuid import get_uuid
 
@@ -76,6 +80,38 @@ class OutputHandler(metaclass=ABCMeta):
         if self._counter % 100 == 0:
             print("{0}: Calculated {1} samples.".format(self.__class__.__name__, self._counter))
 
+    def snapshot(self, *args: Any) -> Optional[Tuple[Any, ...]]:
+        """
+        Return a copy of the arguments of the write method which can be written at a later time.
+
+        This method is used by the input-output handler in its asynchronous output mode, where the write method is
+        called in a background thread while the run continues. The returned arguments must therefore not be affected by
+        later changes of the global state. If None is returned, the arguments can only be written immediately and the
+        input-output handler waits for the background thread before calling the write method. This is the default
+        behaviour, overwrite this method if the arguments can be copied.
+
+        Parameters
+        ----------
+        args : Any
+            The arguments of the write method.
+
+        Returns
+        -------
+        Tuple[Any, ...] or None
+            The copied arguments or None.
+        """
+        return None
+
+    def flush(self) -> None:
+        """
+        Flush the buffered output of this output handler into its files.
+
+        This method is called before the run is dumped in a forked process. Otherwise, data in the buffers of open
+        files would be written by both processes. This method does nothing by default, overwrite it if this output
+        handler writes into open files.
+        """
+        pass
+
     @abstractmethod
     def post_run(self) -> None:
         """
@@ -122,7 +158,272 @@ class HardBufferedTextWriter(object):
         """
         self._tmp_file.write(string)
 
+    def write_row(self, values: Sequence[float]) -> None:
+        """
+        Write a single sample consisting of several values as a tab-separated line into the temporary file.
+
+        Parameters
+        ----------
+        values : Sequence[float]
+            The values of the sample.
+        """
+        print("\t".join(map(str, values)), file=self)
+
+    def flush(self) -> None:
+        """Flush the temporary file."""
+        self._tmp_file.flush()
+
     def close(self) -> None:
         """Close the temporary file and rename it into the original filename."""
         self._tmp_file.close()
         os.system('mv ' + self._filename + '.tmp ' + self._filename)
+
+
+binary_columnar_magic_line = b"# JeLLyFysh binary columnar samples\n"
+"""The first line of every file written by the BinaryColumnarWriter."""
+
+
+class BinaryColumnarWriter(object):
+    """
+    A writer which stores samples of a fixed number of float values in a binary columnar file.
+
+    This writer offers the same write_row and close methods as the HardBufferedTextWriter and can replace it in output
+    handlers which write a fixed number of floats per sample. It writes to a temporary file (filename + '.tmp'). When
+    close is called, the temporary file is renamed to the original filename.
+    The file starts with two text lines. The first line is given by the binary_columnar_magic_line. The second line
+    starts with '# ' and contains a JSON object with the run identification hash, the column names and the dtype of
+    the values. It is padded with spaces so that the header length is a multiple of 64 bytes. The header is followed
+    by the samples, stored row by row as 8-byte floats in the native byte order of the machine (which is specified by
+    the dtype in the header). The number of samples follows from the file size, so that the file can be memory-mapped,
+    for example with numpy.memmap.
+    The samples are buffered in a typed array and are written to the temporary file in blocks.
+    """
+
+    _header_alignment = 64
+
+    def __init__(self, filename: str, column_names: Sequence[str], block_size: int = 4096) -> None:
+        """
+        The constructor of the BinaryColumnarWriter class.
+
+        This method opens the temporary file and writes the header into it.
+
+        Parameters
+        ----------
+        filename : str
+            The filename.
+        column_names : Sequence[str]
+            The names of the values of a single sample.
+        block_size : int, optional
+            The number of samples which are buffered before they are written to the temporary file.
+
+        Raises
+        ------
+        AssertionError
+            If no column names are given or the block size is not positive.
+        """
+        assert len(column_names) > 0
+        assert block_size > 0
+        self._filename = filename
+        self._number_of_columns = len(column_names)
+        self._buffer = array.array("d")
+        self._buffer_length = block_size * self._number_of_columns
+        self._tmp_file = open(filename + ".tmp", "wb")
+        metadata = {"run_identification_hash": str(get_uuid()), "columns": list(column_names),
+                    "dtype": ("<f8" if sys.byteorder == "little" else ">f8")}
+        metadata_line = "# {0}".format(json.dumps(metadata)).encode("ascii")
+        header_length = len(binary_columnar_magic_line) + len(metadata_line) + 1
+        padding = -header_length % self._header_alignment
+        self._tmp_file.write(binary_columnar_magic_line + metadata_line + b" " * padding + b"\n")
+
+    def write_row(self, values: Sequence[float]) -> None:
+        """
+        Buffer a single sample and write the buffer to the temporary file if it is full.
+
+        Parameters
+        ----------
+        values : Sequence[float]
+            The values of the sample.
+
+        Raises
+        ------
+        AssertionError
+            If the number of values does not agree with the number of columns.
+        """
+        assert len(values) == self._number_of_columns
+        self._buffer.extend(values)
+        if len(self._buffer) >= self._buffer_length:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered samples to the temporary file and empty the buffer."""
+        self._buffer.tofile(self._tmp_file)
+        del self._buffer[:]
+
+    def flush(self) -> None:
+        """Write the buffered samples to the temporary file and flush it."""
+        self._flush()
+        self._tmp_file.flush()
+
+    def close(self) -> None:
+        """Write the remaining samples, close the temporary file and rename it into the original filename."""
+        self._flush()
+        self._tmp_file.close()
+        os.replace(self._filename + ".tmp", self._filename)
+
+
+class SampleAccumulator(object):
+    """
+    A writer which accumulates histograms and moments of samples of a fixed number of float values in memory.
+
+    This writer offers the same write_row and close methods as the HardBufferedTextWriter and can replace it in output
+    handlers which write a fixed number of floats per sample. Instead of storing every sample, it updates a histogram,
+    the running mean and the running variance of each value with every sample. The histograms use bins of a fixed width
+    starting from zero, and only occupied bins are stored. The mean and the variance are updated with Welford's
+    algorithm. Optionally, a blocking analysis of each value is updated as well, which estimates the standard error of
+    the mean for correlated samples (see Flyvbjerg and Petersen, J. Chem. Phys. 91, 461 (1989)).
+    Since everything is kept in memory, the accumulated state is part of the dumps of a run. When close is called, the
+    result is written with a HardBufferedTextWriter. The file contains the moments and the blocking analysis as
+    comments, and one line for each occupied histogram bin consisting of the column name, the lower bin edge and the
+    number of samples in the bin.
+    """
+
+    def __init__(self, filename: str, column_names: Sequence[str], histogram_bin_width: float,
+                 blocking_analysis: bool = False) -> None:
+        """
+        The constructor of the SampleAccumulator class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename.
+        column_names : Sequence[str]
+            The names of the values of a single sample.
+        histogram_bin_width : float
+            The width of the histogram bins.
+        blocking_analysis : bool, optional
+            Whether a blocking analysis of each value is updated.
+
+        Raises
+        ------
+        AssertionError
+            If no column names are given or the histogram bin width is not positive.
+        """
+        assert len(column_names) > 0
+        assert histogram_bin_width > 0.0
+        self._filename = filename
+        self._column_names = list(column_names)
+        self._histogram_bin_width = histogram_bin_width
+        self._number_of_samples = 0
+        self._histograms = [{} for _ in self._column_names]
+        self._means = [0.0 for _ in self._column_names]
+        self._squared_deviation_sums = [0.0 for _ in self._column_names]
+        self._blocking_analyses = ([_BlockingAnalysis() for _ in self._column_names] if blocking_analysis
+                                   else None)
+
+    def write_row(self, values: Sequence[float]) -> None:
+        """
+        Update the histograms, moments and blocking analyses with a single sample.
+
+        Parameters
+        ----------
+        values : Sequence[float]
+            The values of the sample.
+
+        Raises
+        ------
+        AssertionError
+            If the number of values does not agree with the number of columns.
+        """
+        assert len(values) == len(self._column_names)
+        self._number_of_samples += 1
+        for index, value in enumerate(values):
+            histogram = self._histograms[index]
+            bin_index = math.floor(value / self._histogram_bin_width)
+            histogram[bin_index] = histogram.get(bin_index, 0) + 1
+            deviation = value - self._means[index]
+            self._means[index] += deviation / self._number_of_samples
+            self._squared_deviation_sums[index] += deviation * (value - self._means[index])
+            if self._blocking_analyses is not None:
+                self._blocking_analyses[index].add(value)
+
+    def flush(self) -> None:
+        """Do nothing since the file is only written when close is called."""
+        pass
+
+    def close(self) -> None:
+        """Write the accumulated histograms, moments and blocking analyses into the file."""
+        file = HardBufferedTextWriter(self._filename)
+        print("# Accumulated histograms and moments", file=file)
+        print("# Number of samples: {0}".format(self._number_of_samples), file=file)
+        print("# Histogram bin width: {0}".format(self._histogram_bin_width), file=file)
+        for index, column_name in enumerate(self._column_names):
+            print("# Column: {0}".format(column_name), file=file)
+            print("# Mean: {0}".format(self._means[index] if self._number_of_samples > 0 else float("nan")),
+                  file=file)
+            print("# Variance: {0}".format(self._squared_deviation_sums[index] / (self._number_of_samples - 1)
+                                           if self._number_of_samples > 1 else float("nan")), file=file)
+            if self._blocking_analyses is not None:
+                print("# Blocking analysis (block size, number of blocks, standard error of the mean):", file=file)
+                for block_size, number_of_blocks, standard_error in self._blocking_analyses[index].standard_errors():
+                    print("# {0}\t{1}\t{2}".format(block_size, number_of_blocks, standard_error), file=file)
+        for index, column_name in enumerate(self._column_names):
+            for bin_index, count in sorted(self._histograms[index].items()):
+                print("{0}\t{1}\t{2}".format(column_name, bin_index * self._histogram_bin_width, count), file=file)
+        file.close()
+
+
+class _BlockingAnalysis(object):
+    """
+    Online blocking analysis of a sequence of correlated values.
+
+    On level k of the blocking analysis, the values are averaged in blocks of size 2^k. For each level, the number of
+    blocks and the running mean and variance of the block averages are stored together with the first value of an
+    incomplete pair of blocks. The memory therefore only grows logarithmically with the number of values.
+    """
+
+    def __init__(self) -> None:
+        """The constructor of the _BlockingAnalysis class."""
+        self._numbers_of_blocks = []
+        self._means = []
+        self._squared_deviation_sums = []
+        self._unpaired_values = []
+
+    def add(self, value: float) -> None:
+        """
+        Add a value to the blocking analysis.
+
+        Parameters
+        ----------
+        value : float
+            The value.
+        """
+        level = 0
+        while True:
+            if level == len(self._numbers_of_blocks):
+                self._numbers_of_blocks.append(0)
+                self._means.append(0.0)
+                self._squared_deviation_sums.append(0.0)
+                self._unpaired_values.append(None)
+            self._numbers_of_blocks[level] += 1
+            deviation = value - self._means[level]
+            self._means[level] += deviation / self._numbers_of_blocks[level]
+            self._squared_deviation_sums[level] += deviation * (value - self._means[level])
+            if self._unpaired_values[level] is None:
+                self._unpaired_values[level] = value
+                return
+            value = (self._unpaired_values[level] + value) / 2.0
+            self._unpaired_values[level] = None
+            level += 1
+
+    def standard_errors(self) -> List[Tuple[int, int, float]]:
+        """
+        Return the estimates of the standard error of the mean on all levels with at least two blocks.
+
+        Returns
+        -------
+        List[Tuple[int, int, float]]
+            The block size, the number of blocks and the estimate of the standard error of the mean of each level.
+        """
+        return [(2 ** level, number_of_blocks,
+                 math.sqrt(self._squared_deviation_sums[level] / (number_of_blocks - 1) / number_of_blocks))
+                for level, number_of_blocks in enumerate(self._numbers_of_blocks) if number_of_blocks > 1]
@@ -27,10 +27,10 @@ from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node
 from jellyfysh.base import vectors
 import jellyfysh.setting as setting
-from .output_handler import OutputHandler, HardBufferedTextWriter
+from .sample_output_handler import SampleOutputHandler
 
 
-class OxygenOxygenSeparationOutputHandler(OutputHandler):
+class OxygenOxygenSeparationOutputHandler(SampleOutputHandler):
     """
     Output handler which samples the shortest separations of the oxygens of water molecules.
 
@@ -41,25 +41,41 @@ class OxygenOxygenSeparationOutputHandler(OutputHandler):
     should correspond to the oxygen.
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, binary: bool = False, histogram_bin_width: float = None,
+                 blocking_analysis: bool = False) -> None:
         """
         The constructor of the OxygenOxygenSeparationOutputHandler class.
 
-        This class uses a HardBufferedTextWriter to first write the separations to a temporary file.
+        This class uses a HardBufferedTextWriter to first write the separations to a temporary file. If binary is True,
+        a BinaryColumnarWriter is used instead. If the histogram bin width is specified, a SampleAccumulator is used.
 
         Parameters
         ----------
         filename : str
             The filename of the file this output handler is connected to.
+        binary : bool, optional
+            Whether the separations are written into a binary columnar file instead of a text file.
+        histogram_bin_width : float or None, optional
+            If not None, the histograms and moments of the separations are accumulated with this histogram bin width
+            instead of writing the separations.
+        blocking_analysis : bool, optional
+            Whether the accumulated moments include a blocking analysis of the standard error of the mean.
 
         Raises
         ------
         base.exceptions.ConfigurationError
             If the number of node levels is not two or the number of nodes per root node is not three.
+        base.exceptions.ConfigurationError
+            If both binary is True and the histogram bin width is specified.
+        base.exceptions.ConfigurationError
+            If the histogram bin width is not positive.
+        base.exceptions.ConfigurationError
+            If blocking_analysis is True but the histogram bin width is not specified.
         """
-        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename)
-        super().__init__(filename)
-        self._file = HardBufferedTextWriter(filename)
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           binary=binary, histogram_bin_width=histogram_bin_width, blocking_analysis=blocking_analysis)
+        super().__init__(filename, binary, histogram_bin_width, blocking_analysis)
+        self._file = self._create_writer(filename, ["oxygen_oxygen_separation"])
         if setting.number_of_node_levels != 2 or setting.number_of_nodes_per_root_node != 3:
             raise ConfigurationError("The output handler {0} can only be used if each root node has 3 child nodes."
                                      .format(self.__class__.__name__))
@@ -85,7 +101,7 @@ class OxygenOxygenSeparationOutputHandler(OutputHandler):
             for second_index in range(first_index + 1, len(oxygen_positions)):
                 oxygen_separation = setting.periodic_boundaries.separation_vector(first_oxygen_position,
                                                                                   oxygen_positions[second_index])
-                print(vectors.norm(oxygen_separation), file=self._file)
+                self._file.write_row([vectors.norm(oxygen_separation)])
 
     def post_run(self) -> None:
         """Clean up the output handler."""
@@ -26,10 +26,11 @@ from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node, yield_closest_leaf_unit_positions
 import jellyfysh.setting as setting
-from .output_handler import OutputHandler, HardBufferedTextWriter
+from .output_handler import HardBufferedTextWriter
+from .sample_output_handler import SampleOutputHandler
 
 
-class PolarizationOutputHandler(OutputHandler):
+class PolarizationOutputHandler(SampleOutputHandler):
     """
     Output handler which samples the polarization of charge neutral composite point objects.
 
@@ -46,11 +47,14 @@ class PolarizationOutputHandler(OutputHandler):
     masses are the one which are the closest to the position of the root cnode.
     """
 
-    def __init__(self, filename: str, charge: str) -> None:
+    def __init__(self, filename: str, charge: str, binary: bool = False, histogram_bin_width: float = None,
+                 blocking_analysis: bool = False) -> None:
         """
         The constructor of the PolarizationOutputHandler class.
 
-        This class uses a HardBufferedTextWriter to first write the polarization to a temporary file.
+        This class uses a HardBufferedTextWriter to first write the polarization to a temporary file. If binary is True,
+        a BinaryColumnarWriter with one column per component of the polarization is used instead. If the histogram bin
+        width is specified, a SampleAccumulator is used.
 
         Parameters
         ----------
@@ -58,20 +62,36 @@ class PolarizationOutputHandler(OutputHandler):
             The filename of the file this output handler is connected to.
         charge : str
             The charge used to calculate the polarization.
+        binary : bool, optional
+            Whether the polarization is written into a binary columnar file instead of a text file.
+        histogram_bin_width : float or None, optional
+            If not None, the histograms and moments of the polarization components are accumulated with this histogram
+            bin width instead of writing the polarization components.
+        blocking_analysis : bool, optional
+            Whether the accumulated moments include a blocking analysis of the standard error of the mean.
 
         Raises
         ------
         base.exceptions.ConfigurationError
             If the number of node levels is not two or the number of nodes per root node is not three.
+        base.exceptions.ConfigurationError
+            If both binary is True and the histogram bin width is specified.
+        base.exceptions.ConfigurationError
+            If the histogram bin width is not positive.
+        base.exceptions.ConfigurationError
+            If blocking_analysis is True but the histogram bin width is not specified.
         """
-        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename, charge=charge)
-        super().__init__(filename)
-        self._file = HardBufferedTextWriter(filename)
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename, charge=charge,
+                           binary=binary, histogram_bin_width=histogram_bin_width, blocking_analysis=blocking_analysis)
+        super().__init__(filename, binary, histogram_bin_width, blocking_analysis)
+        self._file = self._create_writer(
+            filename, ["polarization_{0}".format(index) for index in range(setting.dimension)])
+        if isinstance(self._file, HardBufferedTextWriter):
+            print("# Polarization Vector", file=self._file)
         self._charge = charge
         if setting.number_of_node_levels != 2 or setting.number_of_nodes_per_root_node == 1:
             raise ConfigurationError("The output handler {0} can only be used with charge neutral composite point"
                                      " objects.".format(self.__class__.__name__))
-        print("# Polarization Vector", file=self._file)
 
     def write(self, extracted_global_state: Sequence[Node]) -> None:
         """
@@ -94,7 +114,7 @@ class PolarizationOutputHandler(OutputHandler):
             for leaf_unit, position in yield_closest_leaf_unit_positions(root_cnode):
                 for index, entry in enumerate(position):
                     polarization[index] += leaf_unit.charge[self._charge] * entry
-        print("\t".join(map(str, polarization)), file=self._file)
+        self._file.write_row(polarization)
 
     def post_run(self) -> None:
         """Clean up the output handler."""
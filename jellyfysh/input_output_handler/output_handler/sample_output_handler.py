@@ -0,0 +1,136 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the abstract SampleOutputHandler class."""
+from abc import ABCMeta
+import logging
+from typing import Sequence, Tuple, Union
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node, copy_cnode_tree
+from .output_handler import OutputHandler, BinaryColumnarWriter, HardBufferedTextWriter, SampleAccumulator
+
+
+class SampleOutputHandler(OutputHandler, metaclass=ABCMeta):
+    """
+    Abstract output handler class which writes samples consisting of a fixed number of floats.
+
+    On initialization, an inheriting output handler creates one writer per file with the _create_writer method and
+    passes every sample to the write_row method of the corresponding writer. By default, the samples are written into
+    text files with a HardBufferedTextWriter. Alternatively, they can be written into binary columnar files with a
+    BinaryColumnarWriter. If only the histograms and moments of the samples are required, a SampleAccumulator can be
+    used instead which does not store the samples themselves. This is activated by specifying the histogram bin width.
+    """
+
+    def __init__(self, filename: str, binary: bool = False, histogram_bin_width: float = None,
+                 blocking_analysis: bool = False) -> None:
+        """
+        The constructor of the SampleOutputHandler class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the file this output handler is connected to.
+        binary : bool, optional
+            Whether the samples are written into binary columnar files instead of text files.
+        histogram_bin_width : float or None, optional
+            If not None, the histograms and moments of the samples are accumulated with this histogram bin width
+            instead of writing the samples.
+        blocking_analysis : bool, optional
+            Whether the accumulated moments include a blocking analysis of the standard error of the mean.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If both binary is True and the histogram bin width is specified.
+        base.exceptions.ConfigurationError
+            If the histogram bin width is not positive.
+        base.exceptions.ConfigurationError
+            If blocking_analysis is True but the histogram bin width is not specified.
+        """
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           binary=binary, histogram_bin_width=histogram_bin_width,
+                           blocking_analysis=blocking_analysis)
+        super().__init__(filename)
+        if histogram_bin_width is not None:
+            if binary:
+                raise ConfigurationError("The output handler {0} cannot write binary files and accumulate histograms "
+                                         "at the same time.".format(self.__class__.__name__))
+            if histogram_bin_width <= 0.0:
+                raise ConfigurationError("The histogram bin width of the output handler {0} should be positive."
+                                         .format(self.__class__.__name__))
+        elif blocking_analysis:
+            raise ConfigurationError("The output handler {0} can only perform a blocking analysis if the histogram bin "
+                                     "width is specified.".format(self.__class__.__name__))
+        self._binary = binary
+        self._histogram_bin_width = histogram_bin_width
+        self._blocking_analysis = blocking_analysis
+        self._writers = []
+
+    def snapshot(self, extracted_global_state: Sequence[Node]) -> Tuple[Sequence[Node]]:
+        """
+        Return a copy of the extracted global state which can be written at a later time.
+
+        Parameters
+        ----------
+        extracted_global_state : Sequence[base.node.Node]
+            The extracted global state.
+
+        Returns
+        -------
+        (Sequence[base.node.Node],)
+            The copied extracted global state.
+        """
+        return [copy_cnode_tree(root_cnode) for root_cnode in extracted_global_state],
+
+    def _create_writer(self, filename: str, column_names: Sequence[str]) -> Union[HardBufferedTextWriter,
+                                                                                 BinaryColumnarWriter,
+                                                                                 SampleAccumulator]:
+        """
+        Create the writer for the samples in the given file.
+
+        The writer is stored so that it can be flushed in the flush method.
+
+        Parameters
+        ----------
+        filename : str
+            The filename.
+        column_names : Sequence[str]
+            The names of the values of a single sample.
+
+        Returns
+        -------
+        HardBufferedTextWriter or BinaryColumnarWriter or SampleAccumulator
+            The writer.
+        """
+        if self._histogram_bin_width is not None:
+            writer = SampleAccumulator(filename, column_names, self._histogram_bin_width, self._blocking_analysis)
+        elif self._binary:
+            writer = BinaryColumnarWriter(filename, column_names)
+        else:
+            writer = HardBufferedTextWriter(filename)
+        self._writers.append(writer)
+        return writer
+
+    def flush(self) -> None:
+        """Flush the buffered samples of all writers into their files."""
+        for writer in self._writers:
+            writer.flush()
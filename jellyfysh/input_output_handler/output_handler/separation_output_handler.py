@@ -26,10 +26,10 @@ from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.node import Node, yield_leaf_nodes
 from jellyfysh.base import vectors
 import jellyfysh.setting as setting
-from .output_handler import OutputHandler, HardBufferedTextWriter
+from .sample_output_handler import SampleOutputHandler
 
 
-class SeparationOutputHandler(OutputHandler):
+class SeparationOutputHandler(SampleOutputHandler):
     """
     Output handler which samples the shortest separations between leaf units in different composite objects.
 
@@ -42,35 +42,51 @@ class SeparationOutputHandler(OutputHandler):
     of leaf units between two composite objects and includes the pair in the filename.
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, binary: bool = False, histogram_bin_width: float = None,
+                 blocking_analysis: bool = False) -> None:
         """
         The constructor of the SeparationOutputHandler class.
 
-        This class uses a HardBufferedTextWriter to first write the separations to temporary files.
+        This class uses a HardBufferedTextWriter to first write the separations to temporary files. If binary is True,
+        a BinaryColumnarWriter is used instead. If the histogram bin width is specified, a SampleAccumulator is used.
 
         Parameters
         ----------
         filename : str
             The filename of the file this output handler is connected to.
+        binary : bool, optional
+            Whether the separations are written into binary columnar files instead of text files.
+        histogram_bin_width : float or None, optional
+            If not None, the histograms and moments of the separations are accumulated with this histogram bin width
+            instead of writing the separations.
+        blocking_analysis : bool, optional
+            Whether the accumulated moments include a blocking analysis of the standard error of the mean.
 
         Raises
         ------
         AssertionError
             If the filename does not contain a file format.
+        base.exceptions.ConfigurationError
+            If both binary is True and the histogram bin width is specified.
+        base.exceptions.ConfigurationError
+            If the histogram bin width is not positive.
+        base.exceptions.ConfigurationError
+            If blocking_analysis is True but the histogram bin width is not specified.
         """
-        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename)
-        super().__init__(filename)
+        log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__, filename=filename,
+                           binary=binary, histogram_bin_width=histogram_bin_width, blocking_analysis=blocking_analysis)
+        super().__init__(filename, binary, histogram_bin_width, blocking_analysis)
         self._files = []
         split_filename = filename.split(".")
         assert len(split_filename) == 2
         for number in range(setting.number_of_nodes_per_root_node):
             if setting.number_of_nodes_per_root_node > 1:
-                self._files.append(HardBufferedTextWriter("{0}_1{1}.{2}"
-                                                          .format(split_filename[0],
-                                                                  number + setting.number_of_nodes_per_root_node + 1,
-                                                                  split_filename[1])))
+                separation_filename = "{0}_1{1}.{2}".format(split_filename[0],
+                                                            number + setting.number_of_nodes_per_root_node + 1,
+                                                            split_filename[1])
             else:
-                self._files.append(HardBufferedTextWriter(filename))
+                separation_filename = filename
+            self._files.append(self._create_writer(separation_filename, ["separation"]))
 
     def write(self, extracted_global_state: Sequence[Node]) -> None:
         """
@@ -94,7 +110,7 @@ class SeparationOutputHandler(OutputHandler):
                                                if setting.number_of_node_levels > 1 else 0)
                         separation = setting.periodic_boundaries.separation_vector(first_leaf_node.value.position,
                                                                                    second_leaf_node.value.position)
-                        print(vectors.norm(separation), file=self._files[identifier_distance])
+                        self._files[identifier_distance].write_row([vectors.norm(separation)])
 
     def post_run(self):
         """Clean up the output handler."""
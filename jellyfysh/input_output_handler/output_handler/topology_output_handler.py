@@ -0,0 +1,174 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""Module for the abstract TopologyOutputHandler class."""
+from abc import ABCMeta
+import logging
+from typing import List, Sequence, Tuple
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.logging import log_init_arguments
+from jellyfysh.base.node import Node, copy_cnode_tree
+from jellyfysh.base.uuid import get_uuid
+from jellyfysh.input_output_handler.pdb_format import write_pdb_file
+from jellyfysh.setting import hypercuboid_setting as setting
+from .output_handler import OutputHandler
+
+
+class TopologyOutputHandler(OutputHandler, metaclass=ABCMeta):
+    """
+    Abstract output handler class that writes the point masses of the extracted global state together with their
+    topology, i.e., their names and bonds, into molecular file formats.
+
+    This output handler is designed to work together with the TreeStateHandler. Here, the extracted global state is
+    given by a sequence of trees. Each tree is specified by a root node, which themselves are connected to children
+    nodes. Each node contains a Unit object. This output handler allows for a variable number of root nodes, each with
+    the same number of children. For each leaf node, the names of the corresponding point masses can be given on
+    initialization of this class. The same is true for the bonds of leaf nodes of a single root node.
+    The molecular file formats always store three-dimensional positions. Positions in not used dimensions are set to
+    0.0.
+    """
+
+    def __init__(self, filename: str, names_within_composite_object: Sequence[str] = (),
+                 bonds_within_composite_object: Sequence[int] = ()) -> None:
+        """
+        The constructor of the TopologyOutputHandler class.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the file this output handler is connected to.
+        names_within_composite_object : Sequence[str], optional
+            The sequence of names of the point masses within a composite object.
+        bonds_within_composite_object : Sequence[int], optional
+            The sequence of bonds of the point masses within the composite object. In the sequence, the bonds should be
+            given in pairs of two. The point masses are numbered as they appear in the children sequence of the root
+            node.
+
+        Raises
+        ------
+        base.exceptions.ConfigurationError
+            If the hypercuboid setting is not initialized.
+        base.exceptions.ConfigurationError
+            If the setting package specifies a dimension larger than 3.
+        base.exceptions.ConfigurationError
+            If the bonds_within_composite_object sequence is not divisible by two.
+        base.exceptions.ConfigurationError
+            If the names_within_composite_object sequence does not specify a name for each point mass (if it is not
+            empty).
+        """
+        logger = logging.getLogger(__name__)
+        log_init_arguments(logger.debug, self.__class__.__name__, filename=filename,
+                           names_within_composite_object=names_within_composite_object,
+                           bonds_within_composite_object=bonds_within_composite_object)
+        if not setting.initialized():
+            raise ConfigurationError("The class {0} can only be used in a hypercuboid setting."
+                                     .format(self.__class__.__name__))
+        if setting.dimension < 3:
+            logger.warning("The class {0} only allows for 3 dimensions but the simulation is done in {1} dimensions. "
+                           "This class will set positions in not used dimensions to 0.0."
+                           .format(self.__class__.__name__, setting.dimension))
+        if setting.dimension > 3:
+            raise ConfigurationError("The class {0} does not allow for dimensions > 3.".format(self.__class__.__name__))
+        super().__init__(filename)
+        self._number_of_atoms = setting.number_of_root_nodes * setting.number_of_nodes_per_root_node
+        # dimensions = [x, y, z, alpha, beta, gamma]
+        self._dimensions = ([setting.system_lengths[index] for index in range(setting.dimension)]
+                            + [0.0 for _ in range(3 - setting.dimension)] + [90.0 for _ in range(3)])
+
+        if setting.number_of_node_levels == 1:
+            self._atom_index = lambda identifier: identifier[0]
+        else:
+            self._atom_index = lambda identifier: identifier[0] * setting.number_of_nodes_per_root_node + identifier[1]
+
+        if bonds_within_composite_object:
+            if len(bonds_within_composite_object) % 2 != 0:
+                raise ConfigurationError("The list of bonds should be divisible by two!")
+        self._bonds_within_composite_object = bonds_within_composite_object
+
+        if names_within_composite_object:
+            if len(names_within_composite_object) != setting.number_of_nodes_per_root_node:
+                raise ConfigurationError("Please give a name for each point mass within a composite point object!")
+        self._names_within_composite_object = names_within_composite_object
+
+    def _bonds(self, number_of_root_nodes: int, number_of_nodes_per_root_node: int) -> List[Tuple[int, int]]:
+        """
+        Return the bonds between all point masses as pairs of atom indices.
+
+        Parameters
+        ----------
+        number_of_root_nodes : int
+            The number of root nodes.
+        number_of_nodes_per_root_node : int
+            The number of nodes per root node.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The bonds.
+        """
+        bonds = sum(([index + composite_index * number_of_nodes_per_root_node
+                      for index in self._bonds_within_composite_object]
+                     for composite_index in range(number_of_root_nodes)), [])
+        bonds_iterator = iter(bonds)
+        return [index_tuple for index_tuple in zip(bonds_iterator, bonds_iterator)]
+
+    def _write_pdb_file(self, filename: str, positions: Sequence[Sequence[float]]) -> None:
+        """
+        Write the given positions of all point masses together with their topology into a .pdb file.
+
+        Each composite point object becomes a residue whose name is given by the joined names of its point masses.
+        Without names, the point masses are named 'X' and the residues 'UNK'.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the .pdb file.
+        positions : Sequence[Sequence[float]]
+            The three-dimensional positions of the point masses ordered by their atom index.
+        """
+        number_of_nodes_per_root_node = setting.number_of_nodes_per_root_node
+        if self._names_within_composite_object:
+            names = [self._names_within_composite_object[index % number_of_nodes_per_root_node]
+                     for index in range(self._number_of_atoms)]
+            residue_names = ["".join(self._names_within_composite_object)] * self._number_of_atoms
+        else:
+            names = ["X"] * self._number_of_atoms
+            residue_names = ["UNK"] * self._number_of_atoms
+        write_pdb_file(filename, positions, self._dimensions, names, residue_names,
+                       [index // number_of_nodes_per_root_node + 1 for index in range(self._number_of_atoms)],
+                       bonds=self._bonds(setting.number_of_root_nodes, number_of_nodes_per_root_node),
+                       title="RUN IDENTIFICATION HASH: {0}".format(get_uuid()))
+
+    def snapshot(self, extracted_global_state: Sequence[Node]) -> Tuple[Sequence[Node]]:
+        """
+        Return a copy of the extracted global state which can be written at a later time.
+
+        Parameters
+        ----------
+        extracted_global_state : Sequence[base.node.Node]
+            The extracted global state.
+
+        Returns
+        -------
+        (Sequence[base.node.Node],)
+            The copied extracted global state.
+        """
+        return [copy_cnode_tree(root_cnode) for root_cnode in extracted_global_state],
@@ -0,0 +1,130 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""
+Module for reading and writing files in the fixed-column .pdb format without MDAnalysis.
+
+Only the records used by JeLLyFysh are supported, namely TITLE, CRYST1, ATOM, HETATM, CONECT, and END.
+"""
+from typing import List, Sequence, Tuple
+
+
+def read_pdb_file(filename: str) -> Tuple[List[float], List[List[List[float]]]]:
+    """
+    Read the system box and the atom positions of the first frame in a .pdb file.
+
+    The atoms in the ATOM and HETATM records are grouped into residues. A new residue starts whenever the chain
+    identifier, the residue id or the insertion code changes between subsequent atoms. Therefore, wrapped-around
+    residue ids in large systems are handled correctly.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    (List[float], List[List[List[float]]])
+        The system box given as [x, y, z, alpha, beta, gamma], and the three-dimensional positions of the atoms grouped
+        by residues.
+
+    Raises
+    ------
+    ValueError
+        If the .pdb file does not contain a CRYST1 record.
+    """
+    dimensions = None
+    residues = []
+    residue_key = None
+    with open(filename, "r") as file:
+        for line in file:
+            record = line[:6]
+            if record == "ATOM  " or record == "HETATM":
+                if line[21:27] != residue_key:
+                    residue_key = line[21:27]
+                    residue = []
+                    residues.append(residue)
+                residue.append([float(line[30:38]), float(line[38:46]), float(line[46:54])])
+            elif record == "CRYST1":
+                dimensions = [float(line[6:15]), float(line[15:24]), float(line[24:33]),
+                              float(line[33:40]), float(line[40:47]), float(line[47:54])]
+            elif record.rstrip() in ("END", "ENDMDL"):
+                break
+    if dimensions is None:
+        raise ValueError("The .pdb file {0} does not contain a CRYST1 record with the system box.".format(filename))
+    return dimensions, residues
+
+
+def write_pdb_file(filename: str, positions: Sequence[Sequence[float]], dimensions: Sequence[float],
+                   names: Sequence[str], residue_names: Sequence[str], residue_ids: Sequence[int],
+                   bonds: Sequence[Tuple[int, int]] = (), title: str = "") -> None:
+    """
+    Write a single frame into a .pdb file.
+
+    The atoms are numbered in the order of the given sequences starting from one. All atoms belong to the chain 'X'.
+    Since the fixed-column format limits the atom serial numbers to five and the residue ids to four digits, both are
+    wrapped around if the system is too large.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+    positions : Sequence[Sequence[float]]
+        The three-dimensional positions of the atoms.
+    dimensions : Sequence[float]
+        The system box given as [x, y, z, alpha, beta, gamma].
+    names : Sequence[str]
+        The names of the atoms.
+    residue_names : Sequence[str]
+        The residue names of the atoms.
+    residue_ids : Sequence[int]
+        The residue ids of the atoms.
+    bonds : Sequence[Tuple[int, int]], optional
+        The bonds between the atoms given as pairs of atom indices (starting from zero).
+    title : str, optional
+        The title of the file.
+
+    Raises
+    ------
+    AssertionError
+        If the sequences of positions, names, residue names and residue ids are not of equal length.
+    """
+    assert len(positions) == len(names) == len(residue_names) == len(residue_ids)
+    lines = ["TITLE     {0}".format(title),
+             "CRYST1{0:9.3f}{1:9.3f}{2:9.3f}{3:7.2f}{4:7.2f}{5:7.2f} P 1           1".format(*dimensions)]
+    for index, (position, name, residue_name, residue_id) in enumerate(zip(positions, names, residue_names,
+                                                                            residue_ids)):
+        lines.append("ATOM  {0:5d} {1:<4s} {2:<3s} X{3:4d}    {4:8.3f}{5:8.3f}{6:8.3f}  1.00  0.00              "
+                     .format((index + 1) % 100000, (" " + name if len(name) < 4 else name)[:4], residue_name[:3],
+                             residue_id % 10000, *position))
+    bonded_atoms = [[] for _ in positions]
+    for first_index, second_index in bonds:
+        bonded_atoms[first_index].append(second_index)
+        bonded_atoms[second_index].append(first_index)
+    for index, partners in enumerate(bonded_atoms):
+        partners.sort()
+        # A single CONECT record holds at most four bonded atoms
+        for start in range(0, len(partners), 4):
+            lines.append("CONECT{0:5d}".format((index + 1) % 100000)
+                         + "".join("{0:5d}".format((partner + 1) % 100000) for partner in partners[start:start + 4]))
+    lines.append("END")
+    with open(filename, "w") as file:
+        file.write("\n".join(lines) + "\n")
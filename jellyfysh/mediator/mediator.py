@@ -110,6 +110,15 @@ class MediatorAbstractClass(metaclass=ABCMeta):
         """
         self._input_output_handler.post_run()
 
+    def flush_output(self) -> None:
+        """
+        Flush the buffered output of all output handlers in the input-output handler into their files.
+
+        This method is used by output handlers which dump the run in a forked process. Otherwise, data in the buffers
+        of open files would be written by the forked process and again by the process of the run.
+        """
+        self._input_output_handler.flush_output_handlers()
+
     def deactivate_output(self) -> None:
         """
         Deactivate every output handler in the input-output handler.
@@ -118,6 +127,20 @@ class MediatorAbstractClass(metaclass=ABCMeta):
         """
         self._input_output_handler.deactivate_output()
 
+    def get_event_handlers(self) -> Sequence[EventHandler]:
+        """
+        Return the sequence of all event handlers in the activator.
+
+        This method is used by output handlers which dump the run, for example, in order to separate the shared members
+        of the event handlers from the remaining state of the run.
+
+        Returns
+        -------
+        Sequence[event_handler.EventHandler]
+            The sequence of all created event handlers.
+        """
+        return self._activator.get_event_handlers()
+
     @abstractmethod
     def update_logging(self) -> None:
         """
@@ -185,19 +208,22 @@ class Mediator(MediatorAbstractClass, metaclass=ABCMeta):
         self._event_handler_with_shortest_event_time = None
         self._out_state_arguments = {}
 
-    def _construct_methods_dictionary(self, starting_string: str) -> Dict[EventHandler, Callable[..., Any]]:
+    def _construct_methods_dictionary(self, starting_string: str) -> Dict[type, Callable[..., Any]]:
         """
-        Construct a dictionary which maps from the event handlers onto the method defined in this class which starts
-        with the given string and ends with the class name of the event handler or any base class of it.
+        Construct a dictionary which maps from the classes of the event handlers onto the method defined in this class
+        which starts with the given string and ends with the class name of the event handler or any base class of it.
+
+        The dictionary uses the classes as keys so that it stays valid for event handlers that are created by the
+        activator during the run.
         """
         functions_dictionary = {}
-        for event_handler in self._event_handlers_list:
+        for event_handler_class in {event_handler.__class__ for event_handler in self._event_handlers_list}:
             # We don't have to worry about an alias set by the factory, since the original class is a subclass
-            method = getattr(self, starting_string + strings.to_snake_case(event_handler.__class__.__name__), False)
+            method = getattr(self, starting_string + strings.to_snake_case(event_handler_class.__name__), False)
             if not method:
                 # No method found, check if the wanted method is defined for a subclass
                 possible_methods = [getattr(self, starting_string + strings.to_snake_case(subclass_name), False)
-                                    for subclass_name in _get_bases_names(event_handler.__class__)]
+                                    for subclass_name in _get_bases_names(event_handler_class)]
                 possible_methods = [method for method in possible_methods if method]
                 if len(possible_methods) == 0:
                     # No subclass defines a mediating method
@@ -205,9 +231,9 @@ class Mediator(MediatorAbstractClass, metaclass=ABCMeta):
                 if len(possible_methods) > 1:
                     raise MediatorError("More than one possible method for the event handler {0} "
                                         "(read out from the list of base classes): {1}"
-                                        .format(event_handler.__class__.__name__, possible_methods))
+                                        .format(event_handler_class.__name__, possible_methods))
                 method = possible_methods[0]
-            functions_dictionary[event_handler] = method
+            functions_dictionary[event_handler_class] = method
         return functions_dictionary
 
     def get_arguments_end_of_run_event_handler(self) -> Tuple[Any]:
@@ -147,6 +147,9 @@ class MultiProcessMediator(Mediator):
     objects in the pipe.
     If enough processors are present, the event handlers may compute out-states in advance. This is only relevant for
     event handlers which do not have any arguments in their send_out_state methods.
+    Since the processes are started on initialization of this class, the activator is not allowed to create further
+    event handlers during the run (see fix_event_handlers method of the Activator class). The number of event handlers
+    of each tagger must therefore meet the maximum number of events with its tag simultaneously in the scheduler.
     After these modifications, this mediator follows the same nine general steps as the single-process mediator:
     1. Extract the active global state from the state handler.
     2. Based on this, obtain from the activator the event handlers, whose send_event_time method should be called, and
@@ -202,6 +205,7 @@ class MultiProcessMediator(Mediator):
                                      "when more than one processor is available.")
         state_handler.initialize(input_output_handler.read())
         super().__init__(input_output_handler, state_handler, scheduler, activator)
+        activator.fix_event_handlers()
         self._out_states = {}
         self._number_cores = number_cores
         self._pipes = {}
@@ -238,10 +242,9 @@ class MultiProcessMediator(Mediator):
         This method is called by run.py and resume.py. The loop should only be interrupted when a
         base.exceptions.EndOfRun exception is raised, which is caught in the scripts.
         """
+        # Extract active global state
+        active_global_state = self._state_handler.extract_active_global_state()
         while True:
-            # Extract active global state
-            active_global_state = self._state_handler.extract_active_global_state()
-
             # Fetch event handlers to activate
             event_handlers_in_state_dictionary = self._activator.get_event_handlers_to_run(
                 active_global_state, self._event_handler_with_shortest_event_time)
@@ -294,7 +297,7 @@ class MultiProcessMediator(Mediator):
                             self._send_out_state_events[next_pipe].set()
                             if self._event_handlers[next_pipe].number_send_out_state_arguments:
                                 next_pipe.send(
-                                    self._out_state_arguments_methods[self._event_handlers[next_pipe]](
+                                    self._out_state_arguments_methods[self._event_handlers[next_pipe].__class__](
                                         *self._out_state_arguments[next_pipe]))
                             self._event_handlers_state[next_pipe] = EventHandlerState.out_state_started
                         self._scheduler.push_event(event_time, self._event_handlers[pipe])
@@ -308,7 +311,7 @@ class MultiProcessMediator(Mediator):
                             self._send_out_state_events[next_pipe].set()
                             if self._event_handlers[next_pipe].number_send_out_state_arguments:
                                 next_pipe.send(
-                                    self._out_state_arguments_methods[self._event_handlers[next_pipe]](
+                                    self._out_state_arguments_methods[self._event_handlers[next_pipe].__class__](
                                         *self._out_state_arguments[next_pipe]))
                             self._event_handlers_state[next_pipe] = EventHandlerState.out_state_started
                         self._out_states[self._event_handlers[pipe]] = pipe.recv()
@@ -328,7 +331,7 @@ class MultiProcessMediator(Mediator):
                 self._event_handlers_state[pipe_with_shortest_event_time] = EventHandlerState.out_state_started
                 if self._event_handler_with_shortest_event_time.number_send_out_state_arguments:
                     pipe_with_shortest_event_time.send(
-                        self._out_state_arguments_methods[self._event_handler_with_shortest_event_time](
+                        self._out_state_arguments_methods[self._event_handler_with_shortest_event_time.__class__](
                             *self._out_state_arguments[pipe_with_shortest_event_time]))
             if self._event_handlers_state[pipe_with_shortest_event_time] == EventHandlerState.out_state_started:
                 out_state = pipe_with_shortest_event_time.recv()
@@ -341,10 +344,11 @@ class MultiProcessMediator(Mediator):
 
             # Commit out-state
             self._state_handler.insert_into_global_state(out_state)
+            active_global_state = self._state_handler.extract_active_global_state()
 
             # Trash
             for event_handler in self._activator.get_trashable_events(
-                    self._event_handler_with_shortest_event_time):
+                    self._event_handler_with_shortest_event_time, active_global_state):
                 if self._logger_enabled_for_debug:
                     self._logger.debug("Event handler trashed in the scheduler: {0}"
                                        .format(event_handler.__class__.__name__))
@@ -359,7 +363,7 @@ class MultiProcessMediator(Mediator):
                     self._event_handlers_state[pipe] = EventHandlerState.idle
 
             # Other optional operations, mainly output
-            self._mediating_methods.get(self._event_handler_with_shortest_event_time, lambda: None)()
+            self._mediating_methods.get(self._event_handler_with_shortest_event_time.__class__, lambda: None)()
 
     def post_run(self) -> None:
         """
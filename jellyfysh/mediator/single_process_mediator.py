@@ -48,7 +48,8 @@ class SingleProcessMediator(Mediator):
     method of the event handler.
     7. Commit the out-state to the global state using the state handler.
     8. Based on the event handler, which committed the event to the global state, receive the event handlers from the
-    activator, whose events are trashed in the scheduler.
+    activator, whose events are trashed in the scheduler. Event handlers that were released by the activator are also
+    released in the scheduler.
     (9. Optionally, if the event handler which committed the event to the global state defines a mediating method in the
     Mediator base class, this mediating method is run.)
     (For more details, see [Hoellmer2020] in References.bib.)
@@ -88,10 +89,9 @@ class SingleProcessMediator(Mediator):
         This method is called by run.py and resume.py. The loop should only be interrupted when a
         base.exceptions.EndOfRun exception is raised, which is caught in the scripts.
         """
+        # Extract active global state
+        active_global_state = self._state_handler.extract_active_global_state()
         while True:
-            # Extract active global state
-            active_global_state = self._state_handler.extract_active_global_state()
-
             # Fetch event handlers to activate
             event_handlers_in_state_dictionary = self._activator.get_event_handlers_to_run(
                 active_global_state, self._event_handler_with_shortest_event_time)
@@ -136,24 +136,28 @@ class SingleProcessMediator(Mediator):
             # Request out-state
             if self._event_handler_with_shortest_event_time.number_send_out_state_arguments:
                 out_state = self._event_handler_with_shortest_event_time.send_out_state(
-                    *self._out_state_arguments_methods[self._event_handler_with_shortest_event_time](
+                    *self._out_state_arguments_methods[self._event_handler_with_shortest_event_time.__class__](
                         *self._out_state_arguments[self._event_handler_with_shortest_event_time]))
             else:
                 out_state = self._event_handler_with_shortest_event_time.send_out_state()
 
             # Commit out-state
             self._state_handler.insert_into_global_state(out_state)
+            active_global_state = self._state_handler.extract_active_global_state()
 
             # Trash
             for event_handler in self._activator.get_trashable_events(
-                    self._event_handler_with_shortest_event_time):
+                    self._event_handler_with_shortest_event_time, active_global_state):
                 if self._logger_enabled_for_debug:
                     self._logger.debug("Event handler trashed in the scheduler: {0}"
                                        .format(event_handler.__class__.__name__))
                 self._scheduler.trash_event(event_handler)
+            for event_handler in self._activator.get_released_event_handlers():
+                self._out_state_arguments.pop(event_handler, None)
+                self._scheduler.release_event_handler(event_handler)
 
             # Other optional operations, mainly output
-            self._mediating_methods.get(self._event_handler_with_shortest_event_time, lambda: None)()
+            self._mediating_methods.get(self._event_handler_with_shortest_event_time.__class__, lambda: None)()
 
     def update_logging(self) -> None:
         """
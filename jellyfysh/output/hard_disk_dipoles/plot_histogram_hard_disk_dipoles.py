@@ -86,23 +86,33 @@ def plot_polarization_entries():
         split_line = line.split()
         return float(split_line[1])
 
+    def px_column_transformer(columns: numpy.ndarray) -> numpy.ndarray:
+        return columns[:, 0]
+
+    def py_column_transformer(columns: numpy.ndarray) -> numpy.ndarray:
+        return columns[:, 1]
+
     data_plots = []
     data_plots += plotting_functions.plot_histogram(
         axes, "Polarization_81Dipoles.dat", 'JellyFysh $p_x$ (without cells)', bins,
         "config_files/hard_disk_dipoles/hard_disk_dipoles.ini",
-        line_transformer=px_transformer, linestyle='-', color='C0', **line_properties)
+        line_transformer=px_transformer, column_transformer=px_column_transformer,
+        linestyle='-', color='C0', **line_properties)
     data_plots += plotting_functions.plot_histogram(
         axes, "Polarization_81Dipoles.dat", 'JellyFysh $p_y$ (without cells)', bins,
         "config_files/hard_disk_dipoles/hard_disk_dipoles.ini",
-        line_transformer=py_transformer, linestyle='dotted', color='C0', **line_properties)
+        line_transformer=py_transformer, column_transformer=py_column_transformer,
+        linestyle='dotted', color='C0', **line_properties)
     data_plots += plotting_functions.plot_histogram(
         axes, "Polarization_81Dipoles_Cells.dat", 'JellyFysh $p_x$ (with cells)', bins,
         "config_files/hard_disk_dipoles/hard_disk_dipoles_cells.ini",
-        line_transformer=px_transformer, linestyle='-', color='C0', **line_properties)
+        line_transformer=px_transformer, column_transformer=px_column_transformer,
+        linestyle='-', color='C0', **line_properties)
     data_plots += plotting_functions.plot_histogram(
         axes, "Polarization_81Dipoles_Cells.dat", 'JellyFysh $p_y$ (with cells)', bins,
         "config_files/hard_disk_dipoles/hard_disk_dipoles_cells.ini",
-        line_transformer=py_transformer, linestyle='dotted', color='C0', **line_properties)
+        line_transformer=py_transformer, column_transformer=py_column_transformer,
+        linestyle='dotted', color='C0', **line_properties)
 
     plotting_functions.add_legend(axes, reference_curves + data_plots, loc='upper left')
     plt.xlabel(r"polarization $p_x$ or $p_y$", **label_properties)
@@ -120,10 +120,15 @@ def plot_dipole_angle():
         assert len(split_line) == 2
         return numpy.arctan2(float(split_line[1]), float(split_line[0]))
 
+    def theta_column_transformer(columns: numpy.ndarray) -> numpy.ndarray:
+        assert columns.shape[1] == 2
+        return numpy.arctan2(columns[:, 1], columns[:, 0])
+
     data_plot = plotting_functions.plot_histogram(
         axes, "Polarization_SingleHardDiskDipole.dat", 'JellyFysh', bins,
         "config_files/hard_disk_dipoles/single_hard_disk_dipole.ini",
-        line_transformer=theta_line_transformer, linestyle='--', **line_properties)
+        line_transformer=theta_line_transformer, column_transformer=theta_column_transformer,
+        linestyle='--', **line_properties)
 
     plotting_functions.add_legend(axes, reference_curve + data_plot, loc='upper left')
     plt.xlabel(r"dipole angle $\theta$", **label_properties)
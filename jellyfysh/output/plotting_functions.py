@@ -20,7 +20,9 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 """Module for useful plotting functions used in this directory."""
-from typing import Any, Callable, List, Sequence
+import json
+import os
+from typing import Any, Callable, List, Sequence, Tuple
 import warnings
 import numpy
 import matplotlib.pyplot as plt
@@ -30,9 +32,68 @@ import matplotlib.lines as lines
 default = {'fontsize': 7, 'borderwidth': 0.2}
 """Default values for the plots."""
 
+binary_columnar_magic_line = b"# JeLLyFysh binary columnar samples\n"
+"""The first line of every file written by the BinaryColumnarWriter of the output handlers."""
+
+
+def is_binary_columnar_file(filename: str) -> bool:
+    """
+    Return whether the file was written by the BinaryColumnarWriter of the output handlers.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    bool
+        Whether the file starts with the binary columnar magic line.
+    """
+    with open(filename, "rb") as file:
+        return file.readline() == binary_columnar_magic_line
+
+
+def load_binary_columnar_file(filename: str) -> numpy.ndarray:
+    """
+    Memory-map the samples in the file written by the BinaryColumnarWriter of the output handlers.
+
+    The returned two-dimensional array has one row per sample and one column per value of a sample. An incomplete last
+    sample (for example, of an aborted run) is ignored.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    numpy.ndarray
+        The read-only samples.
+
+    Raises
+    ------
+    ValueError
+        If the file was not written by the BinaryColumnarWriter.
+    """
+    with open(filename, "rb") as file:
+        if file.readline() != binary_columnar_magic_line:
+            raise ValueError("The file {0} is not a binary columnar file.".format(filename))
+        metadata = json.loads(file.readline()[1:])
+        offset = file.tell()
+        file.seek(0, os.SEEK_END)
+        file_size = file.tell()
+    dtype = numpy.dtype(metadata["dtype"])
+    number_of_columns = len(metadata["columns"])
+    number_of_rows = (file_size - offset) // (dtype.itemsize * number_of_columns)
+    if number_of_rows == 0:
+        return numpy.empty((0, number_of_columns), dtype=dtype)
+    return numpy.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(number_of_rows, number_of_columns))
+
 
 def plot_histogram(axes: plt.Axes, filename: str, label: str, bins: numpy.ndarray, ini_filename: str = None,
                    line_transformer: Callable[[str], float] = lambda line: float(line),
+                   column_transformer: Callable[[numpy.ndarray], numpy.ndarray] = lambda columns: columns[:, 0],
                    **kwargs: Any) -> List[lines.Line2D]:
     """
     Plot a histogram in the axes object with the values in the given file.
@@ -40,6 +101,9 @@ def plot_histogram(axes: plt.Axes, filename: str, label: str, bins: numpy.ndarra
     The file can include single line comments which start with #. Each line is passed to the line_transformer function
     that should construct a single float, which is then used for the histogram. The default function assumes that there
     is a single float in the line.
+    If the file was written by the BinaryColumnarWriter of the output handlers, it is memory-mapped instead. The
+    two-dimensional array of the samples is passed to the column_transformer function that should construct a
+    one-dimensional array of floats. The default function uses the first column.
 
     Parameters
     ----------
@@ -55,6 +119,8 @@ def plot_histogram(axes: plt.Axes, filename: str, label: str, bins: numpy.ndarra
         The name of the .ini file which created the file.
     line_transformer : typing.Callable[[str], float], optional
         The transformer function that maps a single line onto a float.
+    column_transformer : typing.Callable[[numpy.ndarray], numpy.ndarray], optional
+        The transformer function that maps the samples of a binary columnar file onto a one-dimensional array.
     kwargs : Any
         Additional kwargs which will be passed to the axes.plot method.
 
@@ -64,12 +130,15 @@ def plot_histogram(axes: plt.Axes, filename: str, label: str, bins: numpy.ndarra
         A list of objects representing the plotted data.
     """
     try:
-        data = []
-        with open(filename) as file:
-            for line in file:
-                if line.startswith("#"):
-                    continue
-                data.append(line_transformer(line))
+        if is_binary_columnar_file(filename):
+            data = column_transformer(load_binary_columnar_file(filename))
+        else:
+            data = []
+            with open(filename) as file:
+                for line in file:
+                    if line.startswith("#"):
+                        continue
+                    data.append(line_transformer(line))
         hists, edges = numpy.histogram(data, bins=bins, density=False)
         total = sum(hists)
         x_values = (edges[1:] + edges[:-1]) / 2.0
@@ -84,6 +153,97 @@ def plot_histogram(axes: plt.Axes, filename: str, label: str, bins: numpy.ndarra
         return []
 
 
+def load_accumulated_histogram(filename: str, column_name: str = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Load a histogram from a file written by the SampleAccumulator of the output handlers.
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+    column_name : str or None, optional
+        The name of the column of the histogram. If None, the file should only contain a single column.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The bin edges and the number of samples in each bin. Unoccupied bins between occupied bins are included.
+
+    Raises
+    ------
+    ValueError
+        If the column name is None but the file contains several columns, or if the column does not exist.
+    """
+    bin_width = None
+    column_names = []
+    lower_edges = []
+    counts = []
+    with open(filename) as file:
+        for line in file:
+            if line.startswith("# Histogram bin width:"):
+                bin_width = float(line.split(":")[1])
+            elif line.startswith("# Column:"):
+                column_names.append(line.split(":", 1)[1].strip())
+            elif not line.startswith("#"):
+                split_line = line.split()
+                if column_name is None or split_line[0] == column_name:
+                    lower_edges.append(float(split_line[1]))
+                    counts.append(int(split_line[2]))
+    if column_name is None and len(column_names) != 1:
+        raise ValueError("The file {0} contains the columns {1}, please specify one of them."
+                         .format(filename, column_names))
+    if column_name is not None and column_name not in column_names:
+        raise ValueError("The file {0} does not contain the column {1}.".format(filename, column_name))
+    if not counts:
+        return numpy.empty(0), numpy.empty(0, dtype=int)
+    bin_indices = numpy.rint(numpy.array(lower_edges) / bin_width).astype(int)
+    dense_counts = numpy.zeros(bin_indices[-1] - bin_indices[0] + 1, dtype=int)
+    dense_counts[bin_indices - bin_indices[0]] = counts
+    edges = (numpy.arange(bin_indices[0], bin_indices[-1] + 2)) * bin_width
+    return edges, dense_counts
+
+
+def plot_accumulated_histogram(axes: plt.Axes, filename: str, label: str, column_name: str = None,
+                               ini_filename: str = None, **kwargs: Any) -> List[lines.Line2D]:
+    """
+    Plot a cumulative histogram in the axes object which was accumulated by the SampleAccumulator of the output
+    handlers.
+
+    The plot uses the bins of the accumulated histogram.
+
+    Parameters
+    ----------
+    axes : matplotlib.pyplot.Axes
+        The axes object.
+    filename : str
+        The filename.
+    label : str
+        The label of the plot.
+    column_name : str or None, optional
+        The name of the column of the histogram. If None, the file should only contain a single column.
+    ini_filename : str
+        The name of the .ini file which created the file.
+    kwargs : Any
+        Additional kwargs which will be passed to the axes.plot method.
+
+    Returns
+    -------
+    matplotlib.lines.Line2D
+        A list of objects representing the plotted data.
+    """
+    try:
+        edges, hists = load_accumulated_histogram(filename, column_name)
+        x_values = (edges[1:] + edges[:-1]) / 2.0
+        y_values = numpy.cumsum(hists / sum(hists))
+        return axes.plot(x_values, y_values, label=label, **kwargs)
+    except FileNotFoundError:
+        if ini_filename is not None:
+            warnings.warn("Could not open the file {0}. Please run the .ini file {1}.".format(filename, ini_filename))
+        else:
+            warnings.warn("Could not open the file {0}.".format(filename))
+        return []
+
+
 def plot_curve(axes: plt.Axes, filename: str, label: str, mask: Sequence[float] = None,
                **kwargs: Any) -> List[lines.Line2D]:
     """
@@ -22,7 +22,7 @@
 """Module for abstract potential classes."""
 from abc import ABCMeta, abstractmethod
 import inspect
-from typing import Any, MutableSequence, Sequence, Tuple
+from typing import Any, List, MutableSequence, Sequence, Tuple
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base import vectors
 from .potential import Potential, InvertiblePotential
@@ -579,3 +579,122 @@ class MexicanHatPotential(StandardVelocityInvertiblePotential, metaclass=ABCMeta
             The absolute value of the separation.
         """
         raise NotImplementedError
+
+
+class PairwiseDerivativesPotential(Potential, metaclass=ABCMeta):
+    """
+    Abstract class for potentials that compute the derivatives of all pairs of leaf units of two composite objects in a
+    single call.
+
+    This interface is required by the event handlers for two composite objects with summed bounding potentials if their
+    fused_kernel option is set. The potential expects a single separation and two charges per pair.
+    """
+
+    @abstractmethod
+    def pairwise_derivatives(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                             local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                             target_charges: List[float]) -> List[float]:
+        """
+        Return the directional time derivatives along the given velocity vector of all pairs of local and target units.
+
+        The separations target_position - local_position between all local and target units are corrected for periodic
+        boundaries. The derivatives are returned in the order of the pairs where the local units are in the outer loop
+        and the target units are in the inner loop. This method is equivalent to calling the derivative method for
+        every pair.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges of the target units.
+
+        Returns
+        -------
+        List[float]
+            The time derivatives of all pairs.
+        """
+        raise NotImplementedError
+
+
+class SummedInvertiblePotential(InvertiblePotential, metaclass=ABCMeta):
+    """
+    Abstract class for invertible potentials that compute the summed positive derivative and the minimum displacement
+    of all pairs of leaf units of two composite objects in a single call.
+
+    This interface is required for the bounding potentials of the event handlers for two composite objects with summed
+    bounding potentials if their fused_kernel option is set. The potential expects a single separation and two charges
+    per pair.
+    """
+
+    @abstractmethod
+    def summed_positive_derivative(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                                   local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                                   target_charges: List[float]) -> float:
+        """
+        Return the sum of the positive directional time derivatives along the given velocity vector of all pairs of
+        local and target units.
+
+        The separations target_position - local_position between all local and target units are corrected for periodic
+        boundaries. This method is equivalent to summing max(0, derivative) over all pairs.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges of the target units.
+
+        Returns
+        -------
+        float
+            The summed positive time derivatives.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def minimum_displacement(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                             local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                             target_charges: List[float], potential_changes: List[float]) -> float:
+        """
+        Return the minimum over all pairs of local and target units of the required time displacement of the local units
+        along the given velocity vector where the cumulative event rate of the pair equals its sampled potential change.
+
+        The potential changes are expected in the order of the pairs where the local units are in the outer loop and the
+        target units are in the inner loop. The separations target_position - local_position between all local and
+        target units are corrected for periodic boundaries. This method is equivalent to taking the minimum of the
+        displacement method over all pairs.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges of the target units.
+        potential_changes : List[float]
+            The sampled potential changes of all pairs.
+
+        Returns
+        -------
+        float
+            The minimum time displacement.
+        """
+        raise NotImplementedError
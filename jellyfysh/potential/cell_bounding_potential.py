@@ -20,6 +20,7 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 """Module for the CellBoundingPotential class."""
+from copy import deepcopy
 import logging
 from typing import Tuple, Union
 from jellyfysh.activator.internal_state.cell_occupancy.cells import PeriodicCells
@@ -49,6 +50,10 @@ class CellBoundingPotential(StandardVelocityInvertiblePotential, Initializer):
     involving two point masses or molecular factors involving all point masses of two composite point objects), and for
     any number of active point masses. The used estimator must just be suited for the factor treated in the event
     handler that uses this cell bounding potential.
+
+    The bounding event rate of the last computed displacement is stored in this class. Therefore, each event handler
+    needs its own instance of this class. Copies of this class (for example, when an event handler is cloned) however
+    share the estimator and the table of derivative bounds which are only read after the initialization.
     """
 
     def __init__(self, estimator: Estimator):
@@ -67,6 +72,16 @@ class CellBoundingPotential(StandardVelocityInvertiblePotential, Initializer):
         self._derivative_bounds = None
         self._bounding_event_rate = None
 
+    def __deepcopy__(self, memo: dict) -> "CellBoundingPotential":
+        """Deepcopy this bounding potential but share the estimator and the table of derivative bounds."""
+        memo[id(self._estimator)] = self._estimator
+        memo[id(self._derivative_bounds)] = self._derivative_bounds
+        copied_potential = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied_potential
+        for key, value in self.__dict__.items():
+            setattr(copied_potential, key, deepcopy(value, memo))
+        return copied_potential
+
     def initialize(self, cells: PeriodicCells, calculate_lower_bound: bool) -> None:
         """
         Initialize this class by using the estimator to determine upper bounds for the derivatives for all not excluded
@@ -106,13 +121,13 @@ class CellBoundingPotential(StandardVelocityInvertiblePotential, Initializer):
                 cell_separation = cells.relative_cell(cell, cells.zero_cell)
                 for bound_array in self._derivative_bounds:
                     bound_array[cell_separation] = [None for _ in range(setting.dimension)]
-                lower_corner = [cell.cell_min[direction] - cells.zero_cell.cell_max[direction]
+                lower_corner = [cells.cell_min(cell)[direction] - cells.cell_max(cells.zero_cell)[direction]
                                 for direction in range(setting.dimension)]
-                upper_corner = [cell.cell_max[direction] - cells.zero_cell.cell_min[direction]
+                upper_corner = [cells.cell_max(cell)[direction] - cells.cell_min(cells.zero_cell)[direction]
                                 for direction in range(setting.dimension)]
 
                 for direction in range(setting.dimension):
-                    bounds = self._estimator.derivative_bound(
+                    bounds = self._estimator.cached_derivative_bound(
                         lower_corner, upper_corner, direction, calculate_lower_bound=calculate_lower_bound)
                     for index, bound in enumerate(bounds):
                         self._derivative_bounds[index][cell_separation][direction] = bound
@@ -21,11 +21,15 @@
 #
 """Module for the DisplacedEvenPowerPotential class."""
 import logging
-from typing import Sequence
+from typing import MutableSequence, Sequence
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base import vectors
 from .abstracts import MexicanHatPotential
+from .pair_displacement_kernels import lib
+
+# Directly import the C function used in performance relevant parts of the code (if the C extension is compiled).
+_lib_displaced_even_power_displacement = lib.displaced_even_power_displacement if lib is not None else None
 
 
 # noinspection PyMethodOverriding
@@ -39,6 +43,10 @@ class DisplacedEvenPowerPotential(MexicanHatPotential):
 
     This potential only allows for standard velocities (i.e., velocities parallel to one of the cartesian coordinate
     axes going in the positive direction) of the active unit.
+
+    If the C extension in the pair_displacement_kernels package is compiled, the standard_velocity_displacement method
+    uses it. Otherwise, it falls back to the pure Python implementation of the MexicanHatPotential class. Both yield
+    bitwise identical results.
     """
 
     def __init__(self, equilibrium_separation: float, power: int, prefactor: float = 1.0) -> None:
@@ -92,6 +100,33 @@ class DisplacedEvenPowerPotential(MexicanHatPotential):
                 * (norm_of_separation - self._equilibrium_separation) ** (self._power - 1)
                 * separation[direction] / norm_of_separation)
 
+    def standard_velocity_displacement(self, direction: int, separation: MutableSequence[float],
+                                       potential_change: float) -> float:
+        """
+        Return the required displacement in space of the active unit along the positive direction of motion parallel to
+        one of the cartesian axes where the cumulative event rate of the potential equals the given potential change.
+
+        Parameters
+        ----------
+        direction : int
+            The direction of motion of the active unit i.
+        separation : MutableSequence[float]
+            The separation vector r_ij.
+        potential_change : float
+            The sampled potential change.
+
+        Returns
+        -------
+        float
+            The required displacement in space of the active unit along its direction of motion where the cumulative
+            event rate equals the sampled potential change.
+        """
+        if _lib_displaced_even_power_displacement is not None:
+            return _lib_displaced_even_power_displacement(
+                self._prefactor, self._equilibrium_separation, self._equilibrium_separation_squared, self._power,
+                self._inverse_power, separation, len(separation), direction, potential_change)
+        return super().standard_velocity_displacement(direction, separation, potential_change)
+
     def _potential(self, separation: Sequence[float]) -> float:
         """
         Return the potential for the given separation.
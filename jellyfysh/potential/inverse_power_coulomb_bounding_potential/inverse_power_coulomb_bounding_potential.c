@@ -33,12 +33,16 @@
  *  c_i and c_j, respectively, and k is a prefactor. The functions in this file are explicitly implemented for a cubic
  *  setting with side length L in three dimensions.
  *
+ *  The functions summed_positive_derivative and minimum_displacement treat all pairs of leaf units of two composite
+ *  objects in a single call. They are equivalent to calling the derivative and displacement functions for every pair
+ *  separately and yield bitwise identical results.
+ *
  *  @author The JeLLyFysh organization.
  *  @bug No known bugs.
  */
 #include "inverse_power_coulomb_bounding_potential.h" // Include declarations.
 
-#include <math.h> // For fabs, floor, fmod, pow, sqrt.
+#include <math.h> // For copysign, fabs, floor, fmod, pow, sqrt.
 
 
 /** @brief Compute the space derivative of the inverse power coulomb bounding potential along the positive x direction
@@ -137,3 +141,119 @@ double displacement(double prefactor_product, double sx, double sy, double sz, d
     }
     return displacement;
 }
+
+
+/** @brief Compute the separation r_ij,0 = nearest(r_j - r_i) between the given positions in a cubic setting with
+ *         periodic boundary conditions, permuted so that the given direction becomes the x component.
+ *
+ *  The periodic correction reproduces the correct_separation_entry method of the HypercubicPeriodicBoundaries class
+ *  (including the semantics of the modulo operator of Python) so that the separation is bitwise identical to the one
+ *  computed in Python.
+ *
+ *  @param reference_position The position r_i (three components).
+ *  @param target_position The position r_j (three components).
+ *  @param direction The direction which should become the x component.
+ *  @param system_length The system length L of the cubic setting.
+ *  @param separation The array of three components where the permuted separation is stored.
+ */
+static void permuted_nearest_separation(const double *reference_position, const double *target_position,
+                                        int direction, double system_length, double *separation) {
+    double system_length_over_two = system_length / 2.0;
+    double entry;
+    int i;
+    for (i = 0; i < 3; i++) {
+        entry = fmod(target_position[(i + direction) % 3] - reference_position[(i + direction) % 3]
+                     + system_length_over_two, system_length);
+        if (entry != 0.0) {
+            if ((system_length < 0.0) != (entry < 0.0)) {
+                entry += system_length;
+            }
+        } else {
+            entry = copysign(0.0, system_length);
+        }
+        separation[i] = entry - system_length_over_two;
+    }
+}
+
+
+/** @brief Compute the sum of the positive time derivatives of the inverse power coulomb bounding potential over all
+ *         pairs of local and target units for a velocity along the positive direction of motion.
+ *
+ *  The pairs are traversed with the local units in the outer loop, and the target units in the inner loop.
+ *
+ *  @param prefactor The prefactor k.
+ *  @param number_local_units The number of local units i.
+ *  @param local_positions The positions of the local units (three components per unit).
+ *  @param local_charges The charges c_i of the local units.
+ *  @param number_target_units The number of target units j.
+ *  @param target_positions The positions of the target units (three components per unit).
+ *  @param target_charges The charges c_j of the target units.
+ *  @param direction The direction of motion of the local units.
+ *  @param speed The speed of the local units along the direction of motion.
+ *  @param system_length The system length L of the cubic setting.
+ *  @return The sum of the positive time derivatives.
+ */
+double summed_positive_derivative(double prefactor, int number_local_units, const double *local_positions,
+                                  const double *local_charges, int number_target_units, const double *target_positions,
+                                  const double *target_charges, int direction, double speed, double system_length) {
+    double summed_derivative = 0.0;
+    double separation[3];
+    double pair_derivative;
+    int i, j;
+    for (i = 0; i < number_local_units; i++) {
+        for (j = 0; j < number_target_units; j++) {
+            permuted_nearest_separation(local_positions + 3 * i, target_positions + 3 * j, direction, system_length,
+                                        separation);
+            pair_derivative = derivative(prefactor * local_charges[i] * target_charges[j], separation[0],
+                                         separation[1], separation[2]) * speed;
+            if (pair_derivative > 0.0) {
+                summed_derivative += pair_derivative;
+            }
+        }
+    }
+    return summed_derivative;
+}
+
+
+/** @brief Return the minimum over all pairs of local and target units of the required time displacement of the local
+ *         units along the positive direction of motion where the cumulative event rate of the pair equals its sampled
+ *         potential change.
+ *
+ *  The pairs are traversed with the local units in the outer loop, and the target units in the inner loop. The
+ *  potential changes are expected in the same order.
+ *
+ *  @param prefactor The prefactor k.
+ *  @param number_local_units The number of local units i.
+ *  @param local_positions The positions of the local units (three components per unit).
+ *  @param local_charges The charges c_i of the local units.
+ *  @param number_target_units The number of target units j.
+ *  @param target_positions The positions of the target units (three components per unit).
+ *  @param target_charges The charges c_j of the target units.
+ *  @param potential_changes The sampled potential changes of all pairs.
+ *  @param direction The direction of motion of the local units.
+ *  @param speed The speed of the local units along the direction of motion.
+ *  @param system_length The system length L of the cubic setting.
+ *  @return The minimum time displacement.
+ */
+double minimum_displacement(double prefactor, int number_local_units, const double *local_positions,
+                            const double *local_charges, int number_target_units, const double *target_positions,
+                            const double *target_charges, const double *potential_changes, int direction, double speed,
+                            double system_length) {
+    double minimum = INFINITY;
+    double separation[3];
+    double pair_displacement;
+    int i, j;
+    for (i = 0; i < number_local_units; i++) {
+        for (j = 0; j < number_target_units; j++) {
+            permuted_nearest_separation(local_positions + 3 * i, target_positions + 3 * j, direction, system_length,
+                                        separation);
+            pair_displacement = displacement(prefactor * local_charges[i] * target_charges[j], separation[0],
+                                             separation[1], separation[2],
+                                             potential_changes[i * number_target_units + j], system_length) / speed;
+            if (pair_displacement < minimum) {
+                minimum = pair_displacement;
+            }
+        }
+    }
+    return minimum;
+}
@@ -25,7 +25,8 @@
 /** @file inverse_power_coulomb_bounding_potential.h
  *  @brief Declarations of functions to compute the space derivative of the inverse power coulomb bounding potential
  *         along the positive x direction, and to compute the required displacement in space along the positive x
- *         direction where the cumulative event rate equals a sampled potential change.
+ *         direction where the cumulative event rate equals a sampled potential change (also summed over all pairs
+ *         of leaf units of two composite objects).
  *
  *  @author The JeLLyFysh organization.
  *  @bug No known bugs.
@@ -36,5 +37,12 @@
 double derivative(double prefactor_product, double sx, double sy, double sz);
 double displacement(double prefactor_product, double sx, double sy, double sz, double potential_change,
                     double system_length);
+double summed_positive_derivative(double prefactor, int number_local_units, const double *local_positions,
+                                  const double *local_charges, int number_target_units, const double *target_positions,
+                                  const double *target_charges, int direction, double speed, double system_length);
+double minimum_displacement(double prefactor, int number_local_units, const double *local_positions,
+                            const double *local_charges, int number_target_units, const double *target_positions,
+                            const double *target_charges, const double *potential_changes, int direction, double speed,
+                            double system_length);
 
 #endif // INVERSE_POWER_COULOMB_BOUNDING_POTENTIAL_H
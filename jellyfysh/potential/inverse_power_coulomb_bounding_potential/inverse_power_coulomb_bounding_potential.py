@@ -21,11 +21,11 @@
 #
 """Module for the InversePowerCoulombBoundingPotential."""
 import logging
-from typing import MutableSequence, Sequence
+from typing import List, MutableSequence, Sequence
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.vectors import permutation_3d
-from jellyfysh.potential.abstracts import StandardVelocityInvertiblePotential
+from jellyfysh.potential.abstracts import StandardVelocityInvertiblePotential, SummedInvertiblePotential
 from jellyfysh.setting import hypercubic_setting as setting
 # noinspection PyUnresolvedReferences
 from ._inverse_power_coulomb_bounding_potential import ffi, lib
@@ -33,10 +33,12 @@ from ._inverse_power_coulomb_bounding_potential import ffi, lib
 # Directly import C functions used in performance relevant parts of the code.
 _lib_derivative = lib.derivative
 _lib_displacement = lib.displacement
+_lib_minimum_displacement = lib.minimum_displacement
+_lib_summed_positive_derivative = lib.summed_positive_derivative
 
 
 # noinspection PyMethodOverriding
-class InversePowerCoulombBoundingPotential(StandardVelocityInvertiblePotential):
+class InversePowerCoulombBoundingPotential(StandardVelocityInvertiblePotential, SummedInvertiblePotential):
     """
     This class implements the pair potential U_ij = c_i * c_j * k / |r_ij,0|.
 
@@ -53,6 +55,10 @@ class InversePowerCoulombBoundingPotential(StandardVelocityInvertiblePotential):
     inverse_power_coulomb_bounding_potential.c and inverse_power_coulomb_bounding_potential.h. The cffi package is used
     call the C code. The executable module inverse_power_coulomb_bounding_potential.py can be used to compile the C code
     and to create the necessary files.
+
+    Event handlers that sum this bounding potential over all pairs of leaf units of two composite objects can use the
+    summed_positive_derivative and minimum_displacement methods, which treat all pairs in a single call of the C code.
+    These methods yield the same results as calling the derivative and displacement methods for every pair.
     """
 
     def __init__(self, prefactor: float = 1.5837) -> None:
@@ -138,3 +144,89 @@ class InversePowerCoulombBoundingPotential(StandardVelocityInvertiblePotential):
         """
         return _lib_displacement(self._prefactor * charge_one * charge_two, *permutation_3d(separation, direction),
                                  potential_change, setting.system_length)
+
+    def summed_positive_derivative(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                                   local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                                   target_charges: List[float]) -> float:
+        """
+        Return the sum of the positive directional time derivatives along the given velocity vector of all pairs of
+        local and target units.
+
+        This method computes the shortest separations target_position - local_position between all local and target
+        units, corrected for periodic boundaries. It is equivalent to summing max(0, derivative) over all pairs but it
+        calls the C code only once.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges c_i of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges c_j of the target units.
+
+        Returns
+        -------
+        float
+            The summed positive time derivatives.
+
+        Raises
+        ------
+        AssertionError
+            If the velocity is not in the positive direction parallel to one of the cartesian axes.
+        """
+        direction, speed = self._analyse_velocity(velocity)
+        return _lib_summed_positive_derivative(
+            self._prefactor, len(local_positions), [entry for position in local_positions for entry in position],
+            local_charges, len(target_positions), [entry for position in target_positions for entry in position],
+            target_charges, direction, speed, setting.system_length)
+
+    def minimum_displacement(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                             local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                             target_charges: List[float], potential_changes: List[float]) -> float:
+        """
+        Return the minimum over all pairs of local and target units of the required time displacement of the local units
+        along the given velocity vector where the cumulative event rate of the pair equals its sampled potential change.
+
+        The potential changes are expected in the order of the pairs where the local units are in the outer loop and the
+        target units are in the inner loop. This method computes the shortest separations
+        target_position - local_position between all local and target units, corrected for periodic boundaries. It is
+        equivalent to taking the minimum of the displacement method over all pairs but it calls the C code only once.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges c_i of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges c_j of the target units.
+        potential_changes : List[float]
+            The sampled potential changes of all pairs.
+
+        Returns
+        -------
+        float
+            The minimum time displacement.
+
+        Raises
+        ------
+        AssertionError
+            If the velocity is not in the positive direction parallel to one of the cartesian axes.
+        AssertionError
+            If the number of potential changes does not equal the number of pairs.
+        """
+        assert len(potential_changes) == len(local_positions) * len(target_positions)
+        direction, speed = self._analyse_velocity(velocity)
+        return _lib_minimum_displacement(
+            self._prefactor, len(local_positions), [entry for position in local_positions for entry in position],
+            local_charges, len(target_positions), [entry for position in target_positions for entry in position],
+            target_charges, potential_changes, direction, speed, setting.system_length)
@@ -37,6 +37,13 @@ ffi_builder.cdef(r"""
 double derivative(double prefactor_product, double sx, double sy, double sz);
 double displacement(double prefactor_product, double sx, double sy, double sz, double potential_change,
                     double system_length);
+double summed_positive_derivative(double prefactor, int number_local_units, const double *local_positions,
+                                  const double *local_charges, int number_target_units, const double *target_positions,
+                                  const double *target_charges, int direction, double speed, double system_length);
+double minimum_displacement(double prefactor, int number_local_units, const double *local_positions,
+                            const double *local_charges, int number_target_units, const double *target_positions,
+                            const double *target_charges, const double *potential_changes, int direction, double speed,
+                            double system_length);
 """)
 
 # First argument is name of the output C extension that is used in inverse_power_coulomb_bounding_potential.py.
@@ -26,6 +26,10 @@ from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base import vectors
 from .abstracts import StandardVelocityInvertiblePotential
+from .pair_displacement_kernels import lib
+
+# Directly import the C function used in performance relevant parts of the code (if the C extension is compiled).
+_lib_inverse_power_displacement = lib.inverse_power_displacement if lib is not None else None
 
 
 # noinspection PyMethodOverriding
@@ -38,6 +42,9 @@ class InversePowerPotential(StandardVelocityInvertiblePotential):
 
     This potential only allows for standard velocities (i.e., velocities parallel to one of the cartesian coordinate
     axes going in the positive direction) of the active unit.
+
+    If the C extension in the pair_displacement_kernels package is compiled, the standard_velocity_displacement method
+    uses it. Otherwise, it falls back to the pure Python implementation. Both yield bitwise identical results.
     """
 
     def __init__(self, power: float, prefactor: float) -> None:
@@ -119,6 +126,10 @@ class InversePowerPotential(StandardVelocityInvertiblePotential):
             event rate equals the sampled potential change.
         """
         charge_product = charge_one * charge_two
+        if _lib_inverse_power_displacement is not None:
+            return _lib_inverse_power_displacement(self._prefactor, charge_product, self._power_over_two,
+                                                   self._two_over_power, separation, len(separation), direction,
+                                                   potential_change)
         prefactor_product = self._prefactor * charge_product
         return (self._displacement_repulsive(direction, charge_product, potential_change, separation)
                 if prefactor_product > 0
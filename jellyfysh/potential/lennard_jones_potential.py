@@ -21,10 +21,14 @@
 #
 """Module for the LennardJonesPotential class."""
 import logging
-from typing import Sequence
+from typing import MutableSequence, Sequence
 from jellyfysh.base.logging import log_init_arguments
 from .abstracts import MexicanHatPotential
 from .inverse_power_potential import InversePowerPotential
+from .pair_displacement_kernels import lib
+
+# Directly import the C function used in performance relevant parts of the code (if the C extension is compiled).
+_lib_lennard_jones_displacement = lib.lennard_jones_displacement if lib is not None else None
 
 
 # noinspection PyMethodOverriding
@@ -38,6 +42,10 @@ class LennardJonesPotential(MexicanHatPotential):
 
     This potential only allows for standard velocities (i.e., velocities parallel to one of the cartesian coordinate
     axes going in the positive direction) of the active unit.
+
+    If the C extension in the pair_displacement_kernels package is compiled, the standard_velocity_displacement method
+    uses it. Otherwise, it falls back to the pure Python implementation of the MexicanHatPotential class. Both yield
+    bitwise identical results.
     """
 
     def __init__(self, prefactor: float = 1.0, characteristic_length: float = 1.0):
@@ -54,10 +62,10 @@ class LennardJonesPotential(MexicanHatPotential):
         log_init_arguments(logging.getLogger(__name__).debug, self.__class__.__name__,
                            prefactor=prefactor, characteristic_length=characteristic_length)
         super().__init__(prefactor=prefactor, equilibrium_separation=characteristic_length * 2 ** (1 / 6))
-        self._six_power_potential = InversePowerPotential(power=6, prefactor=-prefactor *
-                                                          characteristic_length ** 6)
-        self._twelve_power_potential = InversePowerPotential(power=12, prefactor=prefactor *
-                                                             characteristic_length ** 12)
+        self._six_power_prefactor = -prefactor * characteristic_length ** 6
+        self._twelve_power_prefactor = prefactor * characteristic_length ** 12
+        self._six_power_potential = InversePowerPotential(power=6, prefactor=self._six_power_prefactor)
+        self._twelve_power_potential = InversePowerPotential(power=12, prefactor=self._twelve_power_prefactor)
         self._characteristic_length = characteristic_length
 
     def standard_velocity_derivative(self, direction: int, separation: Sequence[float]) -> float:
@@ -80,6 +88,34 @@ class LennardJonesPotential(MexicanHatPotential):
         return (self._six_power_potential.standard_velocity_derivative(direction, separation, 1.0, 1.0)
                 + self._twelve_power_potential.standard_velocity_derivative(direction, separation, 1.0, 1.0))
 
+    def standard_velocity_displacement(self, direction: int, separation: MutableSequence[float],
+                                       potential_change: float) -> float:
+        """
+        Return the required displacement in space of the active unit along the positive direction of motion parallel to
+        one of the cartesian axes where the cumulative event rate of the potential equals the given potential change.
+
+        Parameters
+        ----------
+        direction : int
+            The direction of motion of the active unit i.
+        separation : MutableSequence[float]
+            The separation vector r_ij.
+        potential_change : float
+            The sampled potential change.
+
+        Returns
+        -------
+        float
+            The required displacement in space of the active unit along its direction of motion where the cumulative
+            event rate equals the sampled potential change.
+        """
+        if _lib_lennard_jones_displacement is not None:
+            return _lib_lennard_jones_displacement(
+                self._prefactor, self._equilibrium_separation, self._equilibrium_separation_squared,
+                self._characteristic_length, self._six_power_prefactor, self._twelve_power_prefactor, separation,
+                len(separation), direction, potential_change)
+        return super().standard_velocity_displacement(direction, separation, potential_change)
+
     def _potential(self, separation: Sequence[float]) -> float:
         """
         Return the potential for the given separation.
@@ -24,17 +24,21 @@
 
 /** @file merged_image_coulomb_potential.c
  *  @brief Definitions of functions to compute the space derivative of the merged image coulomb potential along the
- *         positive x direction.
+ *         positive x direction, and to invert its cumulative event rate.
  *
  *  This file contains the functions to create, copy, and destroy a struct containing all parameters to compute the
  *  space derivative of the merged image coulomb potential along the positive x direction in the derivative function.
+ *  The pairwise_derivatives function computes the space derivatives for all pairs of leaf units of two composite objects
+ *  in a single call. It is equivalent to calling the derivative function for every pair separately and yields bitwise
+ *  identical results. The displacement function inverts the cumulative event rate of the merged image coulomb potential
+ *  along the positive x direction without a bounding potential.
  *
  *  @author The JeLLyFysh organization.
  *  @bug No known bugs.
  */
 #include "merged_image_coulomb_potential.h" // Include declarations.
 
-#include <math.h> // For M_PI, cos, erfc, exp, sqrt, sin.
+#include <math.h> // For INFINITY, M_PI, copysign, cos, erfc, exp, fabs, floor, fmod, sqrt, sin.
 #include <stdlib.h> // For free, malloc, size_t.
 #include <string.h> // For memcpy.
 
@@ -272,3 +276,416 @@ double derivative(struct MergedImageCoulombPotential *potential, double sx, doub
     }
     return derivative;
 }
+
+
+/** @brief Compute the separation r_ij,0 = nearest(r_j - r_i) between the given positions in a cubic setting with
+ *         periodic boundary conditions, permuted so that the given direction becomes the x component.
+ *
+ *  The periodic correction reproduces the correct_separation_entry method of the HypercubicPeriodicBoundaries class
+ *  (including the semantics of the modulo operator of Python) so that the separation is bitwise identical to the one
+ *  computed in Python.
+ *
+ *  @param reference_position The position r_i (three components).
+ *  @param target_position The position r_j (three components).
+ *  @param direction The direction which should become the x component.
+ *  @param system_length The system length L of the cubic setting.
+ *  @param separation The array of three components where the permuted separation is stored.
+ */
+static void permuted_nearest_separation(const double *reference_position, const double *target_position,
+                                        int direction, double system_length, double *separation) {
+    double system_length_over_two = system_length / 2.0;
+    double entry;
+    int i;
+    for (i = 0; i < 3; i++) {
+        entry = fmod(target_position[(i + direction) % 3] - reference_position[(i + direction) % 3]
+                     + system_length_over_two, system_length);
+        if (entry != 0.0) {
+            if ((system_length < 0.0) != (entry < 0.0)) {
+                entry += system_length;
+            }
+        } else {
+            entry = copysign(0.0, system_length);
+        }
+        separation[i] = entry - system_length_over_two;
+    }
+}
+
+
+/** @brief Compute the time derivatives of the merged image coulomb potential for all pairs of local and target units
+ *         for a velocity along the positive direction of motion.
+ *
+ *  The pairs are traversed with the local units in the outer loop, and the target units in the inner loop. The time
+ *  derivative of every pair is given by k * c_i * c_j * d * v, where d is the space derivative computed by the
+ *  derivative function and v is the speed.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param prefactor The prefactor k.
+ *  @param number_local_units The number of local units i.
+ *  @param local_positions The positions of the local units (three components per unit).
+ *  @param local_charges The charges c_i of the local units.
+ *  @param number_target_units The number of target units j.
+ *  @param target_positions The positions of the target units (three components per unit).
+ *  @param target_charges The charges c_j of the target units.
+ *  @param direction The direction of motion of the local units.
+ *  @param speed The speed of the local units along the direction of motion.
+ *  @param derivatives The array where the time derivatives of all pairs are stored.
+ */
+void pairwise_derivatives(struct MergedImageCoulombPotential *potential, double prefactor, int number_local_units,
+                          const double *local_positions, const double *local_charges, int number_target_units,
+                          const double *target_positions, const double *target_charges, int direction, double speed,
+                          double *derivatives) {
+    double separation[3];
+    int i, j;
+    for (i = 0; i < number_local_units; i++) {
+        for (j = 0; j < number_target_units; j++) {
+            permuted_nearest_separation(local_positions + 3 * i, target_positions + 3 * j, direction,
+                                        potential->system_length, separation);
+            derivatives[i * number_target_units + j] = prefactor * local_charges[i] * target_charges[j]
+                                                       * derivative(potential, separation[0], separation[1],
+                                                                    separation[2]) * speed;
+        }
+    }
+}
+
+
+/** @brief Compute the merged image coulomb potential (up to a constant which does not depend on the x component of the
+ *         separation) and its space derivative along the positive x direction evaluated at the given separation.
+ *
+ *  The space derivative is computed in the same way as in the derivative function. The potential includes the
+ *  position-space part of the Ewald sum and the Fourier-space part with nonzero x component of the wave vector. The
+ *  omitted terms of the Fourier-space part and the self-energy correction do not depend on the x component of the
+ *  separation.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param sx The x component of the separation.
+ *  @param sy The y component of the separation.
+ *  @param sz The z component of the separation.
+ *  @param derivative The pointer where the space derivative is stored.
+ *  @return The potential up to a constant which does not depend on sx.
+ */
+static double potential_and_derivative(struct MergedImageCoulombPotential *potential, double sx, double sy, double sz,
+                                       double *derivative) {
+    double value = 0.0;
+    double slope = 0.0;
+
+    // First compute the part of the Ewald sum in position space.
+    double vector_norm, vector_sq, vector_x, vector_y_sq, vector_z_sq, screened;
+    int cutoff_x, cutoff_y;
+    int i, j, k;
+    for (k = -potential->position_cutoff; k < potential->position_cutoff + 1; k++) {
+        vector_z_sq = (sz + k * potential->system_length) * (sz + k * potential->system_length);
+        cutoff_y = (int) sqrt(potential->position_cutoff_sq - k * k);
+        for (j = -cutoff_y; j < cutoff_y + 1; j++) {
+            vector_y_sq = (sy + j * potential->system_length) * (sy + j * potential->system_length);
+            cutoff_x = (int) sqrt(potential->position_cutoff_sq - j * j - k * k);
+            for (i = -cutoff_x; i < cutoff_x + 1; i++) {
+                vector_x = sx + i * potential->system_length;
+                vector_sq = vector_x * vector_x + vector_y_sq + vector_z_sq;
+                vector_norm = sqrt(vector_sq);
+                screened = erfc(potential->alpha_over_length * vector_norm) / vector_norm;
+                value += screened;
+                slope += vector_x * (potential->two_alpha_over_length_root_pi
+                                     * exp(-potential->alpha_over_length_sq * vector_sq) + screened) / vector_sq;
+            }
+        }
+    }
+
+    // Then compute the part of the Ewald sum in Fourier space.
+    double delta_cos_x = cos(potential->two_pi_over_length * sx);
+    double delta_sin_x = sin(potential->two_pi_over_length * sx);
+    double delta_cos_y = cos(potential->two_pi_over_length * sy);
+    double delta_sin_y = sin(potential->two_pi_over_length * sy);
+    double delta_cos_z = cos(potential->two_pi_over_length * sz);
+    double delta_sin_z = sin(potential->two_pi_over_length * sz);
+    double cos_x = delta_cos_x;
+    double sin_x = delta_sin_x;
+    double cos_y = 1.0;
+    double sin_y = 0.0;
+    double cos_z = 1.0;
+    double sin_z = 0.0;
+    double store_cos_value;
+
+    for (i = 1; i < potential->fourier_cutoff + 1; i++) {
+        cutoff_y = (int) sqrt(potential->fourier_cutoff_sq - i * i);
+        for (j = 0; j < cutoff_y + 1; j++) {
+            cutoff_x = (int) sqrt(potential->fourier_cutoff_sq - i * i - j * j);
+            for (k = 0; k < cutoff_x + 1; k++) {
+                slope += potential->fourier_array[i][j][k] * sin_x * cos_y * cos_z;
+                value += potential->fourier_array[i][j][k] * cos_x * cos_y * cos_z
+                         / (potential->two_pi_over_length * i);
+
+                if (k != cutoff_x) {
+                    store_cos_value = cos_z;
+                    cos_z = store_cos_value * delta_cos_z - sin_z * delta_sin_z;
+                    sin_z = sin_z * delta_cos_z + store_cos_value * delta_sin_z;
+                } else if (j != cutoff_y) {
+                    store_cos_value = cos_y;
+                    cos_y = store_cos_value * delta_cos_y - sin_y * delta_sin_y;
+                    sin_y = sin_y * delta_cos_y + store_cos_value * delta_sin_y;
+                    cos_z = 1.0;
+                    sin_z = 0.0;
+                } else if (i != potential->fourier_cutoff) {
+                    store_cos_value = cos_x;
+                    cos_x = store_cos_value * delta_cos_x - sin_x * delta_sin_x;
+                    sin_x = sin_x * delta_cos_x + store_cos_value * delta_sin_x;
+                    cos_y = 1.0;
+                    sin_y = 0.0;
+                    cos_z = 1.0;
+                    sin_z = 0.0;
+                }
+            }
+        }
+    }
+    *derivative = slope;
+    return value;
+}
+
+
+/** @brief Struct that stores a point on the line of motion of the active unit. */
+struct LinePoint {
+    /** The displacement of the active unit. */
+    double displacement;
+    /** The potential k * c_i * c_j * U (up to a constant) after the displacement. */
+    double value;
+    /** The space derivative of the potential along the direction of motion after the displacement. */
+    double rate;
+};
+
+
+/** @brief Evaluate the potential and its space derivative along the positive x direction after the active unit was
+ *         displaced by the given displacement along the positive x direction.
+ *
+ *  The x component of the separation decreases with the displacement and is wrapped back into the interval
+ *  [-L/2, L/2) so that the cutoffs of the Ewald summation remain valid.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param charge_product The product k * c_i * c_j.
+ *  @param sx The x component of the initial separation.
+ *  @param sy The y component of the separation.
+ *  @param sz The z component of the separation.
+ *  @param displacement The displacement of the active unit.
+ *  @return The point on the line of motion.
+ */
+static struct LinePoint evaluate_line_point(struct MergedImageCoulombPotential *potential, double charge_product,
+                                            double sx, double sy, double sz, double displacement) {
+    double system_length_over_two = potential->system_length / 2.0;
+    double x = fmod(sx - displacement + system_length_over_two, potential->system_length);
+    if (x < 0.0) {
+        x += potential->system_length;
+    }
+    x -= system_length_over_two;
+    double derivative_x;
+    double value = potential_and_derivative(potential, x, sy, sz, &derivative_x);
+    struct LinePoint point = {displacement, charge_product * value, charge_product * derivative_x};
+    return point;
+}
+
+
+/** @brief Return the step of the scan along the line of motion of the active unit at the given displacement.
+ *
+ *  The step is the smaller one of a fixed fraction of the system length, which resolves the smooth contributions of
+ *  the far images and of the Fourier-space part, and a fixed fraction of the distance to the nearest image, which
+ *  resolves the singular contribution of the nearest image.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param sx The x component of the initial separation.
+ *  @param sy The y component of the separation.
+ *  @param sz The z component of the separation.
+ *  @param displacement The displacement of the active unit.
+ *  @return The step.
+ */
+static double scan_step(struct MergedImageCoulombPotential *potential, double sx, double sy, double sz,
+                        double displacement) {
+    double system_length_over_two = potential->system_length / 2.0;
+    double x = fmod(sx - displacement + system_length_over_two, potential->system_length);
+    if (x < 0.0) {
+        x += potential->system_length;
+    }
+    x -= system_length_over_two;
+    double step = 0.25 * sqrt(x * x + sy * sy + sz * sz);
+    if (step > potential->system_length / 8.0) {
+        step = potential->system_length / 8.0;
+    }
+    if (step < 1.0e-12 * potential->system_length) {
+        step = 1.0e-12 * potential->system_length;
+    }
+    return step;
+}
+
+
+/** @brief Return the point between the given points where the space derivative of the potential changes its sign.
+ *
+ *  The root is found with the Illinois variant of the regula falsi method.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param charge_product The product k * c_i * c_j.
+ *  @param sx The x component of the initial separation.
+ *  @param sy The y component of the separation.
+ *  @param sz The z component of the separation.
+ *  @param lower The point with the smaller displacement.
+ *  @param upper The point with the larger displacement whose space derivative has the opposite sign.
+ *  @return The point where the space derivative changes its sign.
+ */
+static struct LinePoint derivative_root(struct MergedImageCoulombPotential *potential, double charge_product,
+                                        double sx, double sy, double sz, struct LinePoint lower,
+                                        struct LinePoint upper) {
+    struct LinePoint middle = lower;
+    double displacement;
+    int side = 0;
+    int iteration;
+    for (iteration = 0; iteration < 100; iteration++) {
+        displacement = (lower.displacement * upper.rate - upper.displacement * lower.rate) / (upper.rate - lower.rate);
+        if (!(displacement > lower.displacement && displacement < upper.displacement)) {
+            displacement = 0.5 * (lower.displacement + upper.displacement);
+        }
+        middle = evaluate_line_point(potential, charge_product, sx, sy, sz, displacement);
+        if (middle.rate == 0.0 || upper.displacement - lower.displacement <= 1.0e-14 * potential->system_length) {
+            break;
+        }
+        if ((middle.rate > 0.0) == (upper.rate > 0.0)) {
+            upper = middle;
+            if (side == 1) {
+                lower.rate /= 2.0;
+            }
+            side = 1;
+        } else {
+            lower = middle;
+            if (side == -1) {
+                upper.rate /= 2.0;
+            }
+            side = -1;
+        }
+    }
+    return middle;
+}
+
+
+/** @brief Return the displacement between the given points where the potential reaches the given value.
+ *
+ *  The potential must increase monotonically between the given points. The displacement is found with Newton's method
+ *  which falls back to bisection whenever the Newton step leaves the bracket.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param charge_product The product k * c_i * c_j.
+ *  @param sx The x component of the initial separation.
+ *  @param sy The y component of the separation.
+ *  @param sz The z component of the separation.
+ *  @param lower The point with the smaller displacement and the smaller potential.
+ *  @param upper The point with the larger displacement and the larger potential.
+ *  @param target_value The value of the potential which should be reached.
+ *  @return The displacement where the potential reaches the target value.
+ */
+static double potential_root(struct MergedImageCoulombPotential *potential, double charge_product, double sx,
+                             double sy, double sz, struct LinePoint lower, struct LinePoint upper,
+                             double target_value) {
+    double displacement = lower.displacement;
+    if (upper.value > lower.value) {
+        displacement += (upper.displacement - lower.displacement) * (target_value - lower.value)
+                        / (upper.value - lower.value);
+    }
+    struct LinePoint middle;
+    int iteration;
+    for (iteration = 0; iteration < 100; iteration++) {
+        if (!(displacement > lower.displacement && displacement < upper.displacement)) {
+            displacement = 0.5 * (lower.displacement + upper.displacement);
+        }
+        middle = evaluate_line_point(potential, charge_product, sx, sy, sz, displacement);
+        if (middle.value == target_value
+            || upper.displacement - lower.displacement <= 1.0e-14 * potential->system_length) {
+            break;
+        }
+        if (middle.value < target_value) {
+            lower = middle;
+        } else {
+            upper = middle;
+        }
+        if (middle.rate > 0.0) {
+            double newton_displacement = displacement + (target_value - middle.value) / middle.rate;
+            if (fabs(newton_displacement - displacement) <= 1.0e-15 * potential->system_length) {
+                displacement = newton_displacement;
+                break;
+            }
+            displacement = newton_displacement;
+        } else {
+            displacement = 0.5 * (lower.displacement + upper.displacement);
+        }
+    }
+    return displacement;
+}
+
+
+/** @brief Compute the displacement of the active unit along the positive x direction where the cumulative event rate
+ *         of the merged image coulomb potential equals the given potential change.
+ *
+ *  The cumulative event rate is the sum of all increases of the potential along the line of motion. This function
+ *  scans the line of motion with the steps of the scan_step function. Within each step, the potential is considered
+ *  to be monotonic, unless its space derivative changes its sign, in which case the extremum is located with the
+ *  derivative_root function. As soon as the cumulative event rate exceeds the potential change, the displacement is
+ *  found with the potential_root function. Since the potential is periodic along the line of motion, full periods
+ *  are skipped after the increase of the potential within a single period is known.
+ *
+ *  @param potential The pointer to the MergedImageCoulombPotential on the heap whose parameters should be used.
+ *  @param charge_product The product k * c_i * c_j.
+ *  @param sx The x component of the separation r_ij = r_j - r_i.
+ *  @param sy The y component of the separation r_ij = r_j - r_i.
+ *  @param sz The z component of the separation r_ij = r_j - r_i.
+ *  @param potential_change The sampled potential change.
+ *  @return The displacement, or infinity if the potential does not increase along the line of motion.
+ */
+double displacement(struct MergedImageCoulombPotential *potential, double charge_product, double sx, double sy,
+                    double sz, double potential_change) {
+    if (charge_product == 0.0) {
+        return INFINITY;
+    }
+    struct LinePoint lower = evaluate_line_point(potential, charge_product, sx, sy, sz, 0.0);
+    struct LinePoint upper, extremum;
+    double cumulative_increase = 0.0;
+    double period_end = potential->system_length;
+    int period_skipped = 0;
+    double increase, number_periods;
+    for (;;) {
+        double next_displacement = lower.displacement + scan_step(potential, sx, sy, sz, lower.displacement);
+        if (!period_skipped && next_displacement > period_end) {
+            next_displacement = period_end;
+        }
+        upper = evaluate_line_point(potential, charge_product, sx, sy, sz, next_displacement);
+        if (lower.rate >= 0.0 && upper.rate >= 0.0) {
+            increase = upper.value - lower.value;
+            if (increase > 0.0 && cumulative_increase + increase >= potential_change) {
+                return potential_root(potential, charge_product, sx, sy, sz, lower, upper,
+                                      lower.value + potential_change - cumulative_increase);
+            }
+        } else if (lower.rate <= 0.0 && upper.rate <= 0.0) {
+            increase = 0.0;
+        } else {
+            extremum = derivative_root(potential, charge_product, sx, sy, sz, lower, upper);
+            if (lower.rate > 0.0) {
+                increase = extremum.value - lower.value;
+                if (increase > 0.0 && cumulative_increase + increase >= potential_change) {
+                    return potential_root(potential, charge_product, sx, sy, sz, lower, extremum,
+                                          lower.value + potential_change - cumulative_increase);
+                }
+            } else {
+                increase = upper.value - extremum.value;
+                if (increase > 0.0 && cumulative_increase + increase >= potential_change) {
+                    return potential_root(potential, charge_product, sx, sy, sz, extremum, upper,
+                                          extremum.value + potential_change - cumulative_increase);
+                }
+            }
+        }
+        if (increase > 0.0) {
+            cumulative_increase += increase;
+        }
+        lower = upper;
+        if (!period_skipped && lower.displacement == period_end) {
+            // The potential is periodic along the line of motion, the increase within one period is now known.
+            if (!(cumulative_increase > 0.0)) {
+                return INFINITY;
+            }
+            number_periods = floor((potential_change - cumulative_increase) / cumulative_increase);
+            lower.displacement += number_periods * potential->system_length;
+            cumulative_increase += number_periods * cumulative_increase;
+            period_skipped = 1;
+        }
+    }
+}
@@ -24,7 +24,7 @@
 
 /** @file merged_image_coulomb_potential.h
  *  @brief Declarations of functions to compute the space derivative of the merged image coulomb potential along the
- *         positive x direction.
+ *         positive x direction, and to invert its cumulative event rate.
  *
  *  @author The JeLLyFysh organization.
  *  @bug No known bugs.
@@ -42,5 +42,11 @@ void destroy_merged_image_coulomb_potential(struct MergedImageCoulombPotential *
 size_t estimated_size(struct MergedImageCoulombPotential *potential);
 struct MergedImageCoulombPotential *copy_merged_image_coulomb_potential(struct MergedImageCoulombPotential *pot);
 double derivative(struct MergedImageCoulombPotential *potential, double sx, double sy, double sz);
+void pairwise_derivatives(struct MergedImageCoulombPotential *potential, double prefactor, int number_local_units,
+                          const double *local_positions, const double *local_charges, int number_target_units,
+                          const double *target_positions, const double *target_charges, int direction, double speed,
+                          double *derivatives);
+double displacement(struct MergedImageCoulombPotential *potential, double charge_product, double sx, double sy,
+                    double sz, double potential_change);
 
 #endif // MERGED_IMAGE_COULOMB_POTENTIAL_H
@@ -22,20 +22,22 @@
 """Module for the MergedImageCoulombPotential class."""
 from copy import deepcopy
 import logging
-from typing import Any, Mapping, MutableMapping, Sequence
+from typing import Any, List, Mapping, MutableMapping, MutableSequence, Sequence
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.base.logging import log_init_arguments
 from jellyfysh.base.vectors import permutation_3d
-from jellyfysh.potential.abstracts import StandardVelocityPotential
+from jellyfysh.potential.abstracts import PairwiseDerivativesPotential, StandardVelocityInvertiblePotential
 from jellyfysh.setting import hypercubic_setting as setting
 # noinspection PyUnresolvedReferences
 from ._merged_image_coulomb_potential import ffi, lib
 
 # Directly import C functions used in performance relevant parts of the code.
 _lib_derivative = lib.derivative
+_lib_pairwise_derivatives = lib.pairwise_derivatives
+_lib_displacement = lib.displacement
 
 
-class MergedImageCoulombPotential(StandardVelocityPotential):
+class MergedImageCoulombPotential(StandardVelocityInvertiblePotential, PairwiseDerivativesPotential):
     r"""
     This class implements the merged image Coulomb pair potential
     U_ij = k * c_i * c_j * \sum_{\vec{n}\in\mathbb{Z}^3} 1/ (|\vec{r_ij}+\vec{n}L|).
@@ -56,6 +58,15 @@ class MergedImageCoulombPotential(StandardVelocityPotential):
     The standard_velocity_derivative method uses C code that is stored in the files merged_image_coulomb_potential.c and
     merged_image_coulomb_potential.h. The cffi package is used to call the C code. The executable module
     merged_image_coulomb_potential_build.py can be used to compile the C code and to create the necessary files.
+
+    Event handlers that sum this potential over all pairs of leaf units of two composite objects can use the
+    pairwise_derivatives method, which treats all pairs in a single call of the C code.
+
+    This potential is invertible, so event handlers can sample events of a single pair without a bounding potential.
+    The C code scans the potential along the line of motion of the active unit in steps which are small compared to the
+    system length and to the distance to the nearest image. Within each step, the potential is considered to be
+    monotonic unless its derivative changes its sign. The extrema and the final displacement are located by root
+    finding to close to machine precision.
     """
 
     def __init__(self, alpha: float = 3.45, fourier_cutoff: int = 6, position_cutoff: int = 2,
@@ -153,6 +164,83 @@ class MergedImageCoulombPotential(StandardVelocityPotential):
         separation = permutation_3d(separation, direction)
         return self._prefactor * charge_one * charge_two * _lib_derivative(self._potential, *separation)
 
+    # noinspection PyMethodOverriding
+    def standard_velocity_displacement(self, direction: int, separation: MutableSequence[float], charge_one: float,
+                                       charge_two: float, potential_change: float) -> float:
+        """
+        Return the required displacement in space of the active unit along the positive direction of motion parallel to
+        one of the cartesian axes where the cumulative event rate of the potential equals the given potential change.
+
+        Note that the displacement function written in C always considers a motion in x direction. The separation
+        vector is therefore permuted before the function is called.
+
+        Parameters
+        ----------
+        direction : int
+            The direction of motion of the active unit.
+        separation : MutableSequence[float]
+            The separation vector r_ij.
+        charge_one : float
+            The charge c_i.
+        charge_two : float
+            The charge c_j.
+        potential_change : float
+            The sampled potential change.
+
+        Returns
+        -------
+        float
+            The required displacement in space of the active unit along its direction of motion where the cumulative
+            event rate equals the sampled potential change.
+        """
+        separation = permutation_3d(separation, direction)
+        return _lib_displacement(self._potential, self._prefactor * charge_one * charge_two, *separation,
+                                 potential_change)
+
+    def pairwise_derivatives(self, velocity: Sequence[float], local_positions: Sequence[Sequence[float]],
+                             local_charges: List[float], target_positions: Sequence[Sequence[float]],
+                             target_charges: List[float]) -> List[float]:
+        """
+        Return the directional time derivatives along the given velocity vector of all pairs of local and target units.
+
+        This method computes the shortest separations target_position - local_position between all local and target
+        units, corrected for periodic boundaries. The derivatives are returned in the order of the pairs where the
+        local units are in the outer loop and the target units are in the inner loop. This method is equivalent to
+        calling the derivative method for every pair but it calls the C code only once.
+
+        Parameters
+        ----------
+        velocity : Sequence[float]
+            The velocity of the local units.
+        local_positions : Sequence[Sequence[float]]
+            The positions of the local units.
+        local_charges : List[float]
+            The charges c_i of the local units.
+        target_positions : Sequence[Sequence[float]]
+            The positions of the target units.
+        target_charges : List[float]
+            The charges c_j of the target units.
+
+        Returns
+        -------
+        List[float]
+            The time derivatives of all pairs.
+
+        Raises
+        ------
+        AssertionError
+            If the velocity is not in the positive direction parallel to one of the cartesian axes.
+        """
+        direction, speed = self._analyse_velocity(velocity)
+        number_pairs = len(local_positions) * len(target_positions)
+        derivatives = ffi.new("double[]", number_pairs)
+        _lib_pairwise_derivatives(
+            self._potential, self._prefactor, len(local_positions),
+            [entry for position in local_positions for entry in position], local_charges, len(target_positions),
+            [entry for position in target_positions for entry in position], target_charges, direction, speed,
+            derivatives)
+        return ffi.unpack(derivatives, number_pairs)
+
     def __copy__(self) -> 'MergedImageCoulombPotential':
         """
         Create a shallow copy of this class.
@@ -41,6 +41,12 @@ void destroy_merged_image_coulomb_potential(struct MergedImageCoulombPotential *
 size_t estimated_size(struct MergedImageCoulombPotential *potential);
 struct MergedImageCoulombPotential *copy_merged_image_coulomb_potential(struct MergedImageCoulombPotential *pot);
 double derivative(struct MergedImageCoulombPotential *potential, double sx, double sy, double sz);
+void pairwise_derivatives(struct MergedImageCoulombPotential *potential, double prefactor, int number_local_units,
+                          const double *local_positions, const double *local_charges, int number_target_units,
+                          const double *target_positions, const double *target_charges, int direction, double speed,
+                          double *derivatives);
+double displacement(struct MergedImageCoulombPotential *potential, double charge_product, double sx, double sy,
+                    double sz, double potential_change);
 """)
 
 # First argument is name of the output C extension that is used in merged_image_coulomb_potential.py.
@@ -0,0 +1,466 @@
+/************************************************************************************************************************
+ * JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh                  *
+ * Copyright (C) 2019, 2022 The JeLLyFysh organization                                                                  *
+ * (See the AUTHORS.md file for the full list of authors.)                                                              *
+ *                                                                                                                      *
+ * This file is part of JeLLyFysh.                                                                                      *
+ *                                                                                                                      *
+ * JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public       *
+ * License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later *
+ * version.                                                                                                             *
+ *                                                                                                                      *
+ * JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied      *
+ * warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more        *
+ * details.                                                                                                             *
+ *                                                                                                                      *
+ * You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.          *
+ * If not, see <https://www.gnu.org/licenses/>.                                                                         *
+ *                                                                                                                      *
+ * If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):  *
+ * Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,                                    *
+ * JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,                                   *
+ * Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.               *
+ ************************************************************************************************************************/
+
+/** @file pair_displacement_kernels.c
+ *  @brief Definitions of functions to compute the required displacement in space along a positive cartesian direction
+ *         where the cumulative event rate of the inverse power, the Lennard-Jones, or the displaced even power pair
+ *         potential equals a sampled potential change.
+ *
+ *  The functions reproduce the pure Python implementations in the InversePowerPotential class and in the
+ *  MexicanHatPotential class (used by the LennardJonesPotential and DisplacedEvenPowerPotential classes) operation by
+ *  operation. In particular, the power operator of Python is replaced by the pow function and Python's math.sqrt by the
+ *  sqrt function. The results are therefore bitwise identical to the pure Python implementations on CPython (where
+ *  the power operator and math.sqrt call the same functions of the C math library), apart from the cases where the
+ *  Python code raises an exception.
+ *
+ *  The separation r_ij = r_j - r_i and the direction of motion of the active unit i are given in an arbitrary
+ *  dimension. The separation is not changed.
+ *
+ *  @author The JeLLyFysh organization.
+ *  @bug No known bugs.
+ */
+#include "pair_displacement_kernels.h" // Include declarations.
+
+#include <math.h> // For INFINITY, pow, sqrt.
+#include <string.h> // For memcpy.
+
+/** The exponent two for the squares that Python computes with the power operator. It is volatile because compilers
+ *  otherwise replace pow(x, 2.0) by x * x, which is not always bitwise identical to the pow function of the C math
+ *  library that Python uses. */
+static volatile double square_exponent = 2.0;
+
+
+/** @brief Return the squared euclidean norm of the vector.
+ *
+ *  @param vector The vector.
+ *  @param dimension The dimension of the vector.
+ *  @return The squared norm.
+ */
+static double norm_sq(const double *vector, int dimension) {
+    double result = 0.0;
+    int i;
+    for (i = 0; i < dimension; i++) {
+        result += vector[i] * vector[i];
+    }
+    return result;
+}
+
+
+/** @brief Return the sum of the squared components of the vector except for the given direction.
+ *
+ *  @param vector The vector.
+ *  @param dimension The dimension of the vector.
+ *  @param direction The direction which is omitted.
+ *  @return The sum of the squared components.
+ */
+static double transverse_norm_sq(const double *vector, int dimension, int direction) {
+    double result = 0.0;
+    int i;
+    for (i = 0; i < dimension; i++) {
+        if (i != direction) {
+            result += pow(vector[i], square_exponent);
+        }
+    }
+    return result;
+}
+
+
+/** @brief Return the displacement which has to be subtracted from the given positive component of the vector so that
+ *         the squared norm equals the given squared norm.
+ *
+ *  @param vector The vector.
+ *  @param dimension The dimension of the vector.
+ *  @param new_norm_sq The wanted squared norm.
+ *  @param direction The component of the vector which is changed.
+ *  @param valid Set to zero if the wanted squared norm cannot be reached.
+ *  @return The displacement.
+ */
+static double displacement_until_new_norm_sq_component_positive(const double *vector, int dimension,
+                                                                double new_norm_sq, int direction, int *valid) {
+    double radicand = new_norm_sq - transverse_norm_sq(vector, dimension, direction);
+    if (radicand < 0.0) {
+        *valid = 0;
+        return 0.0;
+    }
+    return vector[direction] - sqrt(radicand);
+}
+
+
+/** @brief Return the displacement which has to be subtracted from the given non-positive component of the vector so
+ *         that the squared norm equals the given squared norm.
+ *
+ *  @param vector The vector.
+ *  @param dimension The dimension of the vector.
+ *  @param new_norm_sq The wanted squared norm.
+ *  @param direction The component of the vector which is changed.
+ *  @return The displacement.
+ */
+static double displacement_until_new_norm_sq_component_negative(const double *vector, int dimension,
+                                                                double new_norm_sq, int direction) {
+    return vector[direction] + sqrt(new_norm_sq - transverse_norm_sq(vector, dimension, direction));
+}
+
+
+/** @brief Return the inverse power potential c_i * c_j * k / |r_ij| ** p.
+ *
+ *  @param prefactor_product The product c_i * c_j * k.
+ *  @param power_over_two The power p divided by two.
+ *  @param separation The separation r_ij.
+ *  @param dimension The dimension of the separation.
+ *  @return The potential.
+ */
+static double inverse_power_potential(double prefactor_product, double power_over_two, const double *separation,
+                                      int dimension) {
+    return prefactor_product / pow(norm_sq(separation, dimension), power_over_two);
+}
+
+
+/** @brief Compute the required displacement in space of the active unit along the positive direction of motion where
+ *         the cumulative event rate of the inverse power potential U_ij = c_i * c_j * k / |r_ij| ** p equals the given
+ *         potential change.
+ *
+ *  See the standard_velocity_displacement method of the InversePowerPotential class.
+ *
+ *  @param prefactor The prefactor k.
+ *  @param charge_product The product c_i * c_j of the charges.
+ *  @param power_over_two The power p divided by two.
+ *  @param two_over_power Two divided by the power p.
+ *  @param separation The separation r_ij.
+ *  @param dimension The dimension of the separation.
+ *  @param direction The direction of motion of the active unit i.
+ *  @param potential_change The sampled potential change.
+ *  @return The displacement, or infinity if the cumulative event rate never reaches the potential change.
+ */
+double inverse_power_displacement(double prefactor, double charge_product, double power_over_two,
+                                  double two_over_power, const double *separation, int dimension, int direction,
+                                  double potential_change) {
+    double prefactor_product = charge_product * prefactor;
+    double current_separation[dimension];
+    double current_potential, maximum_potential, new_norm_sq;
+    double displacement = 0.0;
+    memcpy(current_separation, separation, dimension * sizeof(double));
+    if (prefactor * charge_product > 0) {
+        // Active unit is in front of target unit -> travel downhill
+        if (current_separation[direction] <= 0.0) {
+            return INFINITY;
+        }
+        // Active unit behind of target unit -> travel uphill
+        current_potential = inverse_power_potential(prefactor_product, power_over_two, current_separation, dimension);
+        current_separation[direction] = 0.0;
+        maximum_potential = inverse_power_potential(prefactor_product, power_over_two, current_separation, dimension);
+        current_separation[direction] = separation[direction];
+        if (potential_change < maximum_potential - current_potential) {
+            new_norm_sq = pow(prefactor_product / (current_potential + potential_change), two_over_power);
+            int valid = 1;
+            return displacement_until_new_norm_sq_component_positive(current_separation, dimension, new_norm_sq,
+                                                                     direction, &valid);
+        }
+        return INFINITY;
+    } else {
+        // Active unit behind of target unit -> travel downhill
+        if (current_separation[direction] > 0.0) {
+            displacement += current_separation[direction];
+            current_separation[direction] = 0.0;
+        }
+        current_potential = inverse_power_potential(prefactor_product, power_over_two, current_separation, dimension);
+        // Active unit in front of target unit -> travel downhill
+        if (current_potential + potential_change >= 0.0) {
+            return INFINITY;
+        }
+        new_norm_sq = pow(prefactor_product / (current_potential + potential_change), two_over_power);
+        displacement += displacement_until_new_norm_sq_component_negative(current_separation, dimension, new_norm_sq,
+                                                                          direction);
+        return displacement;
+    }
+}
+
+
+/** @brief Struct that stores the functions and parameters which characterize a mexican hat potential. */
+struct MexicanHat {
+    /** Function that returns the potential for the given separation. */
+    double (*potential)(const struct MexicanHat *hat, const double *separation, int dimension);
+    /** Function that returns the absolute value of the separation r <= r_0 where the potential equals the given one. */
+    double (*invert_potential_inside_minimum)(const struct MexicanHat *hat, double potential);
+    /** Function that returns the absolute value of the separation r >= r_0 where the potential equals the given one. */
+    double (*invert_potential_outside_minimum)(const struct MexicanHat *hat, double potential);
+    /** The general multiplicative prefactor k. */
+    double prefactor;
+    /** The absolute value of the equilibrium separation r_0. */
+    double equilibrium_separation;
+    /** The square of the absolute value of the equilibrium separation r_0. */
+    double equilibrium_separation_squared;
+    /** The characteristic length s of the Lennard-Jones potential. */
+    double characteristic_length;
+    /** The prefactor of the inverse sixth power of the Lennard-Jones potential. */
+    double six_power_prefactor;
+    /** The prefactor of the inverse twelfth power of the Lennard-Jones potential. */
+    double twelve_power_prefactor;
+    /** The power p of the displaced even power potential. */
+    double power;
+    /** The inverse 1 / p of the power of the displaced even power potential. */
+    double inverse_power;
+};
+
+
+static double mexican_hat_displacement_front_inside_sphere(const struct MexicanHat *hat, double *separation,
+                                                           int dimension, int direction, double potential_change);
+
+
+/** @brief Return the displacement of the active unit in front of and outside the potential minimum sphere.
+ *
+ *  See the _displacement_front_outside_sphere method of the MexicanHatPotential class.
+ */
+static double mexican_hat_displacement_front_outside_sphere(const struct MexicanHat *hat, double *separation,
+                                                            int dimension, int direction, double current_potential,
+                                                            double potential_change) {
+    double norm_of_new_separation = hat->invert_potential_outside_minimum(hat, current_potential + potential_change);
+    return displacement_until_new_norm_sq_component_negative(
+        separation, dimension, norm_of_new_separation * norm_of_new_separation, direction);
+}
+
+
+/** @brief Return the displacement of the active unit behind and inside the potential minimum sphere.
+ *
+ *  See the _displacement_behind_inside_sphere method of the MexicanHatPotential class.
+ */
+static double mexican_hat_displacement_behind_inside_sphere(const struct MexicanHat *hat, double *separation,
+                                                            int dimension, int direction, double current_potential,
+                                                            double potential_change) {
+    double stored_component = separation[direction];
+    separation[direction] = 0.0;
+    double maximum_potential_inside = hat->potential(hat, separation, dimension);
+    separation[direction] = stored_component;
+    double potential_difference = maximum_potential_inside - current_potential;
+    double displacement;
+    // Active unit cannot climb potential hill
+    if (potential_change < potential_difference) {
+        double norm_of_new_separation = hat->invert_potential_inside_minimum(hat, current_potential + potential_change);
+        int valid = 1;
+        displacement = displacement_until_new_norm_sq_component_positive(
+            separation, dimension, norm_of_new_separation * norm_of_new_separation, direction, &valid);
+    } else {
+        displacement = separation[direction];
+        separation[direction] = 0.0;
+        potential_change -= potential_difference;
+        displacement += mexican_hat_displacement_front_inside_sphere(hat, separation, dimension, direction,
+                                                                     potential_change);
+    }
+    return displacement;
+}
+
+
+/** @brief Return the displacement of the active unit behind and outside the potential minimum sphere.
+ *
+ *  See the _displacement_behind_outside_sphere method of the MexicanHatPotential class.
+ */
+static double mexican_hat_displacement_behind_outside_sphere(const struct MexicanHat *hat, double *separation,
+                                                             int dimension, int direction, double potential_change) {
+    int valid = 1;
+    double displacement = displacement_until_new_norm_sq_component_positive(
+        separation, dimension, hat->equilibrium_separation_squared, direction, &valid);
+    double current_potential;
+    // Active unit can reach potential minimum sphere
+    if (valid) {
+        separation[direction] -= displacement;
+        current_potential = hat->potential(hat, separation, dimension);
+        displacement += mexican_hat_displacement_behind_inside_sphere(hat, separation, dimension, direction,
+                                                                      current_potential, potential_change);
+    // Active unit cannot reach potential minimum sphere
+    } else {
+        displacement = separation[direction];
+        separation[direction] = 0.0;
+        current_potential = hat->potential(hat, separation, dimension);
+        displacement += mexican_hat_displacement_front_outside_sphere(hat, separation, dimension, direction,
+                                                                      current_potential, potential_change);
+    }
+    return displacement;
+}
+
+
+/** @brief Return the displacement of the active unit in front of and inside the potential minimum sphere.
+ *
+ *  See the _displacement_front_inside_sphere method of the MexicanHatPotential class.
+ */
+static double mexican_hat_displacement_front_inside_sphere(const struct MexicanHat *hat, double *separation,
+                                                           int dimension, int direction, double potential_change) {
+    double displacement = displacement_until_new_norm_sq_component_negative(
+        separation, dimension, hat->equilibrium_separation_squared, direction);
+    separation[direction] -= displacement;
+    // Use the sampled potential change to travel uphill
+    double current_potential = hat->potential(hat, separation, dimension);
+    displacement += mexican_hat_displacement_front_outside_sphere(hat, separation, dimension, direction,
+                                                                  current_potential, potential_change);
+    return displacement;
+}
+
+
+/** @brief Return the displacement of the active unit where the cumulative event rate of the mexican hat potential
+ *         equals the given potential change.
+ *
+ *  See the standard_velocity_displacement method of the MexicanHatPotential class.
+ *
+ *  @param hat The mexican hat potential.
+ *  @param separation The separation r_ij.
+ *  @param dimension The dimension of the separation.
+ *  @param direction The direction of motion of the active unit i.
+ *  @param potential_change The sampled potential change.
+ *  @return The displacement.
+ */
+static double mexican_hat_displacement(const struct MexicanHat *hat, const double *separation, int dimension,
+                                       int direction, double potential_change) {
+    double current_separation[dimension];
+    double current_potential;
+    memcpy(current_separation, separation, dimension * sizeof(double));
+    double norm_of_separation = pow(norm_sq(current_separation, dimension), 0.5);
+    // Active unit is outside of the minimum potential shell
+    if (norm_of_separation >= hat->equilibrium_separation) {
+        // Active unit is in front of target unit
+        if (current_separation[direction] <= 0.0) {
+            current_potential = hat->potential(hat, current_separation, dimension);
+            return mexican_hat_displacement_front_outside_sphere(hat, current_separation, dimension, direction,
+                                                                 current_potential, potential_change);
+        }
+        // Active unit is behind of target unit
+        return mexican_hat_displacement_behind_outside_sphere(hat, current_separation, dimension, direction,
+                                                              potential_change);
+    }
+    // Active unit is inside of the minimum potential shell
+    // Active unit is in front of target unit
+    if (current_separation[direction] <= 0.0) {
+        return mexican_hat_displacement_front_inside_sphere(hat, current_separation, dimension, direction,
+                                                            potential_change);
+    }
+    // Active unit is behind of target unit
+    current_potential = hat->potential(hat, current_separation, dimension);
+    return mexican_hat_displacement_behind_inside_sphere(hat, current_separation, dimension, direction,
+                                                         current_potential, potential_change);
+}
+
+
+/** @brief Return the Lennard-Jones potential for the given separation (see the LennardJonesPotential class). */
+static double lennard_jones_potential(const struct MexicanHat *hat, const double *separation, int dimension) {
+    return (inverse_power_potential(1.0 * hat->six_power_prefactor, 3.0, separation, dimension)
+            + inverse_power_potential(1.0 * hat->twelve_power_prefactor, 6.0, separation, dimension));
+}
+
+
+/** @brief Return the absolute value of the separation r <= r_0 where the Lennard-Jones potential equals the given
+ *         potential (see the LennardJonesPotential class). */
+static double lennard_jones_invert_potential_inside_minimum(const struct MexicanHat *hat, double potential) {
+    double sigma_over_r_six = (1 + pow(1 + 4 * potential / hat->prefactor, 0.5)) / 2;
+    return hat->characteristic_length / pow(sigma_over_r_six, 1.0 / 6.0);
+}
+
+
+/** @brief Return the absolute value of the separation r >= r_0 where the Lennard-Jones potential equals the given
+ *         potential (see the LennardJonesPotential class). */
+static double lennard_jones_invert_potential_outside_minimum(const struct MexicanHat *hat, double potential) {
+    if (potential >= 0.0) {
+        return INFINITY;
+    }
+    double sigma_over_r_six = (1 - pow(1 + 4 * potential / hat->prefactor, 0.5)) / 2;
+    return hat->characteristic_length / pow(sigma_over_r_six, 1.0 / 6.0);
+}
+
+
+/** @brief Compute the required displacement in space of the active unit along the positive direction of motion where
+ *         the cumulative event rate of the Lennard-Jones potential U_ij = k * ((s/|r_ij|) ** 12 - (s/|r_ij|) ** 6)
+ *         equals the given potential change.
+ *
+ *  See the standard_velocity_displacement method of the MexicanHatPotential class and the LennardJonesPotential
+ *  class.
+ *
+ *  @param prefactor The prefactor k.
+ *  @param equilibrium_separation The equilibrium separation r_0 = s * 2 ** (1/6).
+ *  @param equilibrium_separation_squared The square of the equilibrium separation r_0.
+ *  @param characteristic_length The characteristic length s.
+ *  @param six_power_prefactor The prefactor -k * s ** 6 of the inverse sixth power.
+ *  @param twelve_power_prefactor The prefactor k * s ** 12 of the inverse twelfth power.
+ *  @param separation The separation r_ij.
+ *  @param dimension The dimension of the separation.
+ *  @param direction The direction of motion of the active unit i.
+ *  @param potential_change The sampled potential change.
+ *  @return The displacement, or infinity if the cumulative event rate never reaches the potential change.
+ */
+double lennard_jones_displacement(double prefactor, double equilibrium_separation,
+                                  double equilibrium_separation_squared, double characteristic_length,
+                                  double six_power_prefactor, double twelve_power_prefactor, const double *separation,
+                                  int dimension, int direction, double potential_change) {
+    struct MexicanHat hat = {lennard_jones_potential, lennard_jones_invert_potential_inside_minimum,
+                             lennard_jones_invert_potential_outside_minimum, prefactor, equilibrium_separation,
+                             equilibrium_separation_squared, characteristic_length, six_power_prefactor,
+                             twelve_power_prefactor, 0.0, 0.0};
+    return mexican_hat_displacement(&hat, separation, dimension, direction, potential_change);
+}
+
+
+/** @brief Return the displaced even power potential for the given separation (see the DisplacedEvenPowerPotential
+ *         class). */
+static double displaced_even_power_potential(const struct MexicanHat *hat, const double *separation, int dimension) {
+    double distance_from_minimum = pow(norm_sq(separation, dimension), 0.5) - hat->equilibrium_separation;
+    return hat->prefactor * pow(distance_from_minimum, hat->power);
+}
+
+
+/** @brief Return the absolute value of the separation r <= r_0 where the displaced even power potential equals the
+ *         given potential (see the DisplacedEvenPowerPotential class). */
+static double displaced_even_power_invert_potential_inside_minimum(const struct MexicanHat *hat, double potential) {
+    return hat->equilibrium_separation - pow(potential / hat->prefactor, hat->inverse_power);
+}
+
+
+/** @brief Return the absolute value of the separation r >= r_0 where the displaced even power potential equals the
+ *         given potential (see the DisplacedEvenPowerPotential class). */
+static double displaced_even_power_invert_potential_outside_minimum(const struct MexicanHat *hat, double potential) {
+    return hat->equilibrium_separation + pow(potential / hat->prefactor, hat->inverse_power);
+}
+
+
+/** @brief Compute the required displacement in space of the active unit along the positive direction of motion where
+ *         the cumulative event rate of the displaced even power potential U_ij = k * (|r_ij| - r_0) ** p equals the
+ *         given potential change.
+ *
+ *  See the standard_velocity_displacement method of the MexicanHatPotential class and the
+ *  DisplacedEvenPowerPotential class.
+ *
+ *  @param prefactor The prefactor k.
+ *  @param equilibrium_separation The equilibrium separation r_0.
+ *  @param equilibrium_separation_squared The square of the equilibrium separation r_0.
+ *  @param power The power p.
+ *  @param inverse_power The inverse 1 / p of the power.
+ *  @param separation The separation r_ij.
+ *  @param dimension The dimension of the separation.
+ *  @param direction The direction of motion of the active unit i.
+ *  @param potential_change The sampled potential change.
+ *  @return The displacement.
+ */
+double displaced_even_power_displacement(double prefactor, double equilibrium_separation,
+                                         double equilibrium_separation_squared, double power, double inverse_power,
+                                         const double *separation, int dimension, int direction,
+                                         double potential_change) {
+    struct MexicanHat hat = {displaced_even_power_potential, displaced_even_power_invert_potential_inside_minimum,
+                             displaced_even_power_invert_potential_outside_minimum, prefactor, equilibrium_separation,
+                             equilibrium_separation_squared, 0.0, 0.0, 0.0, power, inverse_power};
+    return mexican_hat_displacement(&hat, separation, dimension, direction, potential_change);
+}
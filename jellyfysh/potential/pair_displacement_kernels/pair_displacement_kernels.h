@@ -0,0 +1,48 @@
+/************************************************************************************************************************
+ * JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh                  *
+ * Copyright (C) 2019, 2022 The JeLLyFysh organization                                                                  *
+ * (See the AUTHORS.md file for the full list of authors.)                                                              *
+ *                                                                                                                      *
+ * This file is part of JeLLyFysh.                                                                                      *
+ *                                                                                                                      *
+ * JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public       *
+ * License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later *
+ * version.                                                                                                             *
+ *                                                                                                                      *
+ * JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied      *
+ * warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more        *
+ * details.                                                                                                             *
+ *                                                                                                                      *
+ * You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.          *
+ * If not, see <https://www.gnu.org/licenses/>.                                                                         *
+ *                                                                                                                      *
+ * If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):  *
+ * Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,                                    *
+ * JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,                                   *
+ * Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.               *
+ ************************************************************************************************************************/
+
+/** @file pair_displacement_kernels.h
+ *  @brief Declarations of functions to compute the required displacement in space along a positive cartesian direction
+ *         where the cumulative event rate of the inverse power, the Lennard-Jones, or the displaced even power pair
+ *         potential equals a sampled potential change.
+ *
+ *  @author The JeLLyFysh organization.
+ *  @bug No known bugs.
+ */
+#ifndef PAIR_DISPLACEMENT_KERNELS_H
+#define PAIR_DISPLACEMENT_KERNELS_H
+
+double inverse_power_displacement(double prefactor, double charge_product, double power_over_two,
+                                  double two_over_power, const double *separation, int dimension, int direction,
+                                  double potential_change);
+double lennard_jones_displacement(double prefactor, double equilibrium_separation,
+                                  double equilibrium_separation_squared, double characteristic_length,
+                                  double six_power_prefactor, double twelve_power_prefactor, const double *separation,
+                                  int dimension, int direction, double potential_change);
+double displaced_even_power_displacement(double prefactor, double equilibrium_separation,
+                                         double equilibrium_separation_squared, double power, double inverse_power,
+                                         const double *separation, int dimension, int direction,
+                                         double potential_change);
+
+#endif // PAIR_DISPLACEMENT_KERNELS_H
@@ -19,8 +19,12 @@
 # JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
-"""Executable script which runs the JeLLyFysh application based on a dump file created by the DumpingOutputHandler."""
+"""
+Executable script which runs the JeLLyFysh application based on a dump file created by the DumpingOutputHandler or on a
+checkpoint file created by the CheckpointOutputHandler.
+"""
 from argparse import ArgumentParser, Namespace
+import logging
 import platform
 import random
 import sys
@@ -28,7 +32,11 @@ import time
 from typing import Sequence
 import dill
 from jellyfysh.base.exceptions import EndOfRun
+from jellyfysh.base.startup_report import StartupReport
 import jellyfysh.base.uuid as uuid
+from jellyfysh.input_output_handler.checkpoint_format import (is_checkpoint_file, read_checkpoint_file,
+                                                              read_checkpoint_metadata)
+from jellyfysh.mediator import Mediator
 from jellyfysh.run import add_general_parser_arguments, print_start_message, set_up_logging
 import jellyfysh.setting as setting
 
@@ -53,36 +61,78 @@ def parse_options(args: Sequence[str]) -> Namespace:
     argparse.Namespace
         The populated argparse namespace.
     """
-    parser = ArgumentParser(description="Resume a run of the JeLLyFysh application based on a dumped data file.")
-    parser.add_argument("dumping_file", help="specify the dumped data file")
+    parser = ArgumentParser(description="Resume a run of the JeLLyFysh application based on a dumped data file or a "
+                                        "checkpoint file.")
+    parser.add_argument("dumping_file", help="specify the dumped data file or the checkpoint file")
     parser.add_argument('--no-output', action='store_true', help='deactivate output of all output handlers')
     add_general_parser_arguments(parser)
     return parser.parse_args(args)
 
 
+def load_dumping_file(dumping_file: str, logger: logging.Logger) -> Mediator:
+    """
+    Load the mediator of a dumping file and restore the setting package, the run identification hash and the state of
+    the random module.
+
+    The dumping file is read using dill. If the file is a checkpoint file of the CheckpointOutputHandler, it is read
+    together with its static file using the input_output_handler.checkpoint_format module instead. A warning is logged
+    if the checkpoint was written with a different python implementation or version.
+
+    Parameters
+    ----------
+    dumping_file : str
+        The filename of the dumping file or the checkpoint file.
+    logger : logging.Logger
+        The logger.
+
+    Returns
+    -------
+    mediator.Mediator
+        The restored mediator.
+    """
+    if is_checkpoint_file(dumping_file):
+        metadata = read_checkpoint_metadata(dumping_file)
+        if (metadata["python_implementation"] != platform.python_implementation()
+                or metadata["python_version"] != platform.python_version()):
+            logger.warning("The checkpoint file was written with {0} {1} but is read with {2} {3}."
+                           .format(metadata["python_implementation"], metadata["python_version"],
+                                   platform.python_implementation(), platform.python_version()))
+        (mediator, dumped_setting, dumped_uuid, dumped_random_state), _ = read_checkpoint_file(dumping_file)
+    else:
+        with open(dumping_file, "rb") as file:
+            mediator, dumped_setting, dumped_uuid, dumped_random_state = dill.load(file)
+    mediator.update_logging()
+    setting.__dict__.update(dumped_setting.__dict__)
+    uuid.__dict__.update(dumped_uuid.__dict__)
+    random.setstate(dumped_random_state)
+    return mediator
+
+
 def main() -> None:
     """
     Use the command line argument to resume a dumped run of the JeLLyFysh application.
 
     First the command line arguments are parsed, and then the logging is set up. The dumping file specified in the
-    argument strings is then read using dill.
-    Based on the dumping file, the setting package is initialized, the mediator is restored and the state of the random
-    module is set.
+    argument strings is then loaded with the load_dumping_file function. Based on the dumping file, the setting package
+    is initialized, the mediator is restored and the state of the random module is set. If requested, a report of the
+    imports and the duration of the loading is written afterwards.
     The run method of the mediator is executed until an EndOfRun exception is raised. This invokes the post_run method
     of the mediator and ends the resumed run of the application.
     """
     print_start_message()
 
     args = parse_options(sys.argv[1:])
+    startup_report = StartupReport()
+    if args.startup_report:
+        startup_report.start()
     logger = set_up_logging(args)
 
     logger.info("Resuming run based on the dumping file {0}.".format(args.dumping_file))
-    with open(args.dumping_file, "rb") as file:
-        mediator, dumped_setting, dumped_uuid, dumped_random_state = dill.load(file)
-    mediator.update_logging()
-    setting.__dict__.update(dumped_setting.__dict__)
-    uuid.__dict__.update(dumped_uuid.__dict__)
-    random.setstate(dumped_random_state)
+    with startup_report.phase("loading of the dumping file"):
+        mediator = load_dumping_file(args.dumping_file, logger)
+    if args.startup_report:
+        startup_report.stop()
+        startup_report.write()
 
     logger.info("Run identification hash: {0}".format(uuid.get_uuid()))
     logger.info("Underlying platform (determined via platform.platform(aliased=True): {0}"
@@ -29,6 +29,9 @@ import time
 from typing import Sequence
 from jellyfysh.base.exceptions import EndOfRun
 from jellyfysh.base import factory
+from jellyfysh.base.plan_file import (is_plan_file, override_config, override_plans, read_plan_file,
+                                      static_data_filename, StaticData)
+from jellyfysh.base.startup_report import StartupReport
 from jellyfysh.base.strings import to_camel_case
 from jellyfysh.base.uuid import get_uuid
 import jellyfysh.version as version
@@ -43,8 +46,10 @@ def add_general_parser_arguments(parser: ArgumentParser) -> None:
     2. --verbose, -v: Increase verbosity of logging messages. Multiple -v options increase the verbosity. The maximum
     is 2.
     3. --logfile LOGFILE, -l LOGFILE: Specify the logging file.
+    4. --startup-report: Write a report of the imported modules and the durations of the setup phases to stderr
+    before the run starts.
     Per default, also the following argument is added:
-    4. --help, -h: Show the help message and exit.
+    5. --help, -h: Show the help message and exit.
 
     Parameters
     ----------
@@ -57,6 +62,26 @@ def add_general_parser_arguments(parser: ArgumentParser) -> None:
                         help="increase verbosity of logging messages "
                              "(multiple -v options increase the verbosity, the maximum is 2)")
     parser.add_argument("-l", "--logfile", action="store", help="specify the logging file")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="write a report of the imported modules (in the format of python -X importtime) and the "
+                             "durations of the setup phases to stderr before the run starts")
+
+
+def add_override_parser_argument(parser: ArgumentParser) -> None:
+    """
+    Add the --set SECTION.OPTION=VALUE parser argument to the command line argument parser.
+
+    The argument can be given several times. Each argument overrides a single option in a section of the configuration
+    file (see base.plan_file.override_config function). The overrides are stored in the overrides attribute of the
+    argparse namespace.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The argument parser.
+    """
+    parser.add_argument("--set", action="append", default=[], dest="overrides", metavar="SECTION.OPTION=VALUE",
+                        help="override an option in a section of the configuration file (can be given several times)")
 
 
 def parse_options(args: Sequence[str]) -> Namespace:
@@ -65,8 +90,9 @@ def parse_options(args: Sequence[str]) -> Namespace:
     namespace.
 
     The argument strings can for example be sys.argv[1:] in order to parse the command line arguments. The argument
-    parser parses the arguments specified in the add_general_parser_arguments function. This function also adds the
-    configuration file as a required positional argument.
+    parser parses the arguments specified in the add_general_parser_arguments and the add_override_parser_argument
+    functions. This function also adds the configuration file as a required positional argument. Instead of a
+    configuration file, also a construction plan file created by jellyfysh-compile can be given.
 
     Parameters
     ----------
@@ -79,7 +105,9 @@ def parse_options(args: Sequence[str]) -> Namespace:
         The populated argparse namespace.
     """
     parser = ArgumentParser(description="Run the JeLLyFysh application based on a configuration file.")
-    parser.add_argument("config_file", help="specify the path to the configuration file of the run")
+    parser.add_argument("config_file", help="specify the path to the configuration file or the construction plan file "
+                                            "of the run")
+    add_override_parser_argument(parser)
     add_general_parser_arguments(parser)
     return parser.parse_args(args)
 
@@ -151,6 +179,23 @@ def read_config(config_file: str) -> ConfigParser:
     return config
 
 
+def warn_about_unused_sections(config: ConfigParser, logger: logging.Logger) -> None:
+    """
+    Log a warning for every section of the configuration that was not used by the factory.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The parsed configuration file.
+    logger : logging.Logger
+        The logger.
+    """
+    used_sections = factory.used_sections
+    for section in config.sections():
+        if section not in used_sections and section != "Run":
+            logger.warning("The section {0} in the .ini file has not been used!".format(section))
+
+
 def print_start_message() -> None:
     """Print the start message which includes the copyright."""
     print("JeLLFysh (version {0}) - a Python application for all-atom event-chain Monte Carlo - "
@@ -163,14 +208,21 @@ def main() -> None:
     Use the command line arguments to run the JeLLyFysh application.
 
     First the command line arguments are parsed, and then the logging is set up. Afterwards, the configuration file
-    specified in the command line is parsed. Based on the configuration file, the setting package is initialized and the
-    mediator is constructed by the JeLLyFysh factory.
+    specified in the command line is parsed and the overrides of its options are applied. Based on the configuration
+    file, the setting package is initialized and the mediator is constructed by the JeLLyFysh factory. If a
+    construction plan file is given instead, the setting package and the mediator are constructed from the
+    construction plans, and the bounds of the estimators are cached in the static data file of the construction plan
+    file (see base.plan_file module). If requested, a report of the imports and the durations of these setup phases is
+    written before the run starts.
     The run method of the mediator is executed until an EndOfRun exception is raised. This invokes the post_run method
     of the mediator and ends the run of the application.
     """
     print_start_message()
 
     args = parse_options(sys.argv[1:])
+    startup_report = StartupReport()
+    if args.startup_report:
+        startup_report.start()
     logger = set_up_logging(args)
 
     logger.info("Run identification hash: {0}".format(get_uuid()))
@@ -178,14 +230,29 @@ def main() -> None:
                 .format(platform.platform(aliased=True)))
 
     logger.info("Setting up the run based on the configuration file {0}.".format(args.config_file))
-    config = read_config(args.config_file)
-    factory.build_from_config(config, to_camel_case(config.get("Run", "setting")), "jellyfysh.setting")
-    mediator = factory.build_from_config(config, to_camel_case(config.get("Run", "mediator")),
-                                         "jellyfysh.mediator")
-    used_sections = factory.used_sections
-    for section in config.sections():
-        if section not in used_sections and section != "Run":
-            logger.warning("The section {0} in the .ini file has not been used!".format(section))
+    if is_plan_file(args.config_file):
+        with startup_report.phase("reading of the construction plan file"):
+            config, setting_plan, mediator_plan = read_plan_file(args.config_file)
+            setting_plan, mediator_plan = override_plans(config, [setting_plan, mediator_plan], args.overrides)
+            static_data = StaticData(static_data_filename(args.config_file), setting_plan)
+        with startup_report.phase("construction of the setting"):
+            factory.build_from_plan(setting_plan)
+        with startup_report.phase("construction of the mediator"):
+            mediator = factory.build_from_plan(mediator_plan, static_data.object_built)
+        static_data.write()
+    else:
+        with startup_report.phase("reading of the configuration file"):
+            config = read_config(args.config_file)
+            override_config(config, args.overrides)
+        with startup_report.phase("construction of the setting"):
+            factory.build_from_config(config, to_camel_case(config.get("Run", "setting")), "jellyfysh.setting")
+        with startup_report.phase("construction of the mediator"):
+            mediator = factory.build_from_config(config, to_camel_case(config.get("Run", "mediator")),
+                                                 "jellyfysh.mediator")
+        warn_about_unused_sections(config, logger)
+    if args.startup_report:
+        startup_report.stop()
+        startup_report.write()
 
     logger.info("Running the event-chain Monte Carlo simulation.")
     start_time = time.time()
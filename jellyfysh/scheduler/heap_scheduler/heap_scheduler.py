@@ -211,6 +211,25 @@ class HeapScheduler(Scheduler):
         """
         self._minimal_valid_counter[event_handler] = self._minimal_valid_counter.get(event_handler, 0) + 1
 
+    def release_event_handler(self, event_handler: Any) -> None:
+        """
+        Release all resources that the scheduler keeps for the given event handler.
+
+        Extends the release_event_handler method of the abstract Scheduler class. Since the events of the event handler
+        were only lazily deleted, they are now removed from the binary min heap. Afterwards, the handle and the counter
+        of the event handler are deleted so that the event handler can be garbage collected.
+
+        Parameters
+        ----------
+        event_handler : Any
+            The event handler.
+        """
+        super().release_event_handler(event_handler)
+        handle = self._event_handler_handles.pop(event_handler, None)
+        if handle is not None:
+            _lib_delete_events(self._heap, handle)
+        self._minimal_valid_counter.pop(event_handler, None)
+
     def update_logging(self) -> None:
         """
         Update the logging of this class.
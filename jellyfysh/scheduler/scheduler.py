@@ -87,6 +87,21 @@ class Scheduler(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def release_event_handler(self, event_handler: Any) -> None:
+        """
+        Release all resources that the scheduler keeps for the given associated object.
+
+        The mediator calls this method after the activator released an event handler which will not be pushed into the
+        scheduler anymore. All events of the associated object were already trashed. Per default, this method does
+        nothing.
+
+        Parameters
+        ----------
+        event_handler : Any
+            The associated object.
+        """
+        pass
+
     @abstractmethod
     def update_logging(self) -> None:
         """
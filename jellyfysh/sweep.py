@@ -0,0 +1,419 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+"""
+Executable script which runs the JeLLyFysh application for a grid of parameters on a local process pool.
+"""
+from argparse import ArgumentParser, Namespace
+from configparser import ConfigParser
+import contextlib
+import hashlib
+from importlib import import_module
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+from typing import Any, Dict, List, Sequence
+from jellyfysh.base.exceptions import ConfigurationError, EndOfRun
+from jellyfysh.base import factory
+from jellyfysh.base.factory import ConstructionPlan
+from jellyfysh.base.plan_file import is_plan_file, override_plans, read_plan_file, StaticData
+from jellyfysh.base.startup_report import StartupReport
+from jellyfysh.base.strings import to_camel_case
+from jellyfysh.input_output_handler.output_handler.mediator_dumping_output_handler import MediatorDumpingOutputHandler
+from jellyfysh.resume import load_dumping_file
+from jellyfysh.run import (add_general_parser_arguments, add_override_parser_argument, print_start_message,
+                           read_config, set_up_logging, warn_about_unused_sections)
+
+
+_grid_pattern = re.compile(r"(\w+\.\w+)=(.*)", re.DOTALL)
+
+
+class SweepRun(object):
+    """
+    A single run of a parameter sweep.
+
+    The run is specified by the construction plans of the setting and the mediator, where the overrides of the run are
+    already applied. The filenames of all output handlers are redirected into the directory of the run, which is
+    named after the configuration hash of the run. The directory also contains the status file run.json and the
+    file stdout.txt into which the standard output of the run is redirected.
+
+    Runs whose estimators and setting have the same construction plans share a static data file (see
+    base.plan_file.StaticData class) in which the bounds of the estimators are cached. The first run which constructs
+    its mediator determines the bounds, and all other runs reuse them.
+    """
+
+    def __init__(self, overrides: Sequence[str], directory: str, configuration_hash: str,
+                 setting_plan: ConstructionPlan, mediator_plan: ConstructionPlan, static_data_filename: str,
+                 dumping_filenames: Sequence[str]) -> None:
+        """
+        The constructor of the SweepRun class.
+
+        Parameters
+        ----------
+        overrides : Sequence[str]
+            The overrides of the run in the form 'Section.option=value'.
+        directory : str
+            The output directory of the run.
+        configuration_hash : str
+            The configuration hash of the run.
+        setting_plan : base.factory.ConstructionPlan
+            The construction plan of the setting.
+        mediator_plan : base.factory.ConstructionPlan
+            The construction plan of the mediator.
+        static_data_filename : str
+            The filename of the static data file.
+        dumping_filenames : Sequence[str]
+            The filenames of the dumping files of the run that can be used to resume it.
+        """
+        self.overrides = list(overrides)
+        self.directory = directory
+        self.configuration_hash = configuration_hash
+        self.setting_plan = setting_plan
+        self.mediator_plan = mediator_plan
+        self.static_data_filename = static_data_filename
+        self.dumping_filenames = list(dumping_filenames)
+
+    @property
+    def status_filename(self) -> str:
+        """
+        Return the filename of the status file of the run.
+
+        Returns
+        -------
+        str
+            The filename of the status file.
+        """
+        return os.path.join(self.directory, "run.json")
+
+    def read_status(self) -> str:
+        """
+        Return the status of the run that is stored in the status file.
+
+        Returns
+        -------
+        str
+            'finished' if the run was finished, 'started' if it was started, or 'new' if there is no status file.
+        """
+        if not os.path.exists(self.status_filename):
+            return "new"
+        with open(self.status_filename, "r") as file:
+            return json.load(file)["status"]
+
+    def _write_status(self, status: str) -> None:
+        """Write the status together with the overrides and the configuration hash into the status file."""
+        with open(self.status_filename + ".tmp", "w") as file:
+            json.dump({"status": status, "configuration_hash": self.configuration_hash, "overrides": self.overrides},
+                      file, indent=4)
+        os.replace(self.status_filename + ".tmp", self.status_filename)
+
+    def execute(self, static_data_lock: Any) -> str:
+        """
+        Execute the run in the current process.
+
+        If the run was already finished, it is skipped. If it was started and one of its dumping files exists, the
+        run is resumed from the most recently modified dumping file. Otherwise, the setting package and the mediator are
+        constructed from the construction plans while the static data lock is held. By this, runs that share a static
+        data file wait for each other to determine the bounds of the estimators only once.
+
+        Parameters
+        ----------
+        static_data_lock : Any
+            The lock of the static data file, which provides the context manager protocol.
+
+        Returns
+        -------
+        str
+            'skipped', 'resumed' or 'finished'.
+        """
+        status = self.read_status()
+        if status == "finished":
+            return "skipped"
+        os.makedirs(self.directory, exist_ok=True)
+        existing_dumping_filenames = ([filename for filename in self.dumping_filenames if os.path.exists(filename)]
+                                      if status == "started" else [])
+        self._write_status("started")
+        with open(os.path.join(self.directory, "stdout.txt"), "a") as file, contextlib.redirect_stdout(file):
+            if existing_dumping_filenames:
+                mediator = load_dumping_file(max(existing_dumping_filenames, key=os.path.getmtime),
+                                             logging.getLogger(__name__))
+                result = "resumed"
+            else:
+                with static_data_lock:
+                    static_data = StaticData(self.static_data_filename, self.setting_plan)
+                    factory.build_from_plan(self.setting_plan)
+                    mediator = factory.build_from_plan(self.mediator_plan, static_data.object_built)
+                    static_data.write()
+                result = "finished"
+            try:
+                mediator.run()
+            except EndOfRun:
+                pass
+            mediator.post_run()
+        self._write_status("finished")
+        return result
+
+
+def _execute_run(run: SweepRun, static_data_lock: Any) -> str:
+    """Execute the run in a process of the pool and log the traceback of a raised exception."""
+    try:
+        return run.execute(static_data_lock)
+    except Exception:
+        logging.getLogger(__name__).exception("The run in the directory {0} failed.".format(run.directory))
+        raise
+
+
+def parse_grid(grid: Sequence[str]) -> List[List[str]]:
+    """
+    Return the overrides of all runs of a parameter grid.
+
+    Each entry of the grid is a string of the form 'Section.option=value_1,value_2,...'. The runs are given by the
+    cartesian product of the values of all entries, where the values of the last entry change fastest. Options whose
+    values contain commas can therefore not be varied in the grid. Without any entry, a single run without overrides
+    is returned.
+
+    Parameters
+    ----------
+    grid : Sequence[str]
+        The entries of the grid.
+
+    Returns
+    -------
+    List[List[str]]
+        The overrides of the form 'Section.option=value' of every run.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If an entry is not of the form 'Section.option=value_1,value_2,...'.
+    """
+    overrides_of_entries = []
+    for entry in grid:
+        entry_match = _grid_pattern.fullmatch(entry)
+        if entry_match is None:
+            raise ConfigurationError("The grid entry '{0}' is not of the form 'Section.option=value_1,value_2,...'."
+                                     .format(entry))
+        section_and_option, values = entry_match.groups()
+        overrides_of_entries.append(["{0}={1}".format(section_and_option, value.strip())
+                                     for value in values.split(",")])
+    return [list(overrides) for overrides in itertools.product(*overrides_of_entries)]
+
+
+def _hash(*plans: ConstructionPlan) -> str:
+    """Return the SHA-256 hash of the representation of the construction plans."""
+    return hashlib.sha256(repr(plans).encode("utf-8")).hexdigest()
+
+
+def _copy_config(config: ConfigParser) -> ConfigParser:
+    """Return a copy of the configuration."""
+    copied_config = ConfigParser()
+    copied_config.read_dict({section: dict(config.items(section, raw=True)) for section in config.sections()})
+    return copied_config
+
+
+def create_runs(config: ConfigParser, setting_plan: ConstructionPlan, mediator_plan: ConstructionPlan,
+                overrides_of_runs: Sequence[Sequence[str]], directory: str) -> List[SweepRun]:
+    """
+    Create the runs of a parameter sweep.
+
+    For each run, the overrides are applied to the construction plans of the setting and the mediator. The
+    configuration hash of a run is the SHA-256 hash of the resulting construction plans. Runs with equal configuration
+    hashes are only created once. The output directory of a run is given by the first 16 characters of its
+    configuration hash within the given directory. The filenames of all output handlers are redirected into this
+    directory. The static data file of a run is given by the hash of the construction plans of the setting and all
+    estimators.
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The configuration of the construction plans.
+    setting_plan : base.factory.ConstructionPlan
+        The construction plan of the setting.
+    mediator_plan : base.factory.ConstructionPlan
+        The construction plan of the mediator.
+    overrides_of_runs : Sequence[Sequence[str]]
+        The overrides of the form 'Section.option=value' of every run.
+    directory : str
+        The directory of the sweep.
+
+    Returns
+    -------
+    List[SweepRun]
+        The runs.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If an override is invalid.
+    """
+    runs = []
+    configuration_hashes = set()
+    for overrides in overrides_of_runs:
+        run_config = _copy_config(config)
+        run_setting_plan, run_mediator_plan = override_plans(run_config, [setting_plan, mediator_plan], overrides)
+        configuration_hash = _hash(run_setting_plan, run_mediator_plan)
+        if configuration_hash in configuration_hashes:
+            logging.getLogger(__name__).warning("The overrides {0} do not change the configuration of a previous run."
+                                                .format(overrides))
+            continue
+        configuration_hashes.add(configuration_hash)
+        run_directory = os.path.join(directory, configuration_hash[:16])
+        output_handler_plans = [plan for plan in run_mediator_plan.yield_plans()
+                                if plan.module_name.startswith("jellyfysh.input_output_handler.output_handler.")
+                                and "filename" in plan.arguments]
+        run_mediator_plan, = override_plans(
+            run_config, [run_mediator_plan],
+            ["{0}.filename={1}".format(plan.section, os.path.join(run_directory, os.path.basename(
+                plan.arguments["filename"]))) for plan in output_handler_plans])
+        dumping_filenames = []
+        for plan in run_mediator_plan.yield_plans():
+            class_object = getattr(import_module(plan.module_name), plan.class_name)
+            if isinstance(class_object, type) and issubclass(class_object, MediatorDumpingOutputHandler):
+                dumping_filenames.append(class_object.dumping_filename(plan.arguments["filename"]))
+        estimator_plans = [plan for plan in run_mediator_plan.yield_plans()
+                           if plan.module_name.startswith("jellyfysh.estimator.")]
+        static_data_filename = os.path.join(directory, "static_{0}.dat".format(
+            _hash(run_setting_plan, *estimator_plans)[:16]))
+        runs.append(SweepRun(overrides, run_directory, configuration_hash, run_setting_plan, run_mediator_plan,
+                             static_data_filename, dumping_filenames))
+    return runs
+
+
+def parse_options(args: Sequence[str]) -> Namespace:
+    """
+    Convert argument strings to objects and assign them as attributes of the argparse namespace. Return the populated
+    namespace.
+
+    The argument strings can for example be sys.argv[1:] in order to parse the command line arguments. The argument
+    parser parses the arguments specified in the add_general_parser_arguments and the add_override_parser_argument
+    functions in run.py. The overrides apply to all runs. This function also adds the configuration file as a
+    required positional argument, and the --grid, --directory and --processes options.
+
+    Parameters
+    ----------
+    args : Sequence[str]
+        The argument strings.
+
+    Returns
+    -------
+    argparse.Namespace
+        The populated argparse namespace.
+    """
+    parser = ArgumentParser(description="Run the JeLLyFysh application for a grid of parameters on a local process "
+                                        "pool.")
+    parser.add_argument("config_file", help="specify the path to the configuration file or the construction plan file")
+    parser.add_argument("--grid", action="append", default=[], metavar="SECTION.OPTION=VALUE_1,VALUE_2,...",
+                        help="vary an option in a section of the configuration file over the given values (can be "
+                             "given several times, the runs are given by the cartesian product of all values)")
+    parser.add_argument("-d", "--directory", action="store", default="sweep",
+                        help="specify the directory of the sweep which contains the output directories of all runs "
+                             "(default: sweep)")
+    parser.add_argument("-p", "--processes", action="store", type=int, default=os.cpu_count() or 1,
+                        help="specify the number of processes of the pool (default: the number of CPUs)")
+    add_override_parser_argument(parser)
+    add_general_parser_arguments(parser)
+    return parser.parse_args(args)
+
+
+def main() -> None:
+    """
+    Use the command line arguments to run the JeLLyFysh application for a grid of parameters.
+
+    First the command line arguments are parsed, and then the logging is set up. Afterwards, the configuration file
+    specified in the command line is parsed and the construction plans of the setting and the mediator are created.
+    Instead of a configuration file, also a construction plan file can be given. The runs of the grid are created
+    with the create_runs function. Finished runs are skipped, started runs with an existing dumping file are resumed.
+    All other runs are executed from the beginning. The modules of all classes are imported before the runs are
+    executed in separate processes of a local process pool, which are forked if possible, so that the runs do not
+    import them again. Every run is executed in a new process. Runs that share a static data file are started after
+    each other so that their shared bounds are only determined once. Finally, the status of every run is printed.
+
+    Raises
+    ------
+    base.exceptions.ConfigurationError
+        If the number of processes is not positive.
+    """
+    print_start_message()
+
+    args = parse_options(sys.argv[1:])
+    startup_report = StartupReport()
+    if args.startup_report:
+        startup_report.start()
+    logger = set_up_logging(args)
+    if args.processes <= 0:
+        raise ConfigurationError("The number of processes should be positive.")
+
+    logger.info("Setting up the sweep based on the configuration file {0}.".format(args.config_file))
+    if is_plan_file(args.config_file):
+        with startup_report.phase("reading of the construction plan file"):
+            config, setting_plan, mediator_plan = read_plan_file(args.config_file)
+    else:
+        with startup_report.phase("reading of the configuration file"):
+            config = read_config(args.config_file)
+        with startup_report.phase("creation of the construction plans"):
+            setting_plan = factory.create_plan(config, to_camel_case(config.get("Run", "setting")),
+                                               "jellyfysh.setting")
+            mediator_plan = factory.create_plan(config, to_camel_case(config.get("Run", "mediator")),
+                                                "jellyfysh.mediator")
+        warn_about_unused_sections(config, logger)
+    with startup_report.phase("creation of the runs"):
+        os.makedirs(args.directory, exist_ok=True)
+        runs = create_runs(config, setting_plan, mediator_plan,
+                           [args.overrides + overrides for overrides in parse_grid(args.grid)], args.directory)
+        for run in runs:
+            for plan in itertools.chain(run.setting_plan.yield_plans(), run.mediator_plan.yield_plans()):
+                import_module(plan.module_name)
+    if args.startup_report:
+        startup_report.stop()
+        startup_report.write()
+
+    # Start the first run of every static data file before all other runs
+    leading_runs: Dict[str, SweepRun] = {}
+    for run in runs:
+        leading_runs.setdefault(run.static_data_filename, run)
+    runs.sort(key=lambda sweep_run: leading_runs[sweep_run.static_data_filename] is not sweep_run)
+
+    logger.info("Executing {0} runs in {1} processes.".format(len(runs), args.processes))
+    context = (multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods()
+               else multiprocessing.get_context())
+    number_of_failed_runs = 0
+    with context.Manager() as manager:
+        static_data_locks = {static_data_filename: manager.Lock() for static_data_filename in leading_runs}
+        with context.Pool(args.processes, maxtasksperchild=1) as pool:
+            results = [pool.apply_async(_execute_run, (run, static_data_locks[run.static_data_filename]))
+                       for run in runs]
+            for run, result in zip(runs, results):
+                try:
+                    status = result.get()
+                except Exception as exception:
+                    number_of_failed_runs += 1
+                    status = "failed ({0})".format(exception)
+                print("{0}: {1} [{2}]".format(run.directory, status, " ".join(run.overrides)))
+    if number_of_failed_runs > 0:
+        logger.error("{0} of {1} runs failed.".format(number_of_failed_runs, len(runs)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -51,6 +51,10 @@ executables:
 
     jellyfysh config_file: Run the JeLLyFysh application based on a configuration file (see jellyfysh.run.main).
     jellyfysh-resume: Resume a run of the JeLLyFysh application based on a dumped data file (see jellyfysh.resume.main).
+    jellyfysh-compile config_file: Compile a configuration file into a construction plan file which can replace the
+                                   configuration file in the jellyfysh executable (see jellyfysh.compile.main).
+    jellyfysh-sweep config_file: Execute the runs of a parameter grid based on a configuration file on a local process
+                                 pool (see jellyfysh.sweep.main).
     jellyfysh-examples: Copy the exemplary configuration files of the JeLLyFysh application into the
                         current working directory (see jellyfysh.create_examples.main).
 
@@ -139,6 +143,8 @@ setup(
         "console_scripts": [
             "jellyfysh = jellyfysh.run:main",
             "jellyfysh-resume = jellyfysh.resume:main",
+            "jellyfysh-compile = jellyfysh.compile:main",
+            "jellyfysh-sweep = jellyfysh.sweep:main",
             "jellyfysh-examples = jellyfysh.create_examples: main",
         ]
     },
@@ -150,6 +156,7 @@ setup(
         "jellyfysh/potential/merged_image_coulomb_potential/merged_image_coulomb_potential_build.py:ffi_builder",
         "jellyfysh/potential/inverse_power_coulomb_bounding_potential/"
         + "inverse_power_coulomb_bounding_potential_build.py:ffi_builder",
+        "jellyfysh/potential/pair_displacement_kernels/pair_displacement_kernels_build.py:ffi_builder",
         "jellyfysh/scheduler/heap_scheduler/heap_build.py:ffi_builder"
     ],
 
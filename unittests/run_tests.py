@@ -42,6 +42,7 @@ if __name__ == '__main__':
     loader = unittest.TestLoader()
     test_suite = unittest.TestSuite()
     test_suite.addTests(loader.loadTestsFromModule(importlib.import_module("test_expanded_test_case")))
+    test_suite.addTests(loader.loadTestsFromModule(importlib.import_module("test_sweep")))
     for entry in os.scandir():
         if (entry.is_dir() and entry.name != "test_config_files"
                 and os.path.isfile(entry.name + "/__init__.py")):
@@ -0,0 +1,63 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from unittest import TestCase, main
+from jellyfysh.activator.internal_state.cell_occupancy.cells.auto_cuboid_periodic_cells import AutoCuboidPeriodicCells
+from jellyfysh.activator.internal_state.cell_occupancy.cells.cell_system_sizing import choose_cell_system
+from jellyfysh.activator.internal_state.cell_occupancy.cells.cuboid_periodic_cells import CuboidPeriodicCells
+from jellyfysh.base.exceptions import ConfigurationError
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercuboid_setting
+
+
+class TestAutoCuboidPeriodicCells(TestCase):
+    def setUp(self) -> None:
+        hypercuboid_setting.HypercuboidSetting(beta=1.0, dimension=2, system_lengths=[1.0, 2.0])
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(40)
+        setting.set_number_of_nodes_per_root_node(1)
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    def test_same_cells_as_chosen_cell_system(self):
+        cells = AutoCuboidPeriodicCells(cutoff=0.15, maximum_number_of_cells=1000, nearby_event_cost=1.0,
+                                        cell_veto_event_cost=0.2)
+        cells_per_side, neighbor_layers, _ = choose_cell_system(0.15, 40, 1, 1000, 1.0, 1.0, 0.2)
+        self.assertNotEqual(cells_per_side, [1, 1])
+        reference_cells = CuboidPeriodicCells(cells_per_side=cells_per_side, neighbor_layers=neighbor_layers)
+        self.assertEqual([(cell.identifier, cell.cell_min, cell.cell_max) for cell in cells.yield_cells()],
+                         [(cell.identifier, cell.cell_min, cell.cell_max) for cell in reference_cells.yield_cells()])
+        for cell, reference_cell in zip(cells.yield_cells(), reference_cells.yield_cells()):
+            self.assertEqual(set(nearby.identifier for nearby in cells.nearby_cells(cell)),
+                             set(nearby.identifier for nearby in reference_cells.nearby_cells(reference_cell)))
+
+    def test_calibrated_cell_system(self):
+        cells = AutoCuboidPeriodicCells(cutoff=0.15, maximum_number_of_cells=1000)
+        self.assertLessEqual(len(list(cells.yield_cells())), 1000)
+
+    def test_cutoff_not_greater_than_zero_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            AutoCuboidPeriodicCells(cutoff=0.0, nearby_event_cost=1.0, cell_veto_event_cost=0.2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import random
+from unittest import TestCase, main
+from jellyfysh.activator.internal_state.cell_occupancy.cells.cell_system_sizing import (
+    calibrate_event_costs, choose_cell_system, expected_cost, size_cell_system)
+from jellyfysh.base.exceptions import ConfigurationError
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercuboid_setting
+
+
+class TestCellSystemSizing(TestCase):
+    def setUp(self) -> None:
+        hypercuboid_setting.HypercuboidSetting(beta=1.0, dimension=3, system_lengths=[10.0, 10.0, 20.0])
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    def test_expected_cost(self):
+        # 8 * 8 * 16 cells with 3 * 3 * 3 nearby cells, 2048 occupants so that there are 2 occupants per cell on
+        # average. Surplus per cell: E[max(0, X - 1)] = 2 - 1 + exp(-2).
+        cost = expected_cost([8, 8, 16], 1, 2048, 1, 0.5, 2.0, 3.0)
+        number_of_nearby_units = 2048 * 27 / 1024 - 1
+        number_of_surplus_units = 1024 * 1.1353352832366128
+        crossings = (0.8 + 0.8 + 0.8) / 3
+        self.assertAlmostEqual(cost, (crossings + 0.5)
+                               * (3.0 + 2.0 * (number_of_nearby_units + number_of_surplus_units)))
+
+    def test_expected_cost_without_surplus(self):
+        cost = expected_cost([8, 8, 16], 1, 2048, 0, 0.0, 2.0, 3.0)
+        self.assertAlmostEqual(cost, 0.8 * (3.0 + 2.0 * (2048 * 27 / 1024 - 1)))
+
+    def test_expected_cost_nearby_cells_cover_box(self):
+        cost = expected_cost([1, 1, 1], 0, 100, 0, 1.0, 2.0, 3.0)
+        self.assertAlmostEqual(cost, ((0.1 + 0.1 + 0.05) / 3 + 1.0) * (3.0 + 2.0 * 99))
+
+    def test_choose_cell_system_covers_cutoff(self):
+        for cutoff in (0.5, 1.0, 2.5, 4.0):
+            for number_of_occupants in (2, 100, 5000):
+                cells_per_side, neighbor_layers, cost = choose_cell_system(cutoff, number_of_occupants, 1, 10000,
+                                                                           1.0, 1.0, 0.2)
+                self.assertLessEqual(cells_per_side[0] * cells_per_side[1] * cells_per_side[2], 10000)
+                self.assertEqual(cells_per_side[0], cells_per_side[1])
+                self.assertLessEqual(abs(2 * cells_per_side[0] - cells_per_side[2]), 1)
+                if cells_per_side != [1, 1, 1]:
+                    for cells, length in zip(cells_per_side, hypercuboid_setting.system_lengths):
+                        self.assertGreaterEqual(neighbor_layers * length / cells, cutoff * (1.0 - 1.0e-12))
+                        self.assertLessEqual(2 * neighbor_layers + 1, cells)
+                self.assertAlmostEqual(cost, expected_cost(cells_per_side, neighbor_layers, number_of_occupants, 1,
+                                                           1.0, 1.0, 0.2))
+
+    def test_choose_cell_system_is_minimal(self):
+        cells_per_side, neighbor_layers, cost = choose_cell_system(1.0, 1000, 1, 10000, 1.0, 1.0, 0.2)
+        for cells in range(2, 11):
+            candidate_cells_per_side = [cells, cells, 2 * cells]
+            candidate_neighbor_layers = -(-cells // 10)
+            if 2 * candidate_neighbor_layers + 1 <= cells:
+                self.assertLessEqual(cost, expected_cost(candidate_cells_per_side, candidate_neighbor_layers, 1000, 1,
+                                                         1.0, 1.0, 0.2))
+        self.assertLessEqual(cost, expected_cost([1, 1, 1], 0, 1000, 1, 1.0, 1.0, 0.2))
+
+    def test_choose_cell_system_single_cell(self):
+        self.assertEqual(choose_cell_system(1.0, 1000, 1, 1, 1.0, 1.0, 0.2)[:2], ([1, 1, 1], 0))
+
+    def test_choose_cell_system_invalid_arguments_raise_error(self):
+        with self.assertRaises(ConfigurationError):
+            choose_cell_system(0.0, 1000, 1, 1000, 1.0, 1.0, 0.2)
+        with self.assertRaises(ConfigurationError):
+            choose_cell_system(1.0, 1000, 1, 0, 1.0, 1.0, 0.2)
+
+    def test_calibrate_event_costs_keeps_random_state(self):
+        random.seed(5)
+        state = random.getstate()
+        nearby_event_cost, cell_veto_event_cost = calibrate_event_costs(number_of_samples=100)
+        self.assertGreater(nearby_event_cost, 0.0)
+        self.assertGreater(cell_veto_event_cost, 0.0)
+        self.assertEqual(random.getstate(), state)
+
+    def test_size_cell_system(self):
+        setting.set_number_of_root_nodes(1000)
+        setting.set_number_of_nodes_per_root_node(1)
+        setting.set_number_of_node_levels(1)
+        self.assertEqual(size_cell_system("Cells", 1.0, 2.0, 1, 10000, 1.0, 1.0, 0.2),
+                         choose_cell_system(1.0, 2000, 1, 10000, 1.0, 1.0, 0.2)[:2])
+
+    def test_size_cell_system_without_root_nodes_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            size_cell_system("Cells", 1.0, 1.0, 1, 10000, 1.0, 1.0, 0.2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import gc
+import os
+import random
+import sys
+from unittest import TestCase, main
+import weakref
+from jellyfysh.activator.internal_state.cell_occupancy.cells.cuboid_periodic_cells import CuboidPeriodicCells
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
+from jellyfysh.base.exceptions import ConfigurationError
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercuboid_setting
+from jellyfysh.setting import hypercubic_setting
+_unittest_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 4))
+_unittest_directory_added_to_path = False
+if _unittest_directory not in sys.path:
+    sys.path.append(_unittest_directory)
+    _unittest_directory_added_to_path = True
+# noinspection PyUnresolvedReferences
+from expanded_test_case import ExpandedTestCase
+
+
+def tearDownModule():
+    if _unittest_directory_added_to_path:
+        sys.path.remove(_unittest_directory)
+
+
+def cells_in_blocks_below(cells, block, level):
+    return set(cell for cell in cells.yield_cells() if cells.block(cell, level) == block)
+
+
+# Inherit explicitly from TestCase class for Test functionality in PyCharm.
+class TestIndexedCuboidPeriodicCells(ExpandedTestCase, TestCase):
+    def tearDown(self) -> None:
+        setting.reset()
+
+    @staticmethod
+    def _set_up_setting(system_lengths):
+        hypercuboid_setting.HypercuboidSetting(beta=1.0, dimension=len(system_lengths), system_lengths=system_lengths)
+        # Set these values so that the setting package is fully initialized.
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(1)
+        setting.set_number_of_nodes_per_root_node(1)
+
+    def _compare_with_cuboid_periodic_cells(self, cells_per_side, neighbor_layers, maximum_pair_table_size):
+        cuboid_cells = CuboidPeriodicCells(cells_per_side=cells_per_side, neighbor_layers=neighbor_layers)
+        indexed_cells = IndexedCuboidPeriodicCells(cells_per_side=cells_per_side, neighbor_layers=neighbor_layers,
+                                                   maximum_pair_table_size=maximum_pair_table_size)
+        all_cells = list(cuboid_cells.yield_cells())
+        index_of_cell = {cell: index for index, cell in enumerate(all_cells)}
+        self.assertEqual(list(indexed_cells.yield_cells()), list(range(len(all_cells))))
+        self.assertEqual(indexed_cells.number_of_cells, len(all_cells))
+        self.assertEqual(indexed_cells.zero_cell, index_of_cell[cuboid_cells.zero_cell])
+        for index, cell in enumerate(all_cells):
+            self.assertEqual(indexed_cells.cell_min(index), cell.cell_min)
+            self.assertEqual(indexed_cells.cell_max(index), cell.cell_max)
+            self.assertEqual(indexed_cells.position_to_cell(cell.cell_min), index)
+            self.assertEqual(indexed_cells.position_to_cell(cell.cell_max), index)
+            self.assertEqual(indexed_cells.nearby_cells(index),
+                             set(index_of_cell[nearby_cell] for nearby_cell in cuboid_cells.nearby_cells(cell)))
+            for direction in range(setting.dimension):
+                for positive in (True, False):
+                    self.assertEqual(indexed_cells.neighbor_cell(index, direction, positive),
+                                     index_of_cell[cuboid_cells.neighbor_cell(cell, direction, positive)])
+            for other_index, other_cell in enumerate(all_cells):
+                self.assertEqual(indexed_cells.relative_cell(index, other_index),
+                                 index_of_cell[cuboid_cells.relative_cell(cell, other_cell)])
+                self.assertEqual(indexed_cells.translate(index, other_index),
+                                 index_of_cell[cuboid_cells.translate(cell, other_cell)])
+        for _ in range(100):
+            position = [random.uniform(0.0, length) for length in hypercuboid_setting.system_lengths]
+            self.assertEqual(indexed_cells.position_to_cell(position),
+                             index_of_cell[cuboid_cells.position_to_cell(position)])
+
+    def test_two_dimensional_cells_agree_with_cuboid_periodic_cells(self):
+        self._set_up_setting([1.0, 2.0])
+        self._compare_with_cuboid_periodic_cells([4, 5], 1, 4194304)
+
+    def test_two_dimensional_cells_agree_with_cuboid_periodic_cells_without_pair_tables(self):
+        self._set_up_setting([1.0, 2.0])
+        self._compare_with_cuboid_periodic_cells([4, 5], 1, 0)
+
+    def test_three_dimensional_cells_agree_with_cuboid_periodic_cells(self):
+        self._set_up_setting([1.0, 0.5, 1.5])
+        self._compare_with_cuboid_periodic_cells([4, 2, 5], 1, 4194304)
+
+    def test_three_dimensional_cells_agree_with_cuboid_periodic_cells_without_pair_tables(self):
+        self._set_up_setting([1.0, 0.5, 1.5])
+        self._compare_with_cuboid_periodic_cells([4, 2, 5], 1, 0)
+
+    def test_three_dimensional_cells_agree_with_cuboid_periodic_cells_many_neighbor_layers(self):
+        self._set_up_setting([1.0, 0.5, 1.5])
+        self._compare_with_cuboid_periodic_cells([4], 2, 4194304)
+
+    def _check_blocks(self, cells_per_side):
+        cells = IndexedCuboidPeriodicCells(cells_per_side=cells_per_side, neighbor_layers=1)
+        maximum_cells_per_side = max(cells.cells_per_side)
+        self.assertLess(2 ** (cells.number_of_block_levels - 2), maximum_cells_per_side)
+        self.assertLessEqual(maximum_cells_per_side, 2 ** (cells.number_of_block_levels - 1))
+        self.assertEqual(cells.number_of_blocks(cells.number_of_block_levels - 1), 1)
+        for cell in cells.yield_cells():
+            self.assertEqual(cells.block(cell, 0), cell)
+            self.assertEqual(cells.block_coordinate_range(cell, 0),
+                             (tuple(cells.cell_coordinates(cell)),
+                              tuple(coordinate + 1 for coordinate in cells.cell_coordinates(cell))))
+        for level in range(1, cells.number_of_block_levels):
+            cells_in_blocks = {}
+            for cell in cells.yield_cells():
+                cells_in_blocks.setdefault(cells.block(cell, level), set()).add(cell)
+                # The block on the level below is a child of the block on this level.
+                self.assertIn(cells.block(cell, level - 1), cells.block_children(cells.block(cell, level), level))
+            self.assertEqual(set(cells_in_blocks), set(range(cells.number_of_blocks(level))))
+            for block, cells_in_block in cells_in_blocks.items():
+                minimums, maximums = cells.block_coordinate_range(block, level)
+                for direction in range(setting.dimension):
+                    self.assertEqual(minimums[direction] % 2 ** level, 0)
+                    self.assertLessEqual(maximums[direction] - minimums[direction], 2 ** level)
+                self.assertEqual(cells_in_block, set(
+                    cell for cell in cells.yield_cells()
+                    if all(minimums[direction] <= cells.cell_coordinates(cell)[direction] < maximums[direction]
+                           for direction in range(setting.dimension))))
+                self.assertEqual(cells_in_block, set(cell for child in cells.block_children(block, level)
+                                                     for cell in cells_in_blocks_below(cells, child, level - 1)))
+
+    def test_two_dimensional_blocks(self):
+        self._set_up_setting([1.0, 2.0])
+        self._check_blocks([4, 5])
+
+    def test_three_dimensional_blocks(self):
+        self._set_up_setting([1.0, 0.5, 1.5])
+        self._check_blocks([7, 2, 5])
+
+    def test_cell_tables_are_shared_for_same_geometry(self):
+        self._set_up_setting([1.0, 2.0])
+        cells_one = IndexedCuboidPeriodicCells(cells_per_side=[4, 5], neighbor_layers=1)
+        cells_two = IndexedCuboidPeriodicCells(cells_per_side=[4, 5], neighbor_layers=1)
+        cells_three = IndexedCuboidPeriodicCells(cells_per_side=[4, 5], neighbor_layers=0)
+        # noinspection PyProtectedMember
+        self.assertIs(cells_one._tables, cells_two._tables)
+        # noinspection PyProtectedMember
+        self.assertIsNot(cells_one._tables, cells_three._tables)
+
+    def test_cell_tables_are_freed_with_last_cell_system(self):
+        self._set_up_setting([1.0, 2.0])
+        cells_one = IndexedCuboidPeriodicCells(cells_per_side=[4, 5], neighbor_layers=1)
+        cells_two = IndexedCuboidPeriodicCells(cells_per_side=[4, 5], neighbor_layers=1)
+        # noinspection PyProtectedMember
+        tables = weakref.ref(cells_one._tables)
+        del cells_one
+        gc.collect()
+        self.assertIsNotNone(tables())
+        del cells_two
+        gc.collect()
+        self.assertIsNone(tables())
+
+    def test_indexed_cuboid_periodic_cells_raises_error_if_hypercuboid_setting_is_not_initialized(self):
+        with self.assertRaises(ConfigurationError):
+            IndexedCuboidPeriodicCells(cells_per_side=[4, 2, 2], neighbor_layers=1)
+
+    def test_indexed_cuboid_periodic_cells_raises_error_if_too_many_cells_per_side_are_given(self):
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=3, system_length=1.0)
+        # Set these values so that the setting package is fully initialized.
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(1)
+        setting.set_number_of_nodes_per_root_node(1)
+        with self.assertRaises(ConfigurationError):
+            IndexedCuboidPeriodicCells(cells_per_side=[3, 3, 3, 3], neighbor_layers=1)
+
+
+if __name__ == '__main__':
+    main()
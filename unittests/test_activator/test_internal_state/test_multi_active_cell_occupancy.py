@@ -0,0 +1,170 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import sys
+from unittest import TestCase, main
+from jellyfysh.activator.internal_state.cell_occupancy.cells.cuboid_periodic_cells import CuboidPeriodicCells
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
+from jellyfysh.activator.internal_state.multi_active_cell_occupancy import MultiActiveCellOccupancy
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.node import Node
+from jellyfysh.base.unit import Unit
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercubic_setting
+_unittest_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 2))
+_unittest_directory_added_to_path = False
+if _unittest_directory not in sys.path:
+    sys.path.append(_unittest_directory)
+    _unittest_directory_added_to_path = True
+# noinspection PyUnresolvedReferences
+from expanded_test_case import ExpandedTestCase
+
+
+def tearDownModule():
+    if _unittest_directory_added_to_path:
+        sys.path.remove(_unittest_directory)
+
+
+# Inherit explicitly from TestCase class for Test functionality in PyCharm.
+class TestMultiActiveCellOccupancy(ExpandedTestCase, TestCase):
+    def setUp(self) -> None:
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=2, system_length=1.0)
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(6)
+        setting.set_number_of_nodes_per_root_node(1)
+        # Units 0, 1, and 2 are in the same cell.
+        self._positions = [[0.1, 0.1], [0.2, 0.1], [0.1, 0.2], [0.6, 0.1], [0.6, 0.6], [0.9, 0.35]]
+        self._charges = [1.0, 1.0, 0.0, -1.0, 1.0, 1.0]
+        self._indexed_cells = IndexedCuboidPeriodicCells(cells_per_side=[4, 4], neighbor_layers=1)
+        self._cuboid_cells = CuboidPeriodicCells(cells_per_side=[4, 4], neighbor_layers=1)
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    def _global_state(self, active_identifiers=(), velocity=None):
+        return [Node(Unit(identifier=(index,), position=list(position), charge={"charge": charge},
+                          velocity=velocity if index in active_identifiers else None))
+                for index, (position, charge) in enumerate(zip(self._positions, self._charges))]
+
+    def _active_global_state(self, active_identifiers):
+        return [cnode for cnode in self._global_state(active_identifiers, [1.0, 0.0])
+                if cnode.value.identifier[0] in active_identifiers]
+
+    @staticmethod
+    def _stored_identifiers(cell_occupancy, cells):
+        stored = [identifier for cell in cells.yield_cells() for identifier in cell_occupancy[cell]]
+        return sorted(stored + list(cell_occupancy.yield_surplus()))
+
+    def _check_cell_occupancy(self, cell_occupancy, cells, active_identifiers, relevant_identifiers):
+        active_cells = list(cell_occupancy.yield_active_cells())
+        relevant_active_identifiers = [identifier for identifier in active_identifiers
+                                       if identifier in relevant_identifiers]
+        self.assertEqual(sorted(identifier for _, identifier in active_cells),
+                         [(identifier,) for identifier in relevant_active_identifiers])
+        for cell, identifier in active_cells:
+            self.assertEqual(cell, cells.position_to_cell(self._positions[identifier[0]]))
+        self.assertEqual(self._stored_identifiers(cell_occupancy, cells),
+                         [(identifier,) for identifier in relevant_identifiers
+                          if identifier not in relevant_active_identifiers])
+        for cell in cells.yield_cells():
+            self.assertLessEqual(len(cell_occupancy[cell]), 1)
+            for identifier in cell_occupancy[cell]:
+                self.assertEqual(cells.position_to_cell(self._positions[identifier[0]]), cell)
+
+    def _check_block_occupancy(self, cell_occupancy):
+        for level in range(self._indexed_cells.number_of_block_levels):
+            expected_block_occupancy = [0] * self._indexed_cells.number_of_blocks(level)
+            for cell in self._indexed_cells.yield_cells():
+                expected_block_occupancy[self._indexed_cells.block(cell, level)] += len(cell_occupancy[cell])
+            self.assertEqual(list(cell_occupancy.block_occupancy(level)), expected_block_occupancy)
+
+    def _check_block_transitions(self, cell_occupancy, occupied_blocks, known_transitions):
+        # Follow the occupied blocks on all levels with the block transitions only
+        for level in range(self._indexed_cells.number_of_block_levels):
+            changed_blocks = cell_occupancy.block_transitions(level, known_transitions[level])
+            if changed_blocks is None:
+                changed_blocks = range(self._indexed_cells.number_of_blocks(level))
+            for block in changed_blocks:
+                occupied_blocks[level].discard(block)
+                if cell_occupancy.block_occupancy(level)[block]:
+                    occupied_blocks[level].add(block)
+            known_transitions[level] = cell_occupancy.number_of_block_transitions(level)
+            self.assertEqual(occupied_blocks[level], {block for block, number_of_occupants
+                                                      in enumerate(cell_occupancy.block_occupancy(level))
+                                                      if number_of_occupants})
+
+    def _run_updates(self, cells, charge, relevant_identifiers):
+        cell_occupancy = MultiActiveCellOccupancy(cells, cell_level=1, maximum_number_occupants=1, charge=charge)
+        cell_occupancy.initialize(self._global_state())
+        self._check_cell_occupancy(cell_occupancy, cells, [], relevant_identifiers)
+        if isinstance(cells, IndexedCuboidPeriodicCells):
+            occupied_blocks = [set() for _ in range(cells.number_of_block_levels)]
+            known_transitions = [0] * cells.number_of_block_levels
+            self._check_block_transitions(cell_occupancy, occupied_blocks, known_transitions)
+        for active_identifiers in ([0, 3], [0, 1, 3], [3], [2, 5], [1, 2, 4], [0, 1, 2, 3, 4, 5], [4]):
+            cell_occupancy.update(self._active_global_state(active_identifiers))
+            self._check_cell_occupancy(cell_occupancy, cells, active_identifiers, relevant_identifiers)
+            if isinstance(cells, IndexedCuboidPeriodicCells):
+                self._check_block_occupancy(cell_occupancy)
+                # noinspection PyUnboundLocalVariable
+                self._check_block_transitions(cell_occupancy, occupied_blocks, known_transitions)
+            # Move the active units and check that their active cells follow.
+            for identifier in active_identifiers:
+                self._positions[identifier][0] = (self._positions[identifier][0] + 0.3) % 1.0
+            cell_occupancy.update(self._active_global_state(active_identifiers))
+            self._check_cell_occupancy(cell_occupancy, cells, active_identifiers, relevant_identifiers)
+
+    def test_indexed_cells(self):
+        self._run_updates(self._indexed_cells, None, [0, 1, 2, 3, 4, 5])
+
+    def test_indexed_cells_with_charge(self):
+        self._run_updates(self._indexed_cells, "charge", [0, 1, 3, 4, 5])
+
+    def test_cuboid_cells(self):
+        self._run_updates(self._cuboid_cells, None, [0, 1, 2, 3, 4, 5])
+
+    def test_cuboid_cells_with_charge(self):
+        self._run_updates(self._cuboid_cells, "charge", [0, 1, 3, 4, 5])
+
+    def test_block_occupancy_not_available(self):
+        cell_occupancy = MultiActiveCellOccupancy(self._cuboid_cells, cell_level=1)
+        cell_occupancy.initialize(self._global_state())
+        with self.assertRaises(AssertionError):
+            cell_occupancy.block_occupancy(0)
+        with self.assertRaises(AssertionError):
+            cell_occupancy.block_transitions(0, 0)
+
+    def test_block_transitions_not_stored_anymore(self):
+        cell_occupancy = MultiActiveCellOccupancy(self._indexed_cells, cell_level=1)
+        cell_occupancy.initialize(self._global_state())
+        self.assertIsNone(cell_occupancy.block_transitions(
+            0, cell_occupancy.number_of_block_transitions(0) - self._indexed_cells.number_of_blocks(0) - 1))
+
+    def test_charge_on_composite_point_object_level_raises_error(self):
+        setting.number_of_node_levels = 2
+        with self.assertRaises(ConfigurationError):
+            MultiActiveCellOccupancy(self._cuboid_cells, cell_level=1, charge="charge")
+
+
+if __name__ == '__main__':
+    main()
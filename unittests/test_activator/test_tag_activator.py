@@ -0,0 +1,216 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from unittest import TestCase, main, mock
+from jellyfysh.activator.tag_activator import TagActivator
+from jellyfysh.activator.tagger import Tagger
+from jellyfysh.base.exceptions import ConfigurationError, TagActivatorError
+from jellyfysh.base.node import Node
+from jellyfysh.base.time import Time
+from jellyfysh.base.unit import Unit
+from jellyfysh.event_handler import EventHandler
+from jellyfysh.event_handler.abstracts import StartOfRunEventHandler
+
+
+class _StartOfRunEventHandler(StartOfRunEventHandler):
+    def send_event_time(self) -> Time:
+        return Time(0.0, 0.0)
+
+    def send_out_state(self) -> list:
+        return []
+
+
+class _PairEventHandler(EventHandler):
+    _shared_attributes = ("table",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.table = [0.5] * 10
+        self.in_state = None
+
+    def send_event_time(self, in_state) -> Time:
+        self.in_state = in_state
+        return Time(0.0, self.table[0])
+
+    def send_out_state(self) -> list:
+        return self.in_state
+
+
+class _Tagger(Tagger):
+    def __init__(self, create, trash, event_handler, number_event_handlers, tag, number_in_states):
+        super().__init__(create, trash, event_handler, number_event_handlers, tag=tag)
+        self._number_in_states = number_in_states
+
+    def yield_identifiers_send_event_time(self, extracted_active_global_state):
+        for index in range(self._number_in_states):
+            yield (index,) if self._number_in_states > 1 else None
+
+
+class _UnitTagger(Tagger):
+    def __init__(self, create, trash, event_handler, number_event_handlers, tag, number_in_states):
+        super().__init__(create, trash, event_handler, number_event_handlers, tag=tag)
+        self.number_in_states = number_in_states
+
+    def yield_identifiers_send_event_time(self, extracted_active_global_state):
+        for index in range(self.number_in_states):
+            yield ((index,),)
+
+
+def _active_global_state(velocities):
+    return [Node(Unit((index,), [0.0, 0.0], velocity=velocity)) for index, velocity in velocities.items()]
+
+
+class TestTagActivator(TestCase):
+    def setUp(self) -> None:
+        self._start_of_run_tagger = _Tagger(["pair"], ["start_of_run"], _StartOfRunEventHandler(), 1, "start_of_run",
+                                            1)
+        self._pair_tagger = _Tagger(["pair"], ["pair"], _PairEventHandler(), 1, "pair", 3)
+
+    def _set_up_activator(self, shrink_event_handler_pools: bool) -> TagActivator:
+        activator = TagActivator([self._start_of_run_tagger, self._pair_tagger],
+                                 shrink_event_handler_pools=shrink_event_handler_pools)
+        activator.initialize(None)
+        start_of_run_event_handlers = activator.get_event_handlers_to_run(None, None)
+        self.assertEqual(len(start_of_run_event_handlers), 1)
+        start_of_run_event_handler = next(iter(start_of_run_event_handlers))
+        self.assertIsInstance(start_of_run_event_handler, _StartOfRunEventHandler)
+        self.assertEqual(activator.get_trashable_events(start_of_run_event_handler), [start_of_run_event_handler])
+        return activator
+
+    def test_initial_event_handlers(self):
+        activator = TagActivator([self._start_of_run_tagger, self._pair_tagger])
+        activator.initialize(None)
+        self.assertEqual(len(activator.get_event_handlers()), 2)
+        self.assertEqual(len(self._pair_tagger.get_event_handlers()), 1)
+
+    def test_pool_grows_on_demand(self):
+        activator = self._set_up_activator(False)
+        start_of_run_event_handler = self._start_of_run_tagger.get_event_handlers()[0]
+        with mock.patch("jellyfysh.activator.tag_activator.logging.getLogger") as get_logger_mock:
+            event_handlers_to_run = activator.get_event_handlers_to_run(None, start_of_run_event_handler)
+        # The new maximum number of event handlers is logged for each created event handler.
+        self.assertEqual(get_logger_mock.return_value.info.call_count, 2)
+        self.assertIn("is now 3", get_logger_mock.return_value.info.call_args[0][0])
+        self.assertEqual(list(event_handlers_to_run.values()), [(0,), (1,), (2,)])
+        pair_event_handlers = self._pair_tagger.get_event_handlers()
+        self.assertEqual(len(pair_event_handlers), 3)
+        self.assertEqual(len(set(pair_event_handlers)), 3)
+        self.assertEqual(set(event_handlers_to_run), set(pair_event_handlers))
+        for event_handler in pair_event_handlers:
+            self.assertIn(event_handler, activator.get_event_handlers())
+            self.assertIs(event_handler.table, pair_event_handlers[0].table)
+        self.assertEqual(len(activator.get_event_handlers()), 4)
+
+        # The grown pool is reused.
+        event_handlers_to_run = activator.get_event_handlers_to_run(None, pair_event_handlers[0])
+        self.assertEqual(len(event_handlers_to_run), 3)
+        self.assertEqual(len(self._pair_tagger.get_event_handlers()), 6)
+        self.assertEqual(len(activator.get_trashable_events(pair_event_handlers[0])), 6)
+        event_handlers_to_run = activator.get_event_handlers_to_run(None, pair_event_handlers[0])
+        self.assertEqual(len(event_handlers_to_run), 3)
+        self.assertEqual(len(self._pair_tagger.get_event_handlers()), 6)
+        self.assertEqual(activator.get_released_event_handlers(), [])
+
+    def test_trashable_events_in_order_of_running_event_handlers(self):
+        activator = self._set_up_activator(False)
+        event_handlers_to_run = activator.get_event_handlers_to_run(None,
+                                                                    self._start_of_run_tagger.get_event_handlers()[0])
+        preceding_event_handler = list(event_handlers_to_run)[2]
+        self.assertEqual(activator.get_trashable_events(preceding_event_handler), list(event_handlers_to_run))
+        # The trashed event handlers are reused in reversed order.
+        self.assertEqual(list(activator.get_event_handlers_to_run(None, preceding_event_handler)),
+                         list(reversed(list(event_handlers_to_run))))
+
+    def test_fixed_event_handlers_raises_error(self):
+        activator = self._set_up_activator(False)
+        activator.fix_event_handlers()
+        with self.assertRaises(TagActivatorError):
+            activator.get_event_handlers_to_run(None, self._start_of_run_tagger.get_event_handlers()[0])
+
+    def test_pool_shrinks(self):
+        activator = self._set_up_activator(True)
+        event_handlers_to_run = activator.get_event_handlers_to_run(None,
+                                                                    self._start_of_run_tagger.get_event_handlers()[0])
+        preceding_event_handler = list(event_handlers_to_run)[1]
+        trashable_events = activator.get_trashable_events(preceding_event_handler)
+        self.assertEqual(set(trashable_events), set(event_handlers_to_run))
+        released_event_handlers = activator.get_released_event_handlers()
+        self.assertEqual(len(released_event_handlers), 2)
+        self.assertNotIn(preceding_event_handler, released_event_handlers)
+        self.assertEqual(self._pair_tagger.get_event_handlers(), [preceding_event_handler])
+        for event_handler in released_event_handlers:
+            self.assertNotIn(event_handler, activator.get_event_handlers())
+        self.assertEqual(activator.get_released_event_handlers(), [])
+        self.assertEqual(len(activator.get_event_handlers_to_run(None, preceding_event_handler)), 3)
+
+    def _set_up_selective_activator(self, validate_selective_trash: bool):
+        self._pair_tagger = _UnitTagger(["pair"], ["pair"], _PairEventHandler(), 1, "pair", 3)
+        activator = TagActivator([self._start_of_run_tagger, self._pair_tagger], selective_trash_tags=["pair"],
+                                 validate_selective_trash=validate_selective_trash)
+        activator.initialize(None)
+        active_global_state = _active_global_state({0: [1.0, 0.0]})
+        start_of_run_event_handler = next(iter(activator.get_event_handlers_to_run(active_global_state, None)))
+        self.assertEqual(activator.get_trashable_events(start_of_run_event_handler, active_global_state),
+                         [start_of_run_event_handler])
+        event_handlers_to_run = activator.get_event_handlers_to_run(active_global_state, start_of_run_event_handler)
+        self.assertEqual(list(event_handlers_to_run.values()), [((0,),), ((1,),), ((2,),)])
+        return activator, list(event_handlers_to_run)
+
+    def test_selective_trash_keeps_untouched_events(self):
+        activator, event_handlers = self._set_up_selective_activator(False)
+        # The velocities did not change, so only the preceding event handler is trashed.
+        active_global_state = _active_global_state({0: [1.0, 0.0]})
+        self.assertEqual(activator.get_trashable_events(event_handlers[1], active_global_state), [event_handlers[1]])
+        event_handlers_to_run = activator.get_event_handlers_to_run(active_global_state, event_handlers[1])
+        self.assertEqual(list(event_handlers_to_run.items()), [(event_handlers[1], ((1,),))])
+
+        # The unit (0,) becomes inactive and the unit (2,) becomes active.
+        active_global_state = _active_global_state({2: [1.0, 0.0]})
+        self.assertEqual(activator.get_trashable_events(event_handlers[1], active_global_state),
+                         [event_handlers[0], event_handlers[2], event_handlers[1]])
+        self.assertEqual(list(activator.get_event_handlers_to_run(active_global_state, event_handlers[1]).values()),
+                         [((0,),), ((1,),), ((2,),)])
+
+    def test_selective_trash_without_active_global_state_trashes_all_events(self):
+        activator, event_handlers = self._set_up_selective_activator(False)
+        self.assertEqual(activator.get_trashable_events(event_handlers[1]), event_handlers)
+        self.assertEqual(len(activator.get_event_handlers_to_run(None, event_handlers[1])), 3)
+        # Without the velocities of the last call, all events are trashed again.
+        active_global_state = _active_global_state({0: [1.0, 0.0]})
+        self.assertEqual(len(activator.get_trashable_events(event_handlers[1], active_global_state)), 3)
+
+    def test_validate_selective_trash(self):
+        activator, event_handlers = self._set_up_selective_activator(True)
+        active_global_state = _active_global_state({0: [1.0, 0.0]})
+        self.assertEqual(activator.get_trashable_events(event_handlers[1], active_global_state), event_handlers)
+        self.assertEqual(len(activator.get_event_handlers_to_run(active_global_state, event_handlers[1])), 3)
+        self.assertEqual(len(activator.get_trashable_events(event_handlers[1], active_global_state)), 3)
+        self._pair_tagger.number_in_states = 2
+        with self.assertRaises(TagActivatorError):
+            activator.get_event_handlers_to_run(active_global_state, event_handlers[1])
+
+    def test_selective_trash_unknown_tag_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            TagActivator([self._start_of_run_tagger, self._pair_tagger], selective_trash_tags=["coulomb"])
+
+
+if __name__ == '__main__':
+    main()
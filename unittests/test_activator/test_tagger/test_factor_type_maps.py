@@ -0,0 +1,117 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.activator.tagger import factor_type_maps as factor_type_maps_module
+from jellyfysh.activator.tagger.factor_type_maps import FactorTypeMaps
+from jellyfysh.base.exceptions import FactorSetError
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercubic_setting
+
+
+_FACTOR_SET = """[0, 1], Harmonic
+[1, 2], Harmonic
+[1, 4], LennardJones
+[0, 1, 2, 3, 4, 5], Coulomb
+[0, 1], Bond
+"""
+
+
+class TestFactorTypeMaps(TestCase):
+    def setUp(self) -> None:
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=3, system_length=1.0)
+        setting.set_number_of_root_nodes(3)
+        setting.set_number_of_nodes_per_root_node(3)
+        setting.set_number_of_node_levels(2)
+        file_descriptor, self._filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(_FACTOR_SET)
+        FactorTypeMaps._instance = None
+
+    def tearDown(self) -> None:
+        FactorTypeMaps._instance = None
+        os.remove(self._filename)
+        setting.reset()
+
+    def _factors(self, precompute_factors, lazy_precomputation, factor, identifier):
+        FactorTypeMaps._instance = None
+        factor_type_maps = FactorTypeMaps(self._filename, precompute_factors=precompute_factors,
+                                          lazy_precomputation=lazy_precomputation)
+        return list(factor_type_maps[factor].yield_factor_identifier(identifier))
+
+    def test_lennard_jones_factors(self):
+        self.assertEqual(self._factors(False, True, "LennardJones", (0, 1)), [((0, 1), (1, 1)), ((0, 1), (2, 1))])
+        self.assertEqual(self._factors(False, True, "LennardJones", (0, 0)), [])
+
+    def test_precomputed_factors_equal_generated_factors(self):
+        for factor in ["Harmonic", "LennardJones", "Coulomb", "Bending"]:
+            for root_node_number in range(3):
+                for leaf_node_number in range(3):
+                    identifier = (root_node_number, leaf_node_number)
+                    generated_factors = self._factors(False, True, factor, identifier)
+                    self.assertEqual(self._factors(True, True, factor, identifier), generated_factors)
+                    self.assertEqual(self._factors(True, False, factor, identifier), generated_factors)
+
+    def test_precomputed_factor_type_map_is_reused(self):
+        factor_type_maps = FactorTypeMaps(self._filename, precompute_factors=True)
+        factor_type_map = factor_type_maps["Coulomb"]
+        self.assertIs(factor_type_maps["Coulomb"], factor_type_map)
+        self.assertEqual(factor_type_map.number_factors, 0)
+        factors = list(factor_type_map.yield_factor_identifier((1, 2)))
+        self.assertEqual(len(factors), 2)
+        self.assertEqual(list(factor_type_map.yield_factor_identifier((1, 2))), factors)
+        self.assertEqual(factor_type_map.number_factors, 2)
+        self.assertEqual(factor_type_map.number_identifiers, 12)
+        # The second request did not compute the row again
+        self.assertEqual(list(factor_type_map.yield_factor_identifier((0, 0))), [
+            ((0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)), ((0, 0), (0, 1), (0, 2), (2, 0), (2, 1), (2, 2))])
+        self.assertEqual(factor_type_map.number_factors, 4)
+        self.assertEqual(factor_type_map.number_identifiers, 24)
+
+    def test_eager_precomputation(self):
+        factor_type_map = FactorTypeMaps(self._filename, precompute_factors=True, lazy_precomputation=False)["Harmonic"]
+        self.assertEqual(factor_type_map.number_factors, 12)
+        self.assertEqual(factor_type_map.number_identifiers, 24)
+        # Arrays of 24 identifiers, 12 factor ends, and 2 * 9 row boundaries with 8 bytes per entry
+        self.assertEqual(factor_type_map.memory_size, 8 * (24 + 12 + 18))
+
+    def test_lazy_precomputation_logs_size_for_every_quarter(self):
+        factor_type_map = FactorTypeMaps(self._filename, precompute_factors=True)["Harmonic"]
+        with mock.patch.object(factor_type_maps_module, "_logger") as logger_mock:
+            for root_node_number in range(3):
+                for leaf_node_number in range(3):
+                    list(factor_type_map.yield_factor_identifier((root_node_number, leaf_node_number)))
+        # 9 rows pass the quarters after the 3rd, 5th, 7th and 9th computed row
+        self.assertEqual(logger_mock.info.call_count, 4)
+        self.assertIn("9 out of 9 leaf units", logger_mock.info.call_args[0][0])
+
+    def test_leaf_unit_missing_in_local_factor_type_map_raises_error(self):
+        self.assertEqual(self._factors(False, True, "Bond", (1, 0)), [((1, 0), (1, 1))])
+        with self.assertRaises(FactorSetError):
+            self._factors(False, True, "Bond", (1, 2))
+        with self.assertRaises(FactorSetError):
+            self._factors(True, False, "Bond", (1, 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -22,12 +22,14 @@
 from unittest import TestCase, main, mock
 from configparser import ConfigParser
 import importlib
+import importlib.util
 import os
+import pickle
 import sys
 from jellyfysh.base import factory
-# Below, the factory.build_from_config function is patched.
-# The original version can then be accessed using build_from_config_original
-from jellyfysh.base.factory import build_from_config as build_from_config_original
+# Below, the factory.create_plan function is patched.
+# The original version can then be accessed using create_plan_original
+from jellyfysh.base.factory import create_plan as create_plan_original
 from jellyfysh.base.exceptions import ConfigurationError
 
 _path_added = False
@@ -64,31 +66,33 @@ def _import_module_function(name):
     return importlib.import_module(name[len("jellyfysh."):])
 
 
-def _resource_isdir_function(resource_name, directory):
+def _find_spec_function(name):
     """
-    This function replaces the resource_isdir function in the factory.
+    This function replaces the find_spec function in the factory.
 
-    The factory uses setuptools resource management system to check whether certain directories exist in jellyfysh.
-    Here, we just need to use os.path.isdir on the directory instead, since the working directory is changed to the
-    unittests directory in the setUpModule function.
+    The factory uses the find_spec function to check whether certain packages exist in jellyfysh. The test classes,
+    however, are not a part of the jellyfysh package. This function therefore removes the jellyfysh package from the
+    module name that should be found.
     """
-    assert resource_name == "jellyfysh"
-    return os.path.isdir(directory)
+    assert name.startswith("jellyfysh.")
+    return importlib.util.find_spec(name[len("jellyfysh."):])
 
 
-def _build_from_config_function(config, section, package, class_name=None):
+def _create_plan_function(config, section, package, class_name=None):
     """
-    This function replaces the build_from_config function in the factory.
+    This function replaces the create_plan function in the factory.
 
     The factory checks that the package starts with 'jellyfysh.'. Since the test classes are not a part of the jellyfysh
-    package, this function prepends 'jellyfysh.' to the package argument and then uses the original build_from_config
+    package, this function prepends 'jellyfysh.' to the package argument and then uses the original create_plan
     function.
     """
-    return build_from_config_original(config, section, "jellyfysh." + package, class_name)
+    if package.startswith("jellyfysh."):
+        package = package[len("jellyfysh."):]
+    return create_plan_original(config, section, "jellyfysh." + package, class_name)
 
 
-@mock.patch("jellyfysh.base.factory.build_from_config", side_effect=_build_from_config_function)
-@mock.patch("jellyfysh.base.factory.resource_isdir", side_effect=_resource_isdir_function)
+@mock.patch("jellyfysh.base.factory.create_plan", side_effect=_create_plan_function)
+@mock.patch("jellyfysh.base.factory.find_spec", side_effect=_find_spec_function)
 @mock.patch("jellyfysh.base.factory.import_module", side_effect=_import_module_function)
 class TestFactory(TestCase):
     def setUp(self) -> None:
@@ -391,8 +395,7 @@ class TestFactory(TestCase):
 
     def test_non_jellyfysh_package_raises_error(self, _, __, ___):
         with self.assertRaises(AssertionError):
-            build_from_config_original(self._config, "SimpleClassDefaultConstructable",
-                                       "test_base.test_classes_for_factory")
+            create_plan_original(self._config, "SimpleClassDefaultConstructable", "test_base.test_classes_for_factory")
 
     def test_used_sections(self, _, __, ___):
         self._config["CustomClassWithAbstractClass"] = {"abstract_class": "simple_inheriting_class"}
@@ -404,6 +407,53 @@ class TestFactory(TestCase):
         self.assertEqual(factory.used_sections, ["CustomClassWithAbstractClass", "SimpleInheritingClass",
                                                  "SomeSectionName"])
 
+    def test_build_from_plan(self, _, __, ___):
+        module_custom = importlib.import_module("test_base.test_classes_for_factory.custom_class_default_constructable")
+        self._config["CustomClassDefaultConstructable"] = {"simple_class": "test (simple_class_default_constructable)"}
+        self._config["Test"] = {"some_integer": "-3", "some_float": "2.5"}
+        plan = factory.create_plan(self._config, "CustomClassDefaultConstructable",
+                                   "test_base.test_classes_for_factory")
+        # Plans only store names and converted values and can therefore be pickled
+        unpickled_plan = pickle.loads(pickle.dumps(plan))
+        self.assertEqual(unpickled_plan, plan)
+        self.assertEqual(list(plan.yield_sections()), ["CustomClassDefaultConstructable", "Test"])
+        built_objects = []
+        created = factory.build_from_plan(unpickled_plan,
+                                          lambda built_plan, instance: built_objects.append((built_plan, instance)))
+        self.assertIsInstance(created, module_custom.CustomClassDefaultConstructable)
+        self.assertEqual(created.simple_class.__class__.__name__, "Test (SimpleClassDefaultConstructable)")
+        self.assertEqual(created.simple_class.some_integer, -3)
+        self.assertEqual(created.simple_class.some_float, 2.5)
+        # The nested object is built first
+        self.assertEqual([built_plan.section for built_plan, _ in built_objects],
+                         ["Test", "CustomClassDefaultConstructable"])
+        self.assertIs(built_objects[0][1], created.simple_class)
+        self.assertIs(built_objects[1][1], created)
+
+    def test_replace_sections(self, _, __, ___):
+        self._config["CustomClassDefaultConstructable"] = {"simple_class": "test (simple_class_default_constructable)"}
+        self._config["Test"] = {"some_integer": "-3"}
+        plan = factory.create_plan(self._config, "CustomClassDefaultConstructable",
+                                   "test_base.test_classes_for_factory")
+        self._config["Test"]["some_integer"] = "4"
+        replaced_plan = plan.replace_sections(self._config, ["Test"])
+        self.assertNotEqual(replaced_plan, plan)
+        self.assertEqual(plan.arguments["simple_class"].arguments["some_integer"], -3)
+        self.assertEqual(replaced_plan.arguments["simple_class"].arguments["some_integer"], 4)
+        created = factory.build_from_plan(replaced_plan)
+        self.assertEqual(created.simple_class.__class__.__name__, "Test (SimpleClassDefaultConstructable)")
+        self.assertEqual(created.simple_class.some_integer, 4)
+        # Replacing sections which do not appear in the plan does not change it
+        self.assertEqual(plan.replace_sections(self._config, ["OtherSection"]), plan)
+
+    def test_replace_sections_wrong_value_raises_error(self, _, __, ___):
+        self._config["SimpleClassDefaultConstructable"] = {"some_bool": "yes"}
+        plan = factory.create_plan(self._config, "SimpleClassDefaultConstructable",
+                                   "test_base.test_classes_for_factory")
+        self._config["SimpleClassDefaultConstructable"]["some_bool"] = "maybe"
+        with self.assertRaises(TypeError):
+            plan.replace_sections(self._config, ["SimpleClassDefaultConstructable"])
+
     def test_get_alias_alias_set(self, _, __, ___):
         self.assertEqual(factory.get_alias("Test (SomeClass)"), "Test")
 
@@ -275,6 +275,37 @@ class TestNode(ExpandedTestCase, TestCase):
 
         setting.reset()
 
+    def test_copy_cnode_tree(self):
+        root_unit = unit.Unit(identifier=(0,), position=[2.1, 8.3], charge={"e": 0.0}, velocity=[0.0, 1.0])
+        root_cnode = node.Node(root_unit, weight=1)
+        child_unit_one = unit.Unit(identifier=(0, 0), position=[1.1, 8.3], charge={"e": 1.0}, velocity=[0.0, 0.5])
+        child_unit_two = unit.Unit(identifier=(0, 1), position=[3.1, 8.3], charge={"e": -1.0}, velocity=None)
+        root_cnode.add_child(node.Node(child_unit_one, weight=0.5))
+        root_cnode.add_child(node.Node(child_unit_two, weight=0.5))
+
+        copied_cnode = node.copy_cnode_tree(root_cnode)
+        self.assertIsNot(copied_cnode, root_cnode)
+        self.assertIsNone(copied_cnode.parent)
+        self.assertEqual(copied_cnode.weight, 1)
+        self.assertEqual(len(copied_cnode.children), 2)
+        for original, copy in [(root_cnode, copied_cnode), (root_cnode.children[0], copied_cnode.children[0]),
+                               (root_cnode.children[1], copied_cnode.children[1])]:
+            self.assertIsNot(copy.value, original.value)
+            self.assertEqual(copy.value.identifier, original.value.identifier)
+            self.assertIsNot(copy.value.position, original.value.position)
+            self.assertEqual(copy.value.position, original.value.position)
+            self.assertIs(copy.value.charge, original.value.charge)
+            self.assertEqual(copy.value.velocity, original.value.velocity)
+            self.assertEqual(copy.weight, original.weight)
+        self.assertIs(copied_cnode.children[0].parent, copied_cnode)
+        self.assertIs(copied_cnode.children[1].parent, copied_cnode)
+
+        # The copy should not be affected by modifications of the original
+        root_cnode.children[0].value.position[0] = 5.0
+        root_cnode.children[0].value.velocity[1] = 0.0
+        self.assertEqual(copied_cnode.children[0].value.position, [1.1, 8.3])
+        self.assertEqual(copied_cnode.children[0].value.velocity, [0.0, 0.5])
+
 
 if __name__ == '__main__':
     main()
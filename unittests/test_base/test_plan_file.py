@@ -0,0 +1,156 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from configparser import ConfigParser
+import os
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base import factory
+from jellyfysh.base.factory import ConstructionPlan
+from jellyfysh.base.plan_file import (is_plan_file, override_config, override_plans, read_plan_file,
+                                      static_data_filename, StaticData, write_plan_file)
+from jellyfysh.estimator import Estimator
+from jellyfysh.potential import Potential
+
+
+class CountingEstimator(Estimator):
+    # Estimator which returns the direction as the bounds and counts the calls of the derivative_bound method
+    def __init__(self, potential: Potential) -> None:
+        super().__init__(potential, periodic_boundaries=False)
+        self.number_of_calls = 0
+
+    def derivative_bound(self, lower_corner, upper_corner, direction, calculate_lower_bound=False):
+        self.number_of_calls += 1
+        return [float(direction), -float(direction)] if calculate_lower_bound else [float(direction)]
+
+    def charge_correction_factor(self, active_charges, target_charges=None):
+        return 1.0
+
+
+class TestPlanFile(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "run.plan")
+        self._config = ConfigParser()
+        self._config.read_dict({"HypercubicSetting": {"system_length": "1.0", "beta": "1.0", "dimension": "2"},
+                                "FinalTimeEndOfRunEventHandler": {"end_of_run_time": "10.0"}})
+        self._setting_plan = factory.create_plan(self._config, "HypercubicSetting", "jellyfysh.setting")
+        self._end_of_run_plan = factory.create_plan(self._config, "FinalTimeEndOfRunEventHandler",
+                                                    "jellyfysh.event_handler")
+        self._potential_mock = mock.MagicMock(spec_set=Potential)
+        self._potential_mock.number_charge_arguments = 0
+
+    def tearDown(self) -> None:
+        factory.used_sections = []
+        self._directory.cleanup()
+
+    def test_write_and_read_plan_file(self):
+        write_plan_file(self._filename, self._config, self._setting_plan, self._end_of_run_plan)
+        self.assertTrue(is_plan_file(self._filename))
+        config, setting_plan, end_of_run_plan = read_plan_file(self._filename)
+        self.assertEqual(setting_plan, self._setting_plan)
+        self.assertEqual(end_of_run_plan, self._end_of_run_plan)
+        self.assertEqual(config.get("FinalTimeEndOfRunEventHandler", "end_of_run_time"), "10.0")
+        self.assertEqual(end_of_run_plan.arguments, {"end_of_run_time": 10.0})
+
+    def test_configuration_file_is_no_plan_file(self):
+        with open(self._filename, "w") as file:
+            file.write("[Run]\n")
+        self.assertFalse(is_plan_file(self._filename))
+        with self.assertRaises(ValueError):
+            read_plan_file(self._filename)
+
+    def test_override_plans(self):
+        setting_plan, end_of_run_plan = override_plans(
+            self._config, [self._setting_plan, self._end_of_run_plan],
+            ["FinalTimeEndOfRunEventHandler.end_of_run_time=20", "FinalTimeEndOfRunEventHandler.output_handler=out"])
+        self.assertEqual(setting_plan, self._setting_plan)
+        self.assertEqual(end_of_run_plan.arguments, {"end_of_run_time": 20.0, "output_handler": "out"})
+
+    def test_override_plans_unused_section_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            override_plans(self._config, [self._setting_plan, self._end_of_run_plan], ["SomeSection.option=1"])
+
+    def test_override_plans_unknown_option_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            override_plans(self._config, [self._setting_plan, self._end_of_run_plan],
+                           ["FinalTimeEndOfRunEventHandler.option=1"])
+
+    def test_override_config(self):
+        self.assertEqual(override_config(self._config, ["HypercubicSetting.beta=2.0", "NewSection.option=a=b",
+                                                        "HypercubicSetting.dimension=3"]),
+                         ["HypercubicSetting", "NewSection"])
+        self.assertEqual(self._config.get("HypercubicSetting", "beta"), "2.0")
+        self.assertEqual(self._config.get("HypercubicSetting", "dimension"), "3")
+        self.assertEqual(self._config.get("NewSection", "option"), "a=b")
+        for wrong_override in ["HypercubicSetting.beta", "beta=2.0", "HypercubicSetting.=2.0"]:
+            with self.assertRaises(ConfigurationError):
+                override_config(self._config, [wrong_override])
+
+    def test_static_data_reused(self):
+        estimator_plan = ConstructionPlan("CountingEstimator", "jellyfysh.estimator", "test_plan_file",
+                                          "CountingEstimator", {})
+        filename = static_data_filename(self._filename)
+        static_data = StaticData(filename, self._setting_plan)
+        estimator = CountingEstimator(self._potential_mock)
+        static_data.object_built(estimator_plan, estimator)
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 1, calculate_lower_bound=True),
+                         [1.0, -1.0])
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 1, calculate_lower_bound=True),
+                         [1.0, -1.0])
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 0), [0.0])
+        self.assertEqual(estimator.number_of_calls, 2)
+        self.assertFalse(os.path.exists(filename))
+        static_data.write()
+        self.assertTrue(is_plan_file(filename))
+
+        # The bounds are reused by an estimator with the same plan and setting
+        estimator = CountingEstimator(self._potential_mock)
+        StaticData(filename, self._setting_plan).object_built(estimator_plan, estimator)
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 1, calculate_lower_bound=True),
+                         [1.0, -1.0])
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 0), [0.0])
+        self.assertEqual(estimator.number_of_calls, 0)
+
+        # A different setting requires new bounds
+        self._config.set("HypercubicSetting", "beta", "2.0")
+        other_setting_plan = self._setting_plan.replace_sections(self._config, ["HypercubicSetting"])
+        estimator = CountingEstimator(self._potential_mock)
+        StaticData(filename, other_setting_plan).object_built(estimator_plan, estimator)
+        self.assertEqual(estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 0), [0.0])
+        self.assertEqual(estimator.number_of_calls, 1)
+
+    def test_static_data_not_set_for_other_objects(self):
+        static_data = StaticData(static_data_filename(self._filename), self._setting_plan)
+        static_data.object_built(self._end_of_run_plan, object())
+        static_data.write()
+        self.assertFalse(os.path.exists(static_data_filename(self._filename)))
+
+    def test_estimator_without_cache(self):
+        estimator = CountingEstimator(self._potential_mock)
+        estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 0)
+        estimator.cached_derivative_bound([1.0, 1.0], [2.0, 2.0], 0)
+        self.assertEqual(estimator.number_of_calls, 2)
+
+
+if __name__ == '__main__':
+    main()
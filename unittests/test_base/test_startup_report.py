@@ -0,0 +1,98 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import io
+import os
+import sys
+import tempfile
+from unittest import TestCase, main
+from jellyfysh.base.startup_report import StartupReport
+
+
+class TestStartupReport(TestCase):
+    def setUp(self) -> None:
+        # Create a package with a module that imports another module
+        self._directory = tempfile.TemporaryDirectory()
+        package_directory = os.path.join(self._directory.name, "startup_report_test_package")
+        os.mkdir(package_directory)
+        with open(os.path.join(package_directory, "__init__.py"), "w") as file:
+            file.write("")
+        with open(os.path.join(package_directory, "outer.py"), "w") as file:
+            file.write("from . import inner\nvalue = inner.value + 1\n")
+        with open(os.path.join(package_directory, "inner.py"), "w") as file:
+            file.write("value = 1\n")
+        sys.path.insert(0, self._directory.name)
+        self._report = StartupReport()
+
+    def tearDown(self) -> None:
+        self._report.stop()
+        sys.path.remove(self._directory.name)
+        for name in ("startup_report_test_package", "startup_report_test_package.outer",
+                     "startup_report_test_package.inner"):
+            sys.modules.pop(name, None)
+        self._directory.cleanup()
+
+    def test_imports_timed(self):
+        self._report.start()
+        # noinspection PyUnresolvedReferences
+        import startup_report_test_package.outer
+        self._report.stop()
+        self.assertEqual(startup_report_test_package.outer.value, 2)
+        self.assertEqual([(name, depth) for name, depth, _, _ in self._report.imports],
+                         [("startup_report_test_package", 0), ("startup_report_test_package.inner", 1),
+                          ("startup_report_test_package.outer", 0)])
+        for _, _, self_time, cumulative_time in self._report.imports:
+            self.assertGreaterEqual(cumulative_time, self_time)
+        self.assertGreaterEqual(self._report.imports[2][3], self._report.imports[1][3])
+
+    def test_imports_not_timed_after_stop(self):
+        self._report.start()
+        self._report.stop()
+        # noinspection PyUnresolvedReferences
+        import startup_report_test_package.outer
+        self.assertEqual(self._report.imports, [])
+
+    def test_phase(self):
+        with self._report.phase("first phase"):
+            pass
+        self.assertEqual(len(self._report.phases), 1)
+        self.assertEqual(self._report.phases[0][0], "first phase")
+        self.assertGreaterEqual(self._report.phases[0][1], 0.0)
+
+    def test_write(self):
+        self._report.start()
+        # noinspection PyUnresolvedReferences
+        import startup_report_test_package.outer
+        self._report.stop()
+        with self._report.phase("first phase"):
+            pass
+        file = io.StringIO()
+        self._report.write(file)
+        lines = file.getvalue().splitlines()
+        self.assertEqual(lines[0], "import time: self [us] | cumulative | imported package")
+        self.assertTrue(lines[2].startswith("import time:"))
+        self.assertTrue(lines[2].endswith("|   startup_report_test_package.inner"))
+        self.assertTrue(lines[-1].startswith("startup phase:"))
+        self.assertTrue(lines[-1].endswith("| first phase"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from configparser import ConfigParser
+import contextlib
+import os
+from pkg_resources import resource_filename
+import shutil
+import unittest
+from unittest import mock
+import sys
+from jellyfysh.activator.tagger.factor_type_maps import FactorTypeMaps
+import jellyfysh.resume as resume
+import jellyfysh.run as run
+import jellyfysh.setting as setting
+
+
+class TestCellVetoCheckpoint(unittest.TestCase):
+    # Run the cell-veto configuration with a hierarchical cell sampler, and resume it from a checkpoint
+    _output_files = ["TestCellVetoCheckpoint.dat", "TestCellVetoCheckpoint.dat.tmp", "TestCellVetoCheckpoint_full.dat",
+                     "TestCellVetoCheckpoint_checkpoint.dat"]
+
+    def setUp(self) -> None:
+        self._config = ConfigParser()
+        self._ini_file = resource_filename(
+            "jellyfysh", "config_files/2018_JCP_149_064113/coulomb_atoms/cell_veto.ini")
+        if not self._config.read(self._ini_file):
+            self.fail("Could not read the ini file {0}.".format(self._ini_file))
+        # Reduce end of run time
+        self._config.set("FinalTimeEndOfRunEventHandler", "end_of_run_time", "10")
+        # Replace output file
+        self._config.set("SeparationOutputHandler", "filename", "TestCellVetoCheckpoint.dat")
+        # Sample the target cells of the cell-veto event handler hierarchically
+        self._config.set("SingleActiveCellOccupancy", "cells", "indexed_cuboid_periodic_cells")
+        self._config.add_section("IndexedCuboidPeriodicCells")
+        self._config.set("IndexedCuboidPeriodicCells", "cells_per_side",
+                         self._config.get("CuboidPeriodicCells", "cells_per_side"))
+        self._config.remove_section("CuboidPeriodicCells")
+        self._config.set("LeafUnitCellVetoEventHandler", "block_level", "1")
+        # Write two checkpoints during the run
+        self._config.set("TagActivator", "taggers",
+                         self._config.get("TagActivator", "taggers") + ",\ndumping (no_in_state_tagger)")
+        for section in ("EndOfRun", "StartOfRun"):
+            option = "trash" if section == "EndOfRun" else "create"
+            self._config.set(section, option, self._config.get(section, option) + ", dumping")
+        self._config.add_section("Dumping")
+        self._config.set("Dumping", "create", "dumping")
+        self._config.set("Dumping", "trash", "dumping")
+        self._config.set("Dumping", "event_handler", "fixed_interval_dumping_event_handler")
+        self._config.add_section("FixedIntervalDumpingEventHandler")
+        self._config.set("FixedIntervalDumpingEventHandler", "dumping_interval", "3.5")
+        self._config.set("FixedIntervalDumpingEventHandler", "output_handler", "checkpoint_output_handler")
+        self._config.set("InputOutputHandler", "output_handlers",
+                         "separation_output_handler, checkpoint_output_handler")
+        self._config.add_section("CheckpointOutputHandler")
+        self._config.set("CheckpointOutputHandler", "filename", "TestCellVetoCheckpoint_checkpoint.dat")
+
+    @staticmethod
+    def _static_files():
+        return [filename for filename in os.listdir(".")
+                if filename.startswith("TestCellVetoCheckpoint_checkpoint_static_")]
+
+    @staticmethod
+    def _read_samples(filename):
+        with open(filename, "r") as file:
+            return [line for line in file if not line.startswith("#")]
+
+    def tearDown(self) -> None:
+        for output_file in self._output_files + self._static_files():
+            if output_file in os.listdir("."):
+                os.remove(output_file)
+        # Reset setting
+        setting.reset()
+        # Reset factor type maps singleton
+        FactorTypeMaps._instance = None
+
+    @mock.patch("jellyfysh.run.read_config")
+    def test_resume_cell_veto_checkpoint(self, read_config_mock):
+        sys.argv[1:] = [self._ini_file]
+        read_config_mock.return_value = self._config
+        print("\nTest if the .ini file {0} with a hierarchical cell-veto sampler can be resumed from a checkpoint..."
+              .format(self._ini_file), end="")
+        # Redirect stdout to the null device
+        with open(os.devnull, 'w') as devnull:
+            with contextlib.redirect_stdout(devnull):
+                run.main()
+        read_config_mock.assert_called_once_with(self._ini_file)
+        self.assertIn("TestCellVetoCheckpoint.dat", os.listdir("."))
+        self.assertIn("TestCellVetoCheckpoint_checkpoint.dat", os.listdir("."))
+        self.assertEqual(len(self._static_files()), 1)
+        shutil.copyfile("TestCellVetoCheckpoint.dat", "TestCellVetoCheckpoint_full.dat")
+
+        setting.reset()
+        FactorTypeMaps._instance = None
+        sys.argv[1:] = ["TestCellVetoCheckpoint_checkpoint.dat"]
+        with open(os.devnull, 'w') as devnull:
+            with contextlib.redirect_stdout(devnull):
+                resume.main()
+        # The resumed run writes the samples after the last checkpoint, which should agree with the uninterrupted run
+        full_samples = self._read_samples("TestCellVetoCheckpoint_full.dat")
+        resumed_samples = self._read_samples("TestCellVetoCheckpoint.dat")
+        self.assertGreater(len(resumed_samples), 0)
+        self.assertLess(len(resumed_samples), len(full_samples))
+        self.assertEqual(resumed_samples, full_samples[-len(resumed_samples):])
+        self.assertEqual(len(self._static_files()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
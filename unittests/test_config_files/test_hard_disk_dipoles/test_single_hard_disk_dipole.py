@@ -71,7 +71,8 @@ class TestSingleHardDiskDipole(unittest.TestCase):
         with open(os.devnull, 'w') as devnull:
             with contextlib.redirect_stdout(devnull):
                 run.main()
-        set_up_logging_mock.assert_called_once_with(Namespace(config_file=self._ini_file, logfile=None, verbose=None))
+        set_up_logging_mock.assert_called_once_with(Namespace(config_file=self._ini_file, logfile=None, verbose=None,
+                                                                   startup_report=False, overrides=[]))
         read_config_mock.assert_called_once_with(self._ini_file)
         self.assertIn("TestSingleHardDiskDipole.dat", os.listdir("."))
 
@@ -0,0 +1,207 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from copy import deepcopy
+import random
+from unittest import TestCase, main, mock
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
+from jellyfysh.event_handler.hierarchical_cell_veto_sampler import (HierarchicalCellVetoSampler, TopBlockRateCache,
+                                                                     TopBlockRates)
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercuboid_setting
+
+
+class _CellOccupancy(object):
+    """Minimal cell-occupancy system which stores the number of occupants of all blocks of the occupied cells."""
+    def __init__(self, cells, occupied_cells):
+        self._cells = cells
+        self._block_occupancy = [[0] * cells.number_of_blocks(level) for level in range(cells.number_of_block_levels)]
+        self._block_transitions = [[] for _ in range(cells.number_of_block_levels)]
+        for cell in occupied_cells:
+            self.change(cell, 1)
+
+    def change(self, cell, change):
+        for level in range(self._cells.number_of_block_levels):
+            block = self._cells.block(cell, level)
+            self._block_occupancy[level][block] += change
+            if self._block_occupancy[level][block] == (1 if change > 0 else 0):
+                self._block_transitions[level].append(block)
+
+    def block_occupancy(self, level):
+        return self._block_occupancy[level]
+
+    def number_of_block_transitions(self, level):
+        return len(self._block_transitions[level])
+
+    def block_transitions(self, level, number_of_known_transitions):
+        return self._block_transitions[level][number_of_known_transitions:]
+
+
+class TestHierarchicalCellVetoSampler(TestCase):
+    def setUp(self) -> None:
+        hypercuboid_setting.HypercuboidSetting(beta=1.0, dimension=2, system_lengths=[1.0, 2.0])
+        # Set these values so that the setting package is fully initialized.
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(1)
+        setting.set_number_of_nodes_per_root_node(1)
+        random.seed(11)
+        self._cells = IndexedCuboidPeriodicCells(cells_per_side=[6, 5], neighbor_layers=1)
+        self._rates = [0.0 if cell in self._cells.nearby_cells(self._cells.zero_cell) else random.uniform(0.1, 2.0)
+                       for cell in self._cells.yield_cells()]
+        self._occupied_cells = [1, 3, 7, 9, 14, 16, 17, 20, 26, 28]
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    def _rate(self, cell, active_cell):
+        return self._rates[self._cells.relative_cell(cell, active_cell)]
+
+    def _brute_force_block_rate(self, block, level, active_cell):
+        return sum(self._rate(cell, active_cell) for cell in self._cells.yield_cells()
+                   if self._cells.block(cell, level) == block)
+
+    def test_block_rate(self):
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, 1)
+        for active_cell in self._cells.yield_cells():
+            for level in range(self._cells.number_of_block_levels):
+                for block in range(self._cells.number_of_blocks(level)):
+                    self.assertAlmostEqual(
+                        sampler.block_rate(block, level, self._cells.cell_coordinates(active_cell)),
+                        self._brute_force_block_rate(block, level, active_cell), places=12)
+
+    def test_sample_cell_without_occupied_blocks_returns_none(self):
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, 1)
+        self.assertIsNone(TopBlockRateCache(sampler, _CellOccupancy(self._cells, [])).sample_cell(0))
+
+    def test_sample_cell_with_only_nearby_occupied_cells_returns_none(self):
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, 0)
+        cache = TopBlockRateCache(sampler, _CellOccupancy(self._cells, self._cells.nearby_cells(0)))
+        self.assertIsNone(cache.sample_cell(0))
+
+    def test_sample_cell_with_vanishing_child_rates_terminates(self):
+        # The rates of all cells in the occupied block on level 1 are below the tolerance of the summed-area table but
+        # their sum is above it
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, 2)
+        active_cell = 0
+        block = self._cells.block(14, 2)
+        cells_in_block = [cell for cell in self._cells.yield_cells() if self._cells.block(cell, 2) == block]
+        cell_occupancy = _CellOccupancy(self._cells, [14])
+        cache = TopBlockRateCache(sampler, cell_occupancy)
+        top_block_rates = cache.top_block_rates(active_cell)
+        with mock.patch.object(sampler, "block_rate", return_value=0.0):
+            for _ in range(100):
+                sample = sampler.sample_cell(active_cell, cell_occupancy, top_block_rates)
+                self.assertIsNotNone(sample)
+                self.assertIn(sample[2], cells_in_block)
+
+    def test_sample_cell_with_vanishing_rates_in_last_trial_terminates(self):
+        # A top block whose rate is above the tolerance although all its cells have a vanishing rate
+        rates = [0.0] * len(self._rates)
+        sampler = HierarchicalCellVetoSampler(self._cells, rates, 1)
+        cell_occupancy = _CellOccupancy(self._cells, self._occupied_cells)
+        top_block_rates = TopBlockRates(
+            [1.0e-20 if number_of_occupants else 0.0 for number_of_occupants in cell_occupancy.block_occupancy(1)])
+        # The rejected trials are still returned so that their time is not lost
+        self.assertEqual(sampler.sample_cell(0, cell_occupancy, top_block_rates),
+                         (top_block_rates.total_rate(), sampler._maximum_number_of_trials, None))
+
+    def test_top_block_rates(self):
+        rates = [random.uniform(0.0, 1.0) if random.random() < 0.7 else 0.0 for _ in range(13)]
+        top_block_rates = TopBlockRates(rates)
+        for _ in range(100):
+            block = random.randrange(len(rates))
+            rates[block] = random.uniform(0.0, 1.0) if random.random() < 0.7 else 0.0
+            top_block_rates.set_rate(block, rates[block])
+            self.assertAlmostEqual(top_block_rates.total_rate(), sum(rates), places=12)
+            cumulative_rate = 0.0
+            for index, rate in enumerate(rates):
+                if rate > 0.0:
+                    self.assertEqual(top_block_rates.sample_block(cumulative_rate + 0.5 * rate), index)
+                cumulative_rate += rate
+        self.assertIsNone(top_block_rates.sample_block(2.0 * sum(rates)))
+
+    def test_cached_top_block_rates_updated_incrementally(self):
+        for top_block_level in range(3):
+            sampler = HierarchicalCellVetoSampler(self._cells, self._rates, top_block_level)
+            cell_occupancy = _CellOccupancy(self._cells, self._occupied_cells)
+            cache = TopBlockRateCache(sampler, cell_occupancy)
+            occupied_cells = list(self._occupied_cells)
+            for _ in range(200):
+                active_cell = random.choice([0, 13, 22])
+                expected_total_rate = sum(
+                    sampler.top_block_rate(block, active_cell)
+                    for block, number_of_occupants in enumerate(cell_occupancy.block_occupancy(top_block_level))
+                    if number_of_occupants)
+                self.assertAlmostEqual(cache.top_block_rates(active_cell).total_rate(), expected_total_rate,
+                                       places=12)
+                # Move an occupant to a random cell
+                cell = occupied_cells.pop(random.randrange(len(occupied_cells)))
+                cell_occupancy.change(cell, -1)
+                cell = random.randrange(self._cells.number_of_cells)
+                occupied_cells.append(cell)
+                cell_occupancy.change(cell, 1)
+
+    def test_deepcopy_of_cache_shares_sampler_and_cell_occupancy(self):
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, 1)
+        cell_occupancy = _CellOccupancy(self._cells, self._occupied_cells)
+        cache = TopBlockRateCache(sampler, cell_occupancy)
+        top_block_rates = cache.top_block_rates(13)
+        copied_cache = deepcopy(cache)
+        self.assertIs(copied_cache._sampler, sampler)
+        self.assertIs(copied_cache._cell_occupancy, cell_occupancy)
+        self.assertIsNot(copied_cache.top_block_rates(13), top_block_rates)
+
+    def _check_sample_cell(self, top_block_level, active_cell):
+        sampler = HierarchicalCellVetoSampler(self._cells, self._rates, top_block_level)
+        cache = TopBlockRateCache(sampler, _CellOccupancy(self._cells, self._occupied_cells))
+        occupied_top_blocks = set(self._cells.block(cell, top_block_level) for cell in self._occupied_cells)
+        expected_total_rate = sum(self._brute_force_block_rate(block, top_block_level, active_cell)
+                                  for block in occupied_top_blocks)
+        occupied_rate = sum(self._rate(cell, active_cell) for cell in self._occupied_cells)
+        number_of_samples = 10000
+        counts = {}
+        number_of_trials = 0
+        for _ in range(number_of_samples):
+            total_rate, trials, target_cell = cache.sample_cell(active_cell)
+            self.assertAlmostEqual(total_rate, expected_total_rate, places=12)
+            counts[target_cell] = counts.get(target_cell, 0) + 1
+            number_of_trials += trials
+        self.assertLessEqual(set(counts), set(self._occupied_cells))
+        for cell in self._occupied_cells:
+            self.assertAlmostEqual(counts.get(cell, 0) / number_of_samples,
+                                   self._rate(cell, active_cell) / occupied_rate, delta=0.02)
+        # The mean number of trials equals the ratio of the total rate and the rate of the occupied cells.
+        self.assertAlmostEqual(number_of_trials / number_of_samples, expected_total_rate / occupied_rate,
+                               delta=0.05 * expected_total_rate / occupied_rate)
+
+    def test_sample_cell_top_block_level_zero(self):
+        self._check_sample_cell(0, 0)
+
+    def test_sample_cell_top_block_level_one(self):
+        self._check_sample_cell(1, 13)
+
+    def test_sample_cell_top_block_level_two(self):
+        self._check_sample_cell(2, 22)
+
+
+if __name__ == '__main__':
+    main()
@@ -20,10 +20,14 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 import contextlib
+import io
 from unittest import TestCase, main, mock
 import os
 from jellyfysh.activator.internal_state.cell_occupancy.cells import PeriodicCells
+from jellyfysh.activator.internal_state.cell_occupancy.cells.indexed_cuboid_periodic_cells import \
+    IndexedCuboidPeriodicCells
 from jellyfysh.base.node import Node
+from jellyfysh.base.time import Time
 from jellyfysh.base.unit import Unit
 from jellyfysh.estimator import Estimator
 from jellyfysh.event_handler.leaf_unit_cell_veto_event_handler import LeafUnitCellVetoEventHandler
@@ -200,9 +204,9 @@ class TestLeafUnitCellVetoEventHandler(TestCase):
         setting.set_number_of_node_levels(1)
 
         self._estimator_without_charge_mock = mock.MagicMock(spec_set=Estimator)
-        self._estimator_without_charge_mock.derivative_bound.side_effect = mock_derivative_bound
+        self._estimator_without_charge_mock.cached_derivative_bound.side_effect = mock_derivative_bound
         self._estimator_with_charge_mock = mock.MagicMock(spec_set=Estimator)
-        self._estimator_with_charge_mock.derivative_bound.side_effect = mock_derivative_bound
+        self._estimator_with_charge_mock.cached_derivative_bound.side_effect = mock_derivative_bound
         # Mock a 4 * 4 cell system
         cells_mock = mock.MagicMock(spec_set=PeriodicCells)
         cells_mock.yield_cells.side_effect = [iter([i for i in range(16)]) for _ in range(4)]
@@ -229,5 +233,49 @@ class TestLeafUnitCellVetoEventHandler(TestCase):
         setting.reset()
 
 
+@mock.patch("jellyfysh.event_handler.abstracts.cell_veto_event_handler.random.expovariate", return_value=1.0)
+class TestLeafUnitCellVetoEventHandlerWithBlockLevel(TestCase):
+    def setUp(self) -> None:
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=2, system_length=1.0)
+        setting.set_number_of_node_levels(1)
+        setting.set_number_of_root_nodes(1)
+        setting.set_number_of_nodes_per_root_node(1)
+        estimator_mock = mock.MagicMock(spec_set=Estimator)
+        estimator_mock.cached_derivative_bound.return_value = (0.5, -0.25)
+        estimator_mock.charge_correction_factor.return_value = 1.0
+        estimator_mock.potential.number_separation_arguments = 1
+        estimator_mock.potential.number_charge_arguments = 0
+        self._event_handler = LeafUnitCellVetoEventHandler(estimator=estimator_mock, block_level=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self._event_handler.initialize(IndexedCuboidPeriodicCells(cells_per_side=[4, 4], neighbor_layers=1), 1)
+        # The hierarchical sampling is replaced by a mock
+        self._cache_mock = mock.MagicMock()
+        self._event_handler._upper_bound_caches = [self._cache_mock, self._cache_mock]
+        self._in_state = [Node(Unit(identifier=(0,), position=[0.1, 0.2], velocity=[0.5, 0.0],
+                                    time_stamp=Time.from_float(1.0)))]
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    def test_send_event_time_with_sampled_cell(self, _):
+        self._cache_mock.sample_cell.return_value = (2.0, 3, 10)
+        event_time, target_cells = self._event_handler.send_event_time(self._in_state)
+        # Three trials with the total event rate 2.0 and the speed 0.5
+        self.assertAlmostEqual(event_time, Time.from_float(1.0 + 3.0 / (2.0 * 0.5)), places=13)
+        self.assertEqual(target_cells, [10])
+
+    def test_send_event_time_keeps_time_of_failed_trials(self, _):
+        # All trials failed because of rounding errors, and the Walker with the total event rate 7 * 0.5 = 3.5 takes
+        # over
+        self._cache_mock.sample_cell.return_value = (2.0, 3, None)
+        event_time, _ = self._event_handler.send_event_time(self._in_state)
+        self.assertAlmostEqual(event_time, Time.from_float(1.0 + 3.0 / (2.0 * 0.5) + 1.0 / (3.5 * 0.5)), places=13)
+
+    def test_send_event_time_without_occupied_blocks(self, _):
+        self._cache_mock.sample_cell.return_value = None
+        event_time, _ = self._event_handler.send_event_time(self._in_state)
+        self.assertAlmostEqual(event_time, Time.from_float(1.0 + 1.0 / (3.5 * 0.5)), places=13)
+
+
 if __name__ == '__main__':
     main()
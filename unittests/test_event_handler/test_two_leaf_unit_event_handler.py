@@ -73,6 +73,25 @@ class TestTwoLeafUnitEventHandler(ExpandedTestCase, TestCase):
     def tearDown(self) -> None:
         setting.reset()
 
+    def test_clone_shares_potential(self, _):
+        cloned_event_handler = self._event_handler_with_charge.clone()
+        self.assertIsNot(cloned_event_handler, self._event_handler_with_charge)
+        self.assertIsInstance(cloned_event_handler, TwoLeafUnitEventHandler)
+        self.assertIs(cloned_event_handler._potential, self._potential_mock_with_charge)
+
+    def test_clone_sends_same_event_time(self, random_expovariate_mock):
+        self._setUpSendEventTime(random_expovariate_mock, self._potential_mock_without_charge)
+        cloned_event_handler = self._event_handler_without_charge.clone()
+        in_state_one = Node(Unit(identifier=(0,), position=[0.2, 0.8], velocity=[-0.25, 0.5],
+                                 time_stamp=Time.from_float(1.2)), weight=1)
+        in_state_one.add_child(Node(Unit(identifier=(0, 2), position=[0.5, 0.9],
+                                         velocity=[-0.5, 1.0], time_stamp=Time.from_float(1.3)), weight=0.5))
+        in_state_two = Node(Unit(identifier=(3,), position=[0.5, 0.6]), weight=1)
+        in_state_two.add_child(Node(Unit(identifier=(3, 1), position=[0.1, 0.3]), weight=0.5))
+        event_time = cloned_event_handler.send_event_time([in_state_one, in_state_two])
+        self.assertEqual(self._potential_mock_without_charge.displacement.call_count, 1)
+        self.assertAlmostEqual(event_time, Time.from_float(1.6), places=13)
+
     def _setUpSendEventTime(self, random_expovariate_mock, potential_mock):
         potential_mock.displacement.return_value = 0.3
         random_expovariate_mock.return_value = 2
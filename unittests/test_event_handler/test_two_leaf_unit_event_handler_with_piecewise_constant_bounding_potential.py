@@ -1112,6 +1112,131 @@ class TestTwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(Expanded
             TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(potential=self._potential_mock_without_charge,
                                                                           offset=0.05, max_displacement=-0.1)
 
+    def _send_event_time_reused_segment(self, event_handler, active_position, partner_position, time_stamp):
+        in_state_one = Node(Unit(identifier=(0,), position=active_position, velocity=[0.5, 0.0],
+                                 time_stamp=Time.from_float(time_stamp)), weight=1)
+        in_state_two = Node(Unit(identifier=(1,), position=partner_position), weight=1)
+        return event_handler.send_event_time([in_state_one, in_state_two])
+
+    def test_send_event_time_reuse_bounding_segments(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        # The bounding event rate is 0.2 + 0.05 = 0.25 on the segment of length 0.1 starting at time 1.3
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2]
+        random_expovariate_mock.return_value = 0.01
+        event_time = self._send_event_time_reused_segment(event_handler, [0.2, 0.8], [0.5, 0.6], 1.3)
+        self.assertAlmostEqual(event_time, Time.from_float(1.34), places=13)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 2)
+
+        # The active unit is still located on the stored segment
+        event_time = self._send_event_time_reused_segment(event_handler, [0.22, 0.8], [0.5, 0.6], 1.34)
+        self.assertAlmostEqual(event_time, Time.from_float(1.38), places=13)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 2)
+        self.assertEqual(event_handler._event_rate_from_piecewise_constant_bounding_potential(), 0.25)
+
+        # The sampled potential change is not reached before the end of the stored segment
+        event_time = self._send_event_time_reused_segment(event_handler, [0.24, 0.8], [0.5, 0.6], 1.38)
+        self.assertAlmostEqual(event_time, Time.from_float(1.4), places=13)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 2)
+        self.assertIsNone(event_handler._event_rate_from_piecewise_constant_bounding_potential())
+
+        # The stored segment ended
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2]
+        self._send_event_time_reused_segment(event_handler, [0.25, 0.8], [0.5, 0.6], 1.4)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 4)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_searches, 4)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_resumed_segments, 2)
+
+    def test_send_event_time_reuse_bounding_segments_changed_partner(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2, 0.3, 0.1]
+        random_expovariate_mock.return_value = 0.01
+        self._send_event_time_reused_segment(event_handler, [0.2, 0.8], [0.5, 0.6], 1.3)
+        event_time = self._send_event_time_reused_segment(event_handler, [0.22, 0.8], [0.5, 0.65], 1.34)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 4)
+        self.assertAlmostEqual(event_time, Time.from_float(1.34 + 0.01 / 0.35), places=13)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_searches, 2)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_resumed_segments, 0)
+
+    def test_send_event_time_reuse_bounding_segments_off_active_segment(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2, 0.1, 0.2]
+        random_expovariate_mock.return_value = 0.01
+        self._send_event_time_reused_segment(event_handler, [0.2, 0.8], [0.5, 0.6], 1.3)
+        self._send_event_time_reused_segment(event_handler, [0.23, 0.8], [0.5, 0.6], 1.34)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 4)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_searches, 2)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_resumed_segments, 0)
+        # The stale segment was replaced by the segment starting at the new position
+        segments = event_handler._bounding_segment_store.segments
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(segments[((0,), (1,)), 0][2], [0.23, 0.8])
+
+    def test_stale_bounding_segment_removed(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2]
+        random_expovariate_mock.return_value = 0.01
+        self._send_event_time_reused_segment(event_handler, [0.2, 0.8], [0.5, 0.6], 1.3)
+        self.assertEqual(len(event_handler._bounding_segment_store.segments), 1)
+        # A segment that is resumed stays in the store
+        self.assertIsNotNone(event_handler._resume_bounding_segment((((0,), (1,)), 0)))
+        self.assertEqual(len(event_handler._bounding_segment_store.segments), 1)
+        # The segment was consumed
+        event_handler._active_leaf_unit.time_stamp = Time.from_float(1.45)
+        self.assertIsNone(event_handler._resume_bounding_segment((((0,), (1,)), 0)))
+        self.assertEqual(event_handler._bounding_segment_store.segments, {})
+
+    def test_number_of_bounding_segments_bounded(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        store = event_handler._bounding_segment_store
+        store.maximum_number_of_segments = 2
+        store.store("first", 1)
+        store.store("second", 2)
+        store.segments.move_to_end("first")
+        store.store("third", 3)
+        self.assertEqual(list(store.segments.items()), [("first", 1), ("third", 3)])
+        store.store("second", 4)
+        self.assertEqual(list(store.segments.items()), [("third", 3), ("second", 4)])
+
+    def test_send_event_time_reuse_bounding_segments_shared_among_copies(self, random_expovariate_mock, _):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2]
+        random_expovariate_mock.return_value = 0.01
+        self._send_event_time_reused_segment(event_handler, [0.2, 0.8], [0.5, 0.6], 1.3)
+        event_handler_copy = event_handler.clone()
+        event_time = self._send_event_time_reused_segment(event_handler_copy, [0.22, 0.8], [0.5, 0.6], 1.34)
+        self.assertAlmostEqual(event_time, Time.from_float(1.38), places=13)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 2)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_searches, 2)
+        self.assertEqual(event_handler._bounding_segment_store.number_of_resumed_segments, 1)
+        self.assertIs(event_handler_copy._bounding_segment_store, event_handler._bounding_segment_store)
+
+    def test_bounding_segment_store_not_shared_member(self, _, __):
+        event_handler = TwoLeafUnitEventHandlerWithPiecewiseConstantBoundingPotential(
+            potential=self._potential_mock_without_charge, offset=0.05, max_displacement=0.1,
+            reuse_bounding_segments=True)
+        self.assertNotIn(id(event_handler._bounding_segment_store),
+                         [id(shared_member) for shared_member in event_handler.get_shared_members()])
+
+    def test_send_event_time_without_reuse_bounding_segments(self, random_expovariate_mock, _):
+        self._potential_mock_without_charge.derivative.side_effect = [0.1, 0.2, 0.1, 0.2]
+        random_expovariate_mock.return_value = 0.01
+        self._send_event_time_reused_segment(self._event_handler_without_charge, [0.2, 0.8], [0.5, 0.6], 1.3)
+        self._send_event_time_reused_segment(self._event_handler_without_charge, [0.22, 0.8], [0.5, 0.6], 1.34)
+        self.assertEqual(self._potential_mock_without_charge.derivative.call_count, 4)
+        self.assertEqual(self._event_handler_without_charge._bounding_segment_store.segments, {})
+
     def test_number_send_event_time_arguments_one(self, _, __):
         self.assertEqual(self._event_handler_without_charge.number_send_event_time_arguments, 1)
         self.assertEqual(self._event_handler_with_charge.number_send_event_time_arguments, 1)
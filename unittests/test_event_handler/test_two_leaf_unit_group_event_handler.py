@@ -0,0 +1,207 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import sys
+from unittest import TestCase, main, mock
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.base.node import Node
+from jellyfysh.base.time import Time
+from jellyfysh.base.unit import Unit
+from jellyfysh.event_handler.two_leaf_unit_group_event_handler import TwoLeafUnitGroupEventHandler
+from jellyfysh.potential import InvertiblePotential, Potential
+import jellyfysh.setting as setting
+from jellyfysh.setting import hypercubic_setting
+_unittest_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+_unittest_directory_added_to_path = False
+if _unittest_directory not in sys.path:
+    sys.path.append(_unittest_directory)
+    _unittest_directory_added_to_path = True
+# noinspection PyUnresolvedReferences
+from expanded_test_case import ExpandedTestCase
+
+
+def tearDownModule():
+    if _unittest_directory_added_to_path:
+        sys.path.remove(_unittest_directory)
+
+
+@mock.patch("jellyfysh.event_handler.two_leaf_unit_group_event_handler.random")
+class TestTwoLeafUnitGroupEventHandler(ExpandedTestCase, TestCase):
+    def setUp(self) -> None:
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=2, system_length=1.0)
+
+        self._potential_mock = mock.MagicMock(spec_set=InvertiblePotential)
+        self._potential_mock.number_separation_arguments = 1
+        self._potential_mock.number_charge_arguments = 2
+        self._potential_mock.potential_change_required = True
+        self._potential_mock.displacement.side_effect = [0.4, 0.1, 0.3]
+
+        self._bounding_potential_mock = mock.MagicMock(spec_set=InvertiblePotential)
+        self._bounding_potential_mock.number_separation_arguments = 1
+        self._bounding_potential_mock.number_charge_arguments = 2
+        self._bounding_potential_mock.potential_change_required = True
+        self._bounding_potential_mock.displacement.side_effect = [0.4, 0.1, 0.3]
+        self._bounding_potential_mock.derivative.return_value = 2.0
+
+        self._non_invertible_potential_mock = mock.MagicMock(spec_set=Potential)
+        self._non_invertible_potential_mock.number_separation_arguments = 1
+        self._non_invertible_potential_mock.number_charge_arguments = 2
+        self._non_invertible_potential_mock.derivative.return_value = 1.0
+
+    def tearDown(self) -> None:
+        setting.reset()
+
+    @staticmethod
+    def _in_state():
+        in_state = [Node(Unit(identifier=(0,), position=[0.1, 0.5], charge={"charge": 1.0}, velocity=[1.0, 0.0],
+                              time_stamp=Time.from_float(1.0)), weight=1)]
+        for index, position in enumerate([[0.3, 0.5], [0.55, 0.5], [0.8, 0.6]]):
+            in_state.append(Node(Unit(identifier=(index + 1,), position=position, charge={"charge": -0.5 * index}),
+                                 weight=1))
+        return in_state
+
+    def test_non_invertible_potential_without_bounding_potential_raises_error(self, _):
+        with self.assertRaises(ConfigurationError):
+            TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock)
+
+    def test_send_event_time_returns_minimum(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._potential_mock, charge="charge")
+        event_time = event_handler.send_event_time(self._in_state())
+        self.assertAlmostEqual(event_time, Time.from_float(1.1), places=13)
+        self.assertEqual(random_mock.expovariate.call_count, 3)
+        self.assertEqual(self._potential_mock.displacement.call_count, 3)
+        for call, expected_separation, expected_charge in zip(self._potential_mock.displacement.call_args_list,
+                                                              [[0.2, 0.0], [0.45, 0.0], [-0.3, 0.1]],
+                                                              [0.0, -0.5, -1.0]):
+            self.assertCallArgumentsEqualWithAlmostEqualSequence(
+                call, positions_of_sequences_in_args=[0, 1],
+                expected_args=[[1.0, 0.0], expected_separation, 1.0, expected_charge], places=13,
+                expected_kwargs={"potential_change": 2.0})
+
+    def test_send_out_state_exchanges_velocity(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._potential_mock, charge="charge")
+        event_handler.send_event_time(self._in_state())
+        out_state = event_handler.send_out_state()
+        self.assertEqual(len(out_state), 2)
+        self.assertEqual(out_state[0].value.identifier, (0,))
+        self.assertAlmostEqualSequence(out_state[0].value.position, [0.2, 0.5], places=13)
+        self.assertIsNone(out_state[0].value.velocity)
+        self.assertIsNone(out_state[0].value.time_stamp)
+        self.assertEqual(out_state[1].value.identifier, (2,))
+        self.assertAlmostEqualSequence(out_state[1].value.position, [0.55, 0.5], places=13)
+        self.assertEqual(out_state[1].value.velocity, [1.0, 0.0])
+        self.assertAlmostEqual(out_state[1].value.time_stamp, Time.from_float(1.1), places=13)
+
+    def test_send_out_state_with_bounding_potential_confirmed(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        random_mock.uniform.return_value = 0.5
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock,
+                                                     bounding_potential=self._bounding_potential_mock, charge="charge")
+        self.assertAlmostEqual(event_handler.send_event_time(self._in_state()), Time.from_float(1.1), places=13)
+        out_state = event_handler.send_out_state()
+        random_mock.uniform.assert_called_once_with(0, 2.0)
+        self.assertCallArgumentsEqualWithAlmostEqualSequence(
+            self._non_invertible_potential_mock.derivative.call_args, positions_of_sequences_in_args=[0, 1],
+            expected_args=[[1.0, 0.0], [0.35, 0.0], 1.0, -0.5], places=13, expected_kwargs={})
+        self.assertEqual([cnode.value.identifier for cnode in out_state], [(0,), (2,)])
+        self.assertIsNone(out_state[0].value.velocity)
+        self.assertEqual(out_state[1].value.velocity, [1.0, 0.0])
+
+    def test_send_out_state_with_bounding_potential_rejected(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        random_mock.uniform.return_value = 1.5
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock,
+                                                     bounding_potential=self._bounding_potential_mock, charge="charge")
+        event_handler.send_event_time(self._in_state())
+        out_state = event_handler.send_out_state()
+        self.assertEqual([cnode.value.identifier for cnode in out_state], [(0,), (2,)])
+        self.assertAlmostEqualSequence(out_state[0].value.position, [0.2, 0.5], places=13)
+        self.assertEqual(out_state[0].value.velocity, [1.0, 0.0])
+        self.assertIsNone(out_state[1].value.velocity)
+
+    @staticmethod
+    def _composite_object_in_state():
+        in_state = [Node(Unit(identifier=(0, 0), position=[0.1, 0.5], charge={"charge": 1.0}, velocity=[1.0, 0.0],
+                              time_stamp=Time.from_float(1.0)), weight=1)]
+        for identifier, position in zip([(1, 0), (0, 1), (2, 1)], [[0.3, 0.5], [0.55, 0.5], [0.8, 0.6]]):
+            in_state.append(Node(Unit(identifier=identifier, position=position, charge={"charge": -1.0}), weight=1))
+        return in_state
+
+    def _composite_object_potential_mock(self, displacement):
+        composite_object_potential_mock = mock.MagicMock(spec_set=InvertiblePotential)
+        composite_object_potential_mock.number_separation_arguments = 1
+        composite_object_potential_mock.number_charge_arguments = 2
+        composite_object_potential_mock.potential_change_required = False
+        composite_object_potential_mock.displacement.return_value = displacement
+        return composite_object_potential_mock
+
+    def test_composite_object_potential_wins_without_confirmation(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        composite_object_potential_mock = self._composite_object_potential_mock(0.05)
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock,
+                                                     bounding_potential=self._bounding_potential_mock, charge="charge",
+                                                     composite_object_potential=composite_object_potential_mock)
+        event_time = event_handler.send_event_time(self._composite_object_in_state())
+        self.assertAlmostEqual(event_time, Time.from_float(1.05), places=13)
+        # Only the target leaf unit in the same composite object is treated by the composite-object potential.
+        composite_object_potential_mock.displacement.assert_called_once()
+        self.assertCallArgumentsEqualWithAlmostEqualSequence(
+            composite_object_potential_mock.displacement.call_args, positions_of_sequences_in_args=[0, 1],
+            expected_args=[[1.0, 0.0], [0.45, 0.0], 1.0, -1.0], places=13, expected_kwargs={})
+        out_state = event_handler.send_out_state()
+        random_mock.uniform.assert_not_called()
+        self.assertEqual([cnode.value.identifier for cnode in out_state], [(0, 0), (0, 1)])
+        self.assertIsNone(out_state[0].value.velocity)
+        self.assertEqual(out_state[1].value.velocity, [1.0, 0.0])
+        self.assertAlmostEqual(out_state[1].value.time_stamp, Time.from_float(1.05), places=13)
+
+    def test_composite_object_potential_loses(self, random_mock):
+        random_mock.expovariate.return_value = 2.0
+        random_mock.uniform.return_value = 0.5
+        composite_object_potential_mock = self._composite_object_potential_mock(0.2)
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock,
+                                                     bounding_potential=self._bounding_potential_mock, charge="charge",
+                                                     composite_object_potential=composite_object_potential_mock)
+        self.assertAlmostEqual(event_handler.send_event_time(self._composite_object_in_state()),
+                               Time.from_float(1.1), places=13)
+        out_state = event_handler.send_out_state()
+        random_mock.uniform.assert_called_once_with(0, 2.0)
+        self.assertEqual([cnode.value.identifier for cnode in out_state], [(0, 0), (0, 1)])
+        self.assertEqual(out_state[1].value.velocity, [1.0, 0.0])
+
+    def test_non_invertible_composite_object_potential_raises_error(self, _):
+        with self.assertRaises(ConfigurationError):
+            TwoLeafUnitGroupEventHandler(potential=self._potential_mock,
+                                         composite_object_potential=self._non_invertible_potential_mock)
+
+    def test_clone_shares_potentials(self, _):
+        event_handler = TwoLeafUnitGroupEventHandler(potential=self._non_invertible_potential_mock,
+                                                     bounding_potential=self._bounding_potential_mock)
+        cloned_event_handler = event_handler.clone()
+        self.assertIs(cloned_event_handler._potential, self._non_invertible_potential_mock)
+        self.assertIs(cloned_event_handler._bounding_potential, self._bounding_potential_mock)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from copy import deepcopy
+import pickle
+import random
+from unittest import TestCase, main, skipIf
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.event_handler.walker import FlatWalker, WalkerItem
+
+
+class TestFlatWalker(TestCase):
+    def setUp(self) -> None:
+        self._rates = [0.5, 3.0, 0.0, 1.5, 2.0, 1.0]
+        self._total_rate = sum(self._rates)
+
+    def _check_frequencies(self, walker: FlatWalker, items) -> None:
+        number_of_samples = 120000
+        counts = {item: 0 for item in items}
+        for _ in range(number_of_samples):
+            counts[walker.sample_cell()] += 1
+        for item, rate in zip(items, self._rates):
+            self.assertAlmostEqual(counts[item] / number_of_samples, rate / self._total_rate, delta=0.01)
+
+    def test_total_rate(self):
+        walker = FlatWalker([WalkerItem(index, rate) for index, rate in enumerate(self._rates)])
+        self.assertAlmostEqual(walker.total_rate, self._total_rate, places=13)
+
+    def test_sample_integer_items(self):
+        random.seed(1)
+        items = list(range(10, 10 + len(self._rates)))
+        walker = FlatWalker([WalkerItem(item, rate) for item, rate in zip(items, self._rates)], block_size=1000)
+        self._check_frequencies(walker, items)
+
+    def test_sample_general_items(self):
+        random.seed(2)
+        items = [(index, "cell") for index in range(len(self._rates))]
+        walker = FlatWalker([WalkerItem(item, rate) for item, rate in zip(items, self._rates)], block_size=1000)
+        self._check_frequencies(walker, items)
+
+    @skipIf(numpy is None, "NumPy is not installed.")
+    def test_sample_numpy(self):
+        random.seed(3)
+        items = list(range(len(self._rates)))
+        walker = FlatWalker([WalkerItem(item, rate) for item, rate in zip(items, self._rates)], block_size=1000,
+                            use_numpy=True)
+        self._check_frequencies(walker, items)
+
+    def test_zero_rate_never_sampled(self):
+        random.seed(4)
+        walker = FlatWalker([WalkerItem(index, rate) for index, rate in enumerate(self._rates)], block_size=100)
+        self.assertNotIn(2, [walker.sample_cell() for _ in range(10000)])
+
+    def test_resume_from_pickle(self):
+        random.seed(5)
+        walker = FlatWalker([WalkerItem(index, rate) for index, rate in enumerate(self._rates)], block_size=64)
+        for _ in range(100):
+            walker.sample_cell()
+        dumped_walker = pickle.dumps(walker)
+        random_state = random.getstate()
+        expected_samples = [walker.sample_cell() for _ in range(500)]
+        random.seed(6)
+        random.setstate(random_state)
+        resumed_walker = pickle.loads(dumped_walker)
+        self.assertEqual([resumed_walker.sample_cell() for _ in range(500)], expected_samples)
+
+    def test_deepcopy_shares_table(self):
+        random.seed(7)
+        walker = FlatWalker([WalkerItem(index, rate) for index, rate in enumerate(self._rates)], block_size=64)
+        for _ in range(10):
+            walker.sample_cell()
+        copied_walker = deepcopy(walker)
+        self.assertIs(copied_walker._thresholds, walker._thresholds)
+        self.assertIs(copied_walker._aliases, walker._aliases)
+        self.assertIs(copied_walker._items, walker._items)
+
+    def test_deepcopy_does_not_replay_samples(self):
+        random.seed(7)
+        walker = FlatWalker([WalkerItem(index, rate) for index, rate in enumerate(self._rates)], block_size=64)
+        walker.sample_cell()
+        copied_walker = deepcopy(walker)
+        self.assertEqual(copied_walker._samples, [])
+        self.assertEqual(len(walker._samples), 63)
+        self.assertNotEqual([copied_walker.sample_cell() for _ in range(10)],
+                            [walker.sample_cell() for _ in range(10)])
+
+    def test_non_positive_block_size_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            FlatWalker([WalkerItem(0, 1.0)], block_size=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import tempfile
+from unittest import TestCase, main
+from jellyfysh.input_output_handler.checkpoint_format import (hash_static_objects, is_checkpoint_file,
+                                                              read_checkpoint_file, read_checkpoint_metadata,
+                                                              write_checkpoint_file, write_static_file)
+
+
+class Cell(object):
+    # Object which is hashed by its id as the cells of cell systems
+    def __init__(self, identifier):
+        self.identifier = identifier
+
+
+class TestCheckpointFormat(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "checkpoint.dat")
+        self._static_filename = os.path.join(self._directory.name, "checkpoint_static.dat")
+        self._cells = [Cell(index) for index in range(3)]
+        self._static_objects = [{"cells": self._cells}, [0.5, 1.5]]
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _write(self, objects):
+        static_hash, static_memo = write_static_file(self._static_filename, self._static_objects)
+        write_checkpoint_file(self._filename, objects, self._static_filename, static_hash, static_memo,
+                              run_identification_hash="hash")
+
+    def test_objects_read(self):
+        self._write({"time": 1.25, "active": [(0, 1)]})
+        objects, static_objects = read_checkpoint_file(self._filename)
+        self.assertEqual(objects, {"time": 1.25, "active": [(0, 1)]})
+        self.assertEqual(static_objects[1], [0.5, 1.5])
+        self.assertEqual([cell.identifier for cell in static_objects[0]["cells"]], [0, 1, 2])
+
+    def test_static_objects_not_duplicated(self):
+        occupants = {cell: [cell.identifier] for cell in self._cells}
+        self._write([self._static_objects[0], self._cells[1], occupants])
+        (cell_system, cell, read_occupants), static_objects = read_checkpoint_file(self._filename)
+        self.assertIs(cell_system, static_objects[0])
+        # Objects within static objects are also referenced
+        self.assertIs(cell, static_objects[0]["cells"][1])
+        for static_cell in static_objects[0]["cells"]:
+            self.assertEqual(read_occupants[static_cell], [static_cell.identifier])
+
+    def test_static_objects_not_in_checkpoint_file(self):
+        self._static_objects.append(list(range(10000)))
+        self._write([self._static_objects[2]])
+        self.assertLess(os.path.getsize(self._filename), 1000)
+        self.assertEqual(read_checkpoint_file(self._filename)[0][0], list(range(10000)))
+
+    def test_metadata(self):
+        self._write([])
+        self.assertTrue(is_checkpoint_file(self._filename))
+        self.assertTrue(is_checkpoint_file(self._static_filename))
+        metadata = read_checkpoint_metadata(self._filename)
+        self.assertEqual(metadata["kind"], "checkpoint")
+        self.assertEqual(metadata["run_identification_hash"], "hash")
+        self.assertEqual(metadata["static_file"], "checkpoint_static.dat")
+        self.assertFalse(os.path.exists(self._filename + ".tmp"))
+
+    def test_changed_static_file_raises_error(self):
+        self._write([])
+        self._static_objects.append([2.5])
+        write_static_file(self._static_filename, self._static_objects)
+        with self.assertRaises(ValueError):
+            read_checkpoint_file(self._filename)
+
+    def test_hash_static_objects(self):
+        static_hash = hash_static_objects(self._static_objects)
+        self.assertEqual(hash_static_objects(self._static_objects), static_hash)
+        self._static_objects[1][0] = 0.75
+        changed_static_hash = hash_static_objects(self._static_objects)
+        self.assertNotEqual(changed_static_hash, static_hash)
+        self._cells[2].identifier = 5
+        self.assertNotEqual(hash_static_objects(self._static_objects), changed_static_hash)
+
+    def test_other_file_raises_error(self):
+        with open(self._filename, "wb") as file:
+            file.write(b"no checkpoint\n")
+        self.assertFalse(is_checkpoint_file(self._filename))
+        with self.assertRaises(ValueError):
+            read_checkpoint_file(self._filename)
+
+
+if __name__ == '__main__':
+    main()
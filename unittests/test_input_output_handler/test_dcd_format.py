@@ -0,0 +1,156 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from array import array
+import os
+import struct
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.input_output_handler import dcd_format
+from jellyfysh.input_output_handler.dcd_format import DcdWriter
+
+
+class TestDcdWriter(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "trajectory.dcd")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _write_frames(self, writer, number_of_frames, offset=0.0):
+        for frame in range(number_of_frames):
+            writer.write_frame(array("f", [frame + offset, 1.0]), array("f", [2.0, 3.0]), array("f", [4.0, 5.5]),
+                               unit_cell=[10.0, 11.0, 12.0])
+
+    def _read_frames(self):
+        with open(self._filename, "rb") as file:
+            content = file.read()
+        number_of_frames = struct.unpack_from("<i", content, 8)[0]
+        title_length = struct.unpack_from("<i", content, 92)[0]
+        number_of_atoms = struct.unpack_from("<i", content, 92 + title_length + 12)[0]
+        offset = 92 + title_length + 8 + 12
+        frames = []
+        for _ in range(number_of_frames):
+            cell = struct.unpack_from("<i6di", content, offset)
+            offset += 56
+            coordinates = []
+            for _ in range(3):
+                length = struct.unpack_from("<i", content, offset)[0]
+                self.assertEqual(length, 4 * number_of_atoms)
+                coordinates.append(list(struct.unpack_from("<{0}f".format(number_of_atoms), content, offset + 4)))
+                self.assertEqual(struct.unpack_from("<i", content, offset + 4 + length)[0], length)
+                offset += length + 8
+            frames.append((cell, coordinates))
+        self.assertEqual(offset, len(content))
+        return content, frames
+
+    def test_header(self):
+        writer = DcdWriter(self._filename, 2, title="RUN IDENTIFICATION HASH: test")
+        writer.close()
+        content, frames = self._read_frames()
+        self.assertEqual(frames, [])
+        self.assertEqual(struct.unpack_from("<i4s", content, 0), (84, b"CORD"))
+        # Unit cell flag and CHARMM version
+        self.assertEqual(struct.unpack_from("<i", content, 4 + 4 + 10 * 4)[0], 1)
+        self.assertEqual(struct.unpack_from("<i", content, 4 + 4 + 19 * 4)[0], 24)
+        self.assertEqual(struct.unpack_from("<i", content, 96)[0], 3)
+        self.assertEqual(content[100:129], b"RUN IDENTIFICATION HASH: test")
+
+    def test_write_frames(self):
+        writer = DcdWriter(self._filename, 2)
+        self._write_frames(writer, 3)
+        self.assertEqual(writer.number_of_frames, 3)
+        writer.close()
+        _, frames = self._read_frames()
+        self.assertEqual(len(frames), 3)
+        for index, (cell, coordinates) in enumerate(frames):
+            self.assertEqual(cell, (48, 10.0, 0.0, 11.0, 0.0, 0.0, 12.0, 48))
+            self.assertEqual(coordinates, [[float(index), 1.0], [2.0, 3.0], [4.0, 5.5]])
+
+    def test_continue_writing_removes_later_frames(self):
+        writer = DcdWriter(self._filename, 2)
+        self._write_frames(writer, 3)
+        writer.close()
+        with mock.patch.object(dcd_format, "_logger") as logger_mock:
+            writer = DcdWriter(self._filename, 2, number_of_frames=2)
+        logger_mock.warning.assert_called_once()
+        self.assertIn("Removing 1 frames", logger_mock.warning.call_args[0][0])
+        self._write_frames(writer, 2, offset=10.0)
+        self.assertEqual(writer.number_of_frames, 4)
+        writer.close()
+        _, frames = self._read_frames()
+        self.assertEqual([coordinates[0][0] for _, coordinates in frames], [0.0, 1.0, 10.0, 11.0])
+
+    def test_continue_writing_without_later_frames(self):
+        writer = DcdWriter(self._filename, 2, title="RUN IDENTIFICATION HASH: test")
+        self._write_frames(writer, 2)
+        writer.close()
+        with mock.patch.object(dcd_format, "_logger") as logger_mock:
+            writer = DcdWriter(self._filename, 2, title="RUN IDENTIFICATION HASH: test", number_of_frames=2)
+        logger_mock.warning.assert_not_called()
+        self._write_frames(writer, 1, offset=10.0)
+        writer.close()
+        _, frames = self._read_frames()
+        self.assertEqual([coordinates[0][0] for _, coordinates in frames], [0.0, 1.0, 10.0])
+
+    def test_continue_writing_different_title_raises_error(self):
+        writer = DcdWriter(self._filename, 2, title="RUN IDENTIFICATION HASH: test")
+        self._write_frames(writer, 3)
+        writer.close()
+        with self.assertRaises(ValueError):
+            DcdWriter(self._filename, 2, title="RUN IDENTIFICATION HASH: other", number_of_frames=2)
+        # The file is not modified
+        _, frames = self._read_frames()
+        self.assertEqual(len(frames), 3)
+
+    def test_continue_writing_fewer_stored_frames_raises_error(self):
+        writer = DcdWriter(self._filename, 2)
+        self._write_frames(writer, 3)
+        writer.close()
+        # Simulate a file whose header stores fewer frames than the file contains
+        with open(self._filename, "r+b") as file:
+            file.seek(8)
+            file.write(struct.pack("<i", 1))
+        with self.assertRaises(ValueError):
+            DcdWriter(self._filename, 2, number_of_frames=2)
+
+    def test_continue_writing_missing_frames_raises_error(self):
+        writer = DcdWriter(self._filename, 2)
+        self._write_frames(writer, 1)
+        writer.close()
+        with self.assertRaises(ValueError):
+            DcdWriter(self._filename, 2, number_of_frames=2)
+
+    def test_continue_writing_different_number_of_atoms_raises_error(self):
+        writer = DcdWriter(self._filename, 2)
+        self._write_frames(writer, 2)
+        writer.close()
+        with self.assertRaises(ValueError):
+            DcdWriter(self._filename, 1, number_of_frames=2)
+
+    def test_continue_writing_missing_file_raises_error(self):
+        with self.assertRaises(ValueError):
+            DcdWriter(self._filename, 2, number_of_frames=0)
+
+
+if __name__ == '__main__':
+    main()
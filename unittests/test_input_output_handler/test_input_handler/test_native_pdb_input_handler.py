@@ -0,0 +1,51 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from unittest import TestCase, main
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.input_output_handler.input_handler.charge_values import ChargeValues
+from jellyfysh.input_output_handler.input_handler.native_pdb_input_handler import NativePdbInputHandler
+from jellyfysh.setting import hypercubic_setting
+from .pdb_input_handler_test_case import PdbInputHandlerTestCase, setUpModule, tearDownModule
+
+
+class TestNativePdbInputHandler(PdbInputHandlerTestCase, TestCase):
+    _input_handler_class = NativePdbInputHandler
+
+    def test_positions_not_rounded(self):
+        # In contrast to MDAnalysis, the positions are parsed as doubles
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=3, system_length=10.261)
+        electric_charge_values = ChargeValues([0.41, -0.82, 0.41], "electric_charge")
+        pdb_input_handler = NativePdbInputHandler("pdb_test_files/water_test_origin_0.pdb", [electric_charge_values])
+        state = pdb_input_handler.read()
+        self.assertEqual([child.value.position for child in state[0].children],
+                         [[7.859, 5.311, 0.879], [8.663, 5.863, 1.139], [8.794, 6.035, 2.135]])
+        self.assertEqual(state[0].value.position, [(7.859 + 8.663 + 8.794) / 3.0, (5.311 + 5.863 + 6.035) / 3.0,
+                                                   (0.879 + 1.139 + 2.135) / 3.0])
+
+    def test_missing_system_box_raises_error(self):
+        hypercubic_setting.HypercubicSetting(beta=1.0, dimension=3, system_length=1.0)
+        with self.assertRaises(ConfigurationError):
+            NativePdbInputHandler("pdb_test_files/atom_test_no_system_box.pdb")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import threading
+from unittest import TestCase, main, mock
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.input_output_handler import InputOutputHandler
+from jellyfysh.input_output_handler.input_handler import InputHandler
+from jellyfysh.input_output_handler.output_handler import OutputHandler
+
+
+class RecordingOutputHandler(OutputHandler):
+    # Output handler which records the arguments and the thread of all write calls
+    def __init__(self, filename: str, copy_arguments: bool) -> None:
+        super().__init__(filename)
+        self.copy_arguments = copy_arguments
+        self.written = []
+        self.threads = []
+        self.number_of_flushes = 0
+        self.post_run_called = False
+
+    def write(self, *args) -> None:
+        self.written.append(args)
+        self.threads.append(threading.current_thread())
+
+    def snapshot(self, *args):
+        return tuple(list(arg) for arg in args) if self.copy_arguments else None
+
+    def flush(self) -> None:
+        self.number_of_flushes += 1
+
+    def post_run(self) -> None:
+        self.post_run_called = True
+
+
+class NonCopyingOutputHandler(RecordingOutputHandler):
+    # Output handler which checks on every write call that the given output handler has written all its arguments
+    def __init__(self, filename: str, other_output_handler: RecordingOutputHandler) -> None:
+        super().__init__(filename, copy_arguments=False)
+        self.other_output_handler = other_output_handler
+        self.other_number_of_writes = []
+
+    def write(self, *args) -> None:
+        super().write(*args)
+        self.other_number_of_writes.append(len(self.other_output_handler.written))
+
+
+class FailingOutputHandler(RecordingOutputHandler):
+    def write(self, *args) -> None:
+        raise RuntimeError("Failed to write.")
+
+
+class TestInputOutputHandler(TestCase):
+    def setUp(self) -> None:
+        self._input_handler_mock = mock.MagicMock(spec_set=InputHandler)
+
+    def test_synchronous_output(self):
+        output_handler = RecordingOutputHandler("first.dat", copy_arguments=True)
+        input_output_handler = InputOutputHandler(self._input_handler_mock, [output_handler])
+        argument = [1, 2]
+        input_output_handler.write("recording_output_handler", argument)
+        self.assertEqual(len(output_handler.written), 1)
+        self.assertIs(output_handler.written[0][0], argument)
+        self.assertIs(output_handler.threads[0], threading.current_thread())
+        input_output_handler.post_run()
+        self.assertTrue(output_handler.post_run_called)
+
+    def test_asynchronous_output(self):
+        output_handler = RecordingOutputHandler("first.dat", copy_arguments=True)
+        input_output_handler = InputOutputHandler(self._input_handler_mock, [output_handler],
+                                                  asynchronous_output=True, output_queue_size=2)
+        arguments = [[index, index + 1] for index in range(10)]
+        for argument in arguments:
+            input_output_handler.write("recording_output_handler", argument)
+        # Modifying the arguments should not change the written copies
+        arguments[-1][0] = -1
+        input_output_handler.post_run()
+        self.assertTrue(output_handler.post_run_called)
+        self.assertEqual([written[0] for written in output_handler.written],
+                         [[index, index + 1] for index in range(10)])
+        self.assertTrue(all(written[0] is not argument
+                            for written, argument in zip(output_handler.written, arguments)))
+        self.assertTrue(all(thread is not threading.current_thread() for thread in output_handler.threads))
+
+    def test_flush_output_handlers(self):
+        output_handler = RecordingOutputHandler("first.dat", copy_arguments=True)
+        input_output_handler = InputOutputHandler(self._input_handler_mock, [output_handler],
+                                                  asynchronous_output=True, output_queue_size=2)
+        for index in range(5):
+            input_output_handler.write("recording_output_handler", [index])
+        input_output_handler.flush_output_handlers()
+        # The queue of the background thread is emptied before the output handlers are flushed
+        self.assertEqual(len(output_handler.written), 5)
+        self.assertEqual(output_handler.number_of_flushes, 1)
+        input_output_handler.post_run()
+
+    def test_asynchronous_output_without_snapshot_written_after_flush(self):
+        copying_output_handler = RecordingOutputHandler("first.dat", copy_arguments=True)
+        non_copying_output_handler = NonCopyingOutputHandler("second.dat", copying_output_handler)
+        input_output_handler = InputOutputHandler(self._input_handler_mock,
+                                                  [copying_output_handler, non_copying_output_handler],
+                                                  asynchronous_output=True)
+        for index in range(5):
+            input_output_handler.write("recording_output_handler", [index])
+        argument = object()
+        input_output_handler.write("non_copying_output_handler", argument)
+        # The arguments are written immediately after all previous asynchronous writes are done
+        self.assertEqual(len(non_copying_output_handler.written), 1)
+        self.assertIs(non_copying_output_handler.written[0][0], argument)
+        self.assertIs(non_copying_output_handler.threads[0], threading.current_thread())
+        self.assertEqual(non_copying_output_handler.other_number_of_writes, [5])
+        input_output_handler.post_run()
+        self.assertTrue(copying_output_handler.post_run_called)
+        self.assertTrue(non_copying_output_handler.post_run_called)
+
+    def test_asynchronous_output_exception_raised(self):
+        output_handler = FailingOutputHandler("first.dat", copy_arguments=True)
+        input_output_handler = InputOutputHandler(self._input_handler_mock, [output_handler],
+                                                  asynchronous_output=True)
+        input_output_handler.write("failing_output_handler", [1])
+        with self.assertRaises(RuntimeError):
+            input_output_handler.flush()
+        with self.assertRaises(RuntimeError):
+            input_output_handler.write("failing_output_handler", [2])
+
+    def test_asynchronous_output_pickled(self):
+        output_handler = RecordingOutputHandler("first.dat", copy_arguments=True)
+        input_output_handler = InputOutputHandler(self._input_handler_mock, [output_handler],
+                                                  asynchronous_output=True)
+        input_output_handler.write("recording_output_handler", [1])
+        input_output_handler.flush()
+        state = input_output_handler.__getstate__()
+        self.assertIsNone(state["_output_queue"])
+        self.assertIsNone(state["_writer_thread"])
+        # The original input-output handler should still work
+        input_output_handler.write("recording_output_handler", [2])
+        input_output_handler.post_run()
+        self.assertEqual([written[0] for written in output_handler.written], [[1], [2]])
+
+    def test_output_queue_size_not_positive_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            InputOutputHandler(self._input_handler_mock, [], asynchronous_output=True, output_queue_size=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import logging
+import os
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.input_output_handler.output_handler import checkpoint_output_handler
+from jellyfysh.input_output_handler.output_handler.checkpoint_output_handler import CheckpointOutputHandler
+from jellyfysh.mediator import Mediator
+
+
+class TestCheckpointOutputHandler(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "checkpoint.dat")
+        self._shared_members = [[0.5, 1.5], {"cells": [0, 1, 2]}]
+        event_handler_mock = mock.MagicMock()
+        event_handler_mock.get_shared_members.side_effect = lambda: self._shared_members
+        self._mediator_mock = mock.MagicMock(spec=Mediator)
+        self._mediator_mock.get_event_handlers.return_value = [event_handler_mock]
+        self._output_handler = CheckpointOutputHandler(self._filename)
+        self._logger = logging.getLogger(checkpoint_output_handler.__name__)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _prepare_dump(self):
+        with mock.patch.object(checkpoint_output_handler, "write_static_file",
+                               wraps=checkpoint_output_handler.write_static_file) as write_static_file_mock:
+            with mock.patch.object(self._logger, "warning") as warning_mock:
+                self._output_handler._prepare_dump(self._mediator_mock)
+        return write_static_file_mock.call_count, warning_mock.call_count
+
+    def _static_filenames(self):
+        return sorted(filename for filename in os.listdir(self._directory.name) if filename.endswith(".dat"))
+
+    def test_static_file_written_once(self):
+        self.assertEqual(self._prepare_dump(), (1, 0))
+        static_filenames = self._static_filenames()
+        self.assertEqual(len(static_filenames), 1)
+        self.assertRegex(static_filenames[0], r"^checkpoint_static_[0-9a-f]{16}\.dat$")
+        self.assertEqual(self._prepare_dump(), (0, 0))
+        self.assertEqual(self._static_filenames(), static_filenames)
+
+    def test_static_filename_depends_on_shared_members(self):
+        self._prepare_dump()
+        static_filename = self._output_handler._static_filename
+        self._shared_members = self._shared_members + [[2.5]]
+        self._prepare_dump()
+        self.assertNotEqual(self._output_handler._static_filename, static_filename)
+        self._shared_members = self._shared_members[:2]
+        other_output_handler = CheckpointOutputHandler(self._filename)
+        other_output_handler._prepare_dump(self._mediator_mock)
+        self.assertEqual(other_output_handler._static_filename, static_filename)
+
+    def test_old_static_file_kept_until_clean_up(self):
+        self._prepare_dump()
+        self._output_handler._clean_up_after_dump()
+        old_static_filename = self._output_handler._static_filename
+        self._shared_members[1]["cells"].append(3)
+        self._prepare_dump()
+        # The checkpoint file on disk still references the old static file
+        self.assertTrue(os.path.isfile(old_static_filename))
+        self.assertTrue(os.path.isfile(self._output_handler._static_filename))
+        self._output_handler._clean_up_after_dump()
+        self.assertFalse(os.path.exists(old_static_filename))
+        self.assertTrue(os.path.isfile(self._output_handler._static_filename))
+        self._prepare_dump()
+        self.assertEqual(self._output_handler._obsolete_static_filenames, [])
+
+    def test_static_file_rewritten_for_new_shared_member(self):
+        self.assertEqual(self._prepare_dump(), (1, 0))
+        self._shared_members = self._shared_members + [[2.5]]
+        self.assertEqual(self._prepare_dump(), (1, 0))
+        self.assertEqual(self._prepare_dump(), (0, 0))
+
+    def test_static_file_rewritten_for_changed_shared_member(self):
+        self.assertEqual(self._prepare_dump(), (1, 0))
+        static_memo = self._output_handler._static_memo
+        self._shared_members[1]["cells"].append(3)
+        self.assertEqual(self._prepare_dump(), (1, 1))
+        self.assertIsNot(self._output_handler._static_memo, static_memo)
+        self.assertEqual(self._prepare_dump(), (0, 0))
+
+    def test_static_state_not_pickled(self):
+        self._prepare_dump()
+        state = self._output_handler.__getstate__()
+        self.assertEqual(state["_static_objects"], [])
+        self.assertIsNone(state["_static_hash"])
+        self.assertIsNone(state["_static_objects_hash"])
+        self.assertEqual(state["_static_memo"], {})
+        self.assertEqual(state["_static_filename"], self._output_handler._static_filename)
+
+
+if __name__ == '__main__':
+    main()
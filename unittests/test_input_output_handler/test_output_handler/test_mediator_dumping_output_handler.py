@@ -0,0 +1,186 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import contextlib
+import io
+import dill
+import os
+import pickle
+import random
+import tempfile
+import time
+from unittest import TestCase, main, mock, skipUnless
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.input_output_handler import InputOutputHandler
+from jellyfysh.input_output_handler.input_handler import InputHandler
+from jellyfysh.input_output_handler.output_handler.dumping_output_handler import DumpingOutputHandler
+from jellyfysh.input_output_handler.output_handler.mediator_dumping_output_handler import MediatorDumpingOutputHandler
+from jellyfysh.input_output_handler.output_handler.sample_output_handler import SampleOutputHandler
+from jellyfysh.mediator import Mediator
+
+
+class CountingDumpingOutputHandler(MediatorDumpingOutputHandler):
+    # Output handler which dumps the number of dumps and the state of the random module
+    def __init__(self, filename, fork_dumps=False, maximum_number_of_forked_dumps=1, dump_durations=(), fail=False):
+        super().__init__(filename, fork_dumps, maximum_number_of_forked_dumps)
+        self.number_of_dumps = 0
+        self._dump_durations = dump_durations
+        self._fail = fail
+
+    def _prepare_dump(self, mediator):
+        self.number_of_dumps += 1
+
+    def _dump(self, mediator, random_state, filename):
+        if self._fail:
+            raise RuntimeError("Failed to dump.")
+        if self.number_of_dumps <= len(self._dump_durations):
+            time.sleep(self._dump_durations[self.number_of_dumps - 1])
+        with open(filename, "wb") as file:
+            pickle.dump((self.number_of_dumps, random_state), file)
+
+
+class TextSampleOutputHandler(SampleOutputHandler):
+    # Output handler which writes the given values into a text file
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.writer = self._create_writer(filename, ["value"])
+
+    def write(self, value):
+        self.writer.write_row([value])
+
+    def post_run(self):
+        self.writer.close()
+
+
+class SampleDumpingOutputHandler(MediatorDumpingOutputHandler):
+    # Output handler which dumps the given sample output handler with its open file
+    def __init__(self, filename, sample_output_handler):
+        super().__init__(filename, fork_dumps=True)
+        self._sample_output_handler = sample_output_handler
+
+    def _dump(self, mediator, random_state, filename):
+        with open(filename, "wb") as file:
+            dill.dump(self._sample_output_handler, file)
+
+
+class TestMediatorDumpingOutputHandler(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "dump.dat")
+        self._mediator_mock = mock.MagicMock(spec=Mediator)
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _read_dump(self):
+        with open(self._filename, "rb") as file:
+            return pickle.load(file)
+
+    def test_dump(self):
+        output_handler = CountingDumpingOutputHandler(self._filename)
+        random.seed(1)
+        random_state = random.getstate()
+        output_handler.write(self._mediator_mock)
+        output_handler.post_run()
+        self.assertEqual(self._read_dump(), (1, random_state))
+        self.assertEqual(os.listdir(self._directory.name), ["dump.dat"])
+
+    @skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    def test_forked_dumps(self):
+        output_handler = CountingDumpingOutputHandler(self._filename, fork_dumps=True)
+        random_states = []
+        for _ in range(3):
+            random_states.append(random.getstate())
+            output_handler.write(self._mediator_mock)
+            random.random()
+        output_handler.post_run()
+        # The state of the random module is not changed by the reseeding in the forked process
+        self.assertEqual(self._read_dump(), (3, random_states[-1]))
+        self.assertEqual(os.listdir(self._directory.name), ["dump.dat"])
+
+    @skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    def test_older_forked_dump_does_not_replace_newer_dump(self):
+        # The first dump takes longer than the second dump which runs concurrently
+        output_handler = CountingDumpingOutputHandler(self._filename, fork_dumps=True,
+                                                      maximum_number_of_forked_dumps=2, dump_durations=(0.5, 0.0))
+        output_handler.write(self._mediator_mock)
+        output_handler.write(self._mediator_mock)
+        output_handler.post_run()
+        self.assertEqual(self._read_dump()[0], 2)
+
+    @skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    def test_failing_forked_dump_raises_error(self):
+        output_handler = CountingDumpingOutputHandler(self._filename, fork_dumps=True, fail=True)
+        # The forked process prints the traceback of the exception
+        with contextlib.redirect_stderr(io.StringIO()):
+            output_handler.write(self._mediator_mock)
+            with self.assertRaises(RuntimeError):
+                output_handler.post_run()
+        self.assertEqual(os.listdir(self._directory.name), [])
+
+    @skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    @mock.patch("jellyfysh.input_output_handler.output_handler.output_handler.get_uuid", return_value="Test_UUID")
+    def test_forked_dump_does_not_duplicate_buffered_samples(self, _):
+        samples_filename = os.path.join(self._directory.name, "samples.dat")
+        sample_output_handler = TextSampleOutputHandler(samples_filename)
+        input_output_handler = InputOutputHandler(mock.MagicMock(spec_set=InputHandler), [sample_output_handler])
+        self._mediator_mock.flush_output.side_effect = input_output_handler.flush_output_handlers
+        output_handler = SampleDumpingOutputHandler(self._filename, sample_output_handler)
+        for value in range(3):
+            input_output_handler.write("text_sample_output_handler", value)
+        # The samples are still buffered in the text file
+        self.assertEqual(os.path.getsize(samples_filename + ".tmp"), 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            output_handler.write(self._mediator_mock)
+        output_handler.post_run()
+        self._mediator_mock.flush_output.assert_called_once_with()
+        for value in range(3, 5):
+            input_output_handler.write("text_sample_output_handler", value)
+        input_output_handler.post_run()
+        with open(samples_filename, "r") as file:
+            self.assertEqual(file.read(), "# Run identification hash: Test_UUID\n0\n1\n2\n3\n4\n")
+
+    def test_forked_processes_not_pickled(self):
+        output_handler = CountingDumpingOutputHandler(self._filename)
+        output_handler._forked_processes.append(1)
+        output_handler._preceding_dump_file_descriptor = 2
+        state = output_handler.__getstate__()
+        self.assertEqual(state["_forked_processes"], [])
+        self.assertIsNone(state["_preceding_dump_file_descriptor"])
+
+    def test_dumping_filename(self):
+        self.assertEqual(CountingDumpingOutputHandler.dumping_filename(self._filename), self._filename)
+        output_handler = DumpingOutputHandler(self._filename)
+        self.assertEqual(output_handler._output_filename, DumpingOutputHandler.dumping_filename(self._filename))
+        self.assertNotEqual(output_handler._output_filename, self._filename)
+
+    def test_write_no_mediator_raises_error(self):
+        output_handler = CountingDumpingOutputHandler(self._filename)
+        with self.assertRaises(RuntimeError):
+            output_handler.write(object())
+
+    def test_maximum_number_of_forked_dumps_not_positive_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            CountingDumpingOutputHandler(self._filename, fork_dumps=True, maximum_number_of_forked_dumps=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import json
+import math
+import os
+import sys
+import tempfile
+from unittest import TestCase, main, mock
+import numpy
+from jellyfysh.input_output_handler.output_handler.output_handler import (
+    BinaryColumnarWriter, binary_columnar_magic_line, SampleAccumulator, _BlockingAnalysis)
+from jellyfysh.output.plotting_functions import is_binary_columnar_file, load_binary_columnar_file
+
+
+@mock.patch("jellyfysh.input_output_handler.output_handler.output_handler.get_uuid", return_value="Test_UUID")
+class TestBinaryColumnarWriter(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "samples.dat")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _read_header(self):
+        with open(self._filename, "rb") as file:
+            magic_line = file.readline()
+            metadata_line = file.readline()
+            return magic_line, metadata_line, file.tell()
+
+    def test_header_padded(self, _):
+        for column_names in (["a"], ["separation_x", "separation_y", "separation_z"], ["c" * 100]):
+            writer = BinaryColumnarWriter(self._filename, column_names)
+            writer.close()
+            magic_line, metadata_line, header_length = self._read_header()
+            self.assertEqual(magic_line, binary_columnar_magic_line)
+            self.assertTrue(metadata_line.startswith(b"# "))
+            self.assertTrue(metadata_line.endswith(b"\n"))
+            self.assertEqual(header_length % 64, 0)
+            self.assertEqual(os.path.getsize(self._filename), header_length)
+            self.assertEqual(json.loads(metadata_line[2:]),
+                             {"run_identification_hash": "Test_UUID", "columns": column_names,
+                              "dtype": ("<f8" if sys.byteorder == "little" else ">f8")})
+
+    def test_temporary_file_renamed_on_close(self, _):
+        writer = BinaryColumnarWriter(self._filename, ["a"])
+        self.assertEqual(os.listdir(self._directory.name), ["samples.dat.tmp"])
+        writer.close()
+        self.assertEqual(os.listdir(self._directory.name), ["samples.dat"])
+
+    def test_block_flushing(self, _):
+        writer = BinaryColumnarWriter(self._filename, ["a", "b"], block_size=3)
+        writer._tmp_file.flush()
+        header_length = os.path.getsize(self._filename + ".tmp")
+        for row in range(2):
+            writer.write_row([row, -row])
+        writer._tmp_file.flush()
+        self.assertEqual(os.path.getsize(self._filename + ".tmp"), header_length)
+        self.assertEqual(len(writer._buffer), 4)
+        writer.write_row([2.0, -2.0])
+        writer._tmp_file.flush()
+        self.assertEqual(os.path.getsize(self._filename + ".tmp"), header_length + 3 * 2 * 8)
+        self.assertEqual(len(writer._buffer), 0)
+        writer.write_row([3.0, -3.0])
+        writer.close()
+        self.assertEqual(os.path.getsize(self._filename), header_length + 4 * 2 * 8)
+
+    def test_wrong_number_of_values_raises_error(self, _):
+        writer = BinaryColumnarWriter(self._filename, ["a", "b"])
+        with self.assertRaises(AssertionError):
+            writer.write_row([1.0])
+        writer.close()
+
+    def test_no_columns_raises_error(self, _):
+        with self.assertRaises(AssertionError):
+            BinaryColumnarWriter(self._filename, [])
+
+    def test_non_positive_block_size_raises_error(self, _):
+        with self.assertRaises(AssertionError):
+            BinaryColumnarWriter(self._filename, ["a"], block_size=0)
+
+    def test_round_trip(self, _):
+        rows = [[0.1 * row, -1.5 * row, 1.0e-300 * row] for row in range(10)]
+        writer = BinaryColumnarWriter(self._filename, ["a", "b", "c"], block_size=4)
+        for row in rows:
+            writer.write_row(row)
+        writer.close()
+        self.assertTrue(is_binary_columnar_file(self._filename))
+        samples = load_binary_columnar_file(self._filename)
+        self.assertEqual(samples.shape, (10, 3))
+        self.assertTrue(numpy.array_equal(samples, numpy.array(rows)))
+        self.assertFalse(samples.flags.writeable)
+        del samples
+
+    def test_round_trip_empty_file(self, _):
+        writer = BinaryColumnarWriter(self._filename, ["a", "b"])
+        writer.close()
+        samples = load_binary_columnar_file(self._filename)
+        self.assertEqual(samples.shape, (0, 2))
+
+    def test_round_trip_truncated_last_row(self, _):
+        writer = BinaryColumnarWriter(self._filename, ["a", "b"])
+        writer.write_row([1.0, 2.0])
+        writer.write_row([3.0, 4.0])
+        writer.close()
+        with open(self._filename, "r+b") as file:
+            file.truncate(os.path.getsize(self._filename) - 3)
+        samples = load_binary_columnar_file(self._filename)
+        self.assertTrue(numpy.array_equal(samples, numpy.array([[1.0, 2.0]])))
+        del samples
+
+    def test_text_file_is_not_binary_columnar_file(self, _):
+        with open(self._filename, "w") as file:
+            file.write("1.0\n2.0\n")
+        self.assertFalse(is_binary_columnar_file(self._filename))
+        with self.assertRaises(ValueError):
+            load_binary_columnar_file(self._filename)
+
+
+@mock.patch("jellyfysh.input_output_handler.output_handler.output_handler.get_uuid", return_value="Test_UUID")
+class TestSampleAccumulator(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "samples.dat")
+        random_state = numpy.random.RandomState(1)
+        self._samples = numpy.column_stack((random_state.normal(loc=0.5, scale=2.0, size=1000),
+                                            random_state.exponential(scale=3.0, size=1000)))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _read_file(self):
+        comments = []
+        histogram_lines = []
+        with open(self._filename, "r") as file:
+            for line in file:
+                if line.startswith("#"):
+                    comments.append(line[2:].rstrip("\n"))
+                else:
+                    histogram_lines.append(line.split())
+        return comments, histogram_lines
+
+    def _accumulate(self, histogram_bin_width, blocking_analysis):
+        accumulator = SampleAccumulator(self._filename, ["a", "b"], histogram_bin_width, blocking_analysis)
+        for row in self._samples:
+            accumulator.write_row(list(row))
+        accumulator.close()
+        return accumulator
+
+    def test_histograms(self, _):
+        self._accumulate(0.25, False)
+        _, histogram_lines = self._read_file()
+        for column, column_name in enumerate(["a", "b"]):
+            bin_indices, counts = numpy.unique(numpy.floor(self._samples[:, column] / 0.25), return_counts=True)
+            column_lines = [line for line in histogram_lines if line[0] == column_name]
+            self.assertEqual(len(column_lines), len(bin_indices))
+            for line, bin_index, count in zip(column_lines, bin_indices, counts):
+                self.assertAlmostEqual(float(line[1]), bin_index * 0.25, places=13)
+                self.assertEqual(int(line[2]), count)
+        self.assertEqual(len(histogram_lines), sum(len(numpy.unique(numpy.floor(self._samples[:, column] / 0.25)))
+                                                   for column in range(2)))
+
+    def test_histogram_bin_edges(self, _):
+        accumulator = SampleAccumulator(self._filename, ["a"], 0.5)
+        for value in [-0.5, -0.25, 0.0, 0.49, 0.5, 1.75]:
+            accumulator.write_row([value])
+        self.assertEqual(accumulator._histograms, [{-1: 2, 0: 2, 1: 1, 3: 1}])
+        accumulator.close()
+
+    def test_moments(self, _):
+        accumulator = self._accumulate(0.25, False)
+        for column in range(2):
+            self.assertAlmostEqual(accumulator._means[column], numpy.mean(self._samples[:, column]), places=12)
+            self.assertAlmostEqual(accumulator._squared_deviation_sums[column] / (len(self._samples) - 1),
+                                   numpy.var(self._samples[:, column], ddof=1), places=10)
+        comments, _ = self._read_file()
+        self.assertIn("Number of samples: 1000", comments)
+        self.assertIn("Histogram bin width: 0.25", comments)
+        self.assertIn("Column: a", comments)
+        self.assertIn("Column: b", comments)
+        mean_lines = [float(comment.split(": ")[1]) for comment in comments if comment.startswith("Mean")]
+        variance_lines = [float(comment.split(": ")[1]) for comment in comments if comment.startswith("Variance")]
+        for column in range(2):
+            self.assertAlmostEqual(mean_lines[column], numpy.mean(self._samples[:, column]), places=12)
+            self.assertAlmostEqual(variance_lines[column], numpy.var(self._samples[:, column], ddof=1), places=10)
+
+    def test_moments_without_samples(self, _):
+        self._samples = numpy.empty((0, 2))
+        self._accumulate(0.25, False)
+        comments, histogram_lines = self._read_file()
+        self.assertTrue(all(math.isnan(float(comment.split(": ")[1])) for comment in comments
+                            if comment.startswith("Mean") or comment.startswith("Variance")))
+        self.assertEqual(histogram_lines, [])
+
+    def test_blocking_analysis_written(self, _):
+        self._accumulate(0.25, True)
+        comments, _ = self._read_file()
+        blocking_lines = [comment.split("\t") for comment in comments if comment.count("\t") == 2]
+        # Levels with at least two blocks: block sizes 1, 2, ..., 256
+        self.assertEqual(len(blocking_lines), 2 * 9)
+        for line in blocking_lines[:9]:
+            block_size, number_of_blocks = int(line[0]), int(line[1])
+            self.assertEqual(number_of_blocks, 1000 // block_size)
+            block_averages = self._samples[:number_of_blocks * block_size, 0].reshape(
+                number_of_blocks, block_size).mean(axis=1)
+            self.assertAlmostEqual(float(line[2]),
+                                   numpy.std(block_averages, ddof=1) / math.sqrt(number_of_blocks), places=10)
+
+    def test_blocking_analysis_not_written(self, _):
+        self._accumulate(0.25, False)
+        comments, _ = self._read_file()
+        self.assertFalse(any(comment.startswith("Blocking analysis") for comment in comments))
+
+    def test_wrong_number_of_values_raises_error(self, _):
+        accumulator = SampleAccumulator(self._filename, ["a", "b"], 0.25)
+        with self.assertRaises(AssertionError):
+            accumulator.write_row([1.0])
+
+    def test_non_positive_bin_width_raises_error(self, _):
+        with self.assertRaises(AssertionError):
+            SampleAccumulator(self._filename, ["a"], 0.0)
+
+
+class TestBlockingAnalysis(TestCase):
+    def test_standard_errors(self):
+        values = numpy.random.RandomState(2).uniform(size=100)
+        # Introduce correlations
+        values = numpy.convolve(values, numpy.ones(4) / 4.0, mode="valid")
+        blocking_analysis = _BlockingAnalysis()
+        for value in values:
+            blocking_analysis.add(value)
+        standard_errors = blocking_analysis.standard_errors()
+        self.assertEqual([(block_size, number_of_blocks) for block_size, number_of_blocks, _ in standard_errors],
+                         [(1, 97), (2, 48), (4, 24), (8, 12), (16, 6), (32, 3)])
+        for block_size, number_of_blocks, standard_error in standard_errors:
+            block_averages = values[:number_of_blocks * block_size].reshape(number_of_blocks, block_size).mean(axis=1)
+            self.assertAlmostEqual(standard_error, numpy.std(block_averages, ddof=1) / math.sqrt(number_of_blocks),
+                                   places=12)
+
+    def test_standard_errors_constant_values(self):
+        blocking_analysis = _BlockingAnalysis()
+        for _ in range(8):
+            blocking_analysis.add(1.5)
+        self.assertEqual(blocking_analysis.standard_errors(), [(1, 8, 0.0), (2, 4, 0.0), (4, 2, 0.0)])
+
+    def test_standard_errors_single_value(self):
+        blocking_analysis = _BlockingAnalysis()
+        self.assertEqual(blocking_analysis.standard_errors(), [])
+        blocking_analysis.add(1.0)
+        self.assertEqual(blocking_analysis.standard_errors(), [])
+
+
+if __name__ == '__main__':
+    main()
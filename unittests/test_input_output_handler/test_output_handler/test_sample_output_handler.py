@@ -0,0 +1,86 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.input_output_handler.output_handler.output_handler import (BinaryColumnarWriter, HardBufferedTextWriter,
+                                                                         SampleAccumulator)
+from jellyfysh.input_output_handler.output_handler.sample_output_handler import SampleOutputHandler
+
+
+class SingleColumnSampleOutputHandler(SampleOutputHandler):
+    # Output handler which only creates a single writer
+    def __init__(self, filename, binary=False, histogram_bin_width=None, blocking_analysis=False):
+        super().__init__(filename, binary, histogram_bin_width, blocking_analysis)
+        self.writer = self._create_writer(filename, ["a"])
+
+    def write(self, extracted_global_state):
+        pass
+
+    def post_run(self):
+        self.writer.close()
+
+
+@mock.patch("jellyfysh.input_output_handler.output_handler.output_handler.get_uuid", return_value="Test_UUID")
+class TestSampleOutputHandler(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "samples.dat")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _check_writer(self, writer_class, **kwargs):
+        output_handler = SingleColumnSampleOutputHandler(self._filename, **kwargs)
+        self.assertIsInstance(output_handler.writer, writer_class)
+        output_handler.post_run()
+
+    def test_text_writer(self, _):
+        self._check_writer(HardBufferedTextWriter)
+
+    def test_binary_writer(self, _):
+        self._check_writer(BinaryColumnarWriter, binary=True)
+
+    def test_sample_accumulator(self, _):
+        self._check_writer(SampleAccumulator, histogram_bin_width=0.1)
+        self._check_writer(SampleAccumulator, histogram_bin_width=0.1, blocking_analysis=True)
+
+    def test_binary_and_histogram_bin_width_raises_error(self, _):
+        with self.assertRaises(ConfigurationError):
+            SingleColumnSampleOutputHandler(self._filename, binary=True, histogram_bin_width=0.1)
+
+    def test_non_positive_histogram_bin_width_raises_error(self, _):
+        with self.assertRaises(ConfigurationError):
+            SingleColumnSampleOutputHandler(self._filename, histogram_bin_width=0.0)
+        with self.assertRaises(ConfigurationError):
+            SingleColumnSampleOutputHandler(self._filename, histogram_bin_width=-0.1)
+
+    def test_blocking_analysis_without_histogram_bin_width_raises_error(self, _):
+        with self.assertRaises(ConfigurationError):
+            SingleColumnSampleOutputHandler(self._filename, blocking_analysis=True)
+        with self.assertRaises(ConfigurationError):
+            SingleColumnSampleOutputHandler(self._filename, binary=True, blocking_analysis=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+import os
+import tempfile
+from unittest import TestCase, main
+from jellyfysh.input_output_handler.pdb_format import read_pdb_file, write_pdb_file
+
+
+class TestPdbFormat(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._filename = os.path.join(self._directory.name, "configuration.pdb")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_write_pdb_file(self):
+        write_pdb_file(self._filename, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [-7.25, 8.5, 0.0]],
+                       [10.0, 10.0, 10.0, 90.0, 90.0, 90.0], ["H", "O", "H"], ["HOH", "HOH", "HOH"], [1, 1, 1],
+                       bonds=[(0, 1), (1, 2)], title="RUN IDENTIFICATION HASH: test")
+        with open(self._filename, "r") as file:
+            lines = file.read().split("\n")
+        self.assertEqual(lines, [
+            "TITLE     RUN IDENTIFICATION HASH: test",
+            "CRYST1   10.000   10.000   10.000  90.00  90.00  90.00 P 1           1",
+            "ATOM      1  H   HOH X   1       1.000   2.000   3.000  1.00  0.00              ",
+            "ATOM      2  O   HOH X   1       4.000   5.000   6.000  1.00  0.00              ",
+            "ATOM      3  H   HOH X   1      -7.250   8.500   0.000  1.00  0.00              ",
+            "CONECT    1    2",
+            "CONECT    2    1    3",
+            "CONECT    3    2",
+            "END",
+            ""])
+
+    def test_write_pdb_file_more_than_four_bonds(self):
+        write_pdb_file(self._filename, [[0.0, 0.0, 0.0]] * 6, [1.0, 1.0, 1.0, 90.0, 90.0, 90.0], ["X"] * 6,
+                       ["UNK"] * 6, [1] * 6, bonds=[(0, index) for index in range(1, 6)])
+        with open(self._filename, "r") as file:
+            conect_lines = [line for line in file.read().split("\n") if line.startswith("CONECT")]
+        self.assertEqual(conect_lines[:2], ["CONECT    1    2    3    4    5", "CONECT    1    6"])
+        self.assertEqual(len(conect_lines), 7)
+
+    def test_read_written_pdb_file(self):
+        positions = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [-7.25, 8.5, 0.0], [0.125, 0.5, 9.75]]
+        write_pdb_file(self._filename, positions, [10.0, 11.0, 0.0, 90.0, 90.0, 90.0], ["A", "B"] * 2,
+                       ["AB"] * 4, [1, 1, 2, 2])
+        dimensions, residues = read_pdb_file(self._filename)
+        self.assertEqual(dimensions, [10.0, 11.0, 0.0, 90.0, 90.0, 90.0])
+        self.assertEqual(residues, [positions[:2], positions[2:]])
+
+    def test_read_wrapped_residue_ids(self):
+        # Residue ids wrap around after 9999 but subsequent residues are still separated
+        write_pdb_file(self._filename, [[float(index), 0.0, 0.0] for index in range(4)],
+                       [10.0, 10.0, 10.0, 90.0, 90.0, 90.0], ["X"] * 4, ["UNK"] * 4, [9999, 10000, 10000, 10001])
+        _, residues = read_pdb_file(self._filename)
+        self.assertEqual(residues, [[[0.0, 0.0, 0.0]], [[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[3.0, 0.0, 0.0]]])
+
+    def test_read_pdb_file_without_system_box_raises_error(self):
+        with open(self._filename, "w") as file:
+            file.write("ATOM      1  H   HOH X   1       1.000   2.000   3.000  1.00  0.00              \nEND\n")
+        with self.assertRaises(ValueError):
+            read_pdb_file(self._filename)
+
+
+if __name__ == '__main__':
+    main()
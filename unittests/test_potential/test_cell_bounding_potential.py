@@ -20,6 +20,7 @@
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
 import contextlib
+from copy import deepcopy
 import os
 from unittest import TestCase, main, mock
 from jellyfysh.activator.internal_state.cell_occupancy.cells.cuboid_cells import CuboidCells
@@ -246,7 +247,7 @@ class TestCellBoundingPotential(TestCase):
         setting.set_number_of_nodes_per_root_node(1)
         setting.set_number_of_root_nodes(1)
         self._estimator_mock = mock.MagicMock(spec_set=Estimator)
-        self._estimator_mock.derivative_bound.side_effect = mock_derivative_bound
+        self._estimator_mock.cached_derivative_bound.side_effect = mock_derivative_bound
         self._estimator_mock.charge_correction_factor = mock_charge_correction_factor
         # self._cells has the cell 0 with cell_min at the origin as the zero cell.
         self._cells = CuboidPeriodicCells(cells_per_side=[4, 4], neighbor_layers=1)
@@ -276,6 +277,21 @@ class TestCellBoundingPotential(TestCase):
         self.assertEqual(self._cell_bounding_potential_without_charge.derivative(
             [3.0, 0.0], self._cells.position_to_cell([0.6, 0.1]), 1.0, 1.0), 0.2 * 3.0)
 
+    def test_deepcopy_shares_estimator_and_derivative_bounds(self):
+        copied_potential = deepcopy(self._cell_bounding_potential_with_charge)
+        self.assertIsNot(copied_potential, self._cell_bounding_potential_with_charge)
+        self.assertIs(copied_potential._estimator, self._estimator_mock)
+        self.assertIs(copied_potential._derivative_bounds, self._cell_bounding_potential_with_charge._derivative_bounds)
+        cell = self._cells.position_to_cell([0.6, 0.1])
+        self.assertEqual(copied_potential.displacement([1.0, 0.0], cell, 1.0, 1.0, 0.3),
+                         self._cell_bounding_potential_with_charge.displacement([1.0, 0.0], cell, 1.0, 1.0, 0.3))
+        # The bounding event rate of the last computed displacement is not shared.
+        expected_derivative = copied_potential.derivative([1.0, 0.0], cell, 1.0, 1.0)
+        self._cell_bounding_potential_with_charge.displacement([1.0, 0.0], cell, 1.0, -0.5, 0.3)
+        self.assertEqual(copied_potential.derivative([1.0, 0.0], cell, 1.0, 1.0), expected_derivative)
+        self.assertNotEqual(self._cell_bounding_potential_with_charge.derivative([1.0, 0.0], cell, 1.0, 1.0),
+                            expected_derivative)
+
     def test_displacement_derivative_cell_separation_two_direction_one_without_charge(self):
         # Cell separation 2.
         self.assertEqual(self._cell_bounding_potential_without_charge.displacement(
@@ -19,7 +19,8 @@
 # JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
-from unittest import TestCase, main
+import random
+from unittest import TestCase, main, mock
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.potential.displaced_even_power_potential import DisplacedEvenPowerPotential
 
@@ -233,6 +234,23 @@ class TestDisplacedEvenPowerPotential(TestCase):
         with self.assertRaises(ConfigurationError):
             DisplacedEvenPowerPotential(equilibrium_separation=-0.3, power=2, prefactor=1.0)
 
+    def test_displacement_without_c_extension_identical(self):
+        # The C extension (if compiled) and the pure Python implementation should yield bitwise identical results
+        generator = random.Random(1)
+        potential = DisplacedEvenPowerPotential(equilibrium_separation=0.3, power=6, prefactor=2.0)
+        for _ in range(1000):
+            separation = [generator.uniform(-0.5, 0.5) for _ in range(generator.choice([2, 3]))]
+            direction = generator.randrange(len(separation))
+            velocity = [1.0 if d == direction else 0.0 for d in range(len(separation))]
+            potential_change = generator.expovariate(generator.choice([0.1, 1.0, 10.0]))
+            for tested_potential in (self._potential, potential):
+                displacement = tested_potential.displacement(velocity, list(separation), potential_change)
+                with mock.patch(
+                        "jellyfysh.potential.displaced_even_power_potential._lib_displaced_even_power_displacement",
+                        None):
+                    self.assertEqual(tested_potential.displacement(velocity, list(separation), potential_change),
+                                     displacement)
+
 
 if __name__ == '__main__':
     main()
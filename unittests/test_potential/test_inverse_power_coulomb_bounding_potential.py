@@ -21,6 +21,7 @@
 #
 from unittest import TestCase, main
 from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.potential.abstracts import SummedInvertiblePotential
 from jellyfysh.potential.inverse_power_coulomb_bounding_potential import InversePowerCoulombBoundingPotential
 import jellyfysh.setting as setting
 from jellyfysh.setting import hypercubic_setting
@@ -365,6 +366,50 @@ class TestInversePowerCoulombBoundingPotential(TestCase):
         with self.assertRaises(AssertionError):
             self._potential.derivative([0.0, 1.0, 3.1], [0.2, 0.1, -0.3], 1.0, 1.0)
 
+    def test_is_summed_invertible_potential(self):
+        self.assertIsInstance(self._potential, SummedInvertiblePotential)
+
+    def test_summed_positive_derivative(self):
+        local_positions = [[0.1, -0.2, 0.45], [0.15, -0.1, 0.4]]
+        local_charges = [-0.8, 0.4]
+        target_positions = [[-0.45, 0.2, -0.45], [0.3, 0.25, 0.1], [-0.35, 0.15, -0.4]]
+        target_charges = [0.4, -0.8, 0.4]
+        for velocity in ([2.1, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.5]):
+            # The fused computation should agree exactly with the pairwise computation.
+            expected_derivative = 0.0
+            for local_position, local_charge in zip(local_positions, local_charges):
+                for target_position, target_charge in zip(target_positions, target_charges):
+                    expected_derivative += max(0.0, self._potential.derivative(
+                        velocity, setting.periodic_boundaries.separation_vector(local_position, target_position),
+                        local_charge, target_charge))
+            self.assertEqual(self._potential.summed_positive_derivative(velocity, local_positions, local_charges,
+                                                                        target_positions, target_charges),
+                             expected_derivative)
+
+    def test_minimum_displacement(self):
+        local_positions = [[0.1, -0.2, 0.45], [0.15, -0.1, 0.4]]
+        local_charges = [-0.8, 0.4]
+        target_positions = [[-0.45, 0.2, -0.45], [0.3, 0.25, 0.1], [-0.35, 0.15, -0.4]]
+        target_charges = [0.4, -0.8, 0.4]
+        potential_changes = [0.3, 1.2, 0.05, 2.7, 0.9, 0.4]
+        for velocity in ([2.1, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.5]):
+            # The fused computation should agree exactly with the pairwise computation.
+            expected_displacement = min(
+                self._potential.displacement(
+                    velocity, setting.periodic_boundaries.separation_vector(local_positions[index // 3],
+                                                                            target_positions[index % 3]),
+                    local_charges[index // 3], target_charges[index % 3], potential_change)
+                for index, potential_change in enumerate(potential_changes))
+            self.assertEqual(self._potential.minimum_displacement(velocity, local_positions, local_charges,
+                                                                  target_positions, target_charges,
+                                                                  potential_changes),
+                             expected_displacement)
+
+    def test_minimum_displacement_wrong_number_of_potential_changes_raises_error(self):
+        with self.assertRaises(AssertionError):
+            self._potential.minimum_displacement([1.0, 0.0, 0.0], [[0.1, 0.2, 0.3]], [1.0],
+                                                 [[0.2, 0.3, 0.4], [0.4, 0.1, 0.2]], [1.0, 1.0], [0.5])
+
     def test_prefactor_zero_raises_error(self):
         with self.assertRaises(ConfigurationError):
             InversePowerCoulombBoundingPotential(prefactor=0.0)
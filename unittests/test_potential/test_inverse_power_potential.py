@@ -19,7 +19,8 @@
 # JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
-from unittest import TestCase, main
+import random
+from unittest import TestCase, main, mock
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.potential.inverse_power_potential import InversePowerPotential
 
@@ -425,6 +426,24 @@ class TestInversePowerPotential(TestCase):
         with self.assertRaises(ConfigurationError):
             InversePowerPotential(power=1, prefactor=0)
 
+    def test_displacement_without_c_extension_identical(self):
+        # The C extension (if compiled) and the pure Python implementation should yield bitwise identical results
+        generator = random.Random(1)
+        for _ in range(1000):
+            separation = [generator.uniform(-1.5, 1.5) for _ in range(generator.choice([2, 3]))]
+            direction = generator.randrange(len(separation))
+            charges = (generator.choice([1.0, -1.0, 0.5]), generator.choice([1.0, -2.0]))
+            potential_change = generator.expovariate(1.0)
+            for potential in (self._potential_power_one, self._potential_power_two):
+                displacement = potential.displacement(
+                    [1.0 if d == direction else 0.0 for d in range(len(separation))], list(separation), *charges,
+                    potential_change)
+                with mock.patch("jellyfysh.potential.inverse_power_potential._lib_inverse_power_displacement",
+                                None):
+                    self.assertEqual(potential.displacement(
+                        [1.0 if d == direction else 0.0 for d in range(len(separation))], list(separation),
+                        *charges, potential_change), displacement)
+
 
 if __name__ == '__main__':
     main()
@@ -19,7 +19,8 @@
 # JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
 # Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
 #
-from unittest import TestCase, main
+import random
+from unittest import TestCase, main, mock
 from jellyfysh.base.exceptions import ConfigurationError
 from jellyfysh.potential.lennard_jones_potential import LennardJonesPotential
 
@@ -161,6 +162,19 @@ class TestLennardJonesPotential(TestCase):
         with self.assertRaises(ConfigurationError):
             LennardJonesPotential(prefactor=1.0, characteristic_length=0.0)
 
+    def test_displacement_without_c_extension_identical(self):
+        # The C extension (if compiled) and the pure Python implementation should yield bitwise identical results
+        generator = random.Random(1)
+        for _ in range(1000):
+            separation = [generator.uniform(-0.6, 0.6) for _ in range(generator.choice([2, 3]))]
+            direction = generator.randrange(len(separation))
+            velocity = [1.0 if d == direction else 0.0 for d in range(len(separation))]
+            potential_change = generator.expovariate(generator.choice([0.1, 1.0, 10.0]))
+            displacement = self._potential_one.displacement(velocity, list(separation), potential_change)
+            with mock.patch("jellyfysh.potential.lennard_jones_potential._lib_lennard_jones_displacement", None):
+                self.assertEqual(self._potential_one.displacement(velocity, list(separation), potential_change),
+                                 displacement)
+
 
 if __name__ == '__main__':
     main()
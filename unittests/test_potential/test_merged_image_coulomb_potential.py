@@ -21,6 +21,7 @@
 #
 from unittest import TestCase, main
 from jellyfysh.base.exceptions import ConfigurationError
+from jellyfysh.potential.abstracts import PairwiseDerivativesPotential
 from jellyfysh.potential.merged_image_coulomb_potential import MergedImageCoulombPotential
 import jellyfysh.setting as setting
 from jellyfysh.setting import hypercubic_setting
@@ -278,6 +279,92 @@ class TestMergedImageCoulombPotential(TestCase):
             MergedImageCoulombPotential(alpha=3.45, fourier_cutoff=6, position_cutoff=2,
                                         prefactor=1.0)
 
+    def test_is_pairwise_derivatives_potential(self):
+        self.setUpSystemLengthOne()
+        self.assertIsInstance(self._potential, PairwiseDerivativesPotential)
+
+    def test_pairwise_derivatives_system_length_two(self):
+        self.setUpSystemLengthTwo()
+        local_positions = [[0.1, -0.2, 0.7], [0.3, -0.1, 0.65]]
+        local_charges = [-0.8, 0.4]
+        target_positions = [[-0.9, 0.4, -0.95], [0.6, 0.5, 0.2], [-0.7, 0.35, -0.9]]
+        target_charges = [0.4, -0.8, 0.4]
+        for velocity in ([2.1, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.5]):
+            # The fused computation should agree exactly with the pairwise computation.
+            expected_derivatives = [
+                self._potential.derivative(
+                    velocity, setting.periodic_boundaries.separation_vector(local_position, target_position),
+                    local_charge, target_charge)
+                for local_position, local_charge in zip(local_positions, local_charges)
+                for target_position, target_charge in zip(target_positions, target_charges)]
+            self.assertEqual(self._potential.pairwise_derivatives(velocity, local_positions, local_charges,
+                                                                  target_positions, target_charges),
+                             expected_derivatives)
+
+    def test_pairwise_derivatives_velocity_not_parallel_to_axis_raises_error(self):
+        self.setUpSystemLengthOne()
+        with self.assertRaises(AssertionError):
+            self._potential.pairwise_derivatives([1.0, 1.0, 0.0], [[0.1, 0.2, 0.3]], [1.0], [[0.2, 0.3, 0.4]], [1.0])
+
+    def _cumulative_event_rate(self, velocity, separation, charge_one, charge_two, time_displacement,
+                               number_steps=20000):
+        # Midpoint rule for the integral of the positive part of the time derivative along the trajectory
+        step = time_displacement / number_steps
+        cumulative_event_rate = 0.0
+        for i in range(number_steps):
+            displaced_separation = [setting.periodic_boundaries.correct_separation_entry(
+                separation[d] - velocity[d] * (i + 0.5) * step, d) for d in range(3)]
+            cumulative_event_rate += max(
+                self._potential.derivative(velocity, displaced_separation, charge_one, charge_two), 0.0) * step
+        return cumulative_event_rate
+
+    def test_potential_change_required(self):
+        self.setUpSystemLengthOne()
+        self.assertTrue(self._potential.potential_change_required)
+
+    def test_displacement_positive_charge_product_system_length_one(self):
+        self.setUpSystemLengthOne()
+        for velocity in ([1.0, 0.0, 0.0], [0.0, 0.5, 0.0], [0.0, 0.0, 2.0]):
+            for separation, potential_change in (([0.2, -0.1, 0.3], 0.7), ([-0.3, 0.01, 0.02], 2.5),
+                                                 ([0.4, 0.45, -0.2], 0.3)):
+                time_displacement = self._potential.displacement(velocity, separation, 1.0, 1.0, potential_change)
+                self.assertAlmostEqual(self._cumulative_event_rate(velocity, separation, 1.0, 1.0, time_displacement),
+                                       potential_change, places=5)
+
+    def test_displacement_negative_charge_product_system_length_one(self):
+        self.setUpSystemLengthOne()
+        for velocity in ([1.0, 0.0, 0.0], [0.0, 0.5, 0.0], [0.0, 0.0, 2.0]):
+            for separation, potential_change in (([0.2, -0.1, 0.3], 0.7), ([0.3, 0.01, 0.02], 2.5),
+                                                 ([0.4, 0.45, -0.2], 0.3)):
+                time_displacement = self._potential.displacement(velocity, separation, 1.0, -1.0, potential_change)
+                self.assertAlmostEqual(self._cumulative_event_rate(velocity, separation, 1.0, -1.0, time_displacement),
+                                       potential_change, places=5)
+
+    def test_displacement_several_periods_system_length_two(self):
+        self.setUpSystemLengthTwo()
+        separation = [0.6, -0.3, 0.5]
+        time_displacement = self._potential.displacement([0.0, 1.0, 0.0], separation, 0.5, 1.5, 8.0)
+        # The active unit passes several periods of the potential before the event
+        self.assertGreater(time_displacement, 4.0)
+        self.assertAlmostEqual(self._cumulative_event_rate([0.0, 1.0, 0.0], separation, 0.5, 1.5, time_displacement,
+                                                           number_steps=80000), 8.0, places=5)
+
+    def test_displacement_zero_charge_is_infinite(self):
+        self.setUpSystemLengthOne()
+        self.assertEqual(self._potential.displacement([1.0, 0.0, 0.0], [0.2, -0.1, 0.3], 0.0, 1.0, 0.7),
+                         float("inf"))
+
+    def test_displacement_does_not_depend_on_speed(self):
+        self.setUpSystemLengthOne()
+        self.assertAlmostEqual(
+            self._potential.displacement([0.0, 2.5, 0.0], [0.2, -0.1, 0.3], 1.0, 1.0, 0.7) * 2.5,
+            self._potential.displacement([0.0, 1.0, 0.0], [0.2, -0.1, 0.3], 1.0, 1.0, 0.7), places=13)
+
+    def test_displacement_velocity_not_parallel_to_axis_raises_error(self):
+        self.setUpSystemLengthOne()
+        with self.assertRaises(AssertionError):
+            self._potential.displacement([1.0, 1.0, 0.0], [0.2, -0.1, 0.3], 1.0, 1.0, 0.7)
+
     def test_setting_not_initialized_raises_error(self):
         with self.assertRaises(ConfigurationError):
             MergedImageCoulombPotential(alpha=3.45, fourier_cutoff=6, position_cutoff=2,
@@ -0,0 +1,168 @@
+# JeLLFysh - a Python application for all-atom event-chain Monte Carlo - https://github.com/jellyfysh
+# Copyright (C) 2019, 2022 The JeLLyFysh organization
+# (See the AUTHORS.md file for the full list of authors.)
+#
+# This file is part of JeLLyFysh.
+#
+# JeLLyFysh is free software: you can redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# JeLLyFysh is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with JeLLyFysh in the LICENSE file.
+# If not, see <https://www.gnu.org/licenses/>.
+#
+# If you use JeLLyFysh in published work, please cite the following reference (see [Hoellmer2020] in References.bib):
+# Philipp Hoellmer, Liang Qin, Michael F. Faulkner, A. C. Maggs, and Werner Krauth,
+# JeLLyFysh-Version1.0 -- a Python application for all-atom event-chain Monte Carlo,
+# Computer Physics Communications, Volume 253, 107168 (2020), https://doi.org/10.1016/j.cpc.2020.107168.
+#
+from configparser import ConfigParser
+import json
+import os
+import tempfile
+from unittest import TestCase, main, mock
+from jellyfysh.base.exceptions import ConfigurationError, EndOfRun
+from jellyfysh.base import factory
+from jellyfysh.mediator import Mediator
+import jellyfysh.sweep as sweep
+from jellyfysh.sweep import create_runs, parse_grid, SweepRun
+
+
+class TestSweep(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._config = ConfigParser()
+        self._config.read_dict({
+            "HypercubicSetting": {"system_length": "1.0", "beta": "1.0", "dimension": "3"},
+            "InputOutputHandler": {"input_handler": "native_pdb_input_handler",
+                                   "output_handlers": "dumping_output_handler, separation_output_handler"},
+            "NativePdbInputHandler": {"filename": "input/initial.pdb"},
+            "DumpingOutputHandler": {"filename": "output/dump.dat"},
+            "SeparationOutputHandler": {"filename": "output/separation.dat"}})
+        self._setting_plan = factory.create_plan(self._config, "HypercubicSetting", "jellyfysh.setting")
+        self._input_output_handler_plan = factory.create_plan(self._config, "InputOutputHandler",
+                                                              "jellyfysh.input_output_handler")
+
+    def tearDown(self) -> None:
+        factory.used_sections = []
+        self._directory.cleanup()
+
+    def _create_runs(self, overrides_of_runs):
+        return create_runs(self._config, self._setting_plan, self._input_output_handler_plan, overrides_of_runs,
+                           self._directory.name)
+
+    def test_parse_grid(self):
+        self.assertEqual(parse_grid(["HypercubicSetting.beta=1.0, 2.0", "Section.option=a,b"]),
+                         [["HypercubicSetting.beta=1.0", "Section.option=a"],
+                          ["HypercubicSetting.beta=1.0", "Section.option=b"],
+                          ["HypercubicSetting.beta=2.0", "Section.option=a"],
+                          ["HypercubicSetting.beta=2.0", "Section.option=b"]])
+
+    def test_parse_empty_grid(self):
+        self.assertEqual(parse_grid([]), [[]])
+
+    def test_parse_invalid_grid_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            parse_grid(["HypercubicSetting=1.0,2.0"])
+
+    def test_output_files_redirected_into_run_directory(self):
+        runs = self._create_runs([[]])
+        self.assertEqual(len(runs), 1)
+        run = runs[0]
+        self.assertEqual(run.directory, os.path.join(self._directory.name, run.configuration_hash[:16]))
+        output_handler_plans = run.mediator_plan.arguments["output_handlers"]
+        self.assertEqual(output_handler_plans[0].arguments["filename"], os.path.join(run.directory, "dump.dat"))
+        self.assertEqual(output_handler_plans[1].arguments["filename"],
+                         os.path.join(run.directory, "separation.dat"))
+        # The input handler reads from the original file
+        self.assertEqual(run.mediator_plan.arguments["input_handler"].arguments["filename"], "input/initial.pdb")
+        self.assertEqual(len(run.dumping_filenames), 1)
+        self.assertTrue(run.dumping_filenames[0].startswith(os.path.join(run.directory, "dump_")))
+        # The original construction plan is unchanged
+        self.assertEqual(self._input_output_handler_plan.arguments["output_handlers"][0].arguments["filename"],
+                         "output/dump.dat")
+
+    def test_runs_with_equal_configuration_created_once(self):
+        runs = self._create_runs([["HypercubicSetting.beta=1.0"], ["HypercubicSetting.beta=2.0"],
+                                  ["HypercubicSetting.beta=2.0"]])
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(runs[0].overrides, ["HypercubicSetting.beta=1.0"])
+        self.assertEqual(runs[1].overrides, ["HypercubicSetting.beta=2.0"])
+        self.assertNotEqual(runs[0].directory, runs[1].directory)
+
+    def test_static_data_file_shared_for_equal_setting(self):
+        runs = self._create_runs([["HypercubicSetting.beta=1.0", "InputOutputHandler.asynchronous_output=false"],
+                                  ["HypercubicSetting.beta=1.0", "InputOutputHandler.asynchronous_output=true"],
+                                  ["HypercubicSetting.beta=2.0", "InputOutputHandler.asynchronous_output=false"]])
+        self.assertEqual(len(runs), 3)
+        self.assertNotEqual(runs[0].configuration_hash, runs[1].configuration_hash)
+        self.assertEqual(runs[0].static_data_filename, runs[1].static_data_filename)
+        self.assertNotEqual(runs[0].static_data_filename, runs[2].static_data_filename)
+        self.assertEqual(os.path.dirname(runs[0].static_data_filename), self._directory.name)
+
+    def test_override_of_unused_section_raises_error(self):
+        with self.assertRaises(ConfigurationError):
+            self._create_runs([["FinalTimeEndOfRunEventHandler.end_of_run_time=1.0"]])
+
+    def _run(self):
+        return SweepRun([], os.path.join(self._directory.name, "run"), "hash", self._setting_plan,
+                        self._input_output_handler_plan, os.path.join(self._directory.name, "static.dat"),
+                        [os.path.join(self._directory.name, "run", "dump.dat")])
+
+    def _write_status(self, run, status):
+        os.makedirs(run.directory, exist_ok=True)
+        with open(run.status_filename, "w") as file:
+            json.dump({"status": status, "configuration_hash": "hash", "overrides": []}, file)
+
+    def test_finished_run_skipped(self):
+        run = self._run()
+        self._write_status(run, "finished")
+        lock_mock = mock.MagicMock()
+        with mock.patch.object(sweep, "load_dumping_file") as load_dumping_file_mock, \
+                mock.patch.object(sweep.factory, "build_from_plan") as build_from_plan_mock:
+            self.assertEqual(run.execute(lock_mock), "skipped")
+            load_dumping_file_mock.assert_not_called()
+            build_from_plan_mock.assert_not_called()
+        lock_mock.__enter__.assert_not_called()
+
+    def test_new_run_built_and_finished(self):
+        run = self._run()
+        self.assertEqual(run.read_status(), "new")
+        mediator_mock = mock.MagicMock(spec_set=Mediator)
+        mediator_mock.run.side_effect = EndOfRun
+        lock_mock = mock.MagicMock()
+        with mock.patch.object(sweep, "StaticData") as static_data_mock, \
+                mock.patch.object(sweep.factory, "build_from_plan",
+                                  side_effect=[None, mediator_mock]) as build_from_plan_mock:
+            self.assertEqual(run.execute(lock_mock), "finished")
+            static_data_mock.assert_called_once_with(run.static_data_filename, self._setting_plan)
+            self.assertEqual(build_from_plan_mock.call_count, 2)
+            static_data_mock.return_value.write.assert_called_once_with()
+        lock_mock.__enter__.assert_called_once_with()
+        mediator_mock.post_run.assert_called_once_with()
+        self.assertEqual(run.read_status(), "finished")
+        self.assertTrue(os.path.exists(os.path.join(run.directory, "stdout.txt")))
+
+    def test_started_run_resumed_from_dumping_file(self):
+        run = self._run()
+        self._write_status(run, "started")
+        with open(run.dumping_filenames[0], "w"):
+            pass
+        mediator_mock = mock.MagicMock(spec_set=Mediator)
+        mediator_mock.run.side_effect = EndOfRun
+        lock_mock = mock.MagicMock()
+        with mock.patch.object(sweep, "load_dumping_file", return_value=mediator_mock) as load_dumping_file_mock, \
+                mock.patch.object(sweep.factory, "build_from_plan") as build_from_plan_mock:
+            self.assertEqual(run.execute(lock_mock), "resumed")
+            self.assertEqual(load_dumping_file_mock.call_args[0][0], run.dumping_filenames[0])
+            build_from_plan_mock.assert_not_called()
+        lock_mock.__enter__.assert_not_called()
+        mediator_mock.post_run.assert_called_once_with()
+        self.assertEqual(run.read_status(), "finished")
+
+
+if __name__ == '__main__':
+    main()